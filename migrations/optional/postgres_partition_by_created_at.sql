@@ -0,0 +1,132 @@
+-- ABOUTME: Opt-in conversion of conversation_events and request_logs to daily range partitions on created_at
+-- ABOUTME: NOT applied by the migration runner -- run once with psql (PostgreSQL 13+) during a maintenance window
+-- ABOUTME: Existing rows become one "_legacy" partition attached in place; no data is copied
+--
+-- Once converted, the gateway's PartitionManager keeps daily partitions
+-- created ahead of time and the retention purger drops expired partitions
+-- whole instead of deleting their rows one by one.
+--
+-- conversation_calls stays unpartitioned: every child table holds a foreign
+-- key to conversation_calls(call_id), and a partitioned table can only be
+-- referenced through a key that includes the partition column. It is one
+-- small row per call; the event payloads are the bulk.
+--
+-- The ATTACH steps scan each table once to validate the partition bound, and
+-- the whole script holds ACCESS EXCLUSIVE locks until COMMIT. Stop the
+-- gateway (or accept that writes block) while it runs.
+
+BEGIN;
+
+-- Unique constraints on a partitioned table must include the partition key,
+-- so conversation_events(id) alone can no longer be a foreign-key target.
+-- The columns stay; they just stop being nulled when an event is purged.
+ALTER TABLE policy_events DROP CONSTRAINT IF EXISTS policy_events_original_event_id_fkey;
+ALTER TABLE policy_events DROP CONSTRAINT IF EXISTS policy_events_modified_event_id_fkey;
+
+-- ── conversation_events ─────────────────────────────────────────────────
+
+ALTER TABLE conversation_events RENAME TO conversation_events_legacy;
+ALTER TABLE conversation_events_legacy DROP CONSTRAINT conversation_events_pkey;
+ALTER TABLE conversation_events_legacy ADD CONSTRAINT conversation_events_legacy_pkey PRIMARY KEY (id, created_at);
+
+-- Free the index names for the partitioned parent. CREATE INDEX on the
+-- parent below adopts these (identical) indexes instead of rebuilding them.
+ALTER INDEX IF EXISTS idx_conversation_events_type RENAME TO idx_conversation_events_legacy_type;
+ALTER INDEX IF EXISTS idx_conversation_events_created RENAME TO idx_conversation_events_legacy_created;
+ALTER INDEX IF EXISTS idx_conversation_events_session RENAME TO idx_conversation_events_legacy_session;
+ALTER INDEX IF EXISTS idx_conversation_events_call_created RENAME TO idx_conversation_events_legacy_call_created;
+ALTER INDEX IF EXISTS idx_conversation_events_session_id_btree RENAME TO idx_conversation_events_legacy_session_id_btree;
+ALTER INDEX IF EXISTS idx_conversation_events_final_model RENAME TO idx_conversation_events_legacy_final_model;
+
+CREATE TABLE conversation_events (
+    LIKE conversation_events_legacy INCLUDING DEFAULTS
+) PARTITION BY RANGE (created_at);
+
+ALTER TABLE conversation_events ADD PRIMARY KEY (id, created_at);
+ALTER TABLE conversation_events
+    ADD CONSTRAINT conversation_events_call_id_fkey
+    FOREIGN KEY (call_id) REFERENCES conversation_calls(call_id) ON DELETE CASCADE;
+
+-- ── request_logs ────────────────────────────────────────────────────────
+
+ALTER TABLE request_logs RENAME TO request_logs_legacy;
+ALTER TABLE request_logs_legacy DROP CONSTRAINT request_logs_pkey;
+ALTER TABLE request_logs_legacy ADD CONSTRAINT request_logs_legacy_pkey PRIMARY KEY (id, created_at);
+
+ALTER INDEX IF EXISTS idx_request_logs_transaction_id RENAME TO idx_request_logs_legacy_transaction_id;
+ALTER INDEX IF EXISTS idx_request_logs_session_id RENAME TO idx_request_logs_legacy_session_id;
+ALTER INDEX IF EXISTS idx_request_logs_started_at RENAME TO idx_request_logs_legacy_started_at;
+ALTER INDEX IF EXISTS idx_request_logs_direction RENAME TO idx_request_logs_legacy_direction;
+ALTER INDEX IF EXISTS idx_request_logs_endpoint RENAME TO idx_request_logs_legacy_endpoint;
+ALTER INDEX IF EXISTS idx_request_logs_response_status RENAME TO idx_request_logs_legacy_response_status;
+ALTER INDEX IF EXISTS idx_request_logs_model RENAME TO idx_request_logs_legacy_model;
+ALTER INDEX IF EXISTS idx_request_logs_direction_started_at RENAME TO idx_request_logs_legacy_direction_started_at;
+ALTER INDEX IF EXISTS idx_request_logs_user RENAME TO idx_request_logs_legacy_user;
+
+CREATE TABLE request_logs (
+    LIKE request_logs_legacy INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+) PARTITION BY RANGE (created_at);
+
+ALTER TABLE request_logs ADD PRIMARY KEY (id, created_at);
+
+-- ── attach existing rows, pre-create the next week ──────────────────────
+-- Partition names and bounds must match PartitionManager
+-- (src/luthien_proxy/retention/partitions.py): <table>_pYYYYMMDD covering
+-- one UTC day.
+
+DO $$
+DECLARE
+    tbl TEXT;
+    boundary TIMESTAMPTZ := date_trunc('day', NOW() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC' + INTERVAL '1 day';
+    day_start TIMESTAMPTZ;
+BEGIN
+    FOREACH tbl IN ARRAY ARRAY['conversation_events', 'request_logs']
+    LOOP
+        EXECUTE format(
+            'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (MINVALUE) TO (%L)',
+            tbl, tbl || '_legacy', boundary
+        );
+        FOR offset_days IN 0..6 LOOP
+            day_start := boundary + make_interval(days => offset_days);
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                tbl || '_p' || to_char(day_start AT TIME ZONE 'UTC', 'YYYYMMDD'),
+                tbl, day_start, day_start + INTERVAL '1 day'
+            );
+        END LOOP;
+    END LOOP;
+END $$;
+
+-- ── parent indexes (cascade to every partition) ─────────────────────────
+
+CREATE INDEX idx_conversation_events_type ON conversation_events(event_type);
+CREATE INDEX idx_conversation_events_created ON conversation_events(created_at);
+CREATE INDEX idx_conversation_events_session ON conversation_events(session_id) WHERE session_id IS NOT NULL;
+CREATE INDEX idx_conversation_events_call_created ON conversation_events(call_id, created_at);
+CREATE INDEX idx_conversation_events_session_id_btree
+    ON conversation_events (session_id text_pattern_ops)
+    WHERE session_id IS NOT NULL;
+CREATE INDEX idx_conversation_events_final_model
+    ON conversation_events ((payload->>'final_model'))
+    WHERE event_type = 'transaction.request_recorded'
+    AND payload->>'final_model' IS NOT NULL;
+
+CREATE INDEX idx_request_logs_transaction_id ON request_logs(transaction_id);
+CREATE INDEX idx_request_logs_session_id ON request_logs(session_id) WHERE session_id IS NOT NULL;
+CREATE INDEX idx_request_logs_started_at ON request_logs(started_at DESC);
+CREATE INDEX idx_request_logs_direction ON request_logs(direction);
+CREATE INDEX idx_request_logs_endpoint ON request_logs(endpoint);
+CREATE INDEX idx_request_logs_response_status ON request_logs(response_status);
+CREATE INDEX idx_request_logs_model ON request_logs(model);
+CREATE INDEX idx_request_logs_direction_started_at ON request_logs(direction, started_at DESC);
+CREATE INDEX idx_request_logs_user ON request_logs(user_id) WHERE user_id IS NOT NULL;
+
+-- Same conditional grant as migration 008.
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'luthien') THEN
+        GRANT ALL PRIVILEGES ON conversation_events, request_logs TO luthien;
+    END IF;
+END $$;
+
+COMMIT;
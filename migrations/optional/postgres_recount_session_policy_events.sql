@@ -0,0 +1,46 @@
+-- ABOUTME: Opt-in backfill recounting session_summaries.policy_event_count with the current predicate
+-- ABOUTME: NOT applied by the migration runner -- run once with psql (PostgreSQL 11+) after migration 023
+-- ABOUTME: Commits every batch, so only the rows of the current batch are locked at a time
+--
+-- Before migration 023, prefixed judge lifecycle events
+-- ('policy.anthropic_judge.evaluation_started') were counted as policy
+-- interventions, so older sessions can match the history list's
+-- policy_intervention filter without having had one. This recounts every
+-- session with the predicate the history service uses.
+--
+-- Run it outside an explicit transaction (plain `psql -f`): the DO block
+-- COMMITs after each batch. It is safe to interrupt and to re-run. A session
+-- receiving events while its batch is recounted can end up off by those
+-- in-flight events; re-running corrects it.
+
+DO $$
+DECLARE
+    batch_size CONSTANT integer := 1000;
+    last_session_id text := '';
+    batch_last text;
+BEGIN
+    LOOP
+        WITH batch AS (
+            SELECT session_id
+            FROM session_summaries
+            WHERE session_id > last_session_id
+            ORDER BY session_id
+            LIMIT batch_size
+        ), recounted AS (
+            UPDATE session_summaries ss SET policy_event_count = (
+                SELECT COUNT(*)
+                FROM conversation_events ce
+                WHERE ce.session_id = ss.session_id
+                  AND ce.event_type LIKE 'policy.%'
+                  AND ce.event_type NOT LIKE 'policy.%judge.evaluation%'
+            )
+            FROM batch
+            WHERE ss.session_id = batch.session_id
+            RETURNING ss.session_id
+        )
+        SELECT MAX(session_id) INTO batch_last FROM recounted;
+        EXIT WHEN batch_last IS NULL;
+        last_session_id := batch_last;
+        COMMIT;
+    END LOOP;
+END $$;
@@ -0,0 +1,70 @@
+-- ABOUTME: Content-addressed store for conversation messages referenced from event payloads.
+-- ABOUTME: With CONVERSATION_MESSAGE_DEDUP enabled, request payloads replace each message with
+-- ABOUTME: {"blob_ref": "<sha256>"} and the message body is stored here once per distinct digest.
+--
+-- Claude Code resends the whole conversation on every turn, and each turn records the
+-- messages array three times (client_request, request_recorded original + final,
+-- backend_request). Storing each distinct message once turns that O(turns^2) history
+-- into O(turns) rows.
+--
+-- last_seen_at is bumped every time an event references the blob. The purger deletes
+-- blobs whose last_seen_at is older than the retention cutoff: every event that could
+-- still reference such a blob is itself older than the cutoff and already purged.
+
+CREATE TABLE IF NOT EXISTS conversation_message_blobs (
+    digest TEXT PRIMARY KEY,
+    content JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    last_seen_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_conversation_message_blobs_last_seen
+    ON conversation_message_blobs (last_seen_at);
+
+-- Resolve blob refs when extracting search text. The insert path writes blobs before
+-- the event row in the same transaction, so the BEFORE INSERT trigger sees them.
+-- Reading a table makes the function STABLE rather than IMMUTABLE; it is only called
+-- from the trigger and the 014 backfill, never from an index expression.
+CREATE OR REPLACE FUNCTION _extract_event_search_text(payload JSONB) RETURNS TEXT AS $$
+DECLARE
+    result TEXT := '';
+    msg JSONB;
+    block JSONB;
+BEGIN
+    IF payload ? 'final_request' AND payload->'final_request' ? 'messages' THEN
+        FOR msg IN SELECT * FROM jsonb_array_elements(payload->'final_request'->'messages')
+        LOOP
+            IF msg ? 'blob_ref' THEN
+                SELECT content INTO msg FROM conversation_message_blobs WHERE digest = msg->>'blob_ref';
+            END IF;
+            IF msg->>'role' = 'user' THEN
+                IF jsonb_typeof(msg->'content') = 'string' THEN
+                    result := result || ' ' || (msg->>'content');
+                ELSIF jsonb_typeof(msg->'content') = 'array' THEN
+                    FOR block IN SELECT * FROM jsonb_array_elements(msg->'content')
+                    LOOP
+                        IF block->>'type' = 'text' THEN
+                            result := result || ' ' || (block->>'text');
+                        END IF;
+                    END LOOP;
+                END IF;
+            END IF;
+        END LOOP;
+    END IF;
+
+    IF payload ? 'final_response' AND payload->'final_response' ? 'content' THEN
+        IF jsonb_typeof(payload->'final_response'->'content') = 'string' THEN
+            result := result || ' ' || (payload->'final_response'->>'content');
+        ELSIF jsonb_typeof(payload->'final_response'->'content') = 'array' THEN
+            FOR block IN SELECT * FROM jsonb_array_elements(payload->'final_response'->'content')
+            LOOP
+                IF block->>'type' = 'text' THEN
+                    result := result || ' ' || (block->>'text');
+                END IF;
+            END LOOP;
+        END IF;
+    END IF;
+
+    RETURN NULLIF(TRIM(result), '');
+END;
+$$ LANGUAGE plpgsql STABLE;
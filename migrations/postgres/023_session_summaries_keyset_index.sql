@@ -0,0 +1,18 @@
+-- ABOUTME: Prepares session_summaries to serve the history session list directly.
+-- ABOUTME: Adds the (last_seen, session_id) keyset index; the policy_event_count recount
+-- ABOUTME: is an optional batched backfill (optional/postgres_recount_session_policy_events.sql).
+
+-- The list orders by last_seen DESC, session_id DESC and pages with a keyset
+-- cursor on that pair; the composite index covers both the sort and the seek,
+-- so the single-column index from 021 is redundant.
+CREATE INDEX IF NOT EXISTS idx_session_summaries_last_seen_session
+    ON session_summaries(last_seen DESC, session_id DESC);
+DROP INDEX IF EXISTS idx_session_summaries_last_seen;
+
+-- Migration 021 and the incremental writer excluded only unprefixed
+-- 'policy.judge.evaluation%' events, so prefixed judge lifecycle events
+-- ('policy.anthropic_judge.evaluation_started') were counted as interventions.
+-- New events are counted correctly from now on. Recounting existing rows here
+-- would rewrite all of session_summaries inside the migration transaction and
+-- lock it for the whole deploy, so that recount lives in
+-- optional/postgres_recount_session_policy_events.sql, which commits in batches.
@@ -0,0 +1,117 @@
+-- ABOUTME: Replaces the per-event search_vector trigger (014/022) with session_search_index,
+-- ABOUTME: which holds only the user and assistant text each call introduced.
+-- ABOUTME: The gateway computes the per-turn diff in Python; see observability/search_index.py.
+--
+-- Clients resend the whole conversation on every turn, and the 014 trigger tokenized
+-- every request's full messages array, so indexing cost and GIN size grew
+-- quadratically per session. Rows here are written by the event write path:
+-- a request contributes the user messages past the previous call's message count
+-- (tracked in session_search_state), a response contributes its assistant text.
+
+CREATE TABLE IF NOT EXISTS session_search_index (
+    id BIGSERIAL PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    call_id TEXT NOT NULL REFERENCES conversation_calls(call_id) ON DELETE CASCADE,
+    content TEXT NOT NULL,
+    search_vector TSVECTOR GENERATED ALWAYS AS (to_tsvector('english', content)) STORED,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_session_search_index_search_vector
+    ON session_search_index USING GIN (search_vector);
+
+-- Purges delete by call_id; the cascade needs this to avoid a sequential scan.
+CREATE INDEX IF NOT EXISTS idx_session_search_index_call
+    ON session_search_index(call_id);
+
+CREATE TABLE IF NOT EXISTS session_search_state (
+    session_id TEXT PRIMARY KEY,
+    message_count INTEGER NOT NULL
+);
+
+-- Backfill from the stored events with the same rules as the Python indexer:
+-- client messages (original_request, else final_request), probes (max_tokens <= 1)
+-- skipped, and a shorter-than-previous message list indexed whole. Message blob
+-- refs (022) are resolved. Events written concurrently with this migration are
+-- indexed by the gateway once it runs the new code.
+CREATE TEMPORARY TABLE _search_requests AS
+SELECT
+    ce.session_id,
+    ce.call_id,
+    ce.created_at,
+    r.body->'messages' AS messages,
+    jsonb_array_length(r.body->'messages') AS message_count,
+    LAG(jsonb_array_length(r.body->'messages')) OVER (
+        PARTITION BY ce.session_id ORDER BY ce.created_at, ce.id
+    ) AS previous_count,
+    ROW_NUMBER() OVER (PARTITION BY ce.session_id ORDER BY ce.created_at DESC, ce.id DESC) AS recency
+FROM conversation_events ce
+CROSS JOIN LATERAL (
+    SELECT COALESCE(ce.payload->'original_request', ce.payload->'final_request') AS body
+) r
+WHERE ce.event_type = 'transaction.request_recorded'
+  AND ce.session_id IS NOT NULL
+  AND jsonb_typeof(r.body->'messages') = 'array'
+  AND CASE
+      WHEN jsonb_typeof(r.body->'max_tokens') = 'number' THEN (r.body->>'max_tokens')::NUMERIC > 1
+      ELSE TRUE
+  END;
+
+INSERT INTO session_search_index (session_id, call_id, content, created_at)
+SELECT sr.session_id, sr.call_id, string_agg(t.text, ' ' ORDER BY m.ord, t.ord), sr.created_at
+FROM _search_requests sr
+CROSS JOIN LATERAL jsonb_array_elements(sr.messages) WITH ORDINALITY AS m(raw, ord)
+LEFT JOIN conversation_message_blobs b ON b.digest = m.raw->>'blob_ref'
+CROSS JOIN LATERAL (SELECT COALESCE(b.content, m.raw) AS body) msg
+CROSS JOIN LATERAL (
+    SELECT TRIM(msg.body->>'content') AS text, 0::BIGINT AS ord
+    WHERE jsonb_typeof(msg.body->'content') = 'string'
+    UNION ALL
+    SELECT TRIM(block->>'text'), block_ord
+    FROM jsonb_array_elements(
+        CASE WHEN jsonb_typeof(msg.body->'content') = 'array' THEN msg.body->'content' ELSE '[]'::JSONB END
+    ) WITH ORDINALITY AS blocks(block, block_ord)
+    WHERE block->>'type' = 'text'
+) t
+WHERE msg.body->>'role' = 'user'
+  AND m.ord > CASE
+      WHEN sr.previous_count IS NULL OR sr.message_count < sr.previous_count THEN 0
+      ELSE sr.previous_count
+  END
+  AND t.text <> ''
+GROUP BY sr.session_id, sr.call_id, sr.created_at;
+
+INSERT INTO session_search_index (session_id, call_id, content, created_at)
+SELECT ce.session_id, ce.call_id, string_agg(t.text, ' ' ORDER BY t.ord), ce.created_at
+FROM conversation_events ce
+CROSS JOIN LATERAL (
+    SELECT TRIM(ce.payload->'final_response'->>'content') AS text, 0::BIGINT AS ord
+    WHERE jsonb_typeof(ce.payload->'final_response'->'content') = 'string'
+    UNION ALL
+    SELECT TRIM(block->>'text'), block_ord
+    FROM jsonb_array_elements(
+        CASE
+            WHEN jsonb_typeof(ce.payload->'final_response'->'content') = 'array'
+            THEN ce.payload->'final_response'->'content'
+            ELSE '[]'::JSONB
+        END
+    ) WITH ORDINALITY AS blocks(block, block_ord)
+    WHERE block->>'type' = 'text'
+) t
+WHERE ce.event_type IN ('transaction.streaming_response_recorded', 'transaction.non_streaming_response_recorded')
+  AND ce.session_id IS NOT NULL
+  AND t.text <> ''
+GROUP BY ce.id, ce.session_id, ce.call_id, ce.created_at;
+
+INSERT INTO session_search_state (session_id, message_count)
+SELECT session_id, message_count FROM _search_requests WHERE recency = 1
+ON CONFLICT (session_id) DO NOTHING;
+
+DROP TABLE _search_requests;
+
+-- Retire the per-event index.
+DROP TRIGGER IF EXISTS trg_conversation_events_search_vector ON conversation_events;
+DROP FUNCTION IF EXISTS _update_conversation_event_search_vector();
+DROP FUNCTION IF EXISTS _extract_event_search_text(JSONB);
+DROP INDEX IF EXISTS idx_conversation_events_search_vector;
+ALTER TABLE conversation_events DROP COLUMN IF EXISTS search_vector;
@@ -0,0 +1,61 @@
+-- ABOUTME: Content-addressed store for conversation messages referenced from event payloads.
+-- ABOUTME: With CONVERSATION_MESSAGE_DEDUP enabled, request payloads replace each message with
+-- ABOUTME: {"blob_ref": "<sha256>"} and the message body is stored here once per distinct digest.
+--
+-- See the Postgres migration for the retention rationale behind last_seen_at.
+
+CREATE TABLE IF NOT EXISTS conversation_message_blobs (
+    digest TEXT PRIMARY KEY,
+    content TEXT NOT NULL,
+    created_at TEXT NOT NULL DEFAULT (datetime('now')),
+    last_seen_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_conversation_message_blobs_last_seen
+    ON conversation_message_blobs(last_seen_at);
+
+-- Recreate the 014 FTS insert trigger so user messages stored as blob refs are
+-- resolved before extraction. Blobs are written before the event row in the same
+-- transaction, so the AFTER INSERT trigger can see them. Inline messages (dedup
+-- disabled, or rows written before this migration) fall through the LEFT JOIN.
+DROP TRIGGER IF EXISTS trg_conversation_events_fts_insert;
+
+CREATE TRIGGER trg_conversation_events_fts_insert
+AFTER INSERT ON conversation_events
+WHEN NEW.event_type = 'transaction.request_recorded'
+BEGIN
+    INSERT INTO conversation_events_fts(session_id, event_id, content)
+    SELECT NEW.session_id, NEW.id, content FROM (
+        SELECT TRIM(COALESCE((
+            SELECT group_concat(t, ' ') FROM (
+                SELECT json_extract(msg.value, '$.content') AS t
+                FROM (
+                    SELECT COALESCE(b.content, m.value) AS value
+                    FROM json_each(COALESCE(json_extract(NEW.payload, '$.final_request.messages'), '[]')) AS m
+                    LEFT JOIN conversation_message_blobs b ON b.digest = json_extract(m.value, '$.blob_ref')
+                ) AS msg
+                WHERE json_extract(msg.value, '$.role') = 'user'
+                  AND json_type(msg.value, '$.content') = 'text'
+                UNION ALL
+                SELECT json_extract(block.value, '$.text') AS t
+                FROM (
+                    SELECT COALESCE(b.content, m.value) AS value
+                    FROM json_each(COALESCE(json_extract(NEW.payload, '$.final_request.messages'), '[]')) AS m
+                    LEFT JOIN conversation_message_blobs b ON b.digest = json_extract(m.value, '$.blob_ref')
+                ) AS msg,
+                     json_each(COALESCE(json_extract(msg.value, '$.content'), '[]')) AS block
+                WHERE json_extract(msg.value, '$.role') = 'user'
+                  AND json_type(msg.value, '$.content') = 'array'
+                  AND json_extract(block.value, '$.type') = 'text'
+                UNION ALL
+                SELECT json_extract(NEW.payload, '$.final_response.content') AS t
+                WHERE json_type(NEW.payload, '$.final_response.content') = 'text'
+                UNION ALL
+                SELECT json_extract(block.value, '$.text') AS t
+                FROM json_each(COALESCE(json_extract(NEW.payload, '$.final_response.content'), '[]')) AS block
+                WHERE json_type(NEW.payload, '$.final_response.content') = 'array'
+                  AND json_extract(block.value, '$.type') = 'text'
+            ) WHERE t IS NOT NULL AND t != ''
+        ), '')) AS content
+    ) WHERE content != '';
+END;
@@ -0,0 +1,21 @@
+-- ABOUTME: Prepares session_summaries to serve the history session list directly.
+-- ABOUTME: Adds the (last_seen, session_id) keyset index and recounts policy_event_count
+-- ABOUTME: with the same intervention predicate the history service uses.
+
+-- The list orders by last_seen DESC, session_id DESC and pages with a keyset
+-- cursor on that pair; the composite index covers both the sort and the seek,
+-- so the single-column index from 021 is redundant.
+CREATE INDEX IF NOT EXISTS idx_session_summaries_last_seen_session
+    ON session_summaries(last_seen DESC, session_id DESC);
+DROP INDEX IF EXISTS idx_session_summaries_last_seen;
+
+-- Migration 021 and the incremental writer excluded only unprefixed
+-- 'policy.judge.evaluation%' events, so prefixed judge lifecycle events
+-- ('policy.anthropic_judge.evaluation_started') were counted as interventions.
+UPDATE session_summaries SET policy_event_count = (
+    SELECT COUNT(*)
+    FROM conversation_events ce
+    WHERE ce.session_id = session_summaries.session_id
+      AND ce.event_type LIKE 'policy.%'
+      AND ce.event_type NOT LIKE 'policy.%judge.evaluation%'
+);
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Compare per-check latency of the in-process and Redis rate limiters.
+
+Usage:
+    uv run python scripts/benchmark_rate_limiter.py [--redis-url redis://localhost:6379] [--checks 5000]
+
+Runs the same workload (a pool of keys, checked round-robin) against
+TokenBucketRateLimiter and against RedisTokenBucketRateLimiter with local
+pre-admission off (lease 1) and on, then prints p50/p99/mean latency and the
+share of checks that needed a Redis round trip. The Redis modes are skipped
+when Redis is unreachable. Benchmark keys use a throwaway prefix and are
+deleted afterwards.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+import uuid
+
+import redis.asyncio as redis
+
+from luthien_proxy.rate_limit import RateLimiterProtocol, RedisTokenBucketRateLimiter, TokenBucketRateLimiter
+
+
+async def _measure(limiter: RateLimiterProtocol, checks: int, keys: list[str]) -> list[float]:
+    latencies: list[float] = []
+    for i in range(checks):
+        start = time.perf_counter()
+        await limiter.check(keys[i % len(keys)])
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def _report(name: str, latencies: list[float], round_trips: int | None = None) -> None:
+    ordered = sorted(latencies)
+    p50 = ordered[len(ordered) // 2] * 1e6
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1e6
+    mean = statistics.fmean(latencies) * 1e6
+    trips = "" if round_trips is None else f"  redis round trips {round_trips / len(latencies):6.1%}"
+    print(f"{name:<24} p50 {p50:8.1f}us  p99 {p99:8.1f}us  mean {mean:8.1f}us{trips}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--redis-url", default=os.environ.get("REDIS_URL", "redis://localhost:6379"))
+    parser.add_argument("--checks", type=int, default=5000)
+    parser.add_argument("--keys", type=int, default=10)
+    parser.add_argument("--rpm", type=int, default=1_000_000, help="High enough that no check is denied")
+    parser.add_argument("--lease", type=int, default=10, help="Local lease size for the pre-admission run")
+    args = parser.parse_args()
+
+    keys = [f"bench-key-{i}" for i in range(args.keys)]
+    print(f"{args.checks} checks over {args.keys} keys, rpm={args.rpm}\n")
+
+    _report("memory", await _measure(TokenBucketRateLimiter(rpm=args.rpm, burst=args.rpm), args.checks, keys))
+
+    client = redis.from_url(args.redis_url)
+    try:
+        await client.ping()
+    except (redis.RedisError, OSError) as e:
+        print(f"\nSkipping Redis modes: cannot reach {args.redis_url} ({e})")
+        await client.aclose()
+        return
+
+    prefix = f"luthien:ratelimit:bench:{uuid.uuid4().hex}:"
+    try:
+        for name, lease in (("redis", 1), (f"redis (lease {args.lease})", args.lease)):
+            limiter = RedisTokenBucketRateLimiter(
+                client, rpm=args.rpm, burst=args.rpm, lease_size=lease, key_prefix=prefix
+            )
+            latencies = await _measure(limiter, args.checks, keys)
+            _report(name, latencies, round_trips=limiter.redis_checks)
+            await client.delete(*[key async for key in client.scan_iter(match=prefix + "*")])
+    finally:
+        await client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
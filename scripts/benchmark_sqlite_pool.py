@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Measure event-write latency on SQLite while history-style reads run alongside.
+
+Usage:
+    uv run python scripts/benchmark_sqlite_pool.py [--writes 2000] [--readers 4] [--scan-rows 50000]
+
+Seeds a throwaway database file with --scan-rows rows, then runs one writer
+task (single-row INSERTs, like the event emitter) concurrently with
+--read-tasks tasks that repeatedly run a full-table aggregate (like a
+history list or session detail scan). Runs twice: with all work on the
+writer connection (readers=0, the old single-connection behaviour) and with
+--readers read-only WAL connections, then prints write latency p50/p99 and
+the scan rate over the same window.
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from luthien_proxy.utils.db_sqlite import SqlitePool, create_sqlite_pool
+
+
+async def _seed(pool: SqlitePool, rows: int) -> None:
+    await pool.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, session_id TEXT, payload TEXT)")
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            for i in range(rows):
+                await conn.execute("INSERT INTO events (session_id, payload) VALUES ($1, $2)", f"s{i % 100}", "x" * 200)
+
+
+async def _run(readers: int, args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = await create_sqlite_pool(f"sqlite:///{Path(tmp) / 'bench.db'}", readers=readers)
+        try:
+            await _seed(pool, args.scan_rows)
+            done = asyncio.Event()
+            scans = 0
+
+            async def scan() -> None:
+                nonlocal scans
+                while not done.is_set():
+                    await pool.fetch(
+                        "SELECT session_id, COUNT(*), MAX(length(payload)) FROM events GROUP BY session_id"
+                    )
+                    scans += 1
+
+            scanners = [asyncio.create_task(scan()) for _ in range(args.read_tasks)]
+            latencies: list[float] = []
+            began = time.perf_counter()
+            for i in range(args.writes):
+                start = time.perf_counter()
+                await pool.execute("INSERT INTO events (session_id, payload) VALUES ($1, $2)", f"w{i}", "{}")
+                latencies.append(time.perf_counter() - start)
+            done.set()
+            await asyncio.gather(*scanners)
+            elapsed = time.perf_counter() - began
+        finally:
+            await pool.close()
+
+    ordered = sorted(latencies)
+    p50 = ordered[len(ordered) // 2] * 1e3
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1e3
+    mean = statistics.fmean(latencies) * 1e3
+    print(
+        f"readers={readers:<3} write p50 {p50:8.2f}ms  p99 {p99:8.2f}ms  mean {mean:8.2f}ms  scans/s {scans / elapsed:8.1f}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writes", type=int, default=2000)
+    parser.add_argument("--readers", type=int, default=4, help="Read-only connections for the pooled run")
+    parser.add_argument("--read-tasks", type=int, default=4, help="Concurrent scanning tasks")
+    parser.add_argument("--scan-rows", type=int, default=50_000)
+    args = parser.parse_args()
+
+    print(f"{args.writes} writes against {args.read_tasks} scanning tasks over {args.scan_rows} rows\n")
+    for readers in (0, args.readers):
+        await _run(readers, args)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
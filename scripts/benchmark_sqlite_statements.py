@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Measure per-statement overhead of the SQLite shim with and without its translation cache.
+
+Usage:
+    uv run python scripts/benchmark_sqlite_statements.py [--statements 20000]
+
+Runs the event writer's call-row upsert through ``_translate_params`` alone
+and through a full ``SqliteConnection.execute`` on an in-memory database,
+once with the translated-query cache cleared before every statement (the
+old behaviour: regex translation each time) and once warm, then prints
+mean/p50/p99 latency per statement.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+
+from luthien_proxy.utils.db_sqlite import _translate_params, _translate_query, create_sqlite_pool
+
+_UPSERT = """
+    INSERT INTO conversation_calls (call_id, created_at, session_id, user_id)
+    VALUES ($1, $2, $3, $4)
+    ON CONFLICT (call_id) DO UPDATE SET
+        session_id = COALESCE(conversation_calls.session_id, EXCLUDED.session_id),
+        user_id = COALESCE(conversation_calls.user_id, EXCLUDED.user_id)
+"""
+
+
+def _report(name: str, latencies: list[float]) -> None:
+    ordered = sorted(latencies)
+    p50 = ordered[len(ordered) // 2] * 1e6
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1e6
+    mean = statistics.fmean(latencies) * 1e6
+    print(f"{name:<24} p50 {p50:8.1f}us  p99 {p99:8.1f}us  mean {mean:8.1f}us")
+
+
+async def _measure(statements: int, step: Callable[[int], Awaitable[None]], *, cold: bool) -> list[float]:
+    latencies: list[float] = []
+    for i in range(statements):
+        if cold:
+            _translate_query.cache_clear()
+        start = time.perf_counter()
+        await step(i)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--statements", type=int, default=20_000)
+    args = parser.parse_args()
+    now = datetime.now(UTC)
+
+    async def translate(i: int) -> None:
+        _translate_params(_UPSERT, (f"call-{i}", now, "session", "user"))
+
+    for cold in (True, False):
+        _report(
+            f"translate ({'uncached' if cold else 'cached'})", await _measure(args.statements, translate, cold=cold)
+        )
+
+    pool = await create_sqlite_pool("sqlite://:memory:")
+    try:
+        await pool.execute(
+            "CREATE TABLE conversation_calls (call_id TEXT PRIMARY KEY, created_at TEXT, session_id TEXT, user_id TEXT)"
+        )
+        async with pool.acquire() as conn:
+
+            async def execute(i: int) -> None:
+                await conn.execute(_UPSERT, f"call-{i % 100}", now, "session", "user")
+
+            for cold in (True, False):
+                _report(
+                    f"execute ({'uncached' if cold else 'cached'})", await _measure(args.statements, execute, cold=cold)
+                )
+    finally:
+        await pool.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
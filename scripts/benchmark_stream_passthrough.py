@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Compare per-delta proxy overhead of the event and passthrough streaming paths.
+
+Usage:
+    uv run python scripts/benchmark_stream_passthrough.py [--deltas 2000] [--runs 20]
+
+Builds a synthetic upstream SSE body (message_start, N text deltas, message
+stop) and times, per run, the work the proxy does on each path:
+
+- event: parse every frame into an SDK event and re-serialize it with
+  ``_format_sse_event`` before writing it to the client.
+- passthrough: hand each chunk to ``SSEEventCollector.feed`` and forward it
+  unchanged, then parse the whole stream once with ``finish`` for recording.
+  The "forwarding" row is the part of that which sits between upstream and
+  client bytes; the ``finish`` parse runs after the last byte is sent.
+
+Network and policy time are excluded; the numbers are the proxy's own cost.
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+from luthien_proxy.pipeline.anthropic_processor import _format_sse_event
+from luthien_proxy.pipeline.sse_passthrough import SSEEventCollector
+
+
+def _frame(name: str, data: dict) -> bytes:
+    return f"event: {name}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+def _upstream(deltas: int, text: str) -> list[bytes]:
+    message = {
+        "id": "msg_bench",
+        "type": "message",
+        "role": "assistant",
+        "content": [],
+        "model": "claude-bench",
+        "stop_reason": None,
+        "stop_sequence": None,
+        "usage": {"input_tokens": 10, "output_tokens": 0},
+    }
+    delta = {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": text}}
+    return [
+        _frame("message_start", {"type": "message_start", "message": message}),
+        _frame(
+            "content_block_start",
+            {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}},
+        ),
+        *[_frame("content_block_delta", delta) for _ in range(deltas)],
+        _frame("content_block_stop", {"type": "content_block_stop", "index": 0}),
+        _frame(
+            "message_delta",
+            {"type": "message_delta", "delta": {"stop_reason": "end_turn"}, "usage": {"output_tokens": deltas}},
+        ),
+        _frame("message_stop", {"type": "message_stop"}),
+    ]
+
+
+def _event_path(chunks: list[bytes]) -> None:
+    collector = SSEEventCollector()
+    for chunk in chunks:
+        collector.feed(chunk)
+        for event in collector.drain():
+            _format_sse_event(event).encode()
+
+
+def _passthrough_forward(chunks: list[bytes]) -> SSEEventCollector:
+    collector = SSEEventCollector()
+    for chunk in chunks:
+        collector.feed(chunk)
+    return collector
+
+
+def _passthrough_path(chunks: list[bytes]) -> None:
+    _passthrough_forward(chunks).finish()
+
+
+def _report(name: str, timings: list[float], deltas: int) -> float:
+    per_delta = statistics.median(timings) / deltas * 1e6
+    print(f"{name:<12} median {statistics.median(timings) * 1e3:8.2f}ms  per delta {per_delta:6.2f}us")
+    return per_delta
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--deltas", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--text", default="token ", help="Text carried by each delta")
+    args = parser.parse_args()
+
+    chunks = _upstream(args.deltas, args.text)
+    print(f"{args.deltas} deltas, {sum(map(len, chunks))} bytes, {args.runs} runs\n")
+
+    results = {}
+    paths = (
+        ("event", _event_path),
+        ("passthrough", _passthrough_path),
+        ("  forwarding", _passthrough_forward),
+    )
+    for name, path in paths:
+        timings = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            path(chunks)
+            timings.append(time.perf_counter() - start)
+        results[name] = _report(name, timings, args.deltas)
+    print(f"\npassthrough saves {1 - results['passthrough'] / results['event']:.0%} of total per-delta proxy time")
+    print(f"forwarding saves {1 - results['  forwarding'] / results['event']:.0%} of per-delta time on the byte path")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Compare sequential and single-pass StringReplacementPolicy matching.
+
+Usage:
+    uv run python scripts/benchmark_string_replacement.py [--deltas 500] [--runs 5]
+
+For each replacement-list size and text-delta size, times the per-delta work
+the streaming hook does (replacements over ``buffer + chunk``) with:
+
+- sequential: one precompiled ``re.subn`` (``match_capitalization``) or
+  ``str.count``/``str.replace`` pass per pair, as the policy did before.
+- single-pass: the trie-factored matcher ``StringReplacementPolicy`` builds in
+  ``__init__``.
+
+Sources are redaction-style tokens (names, hostnames, emails) replaced with
+"[REDACTED]", so the whole list fits in one scan. Only a few occur in the
+text, as in practice. Results are checked to be identical before timing.
+"""
+
+import argparse
+import random
+import statistics
+import string
+import time
+
+from luthien_proxy.policies.string_replacement_policy import (
+    _apply_with_compiled_count,
+    _compile_case_insensitive_patterns,
+    _ReplacementEngine,
+    apply_replacements_with_count,
+)
+
+
+def _pairs(count: int, rng: random.Random) -> list[tuple[str, str]]:
+    sources: set[str] = set()
+    while len(sources) < count:
+        stem = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(5, 10)))
+        kind = rng.randrange(3)
+        sources.add(stem if kind == 0 else f"{stem}.internal" if kind == 1 else f"{stem}@corp.example")
+    return [(source, "[REDACTED]") for source in sorted(sources)]
+
+
+def _deltas(pairs: list[tuple[str, str]], delta_chars: int, count: int, rng: random.Random) -> list[str]:
+    filler = "the quick brown fox jumps over the lazy dog and keeps on running "
+    text = []
+    for _ in range(count):
+        chunk = (filler * (delta_chars // len(filler) + 1))[:delta_chars]
+        if rng.random() < 0.1:
+            source = rng.choice(pairs)[0]
+            chunk = chunk[: max(0, delta_chars - len(source) - 1)] + " " + source
+        text.append(chunk)
+    return text
+
+
+def _run(apply, deltas: list[str], buffer_size: int) -> float:
+    buffer = ""
+    start = time.perf_counter()
+    for chunk in deltas:
+        replaced, _ = apply(buffer + chunk)
+        buffer = replaced[-buffer_size:] if buffer_size else ""
+    return (time.perf_counter() - start) / len(deltas) * 1e6
+
+
+def main() -> None:
+    """Print per-delta timings across pair counts and delta sizes."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--deltas", type=int, default=500, help="text deltas per run")
+    parser.add_argument("--runs", type=int, default=5, help="runs per configuration (median reported)")
+    parser.add_argument("--match-capitalization", action="store_true", help="benchmark case-insensitive matching")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    mc = args.match_capitalization
+    print(f"match_capitalization={mc}, {args.deltas} deltas/run, median of {args.runs} runs (µs per delta)")
+    print(f"{'pairs':>6} {'delta':>6} {'sequential':>12} {'single-pass':>12} {'speedup':>8} {'build ms':>9}")
+    for pair_count in (10, 50, 100, 200):
+        pairs = _pairs(pair_count, rng)
+        build_start = time.perf_counter()
+        engine = _ReplacementEngine(pairs, mc)
+        build_ms = (time.perf_counter() - build_start) * 1000
+        assert engine.stage_count == 1, "benchmark pairs should need a single scan"
+        buffer_size = max(len(source) for source, _ in pairs) - 1
+
+        compiled = _compile_case_insensitive_patterns(pairs)
+
+        def sequential(text: str, _pairs: list[tuple[str, str]] = pairs, _compiled=compiled) -> tuple[str, int]:
+            if mc:
+                return _apply_with_compiled_count(text, _compiled)
+            return apply_replacements_with_count(text, _pairs, False)
+
+        for delta_chars in (16, 64, 256, 1024):
+            deltas = _deltas(pairs, delta_chars, args.deltas, rng)
+            for chunk in deltas[:50]:
+                assert engine.apply(chunk) == sequential(chunk)
+            seq = statistics.median(_run(sequential, deltas, buffer_size) for _ in range(args.runs))
+            single = statistics.median(_run(engine.apply, deltas, buffer_size) for _ in range(args.runs))
+            print(
+                f"{pair_count:>6} {delta_chars:>6} {seq:>12.1f} {single:>12.1f} {seq / single:>7.1f}x {build_ms:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
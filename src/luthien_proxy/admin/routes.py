@@ -39,10 +39,10 @@ from luthien_proxy.inference.registry import (
     ProviderRecord,
     UnknownBackendTypeError,
 )
-from luthien_proxy.llm import anthropic_client_cache
+from luthien_proxy.llm import anthropic_client_cache, upstream_http
 from luthien_proxy.llm.anthropic_client import AnthropicClient
 from luthien_proxy.llm.types.anthropic import AnthropicRequest, AnthropicResponse
-from luthien_proxy.observability.emitter import EventEmitterProtocol
+from luthien_proxy.observability.emitter import EventEmitter, EventEmitterProtocol
 from luthien_proxy.policy_core.anthropic_execution_interface import AnthropicExecutionInterface
 from luthien_proxy.policy_core.policy_context import PolicyContext
 from luthien_proxy.policy_manager import (
@@ -1436,4 +1436,111 @@ async def webhook_stats(
     )
 
 
+class EventWriteStatsResponse(BaseModel):
+    """Database-sink counters for the event emitter."""
+
+    write_behind: bool
+    # Cumulative events lost to DB errors, in either mode. In write-behind mode
+    # a failed flush adds its whole batch (the batch rolled back as a unit).
+    dropped_db_writes: int
+    # The fields below are only meaningful in write-behind mode (zero otherwise).
+    queue_depth: int = 0
+    max_queue_size: int = 0
+    high_water_mark: int = 0
+    # Events rejected because the queue was full. Sum with dropped_db_writes
+    # for the true "events that never reached the DB" count.
+    dropped_queue_full: int = 0
+    written: int = 0
+    flushes: int = 0
+    failed_flushes: int = 0
+    last_flush_ms: float = 0.0
+    worker_pid: int
+
+
+@router.get("/events/stats", response_model=EventWriteStatsResponse)
+async def event_write_stats(
+    _: str = Depends(verify_admin_token),
+    emitter: EventEmitterProtocol = Depends(get_emitter),
+):
+    """Return event DB-write backpressure stats.
+
+    Counters are cumulative for the process lifetime and **per uvicorn
+    worker**, same caveat as `/webhook/stats`.
+    """
+    pid = os.getpid()
+    if not isinstance(emitter, EventEmitter):
+        return EventWriteStatsResponse(write_behind=False, dropped_db_writes=0, worker_pid=pid)
+    stats = emitter.db_write_stats()
+    return EventWriteStatsResponse(write_behind="queue_depth" in stats, worker_pid=pid, **stats)
+
+
+class PolicyCacheStatsResponse(BaseModel):
+    """Counters for the in-process PolicyCache front (POLICY_CACHE_WRITE_BEHIND)."""
+
+    write_behind: bool
+    # All fields below are zero when write-behind is disabled.
+    l1_entries: int = 0
+    l1_max_entries: int = 0
+    hits: int = 0
+    misses: int = 0
+    hit_rate: float = 0.0
+    pending_writes: int = 0
+    # Puts that replaced a not-yet-flushed write of the same key.
+    coalesced_writes: int = 0
+    # Writes rejected because the pending buffer was full.
+    dropped_writes: int = 0
+    written: int = 0
+    flushes: int = 0
+    failed_flushes: int = 0
+    last_flush_ms: float = 0.0
+    max_flush_ms: float = 0.0
+    invalidations_received: int = 0
+    worker_pid: int
+
+
+@router.get("/policy-cache/stats", response_model=PolicyCacheStatsResponse)
+async def policy_cache_stats(_: str = Depends(verify_admin_token)):
+    """Return PolicyCache hit-rate and flush-latency stats.
+
+    Counters are cumulative for the process lifetime and **per uvicorn
+    worker**, same caveat as `/webhook/stats`.
+    """
+    pid = os.getpid()
+    front = policy_cache_utils.installed_front()
+    if front is None:
+        return PolicyCacheStatsResponse(write_behind=False, worker_pid=pid)
+    return PolicyCacheStatsResponse(write_behind=True, worker_pid=pid, **front.stats())
+
+
+class UpstreamHttpStatsResponse(BaseModel):
+    """Occupancy and connect latency of the shared upstream (Anthropic API) HTTP pool."""
+
+    http2: bool
+    max_connections: int
+    max_keepalive_connections: int
+    # Snapshot of the pool right now. active = serving at least one request
+    # (an HTTP/2 connection may be serving several); idle = kept alive for reuse.
+    open_connections: int
+    active_connections: int
+    idle_connections: int
+    # Cumulative new connections (TCP connect through TLS handshake). A low
+    # count relative to request volume means keep-alive reuse is working.
+    connects: int
+    failed_connects: int
+    avg_connect_ms: float
+    last_connect_ms: float
+    max_connect_ms: float
+    worker_pid: int
+
+
+@router.get("/upstream-http/stats", response_model=UpstreamHttpStatsResponse)
+async def upstream_http_stats(_: str = Depends(verify_admin_token)):
+    """Return shared upstream HTTP pool occupancy and connect-time stats.
+
+    Counters are cumulative for the process lifetime and **per uvicorn
+    worker**, same caveat as `/webhook/stats`.
+    """
+    return UpstreamHttpStatsResponse(worker_pid=os.getpid(), **upstream_http.stats())
+
+
 __all__ = ["router"]
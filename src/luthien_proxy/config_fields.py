@@ -103,6 +103,22 @@ CONFIG_FIELDS: tuple[ConfigFieldMeta, ...] = (
         category="auth", db_settable=True, restart_required=False,
     ),
 
+    ConfigFieldMeta(
+        "credential_l1_cache_ttl_seconds", "CREDENTIAL_L1_CACHE_TTL_SECONDS", int, 30,
+        "Lifetime of in-process credential validation cache entries in front of the shared (Redis) cache. Bounds how long a replica can miss a cross-replica invalidation. 0 disables the in-process layer.",
+        category="auth", restart_required=True,
+    ),
+    ConfigFieldMeta(
+        "credential_l1_cache_max_entries", "CREDENTIAL_L1_CACHE_MAX_ENTRIES", int, 10_000,
+        "Maximum number of credentials held in the in-process validation cache (LRU eviction when exceeded)",
+        category="auth", restart_required=True,
+    ),
+    ConfigFieldMeta(
+        "credential_touch_flush_interval_seconds", "CREDENTIAL_TOUCH_FLUSH_INTERVAL_SECONDS", int, 30,
+        "How often buffered credential last_used_at updates are written to the shared cache. 0 writes them on every request.",
+        category="auth", restart_required=True,
+    ),
+
     # ── rate limiting ─────────────────────────────────────────────────────────
     ConfigFieldMeta(
         "rate_limit_rpm", "RATE_LIMIT_RPM", int, 0,
@@ -119,6 +135,31 @@ CONFIG_FIELDS: tuple[ConfigFieldMeta, ...] = (
         "Maximum number of per-key rate-limit buckets held in memory (LRU eviction when exceeded). Bounds memory under high key cardinality. Raise it if RATE_LIMIT_MAX_KEYS-exceeded eviction warnings appear in logs.",
         category="rate_limiting", restart_required=True,
     ),
+    ConfigFieldMeta(
+        "rate_limit_input_tpm", "RATE_LIMIT_INPUT_TPM", int, 0,
+        "Per-key input tokens per minute for /v1/messages (cached and uncached). Requests are admitted on an estimate from the request body and reconciled with the response usage. 0 disables.",
+        category="rate_limiting", restart_required=True,
+    ),
+    ConfigFieldMeta(
+        "rate_limit_output_tpm", "RATE_LIMIT_OUTPUT_TPM", int, 0,
+        "Per-key output tokens per minute for /v1/messages, charged from the response usage. 0 disables.",
+        category="rate_limiting", restart_required=True,
+    ),
+    ConfigFieldMeta(
+        "rate_limit_max_concurrent", "RATE_LIMIT_MAX_CONCURRENT", int, 0,
+        "Per-key maximum in-flight /v1/messages requests (streaming or not). 0 disables.",
+        category="rate_limiting", restart_required=True,
+    ),
+    ConfigFieldMeta(
+        "rate_limit_backend", "RATE_LIMIT_BACKEND", str, "memory",
+        "Where rate-limit buckets live: memory (per replica, effective limit is replicas x RPM) or redis (shared across replicas; requires REDIS_URL, falls back to memory without it).",
+        category="rate_limiting", restart_required=True,
+    ),
+    ConfigFieldMeta(
+        "rate_limit_local_lease", "RATE_LIMIT_LOCAL_LEASE", int, 5,
+        "Redis backend only: tokens a replica may take from the shared bucket in one round trip when the key is far below its limit, admitting the following requests locally. 1 disables local pre-admission.",
+        category="rate_limiting", restart_required=True,
+    ),
 
     # ── policy ────────────────────────────────────────────────────────────
     ConfigFieldMeta(
@@ -136,6 +177,11 @@ CONFIG_FIELDS: tuple[ConfigFieldMeta, ...] = (
         "Inject active policy names into the system message",
         category="policy", db_settable=True, restart_required=False,
     ),
+    ConfigFieldMeta(
+        "stream_passthrough", "STREAM_PASSTHROUGH", bool, True,
+        "Forward upstream SSE bytes unchanged for streaming requests when the active policy only observes stream events (e.g. NoOp, DebugLogging); events are parsed off the forwarding path for recording",
+        category="policy", db_settable=True, restart_required=False,
+    ),
     ConfigFieldMeta(
         "dogfood_mode", "DOGFOOD_MODE", bool, False,
         "Auto-compose DogfoodSafetyPolicy to prevent agents from killing the proxy",
@@ -146,6 +192,26 @@ CONFIG_FIELDS: tuple[ConfigFieldMeta, ...] = (
         "Max rows per policy namespace in PolicyCache (0 or negative disables the cap)",
         category="policy",
     ),
+    ConfigFieldMeta(
+        "policy_cache_write_behind", "POLICY_CACHE_WRITE_BEHIND", bool, False,
+        "Serve PolicyCache reads from an in-process LRU and coalesce writes into periodic batched flushes (with cross-replica invalidation over Redis when available). Writes not yet flushed are lost on crash.",
+        category="policy", restart_required=True,
+    ),
+    ConfigFieldMeta(
+        "policy_cache_l1_max_entries", "POLICY_CACHE_L1_MAX_ENTRIES", int, 10_000,
+        "Maximum number of PolicyCache entries held in memory across all policies (only used when POLICY_CACHE_WRITE_BEHIND is enabled)",
+        category="policy", restart_required=True,
+    ),
+    ConfigFieldMeta(
+        "policy_cache_l1_ttl_seconds", "POLICY_CACHE_L1_TTL_SECONDS", int, 60,
+        "Longest a PolicyCache entry is served from memory without rereading the database. Bounds how long a replica can miss a cross-replica invalidation.",
+        category="policy", restart_required=True,
+    ),
+    ConfigFieldMeta(
+        "policy_cache_flush_interval_seconds", "POLICY_CACHE_FLUSH_INTERVAL_SECONDS", float, 0.5,
+        "Maximum time in seconds a PolicyCache write waits in memory before being flushed to the database",
+        category="policy", restart_required=True,
+    ),
 
     # ── database ──────────────────────────────────────────────────────────
     ConfigFieldMeta(
@@ -153,6 +219,13 @@ CONFIG_FIELDS: tuple[ConfigFieldMeta, ...] = (
         "Database connection URL (sqlite:/// or postgres://)",
         sensitive=True, category="database",
     ),
+    ConfigFieldMeta(
+        "sqlite_read_connections", "SQLITE_READ_CONNECTIONS", int, 4,
+        "Read-only connections a SQLite database opens next to its single writer. "
+        "Reads outside a transaction use them, so history/session scans do not block "
+        "event writes. 0 serializes everything on the writer; ignored for Postgres",
+        category="database", restart_required=True,
+    ),
     ConfigFieldMeta(
         "redis_url", "REDIS_URL", str, "",
         "Redis connection URL (optional; enables multi-instance pub/sub) — may contain credentials",
@@ -185,6 +258,26 @@ CONFIG_FIELDS: tuple[ConfigFieldMeta, ...] = (
         "Max number of cached Anthropic client instances for passthrough auth",
         category="llm",
     ),
+    ConfigFieldMeta(
+        "upstream_http_max_connections", "UPSTREAM_HTTP_MAX_CONNECTIONS", int, 100,
+        "Max open connections in the shared upstream (Anthropic API) HTTP pool, per worker",
+        category="llm",
+    ),
+    ConfigFieldMeta(
+        "upstream_http_max_keepalive_connections", "UPSTREAM_HTTP_MAX_KEEPALIVE_CONNECTIONS", int, 20,
+        "Max idle connections the shared upstream HTTP pool keeps open for reuse",
+        category="llm",
+    ),
+    ConfigFieldMeta(
+        "upstream_http_keepalive_expiry_seconds", "UPSTREAM_HTTP_KEEPALIVE_EXPIRY_SECONDS", float, 60.0,
+        "Seconds an idle upstream connection is kept before it is closed",
+        category="llm",
+    ),
+    ConfigFieldMeta(
+        "upstream_http2", "UPSTREAM_HTTP2", bool, True,
+        "Use HTTP/2 for upstream connections when the h2 package is installed",
+        category="llm",
+    ),
 
     # ── security ──────────────────────────────────────────────────────────
     ConfigFieldMeta(
@@ -241,6 +334,31 @@ CONFIG_FIELDS: tuple[ConfigFieldMeta, ...] = (
         "Log full HTTP request and response bodies",
         category="observability",
     ),
+    ConfigFieldMeta(
+        "event_write_behind", "EVENT_WRITE_BEHIND", bool, False,
+        "Buffer conversation event DB writes in a bounded in-memory queue and flush them in multi-row batches (one transaction per flush) instead of one transaction per event. Queued events are lost on crash; events recorded while the queue is full are dropped and counted.",
+        category="observability",
+    ),
+    ConfigFieldMeta(
+        "event_write_queue_size", "EVENT_WRITE_QUEUE_SIZE", int, 10_000,
+        "Maximum number of events held in the write-behind queue (only used when EVENT_WRITE_BEHIND is enabled)",
+        category="observability",
+    ),
+    ConfigFieldMeta(
+        "event_write_flush_size", "EVENT_WRITE_FLUSH_SIZE", int, 200,
+        "Maximum number of events written per write-behind flush transaction",
+        category="observability",
+    ),
+    ConfigFieldMeta(
+        "event_write_flush_interval_seconds", "EVENT_WRITE_FLUSH_INTERVAL_SECONDS", float, 0.5,
+        "Maximum time in seconds an event waits in the write-behind queue before being flushed",
+        category="observability",
+    ),
+    ConfigFieldMeta(
+        "conversation_message_dedup", "CONVERSATION_MESSAGE_DEDUP", bool, False,
+        "Store each distinct request message once in a content-addressed table and reference it by sha256 digest from conversation event payloads, instead of embedding the full messages array in every event. History and debug views rehydrate transparently.",
+        category="observability",
+    ),
 
     # ── telemetry ─────────────────────────────────────────────────────────
     ConfigFieldMeta(
@@ -284,6 +402,26 @@ CONFIG_FIELDS: tuple[ConfigFieldMeta, ...] = (
         "rich payloads",
         category="retention",
     ),
+    ConfigFieldMeta(
+        "retention_archive_compression", "RETENTION_ARCHIVE_COMPRESSION", str, "gzip",
+        "Compression for archive objects: gzip (keys end in .jsonl.gz) or none",
+        category="retention",
+    ),
+    ConfigFieldMeta(
+        "retention_archive_segment_mb", "RETENTION_ARCHIVE_SEGMENT_MB", int, 64,
+        "Start a new archive object once the current one reaches this many MiB "
+        "(compressed). Batches stream into the object as a multipart upload; the "
+        "calls in it are deleted only after it is complete, so this also bounds "
+        "the work a failed run leaves to redo",
+        category="retention",
+    ),
+    ConfigFieldMeta(
+        "retention_archive_format", "RETENTION_ARCHIVE_FORMAT", str, "jsonl",
+        "Archive object format: jsonl, or parquet for analytics (one row per call "
+        "with typed model/user/token columns, Hive-partitioned by dt= and model= "
+        "under <prefix>calls/; needs pip install 'luthien-proxy[parquet]')",
+        category="retention",
+    ),
     ConfigFieldMeta(
         "retention_s3_encryption", "RETENTION_S3_ENCRYPTION", str, "AES256",
         "S3 server-side encryption: AES256, aws:kms, or 'bucket-default' to omit "
@@ -296,6 +434,15 @@ CONFIG_FIELDS: tuple[ConfigFieldMeta, ...] = (
         "KMS key ID for aws:kms encryption (required when RETENTION_S3_ENCRYPTION=aws:kms)",
         category="retention",
     ),
+    ConfigFieldMeta(
+        "retention_partition_premake_days", "RETENTION_PARTITION_PREMAKE_DAYS", int, 7,
+        "Days of daily partitions kept created ahead of today for conversation_events and "
+        "request_logs. Only used on Postgres after running "
+        "migrations/optional/postgres_partition_by_created_at.sql; a no-op otherwise. "
+        "Inserts fail if they run past the last partition, so keep this well above any "
+        "expected gateway downtime",
+        category="retention",
+    ),
 
     # ── webhook ───────────────────────────────────────────────────────────
     # NOTE: webhook_url is intentionally NOT db_settable=True (defaults to False).
@@ -2,14 +2,22 @@
 
 Manages configurable auth modes (client_key, passthrough, both) and validates
 Anthropic credentials via the free count_tokens endpoint, caching results.
+
+Validation results are cached in two tiers: a bounded in-process L1 (TTL +
+LRU) in front of the shared credential cache (Redis or in-process). An L1 hit
+answers without any I/O; ``last_used_at`` updates for L1 hits are buffered and
+written back periodically. Concurrent misses for the same credential share one
+upstream count_tokens call.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import logging
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, replace
 from enum import Enum
 from typing import TYPE_CHECKING, Any
@@ -24,7 +32,11 @@ from luthien_proxy.credentials.auth_provider import (
 )
 from luthien_proxy.credentials.credential import Credential, CredentialError, ServerCredentialNotFoundError
 from luthien_proxy.credentials.store import CredentialStore
-from luthien_proxy.utils.credential_cache import CredentialCacheProtocol
+from luthien_proxy.utils.credential_cache import (
+    INVALIDATE_ALL,
+    CredentialCacheProtocol,
+    CredentialInvalidationBusProtocol,
+)
 from luthien_proxy.utils.db import DatabasePool
 
 if TYPE_CHECKING:
@@ -45,6 +57,8 @@ VALIDATION_PAYLOAD = {
     "messages": [{"role": "user", "content": "hi"}],
 }
 
+DEFAULT_L1_MAX_ENTRIES = 10_000
+
 
 class AuthMode(str, Enum):
     """Authentication mode for the gateway."""
@@ -81,11 +95,60 @@ def hash_credential(api_key: str) -> str:
     return hashlib.sha256(api_key.encode()).hexdigest()
 
 
+class _L1Cache:
+    """Bounded in-process TTL + LRU map of key_hash -> CachedCredential.
+
+    Synchronous on purpose: every operation is a dict op, so it never yields
+    to the event loop and needs no lock.
+
+    ``generation`` is bumped by every ``discard``/``clear``. A fill computed
+    across an ``await`` passes the generation it started from, and ``put``
+    drops it if an invalidation landed in between.
+    """
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[CachedCredential, float]] = OrderedDict()
+        self.generation = 0
+
+    def get(self, key_hash: str) -> CachedCredential | None:
+        entry = self._entries.get(key_hash)
+        if entry is None:
+            return None
+        cached, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key_hash]
+            return None
+        self._entries.move_to_end(key_hash)
+        return cached
+
+    def put(self, cached: CachedCredential, ttl_seconds: float, *, generation: int | None = None) -> None:
+        if generation is not None and generation != self.generation:
+            return
+        expires_at = time.monotonic() + min(self._ttl_seconds, ttl_seconds)
+        self._entries[cached.key_hash] = (cached, expires_at)
+        self._entries.move_to_end(cached.key_hash)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, key_hash: str) -> None:
+        self.generation += 1
+        self._entries.pop(key_hash, None)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+
+
 class CredentialManager:
     """Manages auth configuration and credential validation caching.
 
     Auth config is stored in the `auth_config` DB table (single-row, id=1).
     Credential validation results are cached with configurable TTLs.
+
+    Background work (the ``last_used_at`` flush loop and the invalidation
+    subscriber) runs between ``start()`` and ``close()``.
     """
 
     def __init__(
@@ -93,6 +156,11 @@ class CredentialManager:
         db_pool: DatabasePool | None,
         cache: CredentialCacheProtocol | None,
         encryption_key: bytes | None = None,
+        *,
+        l1_ttl_seconds: float = 0,
+        l1_max_entries: int = DEFAULT_L1_MAX_ENTRIES,
+        touch_flush_interval_seconds: float = 0,
+        invalidation_bus: CredentialInvalidationBusProtocol | None = None,
     ):
         """Initialize with DB pool for config and credential cache.
 
@@ -100,9 +168,28 @@ class CredentialManager:
             db_pool: Database pool for auth config and server credentials.
             cache: Credential validation cache (Redis or in-process).
             encryption_key: Optional Fernet key for encrypting stored credentials.
+            l1_ttl_seconds: Lifetime of in-process L1 entries, capped by the
+                entry's validation TTL. 0 disables the L1 cache.
+            l1_max_entries: L1 capacity; least-recently-used entries are
+                evicted beyond it.
+            touch_flush_interval_seconds: When > 0, ``last_used_at`` updates
+                are buffered and written to ``cache`` every this many seconds
+                by the loop ``start()`` launches. 0 writes them inline on
+                every cache hit.
+            invalidation_bus: Optional cross-replica channel. Invalidations
+                are published on it, and announcements received on it drop
+                the matching L1 entries.
         """
+        if l1_max_entries < 1:
+            raise ValueError(f"l1_max_entries must be >= 1 (got {l1_max_entries})")
         self._db_pool = db_pool
         self._cache = cache
+        self._l1 = _L1Cache(ttl_seconds=l1_ttl_seconds, max_entries=l1_max_entries) if l1_ttl_seconds > 0 else None
+        self._touch_flush_interval_seconds = touch_flush_interval_seconds
+        self._pending_touches: dict[str, float] = {}
+        self._inflight: dict[tuple[str, bool], asyncio.Task[bool | None]] = {}
+        self._invalidation_bus = invalidation_bus
+        self._background_tasks: list[asyncio.Task[None]] = []
         self._config = AuthConfig(
             auth_mode=AuthMode.BOTH,
             validate_credentials=True,
@@ -205,11 +292,24 @@ class CredentialManager:
         logger.info(f"Auth config updated: mode={new_config.auth_mode.value} by {updated_by}")
         return self._config
 
+    def start(self) -> None:
+        """Start the ``last_used_at`` flush loop and the invalidation subscriber.
+
+        Both are optional and only started when configured. Idempotent.
+        """
+        if self._background_tasks:
+            return
+        if self._cache is not None and self._touch_flush_interval_seconds > 0:
+            self._background_tasks.append(asyncio.create_task(self._touch_flush_loop()))
+        if self._invalidation_bus is not None and self._l1 is not None:
+            self._background_tasks.append(asyncio.create_task(self._invalidation_bus.listen(self._on_invalidation)))
+
     async def validate_credential(self, credential: str, *, is_bearer: bool) -> bool:
         """Check if an Anthropic API key/token is valid.
 
-        Checks cache first. On miss, calls the free count_tokens
-        endpoint and caches the result.
+        Checks the L1 cache, then the shared cache. On miss, calls the free
+        count_tokens endpoint and caches the result; concurrent misses for
+        the same credential wait on a single upstream call.
 
         Args:
             credential: The API key or OAuth token value.
@@ -219,21 +319,26 @@ class CredentialManager:
         """
         key_hash = hash_credential(credential)
 
-        # Check cache
-        cached = await self._get_cached(key_hash)
+        cached = self._l1.get(key_hash) if self._l1 is not None else None
+        if cached is None:
+            generation = self._l1_generation()
+            cached = await self._get_cached(key_hash)
+            if cached is not None and self._l1 is not None:
+                self._l1.put(cached, self._ttl_for(cached.valid), generation=generation)
         if cached is not None:
-            await self._touch_last_used(key_hash)
+            if self._touch_flush_interval_seconds > 0:
+                self._pending_touches[key_hash] = time.time()
+            else:
+                await self._touch_last_used(key_hash)
             return cached.valid
 
-        # Cache miss - validate against Anthropic API
-        is_valid = await self._call_count_tokens(credential, is_bearer=is_bearer)
+        # Cache miss - validate against Anthropic API (single-flight per credential)
+        is_valid = await self._validate_upstream(credential, key_hash, is_bearer=is_bearer)
         if is_valid is None:
             # Inconclusive (network error, unexpected status, or OAuth bearer that
             # count_tokens can't validate). For OAuth tokens, pass through and let
             # Anthropic's messages endpoint decide. For API keys, block to be safe.
             return is_bearer
-        await self._cache_result(key_hash, is_valid)
-        logger.info(f"Credential validated: hash={key_hash[:16]}... valid={is_valid}")
         return is_valid
 
     async def on_backend_401(self, api_key: str) -> None:
@@ -248,6 +353,7 @@ class CredentialManager:
 
     async def invalidate_all(self) -> int:
         """Remove all cached credentials. Returns count deleted."""
+        await self._broadcast_invalidation(INVALIDATE_ALL)
         if self._cache is None:
             return 0
 
@@ -310,15 +416,55 @@ class CredentialManager:
             last_used_at=data.get("last_used_at", data["validated_at"]),
         )
 
-    async def _cache_result(self, key_hash: str, valid: bool) -> None:
-        if self._cache is None:
+    def _ttl_for(self, valid: bool) -> int:
+        return self._config.valid_cache_ttl_seconds if valid else self._config.invalid_cache_ttl_seconds
+
+    def _l1_generation(self) -> int:
+        return self._l1.generation if self._l1 is not None else 0
+
+    async def _cache_result(self, key_hash: str, valid: bool, *, generation: int) -> None:
+        if generation != self._l1_generation():
+            # An invalidation arrived while we were validating; the result may
+            # predate the revocation, so caching it (in L1 or back into the
+            # shared cache the invalidation just cleared) would resurrect it.
             return
         now = time.time()
-        ttl = self._config.valid_cache_ttl_seconds if valid else self._config.invalid_cache_ttl_seconds
+        ttl = self._ttl_for(valid)
+        if self._l1 is not None:
+            self._l1.put(CachedCredential(key_hash=key_hash, valid=valid, validated_at=now, last_used_at=now), ttl)
+        if self._cache is None:
+            return
         data = json.dumps({"valid": valid, "validated_at": now, "last_used_at": now})
         await self._cache.setex(f"{CACHE_KEY_PREFIX}{key_hash}", ttl, data)
 
-    async def _touch_last_used(self, key_hash: str) -> None:
+    async def _validate_upstream(self, credential: str, key_hash: str, *, is_bearer: bool) -> bool | None:
+        """Run (or join) the upstream validation for one credential.
+
+        The call runs in its own task and callers await it through
+        ``asyncio.shield``, so a client disconnect on whichever request
+        started it doesn't cancel the validation the others are waiting on.
+        """
+        flight_key = (key_hash, is_bearer)
+        task = self._inflight.get(flight_key)
+        if task is None:
+            task = asyncio.create_task(
+                self._validate_and_cache(credential, key_hash, is_bearer=is_bearer, generation=self._l1_generation())
+            )
+            self._inflight[flight_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(flight_key, None))
+        return await asyncio.shield(task)
+
+    async def _validate_and_cache(
+        self, credential: str, key_hash: str, *, is_bearer: bool, generation: int
+    ) -> bool | None:
+        is_valid = await self._call_count_tokens(credential, is_bearer=is_bearer)
+        if is_valid is None:
+            return None
+        await self._cache_result(key_hash, is_valid, generation=generation)
+        logger.info(f"Credential validated: hash={key_hash[:16]}... valid={is_valid}")
+        return is_valid
+
+    async def _touch_last_used(self, key_hash: str, used_at: float | None = None) -> None:
         """Update last_used_at without resetting TTL.
 
         Best-effort: the key could expire between get() and setex().
@@ -334,12 +480,41 @@ class CredentialManager:
         data = self._parse_cached_data(raw, f"{key_hash[:16]}...")
         if data is None:
             return
-        data["last_used_at"] = time.time()
+        data["last_used_at"] = used_at if used_at is not None else time.time()
         ttl = await self._cache.ttl(redis_key)
         if ttl > 0:
             await self._cache.setex(redis_key, ttl, json.dumps(data))
 
+    async def flush_touches(self) -> None:
+        """Write buffered ``last_used_at`` updates to the shared cache."""
+        pending, self._pending_touches = self._pending_touches, {}
+        for key_hash, used_at in pending.items():
+            try:
+                await self._touch_last_used(key_hash, used_at)
+            except Exception as e:
+                logger.warning(f"Failed to flush credential last_used_at: {repr(e)}")
+
+    async def _touch_flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._touch_flush_interval_seconds)
+            await self.flush_touches()
+
+    def _on_invalidation(self, key_hash: str) -> None:
+        if self._l1 is None:
+            return
+        if key_hash == INVALIDATE_ALL:
+            self._l1.clear()
+        else:
+            self._l1.discard(key_hash)
+
+    async def _broadcast_invalidation(self, key_hash: str) -> None:
+        self._on_invalidation(key_hash)
+        self._pending_touches.pop(key_hash, None)
+        if self._invalidation_bus is not None:
+            await self._invalidation_bus.publish(key_hash)
+
     async def _invalidate_key(self, key_hash: str) -> bool:
+        await self._broadcast_invalidation(key_hash)
         if self._cache is None:
             return False
         return await self._cache.delete(f"{CACHE_KEY_PREFIX}{key_hash}")
@@ -504,7 +679,16 @@ class CredentialManager:
         return await self._store.list_names()
 
     async def close(self) -> None:
-        """Clean up HTTP client."""
+        """Stop background tasks, flush buffered touches, and clean up the HTTP client."""
+        for task in self._background_tasks:
+            task.cancel()
+        for task in self._background_tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._background_tasks = []
+        await self.flush_touches()
         if self._http_client:
             await self._http_client.aclose()
             self._http_client = None
@@ -15,6 +15,7 @@ import logging
 import urllib.parse
 from typing import TYPE_CHECKING, Any
 
+from luthien_proxy.observability.message_store import rehydrate_payloads
 from luthien_proxy.utils.db import parse_db_ts
 
 if TYPE_CHECKING:
@@ -225,6 +226,8 @@ async def fetch_call_events(call_id: str, db_pool: DatabasePool) -> CallEventsRe
             """,
             call_id,
         )
+        payloads = [_parse_payload(row["payload"]) for row in rows]
+        await rehydrate_payloads(conn, payloads)
 
     if not rows:
         raise ValueError(f"No events found for call_id: {call_id}")
@@ -242,10 +245,10 @@ async def fetch_call_events(call_id: str, db_pool: DatabasePool) -> CallEventsRe
             event_type=str(row["event_type"]),
             timestamp=parse_db_ts(row["created_at"]).isoformat(),
             hook="",  # Not stored in schema
-            payload=_parse_payload(row["payload"]),
+            payload=payload,
             session_id=str(row["session_id"]) if row["session_id"] else None,
         )
-        for row in rows
+        for row, payload in zip(rows, payloads, strict=True)
     ]
 
     return CallEventsResponse(
@@ -284,6 +287,8 @@ async def fetch_call_diff(call_id: str, db_pool: DatabasePool) -> CallDiffRespon
             """,
             call_id,
         )
+        payloads = [_parse_payload(row["payload"]) for row in rows]
+        await rehydrate_payloads(conn, payloads)
 
     if not rows:
         raise ValueError(f"No events found for call_id: {call_id}")
@@ -292,9 +297,8 @@ async def fetch_call_diff(call_id: str, db_pool: DatabasePool) -> CallDiffRespon
     request_diff = None
     response_diff = None
 
-    for row in rows:
+    for row, payload in zip(rows, payloads, strict=True):
         event_type = str(row["event_type"])
-        payload = _parse_payload(row["payload"])
         if not payload:
             continue
 
@@ -18,7 +18,7 @@ from luthien_proxy.policy_core.anthropic_execution_interface import (
     AnthropicExecutionInterface,
 )
 from luthien_proxy.policy_manager import PolicyManager
-from luthien_proxy.rate_limit import TokenBucketRateLimiter
+from luthien_proxy.rate_limit import RateLimiterProtocol, UsageRateLimiter
 from luthien_proxy.usage_telemetry.collector import UsageCollector
 from luthien_proxy.utils import db
 from luthien_proxy.webhook.sender import WebhookSender
@@ -46,7 +46,8 @@ class Dependencies:
     enable_request_logging: bool = field(default=False)
     usage_collector: UsageCollector | None = field(default=None)
     config_registry: ConfigRegistry | None = field(default=None)
-    rate_limiter: TokenBucketRateLimiter | None = field(default=None)
+    rate_limiter: RateLimiterProtocol | None = field(default=None)
+    usage_rate_limiter: UsageRateLimiter | None = field(default=None)
     last_credential_info: dict[str, Any] = field(default_factory=dict)
     webhook_sender: WebhookSender | None = field(default=None)
 
@@ -203,11 +204,16 @@ def get_config_registry(request: Request) -> ConfigRegistry | None:
     return get_dependencies(request).config_registry
 
 
-def get_rate_limiter(request: Request) -> TokenBucketRateLimiter | None:
+def get_rate_limiter(request: Request) -> RateLimiterProtocol | None:
     """Get rate limiter from dependencies."""
     return get_dependencies(request).rate_limiter
 
 
+def get_usage_rate_limiter(request: Request) -> UsageRateLimiter | None:
+    """Get token/concurrency rate limiter from dependencies."""
+    return get_dependencies(request).usage_rate_limiter
+
+
 def get_webhook_sender(request: Request) -> WebhookSender | None:
     """Get webhook sender from dependencies."""
     return get_dependencies(request).webhook_sender
@@ -265,5 +271,6 @@ __all__ = [
     "get_config_registry",
     "require_config_registry",
     "get_rate_limiter",
+    "get_usage_rate_limiter",
     "get_webhook_sender",
 ]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import logging
 import secrets
 import time
@@ -24,16 +25,23 @@ from luthien_proxy.dependencies import (
     get_emitter,
     get_rate_limiter,
     get_usage_collector,
+    get_usage_rate_limiter,
     get_webhook_sender,
 )
-from luthien_proxy.llm import anthropic_client_cache
+from luthien_proxy.llm import anthropic_client_cache, upstream_http
 from luthien_proxy.llm.anthropic_client import AnthropicClient
 from luthien_proxy.observability.emitter import EventEmitterProtocol
 from luthien_proxy.pipeline import process_anthropic_request
 from luthien_proxy.policy_core.anthropic_execution_interface import (
     AnthropicExecutionInterface,
 )
-from luthien_proxy.rate_limit import TokenBucketRateLimiter
+from luthien_proxy.rate_limit import (
+    RateLimitDecision,
+    RateLimiterProtocol,
+    UsageRateLimiter,
+    UsageReservation,
+    estimate_input_tokens,
+)
 from luthien_proxy.usage_telemetry.collector import UsageCollector
 from luthien_proxy.utils import db
 from luthien_proxy.webhook.sender import WebhookSender
@@ -44,9 +52,9 @@ logger = logging.getLogger(__name__)
 
 ANTHROPIC_API_BASE = "https://api.anthropic.com"
 
-# Shared httpx client for the passthrough proxy.  Reusing a single client
-# avoids creating and tearing down a connection pool on every request.
-_passthrough_client = httpx.AsyncClient(timeout=30.0)
+# Per-request timeout for the /v1/* passthrough. Requests go through the
+# shared upstream pool (upstream_http), the same connections AnthropicClient uses.
+_PASSTHROUGH_TIMEOUT_SECONDS = 30.0
 
 
 # === AUTH ===
@@ -187,7 +195,7 @@ def _hashed_key_prefix(value: str) -> str:
 async def check_rate_limit(
     request: Request,
     credential: Credential = Depends(verify_token),
-    rate_limiter: TokenBucketRateLimiter | None = Depends(get_rate_limiter),
+    rate_limiter: RateLimiterProtocol | None = Depends(get_rate_limiter),
 ) -> None:
     """Enforce per-key rate limit.
 
@@ -211,20 +219,65 @@ async def check_rate_limit(
             decision.limit,
             decision.retry_after,
         )
-        raise HTTPException(
-            status_code=429,
-            detail="Rate limit exceeded",
-            headers={
-                "Retry-After": str(decision.retry_after),
-                "X-RateLimit-Limit": str(decision.limit),
-                "X-RateLimit-Remaining": "0",
-                "X-RateLimit-Reset": str(decision.reset_unix),
-            },
-        )
+        raise _rate_limit_exceeded(decision, "Rate limit exceeded")
 
     request.state.rate_limit_decision = decision
 
 
+def _rate_limit_exceeded(decision: RateLimitDecision, detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=429,
+        detail=detail,
+        headers={
+            "Retry-After": str(decision.retry_after),
+            "X-RateLimit-Limit": str(decision.limit),
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(decision.reset_unix),
+        },
+    )
+
+
+async def check_usage_limit(
+    request: Request,
+    credential: Credential,
+    usage_limiter: UsageRateLimiter | None,
+) -> UsageReservation | None:
+    """Enforce per-key token-per-minute and concurrency limits on /v1/messages.
+
+    Called from the route body rather than as a dependency: a reservation
+    taken during dependency resolution would leak (holding a concurrency
+    slot until it goes stale) whenever a later dependency raised, e.g. the
+    401 from ``resolve_anthropic_client``. Admits the request against an input-token estimate from the body and
+    returns the reservation, which the pipeline settles with the response's
+    ``usage`` (or releases on failure). Denials raise 429 with the same
+    Retry-After / X-RateLimit-* headers as ``check_rate_limit``, describing
+    the exhausted limit; admissions stash the decision on ``request.state``
+    for ``RateLimitHeaderMiddleware``, as ``check_rate_limit`` does.
+    """
+    if usage_limiter is None:
+        return None
+
+    try:
+        body = await request.json()
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        # Malformed bodies are rejected with a 400 by the pipeline.
+        body = None
+    estimated = estimate_input_tokens(body) if isinstance(body, dict) else 0
+
+    decision, reservation = await usage_limiter.acquire(credential.value, estimated)
+    if reservation is None:
+        logger.warning(
+            "Usage limit exceeded for key %s (limit=%d, estimated_input_tokens=%d, retry_after=%ds)",
+            _hashed_key_prefix(credential.value),
+            decision.limit,
+            estimated,
+            decision.retry_after,
+        )
+        raise _rate_limit_exceeded(decision, "Token or concurrency rate limit exceeded")
+    request.state.usage_limit_decision = decision
+    return reservation
+
+
 # === ROUTES ===
 
 
@@ -232,6 +285,8 @@ async def check_rate_limit(
 async def anthropic_messages(
     request: Request,
     _rate_limit: None = Depends(check_rate_limit),
+    credential: Credential = Depends(verify_token),
+    usage_limiter: UsageRateLimiter | None = Depends(get_usage_rate_limiter),
     client_and_credential: tuple[AnthropicClient, Credential | None] = Depends(resolve_anthropic_client),
     anthropic_policy: AnthropicExecutionInterface = Depends(get_anthropic_policy),
     emitter: EventEmitterProtocol = Depends(get_emitter),
@@ -243,19 +298,30 @@ async def anthropic_messages(
     """Anthropic Messages API endpoint (native Anthropic path)."""
     anthropic_client, forwarding_credential = client_and_credential
     deps = get_dependencies(request)
-    return await process_anthropic_request(
-        request=request,
-        policy=anthropic_policy,
-        anthropic_client=anthropic_client,
-        emitter=emitter,
-        db_pool=db_pool,
-        enable_request_logging=deps.enable_request_logging,
-        usage_collector=usage_collector,
-        user_credential=forwarding_credential,
-        credential_manager=credential_manager,
-        webhook_sender=webhook_sender,
-        inference_provider_registry=deps.inference_provider_registry,
-    )
+    # Every dependency has resolved, so from here on the reservation is
+    # either handed to the pipeline or released below.
+    usage_reservation = await check_usage_limit(request, credential, usage_limiter)
+    try:
+        return await process_anthropic_request(
+            request=request,
+            policy=anthropic_policy,
+            anthropic_client=anthropic_client,
+            emitter=emitter,
+            db_pool=db_pool,
+            enable_request_logging=deps.enable_request_logging,
+            usage_collector=usage_collector,
+            user_credential=forwarding_credential,
+            credential_manager=credential_manager,
+            webhook_sender=webhook_sender,
+            inference_provider_registry=deps.inference_provider_registry,
+            usage_reservation=usage_reservation,
+        )
+    except BaseException:
+        # Failed before a response existed to settle it (streaming responses
+        # settle when the stream ends, non-streaming ones before returning).
+        if usage_reservation is not None:
+            usage_reservation.release()
+        raise
 
 
 # IMPORTANT: This catch-all MUST be registered after /v1/messages to avoid
@@ -284,12 +350,14 @@ async def proxy_passthrough(
     body = await request.body()
 
     try:
-        upstream_response = await _passthrough_client.request(
+        upstream_response = await upstream_http.shared_http_client().request(
             method=request.method,
             url=upstream_url,
             headers=forward_headers,
             content=body if body else None,
             params=dict(request.query_params),
+            timeout=_PASSTHROUGH_TIMEOUT_SECONDS,
+            follow_redirects=False,
         )
     except httpx.RequestError as e:
         logger.warning("Proxy passthrough error for /v1/%s: %s", path, repr(e))
@@ -104,18 +104,15 @@ class SessionSearchParams(BaseModel):
         as-is (see the validator below). When ``user_id`` is also set, "last
         activity" is scoped to *that user's* events in the session, not the
         session's last activity overall.
-      - q: full-text content search over indexed conversation text. Postgres
-        uses the ``search_vector`` tsvector column; SQLite uses the
-        ``conversation_events_fts`` FTS5 table. Both are porter-stemmed and
-        treat the query as a conjunction of terms (see ``utils.search``). A
-        session matches if any of its events matches.
+      - q: full-text content search over the ``session_search_index`` table,
+        which holds the new user text of each request and the assistant text
+        of each response. Both backends are porter-stemmed and treat the query
+        as a conjunction of terms (see ``utils.search``). A session matches if
+        all terms appear in one of those entries. The index is built from the
+        client's ``original_request``, so gateway-injected policy context is
+        not searchable.
       - policy_intervention: when True, restrict to sessions with at least one
         policy intervention.
-
-    Known limitation (tracked separately): the search corpus is built from
-    ``final_request`` text, which includes gateway-injected ``<policy-context>``
-    blocks. Queries for policy-context terms can therefore over-match on
-    sessions that ran under an output-modifying policy.
     """
 
     model: str | None = None
@@ -153,13 +150,17 @@ class SessionListResponse(BaseModel):
     """Response for session list endpoint."""
 
     sessions: list[SessionSummary]
-    total: int  # Total count of sessions matching the active filters (all sessions when unfiltered)
+    # Total count of sessions matching the active filters (all sessions when
+    # unfiltered). Served from a short-lived cache, so it can lag new sessions
+    # by a few seconds; has_more is exact.
+    total: int
     offset: int = 0  # Current offset for pagination
     has_more: bool = False  # Whether there are more sessions after this page
+    next_cursor: str | None = None  # Opaque keyset cursor for the next page (set when has_more)
 
 
 class SessionDetail(BaseModel):
-    """Full session detail for conversation view."""
+    """Session detail for conversation view, with all turns or a requested range."""
 
     session_id: str
     first_timestamp: str
@@ -167,6 +168,8 @@ class SessionDetail(BaseModel):
     turns: list[ConversationTurn]
     total_policy_interventions: int
     models_used: list[str]
+    turn_offset: int = 0  # Session index of turns[0] when a turn range was requested
+    total_turns: int | None = None  # Turns in the whole session (set by fetch_session_detail)
 
 
 __all__ = [
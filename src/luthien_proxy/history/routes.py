@@ -3,7 +3,7 @@
 Provides endpoints for:
 - Listing recent sessions
 - Viewing session details
-- Exporting sessions to markdown
+- Exporting sessions to markdown and JSONL
 - HTML UI pages
 """
 
@@ -14,12 +14,13 @@ import os
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from fastapi.responses import FileResponse, PlainTextResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from luthien_proxy.auth import check_auth_or_redirect, verify_admin_token
 from luthien_proxy.dependencies import get_admin_key, get_db_pool
 from luthien_proxy.utils.constants import (
+    HISTORY_SESSION_TURNS_MAX_LIMIT,
     HISTORY_SESSIONS_DEFAULT_LIMIT,
     HISTORY_SESSIONS_MAX_LIMIT,
 )
@@ -27,7 +28,13 @@ from luthien_proxy.utils.db import DatabasePool
 
 from . import user_labels as user_labels_service
 from .models import SessionDetail, SessionListResponse, SessionSearchParams
-from .service import export_session_jsonl, export_session_markdown, fetch_session_detail, fetch_session_list
+from .service import (
+    fetch_session_detail,
+    fetch_session_list,
+    fetch_session_outline,
+    stream_session_jsonl,
+    stream_session_markdown,
+)
 
 
 class UserLabelRequest(BaseModel):
@@ -86,6 +93,13 @@ async def list_sessions(
         ge=0,
         description="Number of sessions to skip for pagination",
     ),
+    cursor: str | None = Query(
+        default=None,
+        description=(
+            "Keyset cursor: pass next_cursor from the previous page to continue after it. "
+            "Cheaper than a large offset on long histories."
+        ),
+    ),
     user_id: str | None = Query(
         default=None,
         description=(
@@ -115,9 +129,8 @@ async def list_sessions(
         default=None,
         description=(
             "Full-text content search over conversation text (porter-stemmed, "
-            "terms ANDed). A session matches if any turn matches. Note: the index "
-            "currently includes gateway-injected policy-context text, so queries "
-            "for policy-context terms may over-match on policy-active sessions."
+            "terms ANDed). A session matches if one turn's new user text or one "
+            "assistant response contains every term."
         ),
     ),
     policy_intervention: bool = Query(
@@ -129,9 +142,10 @@ async def list_sessions(
 
     Returns a list of session summaries ordered by most recent activity,
     including turn counts, policy interventions, and models used.
-    Supports pagination via limit and offset, plus optional server-side
-    filters (user_id, model, from/to time range, full-text q, policy_intervention).
-    ``total`` reflects the count after filters are applied.
+    Supports pagination via limit and offset or the keyset ``cursor`` returned
+    as ``next_cursor``, plus optional server-side filters (user_id, model,
+    from/to time range, full-text q, policy_intervention). ``total`` reflects
+    the count after filters are applied.
     """
     search = SessionSearchParams(
         model=model,
@@ -140,7 +154,10 @@ async def list_sessions(
         q=q,
         policy_intervention=policy_intervention,
     )
-    return await fetch_session_list(limit, db_pool, offset, user_id=user_id, search=search)
+    try:
+        return await fetch_session_list(limit, db_pool, offset, user_id=user_id, search=search, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from None
 
 
 # --- User labels ---
@@ -200,47 +217,57 @@ async def delete_user_label(
 @api_router.get("/sessions/{session_id}", response_model=SessionDetail)
 async def get_session(
     session_id: str,
+    offset: int = Query(default=0, ge=0, description="Index of the first turn to return"),
+    limit: int | None = Query(
+        default=None,
+        ge=1,
+        le=HISTORY_SESSION_TURNS_MAX_LIMIT,
+        description="Maximum number of turns to return (all remaining turns when omitted)",
+    ),
     _: str = Depends(verify_admin_token),
     db_pool: DatabasePool = Depends(get_db_pool),
 ) -> SessionDetail:
-    """Get full session detail with conversation turns.
+    """Get session detail with conversation turns.
 
-    Returns the complete conversation history for a session,
-    including all messages, tool calls, and policy annotations.
+    Returns the conversation history for a session, including messages,
+    tool calls, and policy annotations. ``offset``/``limit`` select a range
+    of turns so long sessions can be loaded incrementally; the header fields
+    and ``total_turns`` always describe the whole session.
     """
     try:
-        return await fetch_session_detail(session_id, db_pool)
+        return await fetch_session_detail(session_id, db_pool, offset=offset, limit=limit)
     except ValueError as e:
         logger.warning(f"Session not found: {repr(e)}")
         raise HTTPException(status_code=404, detail="Session not found.") from None
 
 
+def _attachment_headers(session_id: str, extension: str) -> dict[str, str]:
+    # Sanitize session_id for filename
+    safe_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in session_id)
+    return {"Content-Disposition": f'attachment; filename="conversation_{safe_id}.{extension}"'}
+
+
 @api_router.get("/sessions/{session_id}/export")
 async def export_session(
     session_id: str,
     _: str = Depends(verify_admin_token),
     db_pool: DatabasePool = Depends(get_db_pool),
-) -> PlainTextResponse:
+) -> StreamingResponse:
     """Export session as markdown.
 
     Returns the conversation history formatted as a markdown document,
-    suitable for saving or sharing.
+    suitable for saving or sharing. The document is streamed turn by turn.
     """
     try:
-        session = await fetch_session_detail(session_id, db_pool)
+        outline = await fetch_session_outline(session_id, db_pool)
     except ValueError as e:
         logger.warning(f"Session not found for export: {repr(e)}")
         raise HTTPException(status_code=404, detail="Session not found.") from None
 
-    markdown = export_session_markdown(session)
-
-    # Sanitize session_id for filename
-    safe_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in session_id)
-
-    return PlainTextResponse(
-        content=markdown,
+    return StreamingResponse(
+        stream_session_markdown(outline, db_pool),
         media_type="text/markdown",
-        headers={"Content-Disposition": f'attachment; filename="conversation_{safe_id}.md"'},
+        headers=_attachment_headers(session_id, "md"),
     )
 
 
@@ -249,25 +276,22 @@ async def export_session_jsonl_endpoint(
     session_id: str,
     _: str = Depends(verify_admin_token),
     db_pool: DatabasePool = Depends(get_db_pool),
-) -> PlainTextResponse:
+) -> StreamingResponse:
     """Export session as JSONL (one JSON line per turn).
 
     Returns the conversation history as JSONL, suitable for
-    programmatic analysis and log ingestion.
+    programmatic analysis and log ingestion. Lines are streamed as
+    turns are built.
     """
     try:
-        session = await fetch_session_detail(session_id, db_pool)
+        outline = await fetch_session_outline(session_id, db_pool)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e)) from None
 
-    jsonl = export_session_jsonl(session)
-
-    safe_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in session_id)
-
-    return PlainTextResponse(
-        content=jsonl,
+    return StreamingResponse(
+        stream_session_jsonl(outline, db_pool),
         media_type="application/x-ndjson",
-        headers={"Content-Disposition": f'attachment; filename="conversation_{safe_id}.jsonl"'},
+        headers=_attachment_headers(session_id, "jsonl"),
     )
 
 
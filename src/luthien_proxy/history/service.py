@@ -2,19 +2,29 @@
 
 Provides pure business logic for:
 - Fetching session lists with summaries
-- Fetching full session details with conversation turns
-- Exporting sessions to markdown format
+- Fetching session details with a range of conversation turns
+- Exporting sessions to markdown and JSONL, whole or streamed turn by turn
 """
 
 from __future__ import annotations
 
+import base64
 import json
 import logging
 import re
+import time
+import weakref
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, TypedDict, cast
 
-from luthien_proxy.utils.db import DatabasePool, parse_db_ts
+from luthien_proxy.observability.message_store import rehydrate_payloads
+from luthien_proxy.utils.constants import (
+    HISTORY_SESSION_TURNS_PAGE_SIZE,
+    HISTORY_SESSIONS_TOTAL_CACHE_TTL_SECONDS,
+)
+from luthien_proxy.utils.db import ConnectionProtocol, DatabasePool, parse_db_ts
 from luthien_proxy.utils.search import session_fts_filter_sql
 
 from .models import (
@@ -354,6 +364,13 @@ def _extract_preview_message(payload: dict[str, Any] | str | None) -> str | None
     return None
 
 
+async def _extract_preview_messages(conn: ConnectionProtocol, payloads: list[_PreviewPayload]) -> list[str | None]:
+    """Batch version of ``_extract_preview_message`` that resolves message blob refs first."""
+    parsed = [_safe_parse_json(p) if isinstance(p, str) else p for p in payloads]
+    await rehydrate_payloads(conn, [p for p in parsed if p])
+    return [_extract_preview_message(p) for p in parsed]
+
+
 # A "real" policy intervention is any policy.* event that is not a judge
 # lifecycle/evaluation event. This predicate (over alias ``ce``) is the single
 # source of truth — consumed by both the per-session stat aggregate and the
@@ -378,7 +395,7 @@ def _build_session_filter_sql(
     db_pool: DatabasePool,
     args: list[Any],
     *,
-    user_scope_sql: str = "",
+    user_id_placeholder: str | None = None,
 ) -> tuple[list[str], list[str]]:
     """Build session-qualifying WHERE gates and HAVING clauses for a search.
 
@@ -392,11 +409,11 @@ def _build_session_filter_sql(
       models, policy_interventions) stay correct.
     * ``having`` are aggregate predicates ANDed into ``GROUP BY ... HAVING``.
 
-    ``user_scope_sql`` (when non-empty) is an ``AND ce.call_id IN (...)`` clause
-    using an already-allocated user_id placeholder; it is appended inside the
-    model/q gate subqueries so a session can only qualify on *this* user's
-    events. The time/policy HAVING clauses need no scoping — they run over the
-    caller's session_stats, which is already user-scoped.
+    ``user_id_placeholder`` (when set) is an already-allocated user_id
+    placeholder; the model/q gate subqueries are restricted to that user's
+    calls so a session can only qualify on *this* user's events. The
+    time/policy HAVING clauses need no scoping — they run over the caller's
+    session_stats, which is already user-scoped.
 
     SECURITY INVARIANT: every user-supplied value is bound via ``args`` and
     referenced only by a ``$N`` placeholder the builder controls; no user input
@@ -410,14 +427,19 @@ def _build_session_filter_sql(
         args.append(value)
         return f"${len(args)}"
 
+    def user_scope(alias: str) -> str:
+        if user_id_placeholder is None:
+            return ""
+        return f" AND {alias}.call_id IN (SELECT call_id FROM conversation_calls WHERE user_id = {user_id_placeholder})"
+
     if search.model is not None:
         model_col = "ce.payload->>'final_model'" if db_pool.is_postgres else "json_extract(ce.payload, '$.final_model')"
         placeholder = add_param(search.model)
         where_gates.append(
             "ce.session_id IN ("
             "SELECT ce.session_id FROM conversation_events ce "
-            f"WHERE ce.event_type = 'transaction.request_recorded' AND {model_col} = {placeholder} "
-            f"{user_scope_sql})"
+            f"WHERE ce.event_type = 'transaction.request_recorded' AND {model_col} = {placeholder}"
+            f"{user_scope('ce')})"
         )
 
     if search.q and search.q.strip():
@@ -427,7 +449,7 @@ def _build_session_filter_sql(
         fragment, bind_value = session_fts_filter_sql(db_pool, search.q, placeholder=placeholder)
         add_param(bind_value)
         where_gates.append(
-            f"ce.session_id IN (SELECT ce.session_id FROM conversation_events ce WHERE {fragment} {user_scope_sql})"
+            f"ce.session_id IN (SELECT si.session_id FROM session_search_index si WHERE {fragment}{user_scope('si')})"
         )
 
     if search.from_time is not None:
@@ -454,6 +476,248 @@ def _having_clause(having: list[str]) -> str:
     return ("HAVING " + " AND ".join(having)) if having else ""
 
 
+def _encode_session_cursor(last_ts: Any, session_id: str) -> str:
+    """Encode a keyset position (last activity, session_id) as an opaque cursor.
+
+    ``last_ts`` is kept in the backend's own representation (a datetime on
+    Postgres, the stored ISO text on SQLite) so the next page compares against
+    exactly the value that was read.
+    """
+    raw_ts = last_ts.isoformat() if isinstance(last_ts, datetime) else str(last_ts)
+    return base64.urlsafe_b64encode(json.dumps([raw_ts, session_id]).encode()).decode()
+
+
+def _decode_session_cursor(cursor: str, db_pool: DatabasePool) -> tuple[Any, str]:
+    """Decode a cursor from :func:`_encode_session_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw_ts, session_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(raw_ts, str) or not isinstance(session_id, str):
+            raise TypeError("cursor fields must be strings")
+        last_ts: Any = datetime.fromisoformat(raw_ts) if db_pool.is_postgres else raw_ts
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid session list cursor: {cursor!r}") from e
+    return last_ts, session_id
+
+
+def _cursor_predicate(ts_expr: str, id_expr: str, cursor: tuple[Any, str], args: list[Any]) -> str:
+    """Keyset predicate selecting rows strictly after ``cursor`` in ``(ts DESC, id DESC)`` order."""
+    args.append(cursor[0])
+    ts_placeholder = f"${len(args)}"
+    args.append(cursor[1])
+    id_placeholder = f"${len(args)}"
+    return f"({ts_expr} < {ts_placeholder} OR ({ts_expr} = {ts_placeholder} AND {id_expr} < {id_placeholder}))"
+
+
+# Session totals per pool, keyed by the active filters: key -> (expires_at, total).
+# Weak on the pool so a closed pool's entries go with it.
+_session_total_cache: weakref.WeakKeyDictionary[DatabasePool, dict[tuple[Any, ...], tuple[float, int]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _clear_session_total_cache() -> None:
+    """Drop every cached session total (tests and admin tooling)."""
+    _session_total_cache.clear()
+
+
+async def _cached_session_total(
+    db_pool: DatabasePool,
+    key: tuple[Any, ...],
+    count: Callable[[], Awaitable[Any]],
+) -> int:
+    """Return the session total for ``key``, running ``count`` at most once per TTL."""
+    now = time.monotonic()
+    entries = _session_total_cache.setdefault(db_pool, {})
+    cached = entries.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    value = await count()
+    total = int(value) if value is not None else 0
+    # Arbitrary from/to bounds make the key space unbounded; drop expired
+    # entries whenever a new one is stored.
+    for stale in [k for k, (expires_at, _) in entries.items() if expires_at <= now]:
+        del entries[stale]
+    entries[key] = (now + HISTORY_SESSIONS_TOTAL_CACHE_TTL_SECONDS, total)
+    return total
+
+
+def _escape_like(value: str) -> str:
+    r"""Escape LIKE metacharacters for a pattern declared with ``ESCAPE '\'``."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _build_summary_filter_sql(search: SessionSearchParams, db_pool: DatabasePool, args: list[Any]) -> list[str]:
+    """WHERE predicates over ``session_summaries ss`` for the filters it can answer.
+
+    Covers ``model`` (membership in the comma-joined ``models_used``),
+    ``from_time``/``to_time`` (on ``last_seen``) and ``policy_intervention``.
+    ``q`` needs the event-level search index and is not handled here. Values
+    are bound through ``args`` exactly as in :func:`_build_session_filter_sql`.
+    """
+    where: list[str] = []
+
+    def add_param(value: Any) -> str:
+        args.append(value)
+        return f"${len(args)}"
+
+    if search.model is not None:
+        placeholder = add_param(f"%,{_escape_like(search.model)},%")
+        where.append(f"',' || ss.models_used || ',' LIKE {placeholder} ESCAPE '\\'")
+
+    if search.from_time is not None:
+        placeholder = add_param(search.from_time if db_pool.is_postgres else search.from_time.isoformat())
+        where.append(f"ss.last_seen >= {placeholder}")
+
+    if search.to_time is not None:
+        placeholder = add_param(search.to_time if db_pool.is_postgres else search.to_time.isoformat())
+        where.append(f"ss.last_seen <= {placeholder}")
+
+    if search.policy_intervention:
+        where.append("ss.policy_event_count > 0")
+
+    return where
+
+
+def _where_clause(where: list[str]) -> str:
+    """Render predicates as a ``WHERE ...`` clause or ``""``."""
+    return ("WHERE " + " AND ".join(where)) if where else ""
+
+
+async def _fetch_page_previews(
+    conn: ConnectionProtocol,
+    db_pool: DatabasePool,
+    session_ids: list[str],
+    *,
+    user_id: str | None = None,
+) -> dict[str, str | None]:
+    """Preview message per session on a page, from its first non-probe request.
+
+    When ``user_id`` is set only that user's calls are considered, so a preview
+    can't leak content from another user sharing the session_id.
+    """
+    placeholders = ", ".join(f"${i + 1}" for i in range(len(session_ids)))
+    args: list[Any] = list(session_ids)
+    user_call_filter = ""
+    if user_id is not None:
+        args.append(user_id)
+        user_call_filter = f"AND ce.call_id IN (SELECT call_id FROM conversation_calls WHERE user_id = ${len(args)})"
+
+    if db_pool.is_postgres:
+        # Skip probe requests: max_tokens=1 means internal probe (token counting, quota).
+        # COALESCE to 2 so requests without max_tokens are not skipped.
+        query = f"""
+            SELECT DISTINCT ON (ce.session_id) ce.session_id, ce.payload as request_payload
+            FROM conversation_events ce
+            WHERE ce.session_id IN ({placeholders})
+            AND ce.event_type = 'transaction.request_recorded'
+            AND COALESCE((ce.payload->'final_request'->>'max_tokens')::int, 2) > 1
+            {user_call_filter}
+            ORDER BY ce.session_id, ce.created_at ASC
+            """
+    else:
+        query = f"""
+            SELECT ce.session_id, ce.payload as request_payload
+            FROM conversation_events ce
+            WHERE ce.session_id IN ({placeholders})
+            AND ce.event_type = 'transaction.request_recorded'
+            AND COALESCE(
+                CAST(json_extract(ce.payload, '$.final_request.max_tokens') AS INTEGER),
+                2
+            ) > 1
+            {user_call_filter}
+            ORDER BY ce.session_id, ce.created_at ASC
+            """
+    rows = await conn.fetch(query, *args)
+
+    # Rows are ordered by created_at within each session, so the first
+    # row seen per session is its earliest qualifying request.
+    first_preview_payloads: dict[str, _PreviewPayload] = {}
+    for r in rows:
+        first_preview_payloads.setdefault(str(r["session_id"]), cast(_PreviewPayload, r["request_payload"]))
+    previews = await _extract_preview_messages(conn, list(first_preview_payloads.values()))
+    return dict(zip(first_preview_payloads, previews, strict=True))
+
+
+async def _fetch_page_user_ids(
+    conn: ConnectionProtocol,
+    session_ids: list[str],
+    *,
+    user_id: str | None = None,
+) -> dict[str, list[str]]:
+    """Distinct user_ids per session on a page.
+
+    Never collapse via MIN/MAX, that lies on multi-user sessions. Returned as a
+    list so the consumer can render mixed-identity sessions honestly. When a
+    user filter is in effect we constrain to that user so the response doesn't
+    leak the *existence* of other users sharing the session.
+    """
+    placeholders = ", ".join(f"${i + 1}" for i in range(len(session_ids)))
+    if user_id is not None:
+        user_id_filter_clause = f"AND cc.user_id = ${len(session_ids) + 1}"
+        user_id_args: list[Any] = [user_id]
+    else:
+        user_id_filter_clause = ""
+        user_id_args = []
+    rows = await conn.fetch(
+        f"""
+        SELECT DISTINCT ce.session_id, cc.user_id
+        FROM conversation_events ce
+        JOIN conversation_calls cc ON ce.call_id = cc.call_id
+        WHERE ce.session_id IN ({placeholders})
+        AND cc.user_id IS NOT NULL
+        {user_id_filter_clause}
+        """,
+        *session_ids,
+        *user_id_args,
+    )
+    user_ids_by_session: dict[str, list[str]] = {}
+    for r in rows:
+        bucket = user_ids_by_session.setdefault(str(r["session_id"]), [])
+        uid = str(r["user_id"])
+        if uid not in bucket:
+            bucket.append(uid)
+    return user_ids_by_session
+
+
+def _build_session_list_response(
+    rows: list[Any],
+    limit: int,
+    offset: int,
+    total: int,
+    *,
+    models_by_session: dict[str, list[str]],
+    preview_by_session: dict[str, str | None],
+    user_ids_by_session: dict[str, list[str]],
+) -> SessionListResponse:
+    """Assemble a page from ``limit + 1`` fetched rows (the extra row only signals ``has_more``)."""
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    sessions = [
+        SessionSummary(
+            session_id=str(row["session_id"]),
+            first_timestamp=parse_db_ts(row["first_ts"]).isoformat(),
+            last_timestamp=parse_db_ts(row["last_ts"]).isoformat(),
+            turn_count=int(row["turn_count"]),  # type: ignore[arg-type]
+            total_events=int(row["total_events"]),  # type: ignore[arg-type]
+            policy_interventions=int(row["policy_interventions"]),  # type: ignore[arg-type]
+            models_used=models_by_session.get(str(row["session_id"]), []),
+            preview_message=preview_by_session.get(str(row["session_id"])),
+            user_ids=user_ids_by_session.get(str(row["session_id"]), []),
+        )
+        for row in rows
+    ]
+    next_cursor = (
+        _encode_session_cursor(rows[-1]["last_ts"], str(rows[-1]["session_id"])) if has_more and rows else None
+    )
+    return SessionListResponse(
+        sessions=sessions, total=total, offset=offset, has_more=has_more, next_cursor=next_cursor
+    )
+
+
 async def fetch_session_list(
     limit: int,
     db_pool: DatabasePool,
@@ -461,9 +725,15 @@ async def fetch_session_list(
     *,
     user_id: str | None = None,
     search: SessionSearchParams | None = None,
+    cursor: str | None = None,
 ) -> SessionListResponse:
     """Fetch list of recent sessions with summaries.
 
+    Sessions are read from the ``session_summaries`` table unless a filter it
+    can't answer is active: ``user_id`` (the summary only records the first
+    user of a session, and per-user stats must be scoped to that user's events)
+    and full-text ``q`` fall back to aggregating ``conversation_events``.
+
     Args:
         limit: Maximum number of sessions to return
         db_pool: Database connection pool
@@ -471,16 +741,137 @@ async def fetch_session_list(
         user_id: If provided, only return sessions whose conversation_calls
             row has this exact user_id. Used to attribute traffic per user.
         search: Optional server-side filters (model, time range, full-text
-            ``q``, policy_intervention). When None/empty the unfiltered hot path
-            runs unchanged. ``total`` reflects the filtered count.
+            ``q``, policy_intervention). ``total`` reflects the filtered count.
+        cursor: ``next_cursor`` from a previous page. Resumes after that page's
+            last session (keyset pagination on last activity, session_id), so
+            deep pages cost the same as the first. Applied before ``offset``.
 
     Returns:
         List of session summaries ordered by most recent activity
+
+    Raises:
+        ValueError: If ``cursor`` is malformed.
     """
     search = search or SessionSearchParams()
+    keyset = _decode_session_cursor(cursor, db_pool) if cursor is not None else None
+    if user_id is None and not (search.q and search.q.strip()):
+        return await _fetch_session_list_summaries(limit, db_pool, offset, search=search, keyset=keyset)
     if db_pool.is_sqlite:
-        return await _fetch_session_list_sqlite(limit, db_pool, offset, user_id=user_id, search=search)
-    return await _fetch_session_list_pg(limit, db_pool, offset, user_id=user_id, search=search)
+        return await _fetch_session_list_sqlite(limit, db_pool, offset, user_id=user_id, search=search, keyset=keyset)
+    return await _fetch_session_list_pg(limit, db_pool, offset, user_id=user_id, search=search, keyset=keyset)
+
+
+async def _fetch_session_list_summaries(
+    limit: int,
+    db_pool: DatabasePool,
+    offset: int = 0,
+    *,
+    search: SessionSearchParams,
+    keyset: tuple[Any, str] | None = None,
+) -> SessionListResponse:
+    """Read a page from ``session_summaries`` (same SQL on both backends).
+
+    The page is an index range scan on ``(last_seen, session_id)``; only the
+    page's sessions are touched afterwards, for previews and user_ids. Turn
+    count is the summary's ``call_count`` (one per recorded request).
+    """
+    # SECURITY INVARIANT: every search value and the cursor are bound as query
+    # parameters, never interpolated into the SQL string.
+    async with db_pool.connection() as conn:
+        count_args: list[Any] = []
+        count_where = _where_clause(_build_summary_filter_sql(search, db_pool, count_args))
+        total = await _cached_session_total(
+            db_pool,
+            ("summaries", search.model, search.from_time, search.to_time, search.policy_intervention),
+            lambda: conn.fetchval(f"SELECT COUNT(*) FROM session_summaries ss {count_where}", *count_args),
+        )
+
+        query_args: list[Any] = [limit + 1, offset]
+        where = _build_summary_filter_sql(search, db_pool, query_args)
+        if keyset is not None:
+            where.append(_cursor_predicate("ss.last_seen", "ss.session_id", keyset, query_args))
+        rows = await conn.fetch(
+            f"""
+            SELECT
+                ss.session_id,
+                ss.first_seen as first_ts,
+                ss.last_seen as last_ts,
+                ss.event_count as total_events,
+                ss.call_count as turn_count,
+                ss.policy_event_count as policy_interventions,
+                ss.models_used
+            FROM session_summaries ss
+            {_where_clause(where)}
+            ORDER BY ss.last_seen DESC, ss.session_id DESC
+            LIMIT $1 OFFSET $2
+            """,
+            *query_args,
+        )
+        if not rows:
+            return SessionListResponse(sessions=[], total=total, offset=offset, has_more=False)
+
+        session_ids = [str(row["session_id"]) for row in rows[:limit]]
+        preview_by_session = await _fetch_page_previews(conn, db_pool, session_ids)
+        user_ids_by_session = await _fetch_page_user_ids(conn, session_ids)
+
+    models_by_session = {
+        str(row["session_id"]): str(row["models_used"]).split(",") for row in rows if row["models_used"]
+    }
+    return _build_session_list_response(
+        list(rows),
+        limit,
+        offset,
+        total,
+        models_by_session=models_by_session,
+        preview_by_session=preview_by_session,
+        user_ids_by_session=user_ids_by_session,
+    )
+
+
+async def _count_sessions_aggregate(
+    conn: ConnectionProtocol,
+    db_pool: DatabasePool,
+    *,
+    user_id: str | None,
+    search: SessionSearchParams,
+) -> Any:
+    """Count sessions by aggregating ``conversation_events`` (user_id / q filters)."""
+    # Count sessions that survive the same qualifying gates + HAVING as the
+    # page query. user_id (when set) is $1 here.
+    count_args: list[Any] = []
+    count_user_filter = ""
+    if user_id is not None:
+        count_args.append(user_id)
+        count_user_filter = "AND ce.call_id IN (SELECT call_id FROM conversation_calls WHERE user_id = $1)"
+    count_gates, count_having = _build_session_filter_sql(
+        search, db_pool, count_args, user_id_placeholder="$1" if user_id is not None else None
+    )
+    return await conn.fetchval(
+        f"""
+        SELECT COUNT(*) FROM (
+            SELECT ce.session_id
+            FROM conversation_events ce
+            WHERE ce.session_id IS NOT NULL
+            {count_user_filter}
+            {_gate_clause(count_gates)}
+            GROUP BY ce.session_id
+            {_having_clause(count_having)}
+        ) AS qualifying
+        """,
+        *count_args,
+    )
+
+
+def _aggregate_total_key(user_id: str | None, search: SessionSearchParams) -> tuple[Any, ...]:
+    return (
+        "aggregate",
+        user_id,
+        search.model,
+        search.from_time,
+        search.to_time,
+        search.q,
+        search.policy_intervention,
+    )
 
 
 async def _fetch_session_list_pg(
@@ -490,63 +881,24 @@ async def _fetch_session_list_pg(
     *,
     user_id: str | None = None,
     search: SessionSearchParams | None = None,
+    keyset: tuple[Any, str] | None = None,
 ) -> SessionListResponse:
-    """PostgreSQL version using PG-specific features (FILTER, DISTINCT ON, array_agg)."""
+    """PostgreSQL aggregate path using PG-specific features (FILTER, DISTINCT ON, array_agg)."""
     # SECURITY INVARIANT: user_id and every search value are bound as query
     # parameters, never interpolated into the SQL string. The user_id slot is
     # fixed at $3; search params (built by _build_session_filter_sql) occupy
     # $4+ when present. See test_fetch_session_list_user_filter_sql_injection.
     #
     # PERF: the user_id-population join to conversation_calls is intentionally
-    # OUT of the main aggregation query. When no filter is requested we never
-    # touch conversation_calls in the hot CTE — user_ids come from a separate
+    # OUT of the main aggregation query — user_ids come from a separate
     # post-query keyed on the page's session_ids (mirrors the SQLite pattern).
     search = search or SessionSearchParams()
     async with db_pool.connection() as conn:
-        if search.is_empty():
-            if user_id is not None:
-                total_count = await conn.fetchval(
-                    """
-                    SELECT COUNT(DISTINCT ce.session_id)
-                    FROM conversation_events ce
-                    JOIN conversation_calls cc ON ce.call_id = cc.call_id
-                    WHERE ce.session_id IS NOT NULL AND cc.user_id = $1
-                    """,
-                    user_id,
-                )
-            else:
-                total_count = await conn.fetchval(
-                    """
-                    SELECT COUNT(DISTINCT session_id)
-                    FROM conversation_events
-                    WHERE session_id IS NOT NULL
-                    """
-                )
-        else:
-            # Filtered count: count sessions that survive the same qualifying
-            # gates + HAVING as the page query. user_id (when set) is $1 here.
-            count_args: list[Any] = []
-            count_user_filter = ""
-            if user_id is not None:
-                count_args.append(user_id)
-                count_user_filter = "AND ce.call_id IN (SELECT call_id FROM conversation_calls WHERE user_id = $1)"
-            count_gates, count_having = _build_session_filter_sql(
-                search, db_pool, count_args, user_scope_sql=count_user_filter
-            )
-            total_count = await conn.fetchval(
-                f"""
-                SELECT COUNT(*) FROM (
-                    SELECT ce.session_id
-                    FROM conversation_events ce
-                    WHERE ce.session_id IS NOT NULL
-                    {count_user_filter}
-                    {_gate_clause(count_gates)}
-                    GROUP BY ce.session_id
-                    {_having_clause(count_having)}
-                ) AS qualifying
-                """,
-                *count_args,
-            )
+        total = await _cached_session_total(
+            db_pool,
+            _aggregate_total_key(user_id, search),
+            lambda: _count_sessions_aggregate(conn, db_pool, user_id=user_id, search=search),
+        )
 
         # When the caller filters by user_id we restrict the events under
         # consideration to call_ids belonging to that user — a single shared
@@ -557,12 +909,16 @@ async def _fetch_session_list_pg(
             if user_id is not None
             else ""
         )
-        query_args: list[Any] = [limit, offset]
+        query_args: list[Any] = [limit + 1, offset]
         if user_id is not None:
             query_args.append(user_id)
 
         # Search params occupy $4+ (after limit=$1, offset=$2, user_id=$3).
-        where_gates, having = _build_session_filter_sql(search, db_pool, query_args, user_scope_sql=user_call_filter)
+        where_gates, having = _build_session_filter_sql(
+            search, db_pool, query_args, user_id_placeholder="$3" if user_id is not None else None
+        )
+        if keyset is not None:
+            having.append(_cursor_predicate("MAX(ce.created_at)", "ce.session_id", keyset, query_args))
         gate_clause = _gate_clause(where_gates)
         having_clause = _having_clause(having)
 
@@ -624,64 +980,28 @@ async def _fetch_session_list_pg(
             GROUP BY s.session_id, s.first_ts, s.last_ts,
                      s.total_events, s.turn_count, s.policy_interventions,
                      f.request_payload
-            ORDER BY s.last_ts DESC
+            ORDER BY s.last_ts DESC, s.session_id DESC
             LIMIT $1 OFFSET $2
             """,
             *query_args,
         )
-
-        # Separate user_ids lookup keyed on the page's session_ids. Distinct
-        # users only — never collapse via MIN/MAX. When a user filter is in
-        # effect the same scoping is applied so the response doesn't leak the
-        # *existence* of other users sharing the session.
-        user_ids_by_session: dict[str, list[str]] = {}
-        if rows:
-            session_ids_on_page = [str(row["session_id"]) for row in rows]
-            placeholders = ", ".join(f"${i + 1}" for i in range(len(session_ids_on_page)))
-            if user_id is not None:
-                user_id_filter_clause = f"AND cc.user_id = ${len(session_ids_on_page) + 1}"
-                user_id_extra_args: list[Any] = [user_id]
-            else:
-                user_id_filter_clause = ""
-                user_id_extra_args = []
-            user_id_rows = await conn.fetch(
-                f"""
-                SELECT DISTINCT ce.session_id, cc.user_id
-                FROM conversation_events ce
-                JOIN conversation_calls cc ON ce.call_id = cc.call_id
-                WHERE ce.session_id IN ({placeholders})
-                AND cc.user_id IS NOT NULL
-                {user_id_filter_clause}
-                """,
-                *session_ids_on_page,
-                *user_id_extra_args,
-            )
-            for r in user_id_rows:
-                sid = str(r["session_id"])
-                uid = str(r["user_id"])
-                bucket = user_ids_by_session.setdefault(sid, [])
-                if uid not in bucket:
-                    bucket.append(uid)
-
-    sessions = [
-        SessionSummary(
-            session_id=str(row["session_id"]),
-            first_timestamp=parse_db_ts(row["first_ts"]).isoformat(),
-            last_timestamp=parse_db_ts(row["last_ts"]).isoformat(),
-            turn_count=int(row["turn_count"]),  # type: ignore[arg-type]
-            total_events=int(row["total_events"]),  # type: ignore[arg-type]
-            policy_interventions=int(row["policy_interventions"]),  # type: ignore[arg-type]
-            models_used=list(row["models"]) if row["models"] else [],  # type: ignore[arg-type]
-            preview_message=_extract_preview_message(cast(_PreviewPayload, row["request_payload"])),
-            user_ids=user_ids_by_session.get(str(row["session_id"]), []),
+        page = rows[:limit]
+        previews = await _extract_preview_messages(
+            conn, [cast(_PreviewPayload, row["request_payload"]) for row in page]
+        )
+        user_ids_by_session = (
+            await _fetch_page_user_ids(conn, [str(row["session_id"]) for row in page], user_id=user_id) if page else {}
         )
-        for row in rows
-    ]
-
-    total = int(total_count) if total_count is not None else 0  # type: ignore[arg-type]
-    has_more = offset + len(sessions) < total
 
-    return SessionListResponse(sessions=sessions, total=total, offset=offset, has_more=has_more)
+    return _build_session_list_response(
+        list(rows),
+        limit,
+        offset,
+        total,
+        models_by_session={str(row["session_id"]): list(row["models"]) for row in page if row["models"]},
+        preview_by_session={str(row["session_id"]): preview for row, preview in zip(page, previews, strict=True)},
+        user_ids_by_session=user_ids_by_session,
+    )
 
 
 async def _fetch_session_list_sqlite(
@@ -691,77 +1011,45 @@ async def _fetch_session_list_sqlite(
     *,
     user_id: str | None = None,
     search: SessionSearchParams | None = None,
+    keyset: tuple[Any, str] | None = None,
 ) -> SessionListResponse:
-    """SQLite version: 3 queries total (vs PostgreSQL's 2).
+    """SQLite aggregate path: 4 queries total (vs PostgreSQL's 2).
 
-    Avoids N+1 by batching models and previews for the whole page in one
-    query each, then merging in Python. PostgreSQL uses array_agg/DISTINCT ON
-    in a single CTE; SQLite lacks those, so we use IN (session_ids) instead.
+    Avoids N+1 by batching models, previews and user_ids for the whole page
+    in one query each, then merging in Python. PostgreSQL uses
+    array_agg/DISTINCT ON in a single CTE; SQLite lacks those, so we use
+    IN (session_ids) instead.
     """
     # SECURITY INVARIANT: user_id and every search value are bound as query
     # parameters, never interpolated into the SQL string. user_id occupies $3
     # in the page query ($1 in the filtered count); search params follow.
     search = search or SessionSearchParams()
     async with db_pool.connection() as conn:
-        if search.is_empty():
-            if user_id is not None:
-                total_count = await conn.fetchval(
-                    """
-                    SELECT COUNT(DISTINCT ce.session_id)
-                    FROM conversation_events ce
-                    JOIN conversation_calls cc ON ce.call_id = cc.call_id
-                    WHERE ce.session_id IS NOT NULL AND cc.user_id = $1
-                    """,
-                    user_id,
-                )
-            else:
-                total_count = await conn.fetchval(
-                    """
-                    SELECT COUNT(DISTINCT session_id)
-                    FROM conversation_events
-                    WHERE session_id IS NOT NULL
-                    """
-                )
-        else:
-            count_args: list[Any] = []
-            count_user_filter = ""
-            if user_id is not None:
-                count_args.append(user_id)
-                count_user_filter = "AND ce.call_id IN (SELECT call_id FROM conversation_calls WHERE user_id = $1)"
-            count_gates, count_having = _build_session_filter_sql(
-                search, db_pool, count_args, user_scope_sql=count_user_filter
-            )
-            total_count = await conn.fetchval(
-                f"""
-                SELECT COUNT(*) FROM (
-                    SELECT ce.session_id
-                    FROM conversation_events ce
-                    WHERE ce.session_id IS NOT NULL
-                    {count_user_filter}
-                    {_gate_clause(count_gates)}
-                    GROUP BY ce.session_id
-                    {_having_clause(count_having)}
-                ) AS qualifying
-                """,
-                *count_args,
-            )
+        total = await _cached_session_total(
+            db_pool,
+            _aggregate_total_key(user_id, search),
+            lambda: _count_sessions_aggregate(conn, db_pool, user_id=user_id, search=search),
+        )
 
         # PERF: only filter through conversation_calls when a user filter is
-        # actually requested. Unfiltered list calls (the hot path) skip the
-        # conversation_calls subquery entirely. user_ids are populated by a
-        # separate post-query keyed on the page's session_ids (SQLite has no
-        # array_agg, so we can't compute them inside this query anyway).
+        # actually requested. user_ids are populated by a separate post-query
+        # keyed on the page's session_ids (SQLite has no array_agg, so we can't
+        # compute them inside this query anyway).
         user_call_filter = (
             "AND ce.call_id IN (SELECT call_id FROM conversation_calls WHERE user_id = $3)"
             if user_id is not None
             else ""
         )
-        query_args: list[Any] = [limit, offset]
+        query_args: list[Any] = [limit + 1, offset]
         if user_id is not None:
             query_args.append(user_id)
 
         # Search params occupy $4+ (after limit=$1, offset=$2, user_id=$3).
-        where_gates, having = _build_session_filter_sql(search, db_pool, query_args, user_scope_sql=user_call_filter)
+        where_gates, having = _build_session_filter_sql(
+            search, db_pool, query_args, user_id_placeholder="$3" if user_id is not None else None
+        )
+        if keyset is not None:
+            having.append(_cursor_predicate("MAX(ce.created_at)", "ce.session_id", keyset, query_args))
 
         rows = await conn.fetch(
             f"""
@@ -778,18 +1066,16 @@ async def _fetch_session_list_sqlite(
             {_gate_clause(where_gates)}
             GROUP BY ce.session_id
             {_having_clause(having)}
-            ORDER BY last_ts DESC
+            ORDER BY last_ts DESC, ce.session_id DESC
             LIMIT $1 OFFSET $2
             """,
             *query_args,
         )
 
-        total = int(total_count) if total_count is not None else 0  # type: ignore[arg-type]
-
         if not rows:
             return SessionListResponse(sessions=[], total=total, offset=offset, has_more=False)
 
-        session_ids = [str(row["session_id"]) for row in rows]
+        session_ids = [str(row["session_id"]) for row in rows[:limit]]
         placeholders = ", ".join(f"${i + 1}" for i in range(len(session_ids)))
 
         # When a user_id filter is in effect, restrict the model/preview/user-id
@@ -821,50 +1107,9 @@ async def _fetch_session_list_sqlite(
             *session_ids,
             *extra_args,
         )
+        preview_by_session = await _fetch_page_previews(conn, db_pool, session_ids, user_id=user_id)
+        user_ids_by_session = await _fetch_page_user_ids(conn, session_ids, user_id=user_id)
 
-        # One query for first qualifying preview per session on this page
-        preview_rows = await conn.fetch(
-            f"""
-            SELECT ce.session_id, ce.payload as request_payload
-            FROM conversation_events ce
-            WHERE ce.session_id IN ({placeholders})
-            AND ce.event_type = 'transaction.request_recorded'
-            AND COALESCE(
-                CAST(json_extract(ce.payload, '$.final_request.max_tokens') AS INTEGER),
-                2
-            ) > 1
-            {user_call_filter_lookups}
-            ORDER BY ce.session_id, ce.created_at ASC
-            """,
-            *session_ids,
-            *extra_args,
-        )
-
-        # Distinct user_ids per session — never collapse via MIN/MAX, that lies
-        # on multi-user sessions. Returned as a list so the consumer can render
-        # mixed-identity sessions honestly. When a user filter is in effect
-        # we constrain to that user so the response doesn't leak the *existence*
-        # of other users sharing the session.
-        if user_id is not None:
-            user_id_filter_clause = f"AND cc.user_id = ${len(session_ids) + 1}"
-            user_id_args: list[Any] = [user_id]
-        else:
-            user_id_filter_clause = ""
-            user_id_args = []
-        user_id_rows = await conn.fetch(
-            f"""
-            SELECT DISTINCT ce.session_id, cc.user_id
-            FROM conversation_events ce
-            JOIN conversation_calls cc ON ce.call_id = cc.call_id
-            WHERE ce.session_id IN ({placeholders})
-            AND cc.user_id IS NOT NULL
-            {user_id_filter_clause}
-            """,
-            *session_ids,
-            *user_id_args,
-        )
-
-    # Build per-session lookup maps from the bulk results
     models_by_session: dict[str, list[str]] = {}
     for r in model_rows:
         sid = str(r["session_id"])
@@ -873,59 +1118,60 @@ async def _fetch_session_list_sqlite(
         if model not in session_models:
             session_models.append(model)
 
-    preview_by_session: dict[str, str | None] = {}
-    for r in preview_rows:
-        sid = str(r["session_id"])
-        if sid not in preview_by_session:
-            preview_by_session[sid] = _extract_preview_message(cast(_PreviewPayload, r["request_payload"]))
+    return _build_session_list_response(
+        list(rows),
+        limit,
+        offset,
+        total,
+        models_by_session=models_by_session,
+        preview_by_session=preview_by_session,
+        user_ids_by_session=user_ids_by_session,
+    )
 
-    user_ids_by_session: dict[str, list[str]] = {}
-    for r in user_id_rows:
-        sid = str(r["session_id"])
-        uid = str(r["user_id"])
-        bucket = user_ids_by_session.setdefault(sid, [])
-        if uid not in bucket:
-            bucket.append(uid)
 
-    sessions = [
-        SessionSummary(
-            session_id=str(row["session_id"]),
-            first_timestamp=parse_db_ts(row["first_ts"]).isoformat(),
-            last_timestamp=parse_db_ts(row["last_ts"]).isoformat(),
-            turn_count=int(row["turn_count"]),  # type: ignore[arg-type]
-            total_events=int(row["total_events"]),  # type: ignore[arg-type]
-            policy_interventions=int(row["policy_interventions"]),  # type: ignore[arg-type]
-            models_used=models_by_session.get(str(row["session_id"]), []),
-            preview_message=preview_by_session.get(str(row["session_id"])),
-            user_ids=user_ids_by_session.get(str(row["session_id"]), []),
-        )
-        for row in rows
-    ]
+@dataclass(frozen=True)
+class SessionOutline:
+    """Turn index and header totals of a session, read without event payloads.
+
+    ``call_ids`` lists the session's calls in turn order (by first event), so
+    a turn range maps to a slice of it.
+    """
 
-    has_more = offset + len(sessions) < total
-    return SessionListResponse(sessions=sessions, total=total, offset=offset, has_more=has_more)
+    session_id: str
+    first_timestamp: str
+    last_timestamp: str
+    call_ids: list[str]
+    models_used: list[str]
+    total_policy_interventions: int
 
 
-async def fetch_session_detail(session_id: str, db_pool: DatabasePool) -> SessionDetail:
-    """Fetch full session detail with conversation turns.
+# Policy events that ``_build_turn`` turns into annotations.
+_ANNOTATION_PREDICATE = "event_type LIKE 'policy.%' AND event_type NOT LIKE '%evaluation%'"
 
-    Args:
-        session_id: Session identifier
-        db_pool: Database connection pool
 
-    Returns:
-        Full session detail with all conversation turns
+async def fetch_session_outline(session_id: str, db_pool: DatabasePool) -> SessionOutline:
+    """Fetch a session's turn order, time span, models and intervention count.
+
+    One grouped query over ``conversation_events``; payloads are not loaded
+    beyond ``final_model``.
 
     Raises:
         ValueError: If no events found for session_id
     """
+    model_expr = "payload->>'final_model'" if db_pool.is_postgres else "json_extract(payload, '$.final_model')"
     async with db_pool.connection() as conn:
         rows = await conn.fetch(
-            """
-            SELECT call_id, event_type, payload, created_at
+            f"""
+            SELECT
+                call_id,
+                MIN(created_at) AS first_ts,
+                MAX(created_at) AS last_ts,
+                MAX(CASE WHEN event_type = 'transaction.request_recorded' THEN {model_expr} END) AS model,
+                SUM(CASE WHEN {_ANNOTATION_PREDICATE} THEN 1 ELSE 0 END) AS annotation_count
             FROM conversation_events
             WHERE session_id = $1
-            ORDER BY created_at ASC
+            GROUP BY call_id
+            ORDER BY MIN(created_at) ASC, call_id ASC
             """,
             session_id,
         )
@@ -933,56 +1179,105 @@ async def fetch_session_detail(session_id: str, db_pool: DatabasePool) -> Sessio
     if not rows:
         raise ValueError(f"No events found for session_id: {session_id}")
 
-    # Group events by call_id
-    calls: dict[str, list[StoredEvent]] = {}
-    for row in rows:
-        call_id = str(row["call_id"])
-        if call_id not in calls:
-            calls[call_id] = []
-
-        raw_payload = row["payload"]
-        if isinstance(raw_payload, dict):
-            payload: dict[str, object] = dict(raw_payload)
-        elif isinstance(raw_payload, str):
-            payload = json.loads(raw_payload)
-        else:
-            raise TypeError(f"Unexpected payload type: {type(raw_payload).__name__}")
+    return SessionOutline(
+        session_id=session_id,
+        first_timestamp=min(parse_db_ts(row["first_ts"]) for row in rows).isoformat(),
+        last_timestamp=max(parse_db_ts(row["last_ts"]) for row in rows).isoformat(),
+        call_ids=[str(row["call_id"]) for row in rows],
+        models_used=sorted({str(row["model"]) for row in rows if row["model"]}),
+        total_policy_interventions=sum(int(row["annotation_count"] or 0) for row in rows),
+    )
+
+
+def _decode_payload(raw_payload: Any) -> dict[str, Any]:
+    if isinstance(raw_payload, dict):
+        return dict(raw_payload)
+    if isinstance(raw_payload, str):
+        return json.loads(raw_payload)
+    raise TypeError(f"Unexpected payload type: {type(raw_payload).__name__}")
 
-        raw_created_at = parse_db_ts(row["created_at"])
 
-        calls[call_id].append(
-            StoredEvent(
-                event_type=str(row["event_type"]),
-                payload=payload,
-                created_at=raw_created_at,
+async def iter_session_turns(
+    outline: SessionOutline,
+    db_pool: DatabasePool,
+    *,
+    start: int = 0,
+    stop: int | None = None,
+) -> AsyncIterator[ConversationTurn]:
+    """Yield the turns ``outline.call_ids[start:stop]`` in order.
+
+    Events are loaded :data:`HISTORY_SESSION_TURNS_PAGE_SIZE` calls at a time,
+    each page on its own short-lived connection, so memory and connection hold
+    time stay bounded however long the session is. Calls purged after the
+    outline was read are skipped.
+    """
+    call_ids = outline.call_ids[start:stop]
+    for page_start in range(0, len(call_ids), HISTORY_SESSION_TURNS_PAGE_SIZE):
+        page = call_ids[page_start : page_start + HISTORY_SESSION_TURNS_PAGE_SIZE]
+        placeholders = ", ".join(f"${i + 2}" for i in range(len(page)))
+        async with db_pool.connection() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT call_id, event_type, payload, created_at
+                FROM conversation_events
+                WHERE session_id = $1 AND call_id IN ({placeholders})
+                ORDER BY created_at ASC
+                """,
+                outline.session_id,
+                *page,
             )
-        )
+            payloads = [_decode_payload(row["payload"]) for row in rows]
+            await rehydrate_payloads(conn, payloads)
+
+        calls: dict[str, list[StoredEvent]] = {}
+        for row, payload in zip(rows, payloads, strict=True):
+            calls.setdefault(str(row["call_id"]), []).append(
+                StoredEvent(
+                    event_type=str(row["event_type"]),
+                    payload=payload,
+                    created_at=parse_db_ts(row["created_at"]),
+                )
+            )
+        for call_id in page:
+            if call_id in calls:
+                yield _build_turn(call_id, calls[call_id])
+
+
+async def fetch_session_detail(
+    session_id: str,
+    db_pool: DatabasePool,
+    *,
+    offset: int = 0,
+    limit: int | None = None,
+) -> SessionDetail:
+    """Fetch session detail with a range of its conversation turns.
 
-    # Build conversation turns, sorted by first event timestamp
-    turns = []
-    all_models = set()
-    total_interventions = 0
+    Args:
+        session_id: Session identifier
+        db_pool: Database connection pool
+        offset: Index of the first turn to include
+        limit: Maximum number of turns to include (None for all remaining)
 
-    # Sort call_ids by their first event timestamp to ensure chronological order
-    sorted_call_ids = sorted(calls.keys(), key=lambda cid: calls[cid][0]["created_at"])
-    for call_id in sorted_call_ids:
-        turn = _build_turn(call_id, calls[call_id])
-        turns.append(turn)
-        if turn.model:
-            all_models.add(turn.model)
-        if turn.had_policy_intervention:
-            total_interventions += len(turn.annotations)
+    Returns:
+        Session detail whose header covers the whole session and whose
+        ``turns`` hold the requested range
 
-    first_ts_str = parse_db_ts(rows[0]["created_at"]).isoformat()
-    last_ts_str = parse_db_ts(rows[-1]["created_at"]).isoformat()
+    Raises:
+        ValueError: If no events found for session_id
+    """
+    outline = await fetch_session_outline(session_id, db_pool)
+    stop = None if limit is None else offset + limit
+    turns = [turn async for turn in iter_session_turns(outline, db_pool, start=offset, stop=stop)]
 
     return SessionDetail(
         session_id=session_id,
-        first_timestamp=first_ts_str,
-        last_timestamp=last_ts_str,
+        first_timestamp=outline.first_timestamp,
+        last_timestamp=outline.last_timestamp,
         turns=turns,
-        total_policy_interventions=total_interventions,
-        models_used=sorted(all_models),
+        total_policy_interventions=outline.total_policy_interventions,
+        models_used=outline.models_used,
+        turn_offset=offset,
+        total_turns=len(outline.call_ids),
     )
 
 
@@ -1111,6 +1406,56 @@ def _extract_policy_name(event_type: str) -> str:
     return "unknown"
 
 
+def _markdown_header_lines(
+    session_id: str,
+    first_timestamp: str,
+    last_timestamp: str,
+    turn_count: int,
+    models_used: list[str],
+    total_policy_interventions: int,
+) -> list[str]:
+    lines = [
+        f"# Conversation History: {session_id}",
+        "",
+        f"**Started:** {first_timestamp}",
+        f"**Ended:** {last_timestamp}",
+        f"**Turns:** {turn_count}",
+    ]
+    if models_used:
+        lines.append(f"**Models:** {', '.join(models_used)}")
+    if total_policy_interventions > 0:
+        lines.append(f"**Policy Interventions:** {total_policy_interventions}")
+    lines.extend(["", "---", ""])
+    return lines
+
+
+def _markdown_turn_lines(number: int, turn: ConversationTurn) -> list[str]:
+    lines = [f"## Turn {number}"]
+    if turn.model:
+        lines.append(f"*Model: {turn.model}*")
+    lines.append("")
+
+    # Request messages
+    for msg in turn.request_messages:
+        lines.append(_format_message_markdown(msg))
+        lines.append("")
+
+    # Response messages
+    for msg in turn.response_messages:
+        lines.append(_format_message_markdown(msg))
+        lines.append("")
+
+    # Policy annotations
+    if turn.annotations:
+        lines.append("### Policy Annotations")
+        for ann in turn.annotations:
+            lines.append(f"- **{ann.policy_name}**: {ann.summary}")
+        lines.append("")
+
+    lines.extend(["---", ""])
+    return lines
+
+
 def export_session_markdown(session: SessionDetail) -> str:
     """Export a session to markdown format.
 
@@ -1120,50 +1465,55 @@ def export_session_markdown(session: SessionDetail) -> str:
     Returns:
         Markdown formatted string of the conversation
     """
-    lines = []
-
-    # Header
-    lines.append(f"# Conversation History: {session.session_id}")
-    lines.append("")
-    lines.append(f"**Started:** {session.first_timestamp}")
-    lines.append(f"**Ended:** {session.last_timestamp}")
-    lines.append(f"**Turns:** {len(session.turns)}")
-    if session.models_used:
-        lines.append(f"**Models:** {', '.join(session.models_used)}")
-    if session.total_policy_interventions > 0:
-        lines.append(f"**Policy Interventions:** {session.total_policy_interventions}")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-
-    # Turns
+    lines = _markdown_header_lines(
+        session.session_id,
+        session.first_timestamp,
+        session.last_timestamp,
+        len(session.turns),
+        session.models_used,
+        session.total_policy_interventions,
+    )
     for i, turn in enumerate(session.turns, 1):
-        lines.append(f"## Turn {i}")
-        if turn.model:
-            lines.append(f"*Model: {turn.model}*")
-        lines.append("")
-
-        # Request messages
-        for msg in turn.request_messages:
-            lines.append(_format_message_markdown(msg))
-            lines.append("")
-
-        # Response messages
-        for msg in turn.response_messages:
-            lines.append(_format_message_markdown(msg))
-            lines.append("")
-
-        # Policy annotations
-        if turn.annotations:
-            lines.append("### Policy Annotations")
-            for ann in turn.annotations:
-                lines.append(f"- **{ann.policy_name}**: {ann.summary}")
-            lines.append("")
+        lines.extend(_markdown_turn_lines(i, turn))
+    return "\n".join(lines)
 
-        lines.append("---")
-        lines.append("")
 
-    return "\n".join(lines)
+async def stream_session_markdown(outline: SessionOutline, db_pool: DatabasePool) -> AsyncIterator[str]:
+    """Stream :func:`export_session_markdown` output for a whole session, one turn per chunk."""
+    yield "\n".join(
+        _markdown_header_lines(
+            outline.session_id,
+            outline.first_timestamp,
+            outline.last_timestamp,
+            len(outline.call_ids),
+            outline.models_used,
+            outline.total_policy_interventions,
+        )
+    )
+    number = 0
+    async for turn in iter_session_turns(outline, db_pool):
+        number += 1
+        yield "\n" + "\n".join(_markdown_turn_lines(number, turn))
+
+
+def _jsonl_record(session_id: str, turn: ConversationTurn) -> str:
+    record: dict[str, object] = {
+        "call_id": turn.call_id,
+        "session_id": session_id,
+        "timestamp": turn.timestamp,
+        "model": turn.model,
+        "request_messages": [m.model_dump(mode="json") for m in turn.request_messages],
+        "response_messages": [m.model_dump(mode="json") for m in turn.response_messages],
+        "annotations": [a.model_dump(mode="json") for a in turn.annotations],
+        "had_policy_intervention": turn.had_policy_intervention,
+        "request_was_modified": turn.request_was_modified,
+        "response_was_modified": turn.response_was_modified,
+    }
+    if turn.original_request_messages is not None:
+        record["original_request_messages"] = [m.model_dump(mode="json") for m in turn.original_request_messages]
+    if turn.original_response_messages is not None:
+        record["original_response_messages"] = [m.model_dump(mode="json") for m in turn.original_response_messages]
+    return json.dumps(record, default=str)
 
 
 def export_session_jsonl(session: SessionDetail) -> str:
@@ -1172,26 +1522,13 @@ def export_session_jsonl(session: SessionDetail) -> str:
     Each line contains a turn with call_id, session_id, model,
     request/response messages, and annotations.
     """
-    lines: list[str] = []
-    for turn in session.turns:
-        record: dict[str, object] = {
-            "call_id": turn.call_id,
-            "session_id": session.session_id,
-            "timestamp": turn.timestamp,
-            "model": turn.model,
-            "request_messages": [m.model_dump(mode="json") for m in turn.request_messages],
-            "response_messages": [m.model_dump(mode="json") for m in turn.response_messages],
-            "annotations": [a.model_dump(mode="json") for a in turn.annotations],
-            "had_policy_intervention": turn.had_policy_intervention,
-            "request_was_modified": turn.request_was_modified,
-            "response_was_modified": turn.response_was_modified,
-        }
-        if turn.original_request_messages is not None:
-            record["original_request_messages"] = [m.model_dump(mode="json") for m in turn.original_request_messages]
-        if turn.original_response_messages is not None:
-            record["original_response_messages"] = [m.model_dump(mode="json") for m in turn.original_response_messages]
-        lines.append(json.dumps(record, default=str))
-    return "\n".join(lines) + "\n" if lines else ""
+    return "".join(_jsonl_record(session.session_id, turn) + "\n" for turn in session.turns)
+
+
+async def stream_session_jsonl(outline: SessionOutline, db_pool: DatabasePool) -> AsyncIterator[str]:
+    """Stream :func:`export_session_jsonl` output for a whole session, one line per turn."""
+    async for turn in iter_session_turns(outline, db_pool):
+        yield _jsonl_record(outline.session_id, turn) + "\n"
 
 
 def _format_message_markdown(msg: ConversationMessage) -> str:
@@ -1229,6 +1566,11 @@ __all__ = [
     "extract_text_content",
     "fetch_session_list",
     "fetch_session_detail",
+    "fetch_session_outline",
+    "iter_session_turns",
+    "SessionOutline",
     "export_session_markdown",
     "export_session_jsonl",
+    "stream_session_markdown",
+    "stream_session_jsonl",
 ]
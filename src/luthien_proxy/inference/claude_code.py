@@ -35,6 +35,28 @@ subprocess running with the OAuth token in its env and no HOME/CLAUDE_CONFIG_DIR
 to read from. `_run_subprocess` enforces this: it never returns without
 `proc.wait()` having completed for the child, regardless of how it
 unwinds (success, timeout, cancel, exception).
+
+Warm pool (opt-in, `warm_pool_size` / `max_concurrency`):
+
+Most of a `claude -p` call's fixed latency is Node booting the CLI. A
+warm pool pre-spawns the CLI with its final flags but no positional
+prompt, so it boots and then blocks reading the prompt from stdin; a call
+checks out a live spare, writes the prompt and reads the result. Each
+process still serves exactly one call (`-p` sessions would otherwise carry
+one caller's conversation into the next caller's verdict), with its own
+scratch HOME and scrubbed env, and goes through the same reap-then-rmtree
+path as a cold spawn. Spares past `spare_max_idle_seconds` or already
+exited are reaped instead of used. Only a warm hit reads its prompt from
+stdin: a miss, a spare found dead when its prompt is written, or a
+provider that sets only `max_concurrency` spawns cold with the prompt in
+argv, as the unpooled path does. `timeout_seconds` is one deadline
+covering the wait for a slot and the run.
+`max_concurrency` caps concurrent runs per credential and `max_queued`
+bounds how many calls may wait for a slot. Pools and slot gates are
+module-level (the registry builds a fresh provider per lookup); gates are
+keyed by credential hash alone, so every provider on a credential shares
+one cap whatever its pool settings. `close_warm_pools()` reaps them at
+shutdown.
 """
 
 from __future__ import annotations
@@ -45,8 +67,14 @@ import logging
 import os
 import shutil
 import tempfile
+import time
+from collections import Counter, OrderedDict, deque
+from collections.abc import AsyncIterator, Coroutine
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, nullcontext
+from dataclasses import dataclass
 from typing import Any
 
+from luthien_proxy.credential_manager import hash_credential
 from luthien_proxy.credentials.credential import Credential, CredentialType
 from luthien_proxy.inference.base import (
     InferenceCredentialOverrideUnsupported,
@@ -72,6 +100,21 @@ DEFAULT_TIMEOUT_SECONDS = 120.0
 #: Verified in the shipped claude binary (2.1.119).
 STRUCTURED_OUTPUT_RETRY_EXHAUSTED_SUBTYPE = "error_max_structured_output_retries"
 
+#: Calls allowed to wait for a run slot when `max_concurrency` is set.
+DEFAULT_MAX_QUEUED = 32
+
+#: Age after which an idle warm spare is reaped rather than handed out.
+DEFAULT_SPARE_MAX_IDLE_SECONDS = 300.0
+
+#: Argv signatures (model, system prompt, schema) a warm pool keeps spares
+#: for. Spares are spawned with their final flags, so each signature needs
+#: its own; the least recently used one beyond this bound is dropped.
+_MAX_SPARE_SIGNATURES = 4
+
+#: Warm pools kept at once (one per credential + pool configuration). Idle
+#: slot gates (one per credential) are pruned past the same bound.
+_MAX_WARM_POOLS = 8
+
 #: Env vars that MUST pass through to the child. We don't want to inherit
 #: the full parent env (hooks/plugin envvars would sneak back in, defeating
 #: `--bare`), but a minimal PATH-only env breaks Node locale handling,
@@ -100,6 +143,10 @@ class ClaudeCodeProvider(InferenceProvider):
         default_model: Model name passed to `--model`. If None, let the
             CLI pick (sonnet in bare mode as of 2.1.x).
         timeout_seconds: Wall-clock per-call timeout.
+        warm_pool_size: Pre-spawned spares kept per argv signature. 0
+            (default) spawns cold on every call.
+        max_concurrency: Concurrent runs allowed per credential. 0
+            (default) is unlimited.
     """
 
     backend_type: str = "claude_code"
@@ -112,6 +159,10 @@ class ClaudeCodeProvider(InferenceProvider):
         default_model: str | None = None,
         timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
         claude_binary: str = DEFAULT_CLAUDE_BINARY,
+        warm_pool_size: int = 0,
+        max_concurrency: int = 0,
+        max_queued: int = DEFAULT_MAX_QUEUED,
+        spare_max_idle_seconds: float = DEFAULT_SPARE_MAX_IDLE_SECONDS,
     ) -> None:
         """Initialize with a stored credential and subprocess defaults.
 
@@ -128,6 +179,15 @@ class ClaudeCodeProvider(InferenceProvider):
             default_model: Optional model for `--model`.
             timeout_seconds: Per-call wall-clock timeout.
             claude_binary: Executable name / path. Overridable for tests.
+            warm_pool_size: Spares to keep booted per argv signature; see
+                the module docstring. Enables the warm pool when > 0.
+            max_concurrency: Cap on concurrent runs sharing this
+                credential. Enables the warm pool when > 0.
+            max_queued: Calls allowed to wait for a slot once
+                `max_concurrency` runs are in flight; the next one raises
+                `InferenceProviderError`.
+            spare_max_idle_seconds: Idle age after which a spare is
+                reaped instead of used.
         """
         super().__init__(name=name)
         if credential.credential_type is not CredentialType.AUTH_TOKEN:
@@ -140,6 +200,10 @@ class ClaudeCodeProvider(InferenceProvider):
         self._default_model = default_model
         self._timeout_seconds = timeout_seconds
         self._claude_binary = claude_binary
+        self._warm_pool_size = max(0, warm_pool_size)
+        self._max_concurrency = max(0, max_concurrency)
+        self._max_queued = max(0, max_queued)
+        self._spare_max_idle_seconds = spare_max_idle_seconds
 
     async def complete(
         self,
@@ -195,44 +259,129 @@ class ClaudeCodeProvider(InferenceProvider):
             args.extend(["--system-prompt", system_prompt])
         if serialized_schema is not None:
             args.extend(["--json-schema", serialized_schema])
-        args.append(prompt)
 
-        scratch_dir = tempfile.mkdtemp(prefix="luthien-claude-")
-        env = _build_child_env(self._credential.value, scratch_dir)
+        if self._warm_pool_size > 0 or self._max_concurrency > 0:
+            stdout_bytes, stderr_bytes, returncode = await self._run_pooled(args, prompt, model=resolved_model)
+        else:
+            stdout_bytes, stderr_bytes, returncode = await self._run_cold(
+                [*args, prompt],
+                model=resolved_model,
+                timeout_seconds=self._timeout_seconds,
+            )
+
+        return self._parse_output(
+            stdout_bytes,
+            stderr_bytes,
+            returncode,
+            structured_expected=schema is not None,
+        )
 
+    def _log_spawn(self, args: list[str], *, model: str | None, **extra: object) -> None:
         logger.debug(
             "inference.claude_code.spawn",
             extra={
                 "inference_provider_name": self.name,
                 "inference_backend_type": self.backend_type,
-                "inference_model": resolved_model,
-                "inference_structured": schema is not None,
+                "inference_model": model,
+                "inference_structured": "--json-schema" in args,
                 # Redact by name, not index. The argv redactor surfaces a stable
                 # set of flag names (never prompt content, never schema body,
                 # never the model's system prompt) so a reorder can't leak.
                 "argv_flags": _redact_argv_for_log(args),
+                **extra,
             },
         )
 
+    async def _run_cold(
+        self,
+        args: list[str],
+        *,
+        model: str | None,
+        timeout_seconds: float,
+        **log_extra: object,
+    ) -> tuple[bytes, bytes, int]:
+        """Spawn `args` (prompt included as the last positional) in a fresh scratch dir."""
+        scratch_dir = tempfile.mkdtemp(prefix="luthien-claude-")
+        env = _build_child_env(self._credential.value, scratch_dir)
+        self._log_spawn(args, model=model, **log_extra)
+
         # _run_subprocess guarantees the child process has fully exited
         # (wait() returned) before it returns or re-raises, so the
         # scratch-dir rmtree below is always safe to run.
         try:
-            stdout_bytes, stderr_bytes, returncode = await _run_subprocess(
+            return await _run_subprocess(
                 args,
                 env=env,
-                timeout_seconds=self._timeout_seconds,
+                timeout_seconds=timeout_seconds,
                 provider_name=self.name,
             )
         finally:
             shutil.rmtree(scratch_dir, ignore_errors=True)
 
-        return self._parse_output(
-            stdout_bytes,
-            stderr_bytes,
-            returncode,
-            structured_expected=schema is not None,
-        )
+    async def _run_pooled(self, args: list[str], prompt: str, *, model: str | None) -> tuple[bytes, bytes, int]:
+        """Run one call under admission control, on a warm spare when one is ready.
+
+        `args` carries every flag but no positional prompt. A warm spare is
+        fed the prompt on stdin; every other run (no pool, a pool miss, or a
+        spare found dead before the prompt was written) spawns cold with the
+        prompt in argv, exactly as the unpooled path does.
+        """
+        deadline = time.monotonic() + self._timeout_seconds
+        slot: AbstractAsyncContextManager[None] = nullcontext()
+        if self._max_concurrency > 0:
+            gate = _get_admission_gate(
+                api_key=self._credential.value,
+                max_concurrency=self._max_concurrency,
+                max_queued=self._max_queued,
+            )
+            slot = gate.slot(provider_name=self.name, timeout_seconds=self._timeout_seconds)
+        async with slot:
+            if self._warm_pool_size > 0:
+                pool = _get_warm_pool(
+                    name=self.name,
+                    api_key=self._credential.value,
+                    size=self._warm_pool_size,
+                    spare_max_idle_seconds=self._spare_max_idle_seconds,
+                )
+                spare = pool.checkout(args)
+                if spare is not None:
+                    self._log_spawn(args, model=model, warm_hit=True)
+                    result = await self._run_on_spare(spare, prompt, deadline)
+                    if result is not None:
+                        return result
+                    # The spare exited before the prompt reached it, so the
+                    # call never ran and is safe to run once more, cold.
+                    logger.warning(
+                        "inference.claude_code.warm_spare_died",
+                        extra={"inference_provider_name": self.name, "returncode": spare.proc.returncode},
+                    )
+            return await self._run_cold(
+                [*args, prompt],
+                model=model,
+                timeout_seconds=max(0.0, deadline - time.monotonic()),
+                warm_hit=False,
+            )
+
+    async def _run_on_spare(self, spare: _Spare, prompt: str, deadline: float) -> tuple[bytes, bytes, int] | None:
+        """Feed `prompt` to `spare` within `deadline`; None if the spare was dead before the write."""
+        # Same invariant as the cold path: _feed_prompt and _communicate_child
+        # have reaped the child before they return or raise.
+        try:
+            fed = await _feed_prompt(
+                spare.proc,
+                prompt.encode("utf-8"),
+                timeout_seconds=max(0.0, deadline - time.monotonic()),
+                provider_name=self.name,
+            )
+            if not fed:
+                return None
+            return await _communicate_child(
+                spare.proc,
+                timeout_seconds=max(0.0, deadline - time.monotonic()),
+                provider_name=self.name,
+            )
+        finally:
+            shutil.rmtree(spare.scratch_dir, ignore_errors=True)
 
     def _parse_output(
         self,
@@ -359,10 +508,22 @@ async def _run_subprocess(
       cancellation is preserved and re-raised after the child exits.
     - Any other `BaseException`: `_reap_child` → re-raise.
     """
+    proc = await _spawn_child(args, env=env)
+    return await _communicate_child(proc, timeout_seconds=timeout_seconds, provider_name=provider_name)
+
+
+async def _spawn_child(
+    args: list[str],
+    *,
+    env: dict[str, str],
+    stdin_pipe: bool = False,
+) -> asyncio.subprocess.Process:
+    """Start the claude CLI with piped stdout/stderr (and stdin if `stdin_pipe`)."""
     try:
-        proc = await asyncio.create_subprocess_exec(
+        return await asyncio.create_subprocess_exec(
             *args,
             env=env,
+            stdin=asyncio.subprocess.PIPE if stdin_pipe else None,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
@@ -374,11 +535,20 @@ async def _run_subprocess(
             f"failed to spawn `claude` subprocess: {exc}",
         ) from exc
 
+
+async def _communicate_child(
+    proc: asyncio.subprocess.Process,
+    *,
+    timeout_seconds: float,
+    provider_name: str,
+) -> tuple[bytes, bytes, int]:
+    """Collect output from an already-spawned child, return (stdout, stderr, rc).
+
+    Carries the `_run_subprocess` invariant for an already-spawned child:
+    never returns or raises before `proc.wait()` has resolved.
+    """
     try:
-        stdout_bytes, stderr_bytes = await asyncio.wait_for(
-            proc.communicate(),
-            timeout=timeout_seconds,
-        )
+        stdout_bytes, stderr_bytes = await asyncio.wait_for(proc.communicate(), timeout=timeout_seconds)
     except asyncio.TimeoutError as exc:
         await _reap_child(proc, provider_name=provider_name)
         raise InferenceTimeoutError(
@@ -398,6 +568,43 @@ async def _run_subprocess(
     return stdout_bytes, stderr_bytes, returncode
 
 
+async def _feed_prompt(
+    proc: asyncio.subprocess.Process,
+    input_bytes: bytes,
+    *,
+    timeout_seconds: float,
+    provider_name: str,
+) -> bool:
+    """Write `input_bytes` to a warm spare's stdin and close it.
+
+    Returns False, with the child reaped, only when the spare is known to
+    have exited before reading anything: it had already exited, or the
+    write hit a broken pipe. Any later failure is the call's own result, so
+    it is never retried. Unless it returns True, the child has exited
+    (wait() resolved) by the time this returns or raises.
+    """
+    assert proc.stdin is not None
+    if proc.returncode is not None:
+        await _reap_child(proc, provider_name=provider_name)
+        return False
+    try:
+        proc.stdin.write(input_bytes)
+        await asyncio.wait_for(proc.stdin.drain(), timeout=timeout_seconds)
+    except (BrokenPipeError, ConnectionResetError):
+        await _reap_child(proc, provider_name=provider_name)
+        return False
+    except asyncio.TimeoutError as exc:
+        await _reap_child(proc, provider_name=provider_name)
+        raise InferenceTimeoutError(
+            f"claude -p did not read its prompt within {timeout_seconds:.0f}s",
+        ) from exc
+    except BaseException:
+        await _reap_child(proc, provider_name=provider_name)
+        raise
+    proc.stdin.close()
+    return True
+
+
 async def _reap_child(proc: asyncio.subprocess.Process, *, provider_name: str) -> None:
     """Kill `proc` and wait for it to fully exit, resilient to re-cancellation.
 
@@ -501,6 +708,257 @@ async def _terminate_and_wait(proc: asyncio.subprocess.Process) -> None:
     await proc.wait()
 
 
+@dataclass
+class _Spare:
+    """A pre-spawned `claude -p` blocked on stdin, waiting for its one prompt."""
+
+    proc: asyncio.subprocess.Process
+    scratch_dir: str
+    spawned_at: float
+
+
+class _AdmissionGate:
+    """Run slots for one credential, shared by every provider and pool using it."""
+
+    def __init__(self, *, max_concurrency: int, max_queued: int) -> None:
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_queued = max_queued
+        self._waiting = 0
+        self._running = 0
+
+    @property
+    def idle(self) -> bool:
+        """True when no call holds or waits for a slot."""
+        return self._waiting == 0 and self._running == 0
+
+    @asynccontextmanager
+    async def slot(self, *, provider_name: str, timeout_seconds: float) -> AsyncIterator[None]:
+        """Hold a run slot for the body, waiting up to `timeout_seconds` for one.
+
+        Raises `InferenceProviderError` without waiting when `max_queued`
+        callers are already queued.
+        """
+        if self._semaphore.locked() and self._waiting >= self._max_queued:
+            raise InferenceProviderError(
+                f"{provider_name}: claude -p queue is full ({self._waiting} calls already waiting for a slot)",
+            )
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=timeout_seconds)
+        except asyncio.TimeoutError as exc:
+            raise InferenceTimeoutError(
+                f"{provider_name}: no claude -p slot freed up within {timeout_seconds:.0f}s",
+            ) from exc
+        finally:
+            self._waiting -= 1
+        self._running += 1
+        try:
+            yield
+        finally:
+            self._running -= 1
+            self._semaphore.release()
+
+
+class _WarmPool:
+    """Warm spares shared by every provider on one credential and pool configuration.
+
+    Spares are keyed by their full argv (binary, model, system prompt,
+    schema), since those flags are fixed at spawn. Each checkout tops the
+    signature back up to `size` in the background, so spawning is driven by
+    demand and a failing binary costs one attempt per call, not a hot loop.
+    A janitor task reaps spares that outlive `spare_max_idle_seconds` and
+    exits once the pool is empty; the next checkout restarts it.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        api_key: str,
+        size: int,
+        spare_max_idle_seconds: float,
+    ) -> None:
+        self.name = name
+        self._api_key = api_key
+        self._size = size
+        self._spare_max_idle_seconds = spare_max_idle_seconds
+        self._spares: OrderedDict[tuple[str, ...], deque[_Spare]] = OrderedDict()
+        self._spawning: Counter[tuple[str, ...]] = Counter()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._janitor: asyncio.Task[None] | None = None
+        self._closed = False
+
+    def checkout(self, args: list[str]) -> _Spare | None:
+        """Return a live spare for `args`, or None when none is ready.
+
+        Either way the signature is topped back up in the background. The
+        caller owns the returned process and its scratch dir.
+        """
+        signature = tuple(args)
+        spare = self._take_spare(signature)
+        self._replenish(signature)
+        return spare
+
+    def _is_usable(self, spare: _Spare, now: float) -> bool:
+        return spare.proc.returncode is None and now - spare.spawned_at < self._spare_max_idle_seconds
+
+    def _take_spare(self, signature: tuple[str, ...]) -> _Spare | None:
+        spares = self._spares.get(signature)
+        if spares is None:
+            return None
+        self._spares.move_to_end(signature)
+        now = time.monotonic()
+        while spares:
+            spare = spares.popleft()
+            if self._is_usable(spare, now):
+                return spare
+            self._track(self._dispose(spare))
+        return None
+
+    def _replenish(self, signature: tuple[str, ...]) -> None:
+        if self._closed or self._size <= 0:
+            return
+        spares = self._spares.setdefault(signature, deque())
+        self._spares.move_to_end(signature)
+        while len(self._spares) > _MAX_SPARE_SIGNATURES:
+            _, evicted = self._spares.popitem(last=False)
+            for spare in evicted:
+                self._track(self._dispose(spare))
+        for _ in range(self._size - len(spares) - self._spawning[signature]):
+            self._spawning[signature] += 1
+            self._track(self._spawn_spare(signature))
+        if self._janitor is None or self._janitor.done():
+            self._janitor = asyncio.create_task(self._reap_idle_spares())
+
+    async def _spawn(self, args: list[str]) -> _Spare:
+        scratch_dir = tempfile.mkdtemp(prefix="luthien-claude-")
+        try:
+            proc = await _spawn_child(args, env=_build_child_env(self._api_key, scratch_dir), stdin_pipe=True)
+        except BaseException:
+            shutil.rmtree(scratch_dir, ignore_errors=True)
+            raise
+        return _Spare(proc=proc, scratch_dir=scratch_dir, spawned_at=time.monotonic())
+
+    async def _spawn_spare(self, signature: tuple[str, ...]) -> None:
+        try:
+            spare = await self._spawn(list(signature))
+        except InferenceProviderError as exc:
+            logger.warning(
+                "inference.claude_code.spare_spawn_failed",
+                extra={"inference_provider_name": self.name, "error": str(exc)},
+            )
+            return
+        finally:
+            self._spawning[signature] -= 1
+            if self._spawning[signature] <= 0:
+                del self._spawning[signature]
+        spares = self._spares.get(signature)
+        if self._closed or spares is None:
+            await self._dispose(spare)
+            return
+        spares.append(spare)
+
+    async def _reap_idle_spares(self) -> None:
+        interval = max(1.0, self._spare_max_idle_seconds / 2)
+        while not self._closed and (self._spawning or any(self._spares.values())):
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            for spares in self._spares.values():
+                for spare in [s for s in spares if not self._is_usable(s, now)]:
+                    spares.remove(spare)
+                    self._track(self._dispose(spare))
+
+    async def _dispose(self, spare: _Spare) -> None:
+        """Reap an unused spare, then remove its scratch dir."""
+        await _reap_child(spare.proc, provider_name=self.name)
+        shutil.rmtree(spare.scratch_dir, ignore_errors=True)
+
+    def _track(self, coro: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def close(self) -> None:
+        """Reap every spare and wait for in-flight spawns and disposals."""
+        self._closed = True
+        if self._janitor is not None:
+            self._janitor.cancel()
+            await asyncio.gather(self._janitor, return_exceptions=True)
+        for spares in self._spares.values():
+            for spare in spares:
+                self._track(self._dispose(spare))
+        self._spares.clear()
+        # A spawn finishing after `_closed` disposes its spare in a new task.
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+_warm_pools: OrderedDict[tuple[Any, ...], _WarmPool] = OrderedDict()
+_closing_pools: set[asyncio.Task[None]] = set()
+_admission_gates: dict[str, _AdmissionGate] = {}
+
+
+def _get_admission_gate(*, api_key: str, max_concurrency: int, max_queued: int) -> _AdmissionGate:
+    """Return the run-slot gate for this credential, creating it on first use.
+
+    Keyed by credential hash alone, so providers with different pool
+    settings share one cap and evicting a pool never resets it; the first
+    caller's limits win. Past `_MAX_WARM_POOLS` gates, idle ones are dropped,
+    which cannot release a held slot.
+    """
+    key = hash_credential(api_key)
+    gate = _admission_gates.get(key)
+    if gate is not None:
+        return gate
+    if len(_admission_gates) >= _MAX_WARM_POOLS:
+        for stale in [k for k, g in _admission_gates.items() if g.idle]:
+            del _admission_gates[stale]
+    gate = _AdmissionGate(max_concurrency=max_concurrency, max_queued=max_queued)
+    _admission_gates[key] = gate
+    return gate
+
+
+def _get_warm_pool(
+    *,
+    name: str,
+    api_key: str,
+    size: int,
+    spare_max_idle_seconds: float,
+) -> _WarmPool:
+    """Return the warm pool for this credential + configuration, creating it on first use.
+
+    Keyed by SHA-256 of the credential so raw tokens are never dict keys.
+    Beyond `_MAX_WARM_POOLS`, the least recently used pool is closed in the
+    background.
+    """
+    key = (hash_credential(api_key), size, spare_max_idle_seconds)
+    pool = _warm_pools.get(key)
+    if pool is not None:
+        _warm_pools.move_to_end(key)
+        return pool
+    pool = _WarmPool(
+        name=name,
+        api_key=api_key,
+        size=size,
+        spare_max_idle_seconds=spare_max_idle_seconds,
+    )
+    _warm_pools[key] = pool
+    while len(_warm_pools) > _MAX_WARM_POOLS:
+        _, evicted = _warm_pools.popitem(last=False)
+        task = asyncio.create_task(evicted.close())
+        _closing_pools.add(task)
+        task.add_done_callback(_closing_pools.discard)
+    return pool
+
+
+async def close_warm_pools() -> None:
+    """Reap every warm spare and drop all pools and slot gates (gateway shutdown)."""
+    pools = list(_warm_pools.values())
+    _warm_pools.clear()
+    _admission_gates.clear()
+    await asyncio.gather(*(pool.close() for pool in pools), *_closing_pools, return_exceptions=True)
+
+
 def _build_child_env(api_key: str, scratch_dir: str) -> dict[str, str]:
     """Minimal env for the claude subprocess.
 
@@ -135,11 +135,11 @@ class DirectApiProvider(InferenceProvider):
         )
 
         # Stable-credential calls (no override) reuse a cached client keyed
-        # by credential + base URL, so a judge that fires on every tool call
-        # doesn't pay pool init/teardown each time. Per-user passthrough
-        # (credential_override set) builds a fresh client and closes it,
-        # since those credentials vary per request and shouldn't accumulate
-        # in the shared cache.
+        # by credential + base URL. Per-user passthrough (credential_override
+        # set) builds a fresh client and closes it, since those credentials
+        # vary per request and shouldn't accumulate in the shared cache.
+        # Either way the connections come from the shared upstream pool, so
+        # a fresh client does not pay TCP+TLS.
         is_passthrough = credential_override is not None
         if is_passthrough:
             client = _build_client(credential, self._api_base)
@@ -196,9 +196,10 @@ def _build_client(credential: Credential, api_base: str | None) -> AnthropicClie
     """Build a fresh `AnthropicClient` for a single passthrough request.
 
     Used for `credential_override` (per-user passthrough) calls, where the
-    credential varies per request and the client should not be cached. The
-    caller is responsible for closing it. Stable-credential calls go through
-    `_cached_client` instead.
+    credential varies per request and the client should not be cached. It
+    sends through the shared upstream connection pool, so building one is
+    cheap. The caller is responsible for closing it. Stable-credential calls
+    go through `_cached_client` instead.
     """
     if credential.credential_type == CredentialType.AUTH_TOKEN:
         return AnthropicClient(auth_token=credential.value, base_url=api_base)
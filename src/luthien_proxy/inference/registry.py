@@ -50,7 +50,12 @@ from luthien_proxy.credentials.credential import (
     ServerCredentialNotFoundError,
 )
 from luthien_proxy.inference.base import InferenceError, InferenceProvider, InferenceProviderError, InferenceResult
-from luthien_proxy.inference.claude_code import ClaudeCodeProvider
+from luthien_proxy.inference.claude_code import (
+    DEFAULT_MAX_QUEUED,
+    DEFAULT_SPARE_MAX_IDLE_SECONDS,
+    ClaudeCodeProvider,
+    close_warm_pools,
+)
 from luthien_proxy.inference.direct_api import DirectApiProvider
 from luthien_proxy.utils.db import DatabasePool
 
@@ -240,18 +245,26 @@ def _build_claude_code(record: ProviderRecord, credential: Any) -> InferenceProv
 
     `ClaudeCodeProvider` requires a credential (the OAuth access token
     it injects into the subprocess env). Raise if one wasn't configured.
+    Warm-pool keys (`warm_pool_size`, `max_concurrency`, `max_queued`,
+    `spare_max_idle_seconds`) are optional; without them every call spawns
+    cold, as before.
     """
     if credential is None:
         raise MissingCredentialError(
             f"Provider {record.name!r} (backend=claude_code) requires credential_name "
             "to be set — the claude CLI cannot authenticate without one."
         )
-    timeout = float(record.config.get("timeout_seconds", 120.0))
+    config = record.config
+    timeout = float(config.get("timeout_seconds", 120.0))
     return ClaudeCodeProvider(
         name=record.name,
         credential=credential,
         default_model=record.default_model,
         timeout_seconds=timeout,
+        warm_pool_size=int(config.get("warm_pool_size", 0)),
+        max_concurrency=int(config.get("max_concurrency", 0)),
+        max_queued=int(config.get("max_queued", DEFAULT_MAX_QUEUED)),
+        spare_max_idle_seconds=float(config.get("spare_max_idle_seconds", DEFAULT_SPARE_MAX_IDLE_SECONDS)),
     )
 
 
@@ -505,12 +518,13 @@ class InferenceProviderRegistry:
         return deleted
 
     async def close(self) -> None:
-        """Clear the record cache.
+        """Clear the record cache and reap `claude_code` warm pools.
 
-        No provider instances are held, so there's nothing async to
-        drain. Kept for lifespan symmetry with `CredentialManager.close()`.
+        No provider instances are held. The warm spare processes outlive
+        them (they're shared per credential), so they're reaped here.
         """
         self._record_cache.clear()
+        await close_warm_pools()
 
     def _invalidate(self, name: str) -> None:
         """Drop a cached record on update / delete."""
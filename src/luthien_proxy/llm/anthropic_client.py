@@ -7,6 +7,7 @@ import anthropic.types
 from anthropic.types import RawMessageStreamEvent
 from opentelemetry import trace
 
+from luthien_proxy.llm import upstream_http
 from luthien_proxy.llm.types.anthropic import AnthropicRequest, AnthropicResponse, build_usage
 
 tracer = trace.get_tracer(__name__)
@@ -28,7 +29,9 @@ class AnthropicClient:
         """Initialize the Anthropic client.
 
         Creates the AsyncAnthropic client immediately for thread safety.
-        Exactly one of api_key or auth_token must be provided.
+        Exactly one of api_key or auth_token must be provided. Requests go
+        through the process-wide pool from ``upstream_http``; the credential
+        is only sent as a request header, so clients are cheap to create.
 
         Args:
             api_key: Anthropic API key (sent as x-api-key header).
@@ -45,15 +48,19 @@ class AnthropicClient:
             kwargs["auth_token"] = auth_token
         if base_url:
             kwargs["base_url"] = base_url
-        self._client = anthropic.AsyncAnthropic(**kwargs)
+        self._client = anthropic.AsyncAnthropic(http_client=upstream_http.shared_http_client(), **kwargs)
         if auth_token is not None:
             # The SDK reads ANTHROPIC_API_KEY from the environment and sends it as
             # x-api-key alongside the bearer token. Clear it so only bearer auth is sent.
             self._client.api_key = None
 
     async def close(self) -> None:
-        """Close the underlying HTTP connection pool."""
-        await self._client.close()
+        """Release the client.
+
+        A no-op: the HTTP connection pool is shared and outlives any one
+        client (``upstream_http.close`` shuts it down). ``AsyncAnthropic.close``
+        would close that shared pool, so it is deliberately not called.
+        """
 
     def with_api_key(self, api_key: str) -> "AnthropicClient":
         """Create a new client with a different API key, preserving base_url."""
@@ -208,5 +215,34 @@ class AnthropicClient:
                 async for event in stream:
                     yield event
 
+    async def stream_raw(
+        self, request: AnthropicRequest, extra_headers: dict[str, str] | None = None
+    ) -> AsyncIterator[bytes]:
+        """Stream the raw SSE response body from Anthropic API.
+
+        Same request as ``stream``, but yields the upstream bytes exactly as
+        received instead of parsed events. HTTP error statuses still raise
+        ``anthropic.APIStatusError`` before the first chunk; in-stream
+        ``error`` events are passed through as bytes.
+
+        Args:
+            request: Anthropic Messages API request.
+            extra_headers: Additional headers to forward to the API (e.g. anthropic-beta).
+
+        Yields:
+            Chunks of the ``text/event-stream`` response body.
+        """
+        with tracer.start_as_current_span("anthropic.stream") as span:
+            span.set_attribute("llm.model", request["model"])
+            span.set_attribute("llm.stream", True)
+            span.set_attribute("llm.stream_raw", True)
+
+            kwargs = self._prepare_request_kwargs(request)
+            if extra_headers:
+                kwargs["extra_headers"] = extra_headers
+            async with self._client.messages.with_streaming_response.create(**kwargs, stream=True) as response:
+                async for chunk in response.iter_bytes():
+                    yield chunk
+
 
 __all__ = ["AnthropicClient"]
@@ -1,11 +1,9 @@
 """LRU cache for AnthropicClient instances keyed by credential hash.
 
-Passthrough auth creates a per-credential AnthropicClient. Without caching,
-every request spins up a new anthropic.AsyncAnthropic (and its underlying
-httpx.AsyncClient connection pool), adding 50-100ms TCP+TLS overhead.
-
-This module maintains a bounded LRU cache so repeated requests with the
-same credential reuse the existing client and its warm connection pool.
+Passthrough auth creates a per-credential AnthropicClient. Connections live in
+the shared pool from ``upstream_http`` whether or not a client is cached, so
+this cache only saves rebuilding the ``anthropic.AsyncAnthropic`` wrapper on
+repeated requests with the same credential.
 """
 
 from __future__ import annotations
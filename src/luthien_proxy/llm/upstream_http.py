@@ -0,0 +1,174 @@
+"""Process-wide HTTP connection pool for upstream Anthropic API traffic.
+
+Each ``anthropic.AsyncAnthropic`` used to own an ``httpx.AsyncClient`` and
+with it a private connection pool. Passthrough auth creates one client per
+user credential, so a gateway serving many distinct keys held as many idle
+pools, and per-call clients (``credential_override`` judge calls) paid
+TCP+TLS on every request.
+
+Credentials are request headers, not connection state, so every
+``AnthropicClient`` and the ``/v1/*`` passthrough route now share the single
+bounded pool returned by :func:`shared_http_client`. With ``UPSTREAM_HTTP2``
+on (the default; ``h2`` ships via the ``httpx[http2]`` dependency)
+connections negotiate HTTP/2 and concurrent requests, including long-lived
+streams, multiplex over them instead of each holding a connection. The
+client keeps no cookies, since one jar would otherwise be shared by every
+user credential.
+
+:func:`stats` reports pool occupancy and connect latency for
+``/api/admin/upstream-http/stats``. Like every in-process counter here it is
+per uvicorn worker.
+"""
+
+from __future__ import annotations
+
+import http.cookiejar
+import importlib.util
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import anthropic
+import httpx
+
+from luthien_proxy.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+_TraceCallback = Callable[[str, dict[str, Any]], Awaitable[None]]
+
+_client: httpx.AsyncClient | None = None
+_http2_enabled = False
+
+
+class _ConnectStats:
+    """Cumulative connection-establishment counters (TCP connect through TLS handshake)."""
+
+    def __init__(self) -> None:
+        self.connects = 0
+        self.failed_connects = 0
+        self.total_ms = 0.0
+        self.last_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms: float) -> None:
+        self.connects += 1
+        self.total_ms += elapsed_ms
+        self.last_ms = elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+
+_connect_stats = _ConnectStats()
+
+
+def _make_connect_trace(request: httpx.Request, chained: _TraceCallback | None) -> _TraceCallback:
+    """Build an httpcore ``trace`` extension that times new connections for ``request``.
+
+    httpcore only emits the ``connection.*`` events when the pool opens a new
+    connection, so requests served by a kept-alive connection record nothing.
+    """
+    is_tls = request.url.scheme == "https"
+    started: float | None = None
+
+    async def trace(event: str, info: dict[str, Any]) -> None:
+        nonlocal started
+        if event == "connection.connect_tcp.started":
+            started = time.perf_counter()
+        elif started is not None and (
+            event == "connection.start_tls.complete" or (event == "connection.connect_tcp.complete" and not is_tls)
+        ):
+            _connect_stats.record((time.perf_counter() - started) * 1000)
+            started = None
+        elif started is not None and event in ("connection.connect_tcp.failed", "connection.start_tls.failed"):
+            _connect_stats.failed_connects += 1
+            started = None
+        if chained is not None:
+            await chained(event, info)
+
+    return trace
+
+
+async def _attach_connect_trace(request: httpx.Request) -> None:
+    request.extensions["trace"] = _make_connect_trace(request, request.extensions.get("trace"))
+
+
+def _build_client() -> httpx.AsyncClient:
+    global _http2_enabled
+    settings = get_settings()
+    _http2_enabled = settings.upstream_http2 and importlib.util.find_spec("h2") is not None
+    if settings.upstream_http2 and not _http2_enabled:
+        logger.info("UPSTREAM_HTTP2 is on but the h2 package is not installed; upstream pool uses HTTP/1.1.")
+    # DefaultAsyncHttpxClient keeps the SDK's own timeout and redirect defaults,
+    # so AsyncAnthropic treats the shared client exactly like the one it would
+    # have built for itself.
+    return anthropic.DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=max(1, settings.upstream_http_max_connections),
+            max_keepalive_connections=max(0, settings.upstream_http_max_keepalive_connections),
+            keepalive_expiry=settings.upstream_http_keepalive_expiry_seconds,
+        ),
+        http2=_http2_enabled,
+        # Cookies set for one credential's response must never ride along on
+        # another's request; a policy that allows no domain discards them all.
+        cookies=http.cookiejar.CookieJar(policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])),
+        event_hooks={"request": [_attach_connect_trace]},
+    )
+
+
+def shared_http_client() -> httpx.AsyncClient:
+    """Return the process-wide upstream HTTP client, creating it on first use.
+
+    Created lazily so pool settings resolved after import (CLI, env, DB
+    overrides) take effect. Callers must NOT close it; :func:`close` does that
+    at shutdown.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+    return _client
+
+
+def _pool_connections(client: httpx.AsyncClient) -> list[Any]:
+    # httpx exposes no public view of its pool: AsyncHTTPTransport wraps an
+    # httpcore AsyncConnectionPool, whose ``connections`` property is public.
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    return list(getattr(pool, "connections", ()))
+
+
+def stats() -> dict[str, Any]:
+    """Snapshot of pool occupancy and cumulative connect latency."""
+    settings = get_settings()
+    connections = _pool_connections(_client) if _client is not None and not _client.is_closed else []
+    idle = sum(1 for connection in connections if connection.is_idle())
+    connects = _connect_stats.connects
+    return {
+        "http2": _http2_enabled,
+        "max_connections": settings.upstream_http_max_connections,
+        "max_keepalive_connections": settings.upstream_http_max_keepalive_connections,
+        "open_connections": len(connections),
+        "active_connections": len(connections) - idle,
+        "idle_connections": idle,
+        "connects": connects,
+        "failed_connects": _connect_stats.failed_connects,
+        "avg_connect_ms": _connect_stats.total_ms / connects if connects else 0.0,
+        "last_connect_ms": _connect_stats.last_ms,
+        "max_connect_ms": _connect_stats.max_ms,
+    }
+
+
+async def close() -> None:
+    """Close the shared client and its connections (gateway shutdown)."""
+    global _client
+    client, _client = _client, None
+    if client is not None:
+        await client.aclose()
+
+
+def reset_stats() -> None:
+    """Zero the connect counters (for tests only)."""
+    global _connect_stats
+    _connect_stats = _ConnectStats()
+
+
+__all__ = ["close", "reset_stats", "shared_http_client", "stats"]
@@ -31,9 +31,9 @@ from luthien_proxy.exceptions import BackendAPIError
 from luthien_proxy.gateway_routes import router as gateway_router
 from luthien_proxy.history import routes as history_routes
 from luthien_proxy.inference.registry import InferenceProviderRegistry
-from luthien_proxy.llm import anthropic_client_cache
+from luthien_proxy.llm import anthropic_client_cache, upstream_http
 from luthien_proxy.llm.anthropic_client import AnthropicClient
-from luthien_proxy.observability.emitter import EventEmitter
+from luthien_proxy.observability.emitter import EventEmitter, EventWriteBuffer
 from luthien_proxy.observability.event_publisher import (
     EventPublisherProtocol,
     InProcessEventPublisher,
@@ -42,9 +42,19 @@ from luthien_proxy.observability.redis_event_publisher import RedisEventPublishe
 from luthien_proxy.observability.sentry import init_sentry
 from luthien_proxy.pipeline.upstream_headers import validate_upstream_headers_at_startup
 from luthien_proxy.policy_manager import PolicyManager
-from luthien_proxy.rate_limit import TokenBucketRateLimiter
+from luthien_proxy.rate_limit import (
+    RATE_LIMIT_BACKEND_MEMORY,
+    RATE_LIMIT_BACKEND_REDIS,
+    VALID_RATE_LIMIT_BACKENDS,
+    RateLimiterProtocol,
+    RedisTokenBucketRateLimiter,
+    TokenBucketRateLimiter,
+    UsageRateLimiter,
+    tightest_decision,
+)
 from luthien_proxy.request_log import router as request_log_router
 from luthien_proxy.retention.archiver import S3ConversationArchiver
+from luthien_proxy.retention.partitions import PartitionManager
 from luthien_proxy.retention.purger import ConversationPurger
 from luthien_proxy.session import login_page_router
 from luthien_proxy.session import router as session_router
@@ -65,8 +75,11 @@ from luthien_proxy.utils.credential_cache import (
     CredentialCacheProtocol,
     InProcessCredentialCache,
     RedisCredentialCache,
+    RedisCredentialInvalidationBus,
 )
 from luthien_proxy.utils.migration_check import check_migrations
+from luthien_proxy.utils.policy_cache import install_front
+from luthien_proxy.utils.policy_cache_front import PolicyCacheFront, RedisPolicyCacheInvalidationBus
 from luthien_proxy.utils.url import sanitize_url_for_logging
 from luthien_proxy.version import PROXY_DISPLAY_VERSION
 from luthien_proxy.webhook.sender import WebhookSender
@@ -205,13 +218,48 @@ def create_app(
             _event_publisher = InProcessEventPublisher()
             logger.info("Using in-process event publisher (no Redis)")
 
+        _event_write_buffer: EventWriteBuffer | None = None
+        if settings.event_write_behind:
+            _event_write_buffer = EventWriteBuffer(
+                db_pool,
+                max_queue_size=settings.event_write_queue_size,
+                flush_size=settings.event_write_flush_size,
+                flush_interval_seconds=settings.event_write_flush_interval_seconds,
+                dedup_messages=settings.conversation_message_dedup,
+            )
+            _event_write_buffer.start()
+            logger.info(
+                f"Event write-behind enabled: queue={settings.event_write_queue_size}, "
+                f"flush_size={settings.event_write_flush_size}, "
+                f"flush_interval={settings.event_write_flush_interval_seconds}s"
+            )
+
         _emitter = EventEmitter(
             db_pool=db_pool,
             event_publisher=_event_publisher,
             stdout_enabled=True,
+            db_write_buffer=_event_write_buffer,
+            dedup_messages=settings.conversation_message_dedup,
         )
         logger.info("Event emitter created")
 
+        _policy_cache_front: PolicyCacheFront | None = None
+        if settings.policy_cache_write_behind:
+            _policy_cache_front = PolicyCacheFront(
+                db_pool,
+                l1_max_entries=settings.policy_cache_l1_max_entries,
+                l1_ttl_seconds=settings.policy_cache_l1_ttl_seconds,
+                flush_interval_seconds=settings.policy_cache_flush_interval_seconds,
+                invalidation_bus=RedisPolicyCacheInvalidationBus(redis_client) if redis_client else None,
+            )
+            _policy_cache_front.start()
+            install_front(_policy_cache_front)
+            logger.info(
+                f"Policy cache write-behind enabled: l1={settings.policy_cache_l1_max_entries} entries, "
+                f"l1_ttl={settings.policy_cache_l1_ttl_seconds}s, "
+                f"flush_interval={settings.policy_cache_flush_interval_seconds}s"
+            )
+
         # Initialize PolicyManager
         try:
             _policy_manager = PolicyManager(
@@ -235,8 +283,10 @@ def create_app(
 
         # Create credential cache (Redis or in-process)
         _credential_cache: CredentialCacheProtocol | None
+        _credential_invalidation_bus: RedisCredentialInvalidationBus | None = None
         if redis_client:
             _credential_cache = RedisCredentialCache(redis_client)
+            _credential_invalidation_bus = RedisCredentialInvalidationBus(redis_client)
         else:
             _credential_cache = InProcessCredentialCache()
             logger.info("Using in-process credential cache (no Redis)")
@@ -244,8 +294,17 @@ def create_app(
         # Initialize CredentialManager for passthrough auth + server credentials
         _enc_key_str = get_settings().credential_encryption_key
         encryption_key = _enc_key_str.encode() if _enc_key_str else None
-        _credential_manager = CredentialManager(db_pool=db_pool, cache=_credential_cache, encryption_key=encryption_key)
+        _credential_manager = CredentialManager(
+            db_pool=db_pool,
+            cache=_credential_cache,
+            encryption_key=encryption_key,
+            l1_ttl_seconds=settings.credential_l1_cache_ttl_seconds,
+            l1_max_entries=settings.credential_l1_cache_max_entries,
+            touch_flush_interval_seconds=settings.credential_touch_flush_interval_seconds,
+            invalidation_bus=_credential_invalidation_bus,
+        )
         await _credential_manager.initialize(default_auth_mode=auth_mode)
+        _credential_manager.start()
 
         # Inference provider registry depends on the credential manager
         # (it resolves `credential_name` on each lookup).
@@ -297,19 +356,66 @@ def create_app(
         else:
             logger.info("Usage telemetry disabled")
 
-        _rate_limiter: TokenBucketRateLimiter | None = None
+        _rate_limiter: RateLimiterProtocol | None = None
         if settings.rate_limit_rpm > 0:
-            _rate_limiter = TokenBucketRateLimiter(
-                rpm=settings.rate_limit_rpm,
-                burst=settings.rate_limit_burst,
+            _rate_limit_backend = settings.rate_limit_backend
+            if _rate_limit_backend not in VALID_RATE_LIMIT_BACKENDS:
+                raise ValueError(
+                    f"Invalid RATE_LIMIT_BACKEND '{_rate_limit_backend}'. "
+                    f"Must be one of: {', '.join(sorted(VALID_RATE_LIMIT_BACKENDS))}"
+                )
+            if _rate_limit_backend == RATE_LIMIT_BACKEND_REDIS and redis_client is None:
+                logger.warning("RATE_LIMIT_BACKEND=redis but no Redis client is configured; using in-process buckets")
+                _rate_limit_backend = RATE_LIMIT_BACKEND_MEMORY
+            if _rate_limit_backend == RATE_LIMIT_BACKEND_REDIS and redis_client is not None:
+                _redis_rate_limiter = RedisTokenBucketRateLimiter(
+                    redis_client,
+                    rpm=settings.rate_limit_rpm,
+                    burst=settings.rate_limit_burst,
+                    lease_size=settings.rate_limit_local_lease,
+                    max_keys=settings.rate_limit_max_keys,
+                )
+                _rate_limiter = _redis_rate_limiter
+                logger.info(
+                    f"Rate limiting enabled (redis): {settings.rate_limit_rpm} RPM, "
+                    f"burst={int(_redis_rate_limiter.burst)}, local_lease={_redis_rate_limiter.lease_size}"
+                )
+            else:
+                _memory_rate_limiter = TokenBucketRateLimiter(
+                    rpm=settings.rate_limit_rpm,
+                    burst=settings.rate_limit_burst,
+                    max_keys=settings.rate_limit_max_keys,
+                )
+                _rate_limiter = _memory_rate_limiter
+                logger.info(
+                    f"Rate limiting enabled (memory): {settings.rate_limit_rpm} RPM, "
+                    f"burst={int(_memory_rate_limiter.burst)}, max_keys={_memory_rate_limiter.max_keys}"
+                )
+        else:
+            logger.info("Rate limiting disabled (RATE_LIMIT_RPM=0)")
+
+        _usage_rate_limiter: UsageRateLimiter | None = None
+        if settings.rate_limit_input_tpm or settings.rate_limit_output_tpm or settings.rate_limit_max_concurrent:
+            _usage_rate_limiter = UsageRateLimiter(
+                input_tpm=settings.rate_limit_input_tpm,
+                output_tpm=settings.rate_limit_output_tpm,
+                max_concurrent=settings.rate_limit_max_concurrent,
                 max_keys=settings.rate_limit_max_keys,
             )
             logger.info(
-                f"Rate limiting enabled: {settings.rate_limit_rpm} RPM, "
-                f"burst={int(_rate_limiter.burst)}, max_keys={_rate_limiter.max_keys}"
+                f"Usage rate limiting enabled: input_tpm={settings.rate_limit_input_tpm}, "
+                f"output_tpm={settings.rate_limit_output_tpm}, max_concurrent={settings.rate_limit_max_concurrent}"
             )
-        else:
-            logger.info("Rate limiting disabled (RATE_LIMIT_RPM=0)")
+
+        # Keeps daily partitions ahead of inserts once the optional
+        # partitioning script has been applied; no-op on unpartitioned tables.
+        _partition_manager: PartitionManager | None = None
+        if not db_pool.is_sqlite:
+            _partition_manager = PartitionManager(
+                db_pool=db_pool,
+                premake_days=settings.retention_partition_premake_days,
+            )
+            _partition_manager.start()
 
         _purger: ConversationPurger | None = None
         _retention_days = settings.conversation_retention_days
@@ -324,12 +430,17 @@ def create_app(
                     batch_size=settings.retention_archive_batch_size,
                     encryption_mode=settings.retention_s3_encryption,
                     kms_key_id=settings.retention_s3_kms_key_id,
+                    compression=settings.retention_archive_compression,
+                    segment_max_bytes=settings.retention_archive_segment_mb * 1024 * 1024,
+                    archive_format=settings.retention_archive_format,
                 )
                 logger.info(
-                    "Conversation archival enabled: s3://%s/%s (encryption=%s)",
+                    "Conversation archival enabled: s3://%s/%s (format=%s, encryption=%s, compression=%s)",
                     _s3_bucket,
                     _s3_prefix,
+                    settings.retention_archive_format,
                     settings.retention_s3_encryption,
+                    settings.retention_archive_compression,
                 )
                 if settings.retention_s3_encryption == "bucket-default":
                     logger.warning(
@@ -338,7 +449,13 @@ def create_app(
                         "configuration; otherwise objects will be written unencrypted.",
                         _s3_bucket,
                     )
-            _purger = ConversationPurger(db_pool=db_pool, retention_days=_retention_days, archiver=_archiver)
+            _purger = ConversationPurger(
+                db_pool=db_pool,
+                retention_days=_retention_days,
+                archiver=_archiver,
+                purge_message_blobs=settings.conversation_message_dedup,
+                partitions=_partition_manager,
+            )
             _purger.start()
         else:
             if settings.archive_s3_bucket:
@@ -380,6 +497,7 @@ def create_app(
             usage_collector=_usage_collector,
             config_registry=_config_registry,
             rate_limiter=_rate_limiter,
+            usage_rate_limiter=_usage_rate_limiter,
             webhook_sender=_webhook_sender,
         )
 
@@ -401,11 +519,21 @@ def create_app(
         await _webhook_sender.stop()
         if _purger is not None:
             await _purger.stop()
+        if _partition_manager is not None:
+            await _partition_manager.stop()
         if _telemetry_sender is not None:
             await _telemetry_sender.stop()
         await _inference_provider_registry.close()
         await _credential_manager.close()
         await anthropic_client_cache.close_all()
+        await upstream_http.close()
+        if _policy_cache_front is not None:
+            install_front(None)
+            await _policy_cache_front.stop()
+        # Flush queued events last so anything recorded during the teardown
+        # above still reaches the DB before the caller closes db_pool.
+        if _event_write_buffer is not None:
+            await _event_write_buffer.stop()
         # Note: db_pool and redis_client are NOT closed here - they are owned by
         # the caller who passed them in. The caller is responsible for cleanup.
         logger.info("Luthien Gateway shutdown complete")
@@ -443,13 +571,18 @@ def create_app(
     app.add_middleware(StaticCacheMiddleware)
 
     # Attach X-RateLimit-* headers to successful /v1/ responses. The rate-limit
-    # dependency stashes its RateLimitDecision on request.state; we read it here
-    # because the /v1 routes return their own Response objects (StreamingResponse
-    # / JSONResponse), which discard headers set on a dependency-injected Response.
+    # and usage-limit dependencies stash their RateLimitDecisions on request.state;
+    # we read them here because the /v1 routes return their own Response objects
+    # (StreamingResponse / JSONResponse), which discard headers set on a
+    # dependency-injected Response. With both limiters on, the headers describe
+    # whichever is closer to exhaustion, i.e. the one whose 429 comes next.
     class RateLimitHeaderMiddleware(BaseHTTPMiddleware):
         async def dispatch(self, request: Request, call_next):
             response = await call_next(request)
-            decision = getattr(request.state, "rate_limit_decision", None)
+            decision = tightest_decision(
+                getattr(request.state, "rate_limit_decision", None),
+                getattr(request.state, "usage_limit_decision", None),
+            )
             if decision is not None:
                 response.headers["X-RateLimit-Limit"] = str(decision.limit)
                 response.headers["X-RateLimit-Remaining"] = str(decision.remaining)
@@ -569,11 +702,12 @@ def create_app(
     return app
 
 
-async def connect_db(database_url: str) -> db.DatabasePool:
+async def connect_db(database_url: str, *, sqlite_readers: int = db.DEFAULT_SQLITE_READERS) -> db.DatabasePool:
     """Create and initialize database connection pool.
 
     Args:
         database_url: PostgreSQL connection URL
+        sqlite_readers: Read-only connections to open for a SQLite database
 
     Returns:
         Initialized DatabasePool
@@ -582,7 +716,7 @@ async def connect_db(database_url: str) -> db.DatabasePool:
         RuntimeError: If connection fails
     """
     try:
-        pool = db.DatabasePool(database_url)
+        pool = db.DatabasePool(database_url, sqlite_readers=sqlite_readers)
         await pool.get_pool()
         logger.info(f"Connected to database at {database_url[:DB_URL_PREVIEW_LENGTH]}...")
         return pool
@@ -654,6 +788,7 @@ def load_config_from_env(settings: Settings | None = None) -> dict:
         "api_key": settings.client_api_key,
         "admin_key": settings.admin_api_key,
         "database_url": database_url,
+        "sqlite_read_connections": settings.sqlite_read_connections,
         "redis_url": redis_url,
         "startup_policy_path": settings.policy_config if settings.policy_config else None,
         "policy_source": settings.policy_source,
@@ -849,7 +984,7 @@ if __name__ == "__main__":
         db_pool = None
         redis_client = None
         try:
-            db_pool = await connect_db(config["database_url"])
+            db_pool = await connect_db(config["database_url"], sqlite_readers=config["sqlite_read_connections"])
             redis_url = config["redis_url"]
             if redis_url:
                 redis_client = await connect_redis(redis_url)
@@ -0,0 +1,155 @@
+"""Compact projections of event payloads for the live activity stream.
+
+The activity stream (``/api/activity/stream``, fed by the Redis or
+in-process publisher) only needs enough of each event to render a summary
+row. Publishing the full payload meant every replica and every subscriber
+received whole request and response bodies, several times per turn.
+
+:func:`project_activity_data` maps an event payload to what the stream
+publishes:
+
+* Payloads whose JSON is at most ``ACTIVITY_DATA_MAX_BYTES`` pass through
+  unchanged (and reuse the emitter's encoding).
+* Request and response bodies of the ``transaction.*`` / ``pipeline.*``
+  events are replaced by per-type summaries (model, message/tool counts,
+  stop reason, usage, a short preview).
+* Everything else is trimmed generically: long strings are cut to
+  ``ACTIVITY_STRING_MAX_CHARS``, long lists to ``ACTIVITY_LIST_MAX_ITEMS``
+  and nesting below ``ACTIVITY_MAX_DEPTH`` is dropped.
+
+A projected payload carries ``"truncated": true`` and a ``full_payload``
+path (``/api/debug/calls/{call_id}``) where the stored events can be fetched.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import quote
+
+# Payloads up to this many bytes of (ASCII) JSON are published unchanged.
+ACTIVITY_DATA_MAX_BYTES = 4096
+ACTIVITY_STRING_MAX_CHARS = 200
+ACTIVITY_LIST_MAX_ITEMS = 10
+ACTIVITY_MAX_DEPTH = 3
+
+
+def _cap_string(text: str) -> str:
+    if len(text) <= ACTIVITY_STRING_MAX_CHARS:
+        return text
+    return text[:ACTIVITY_STRING_MAX_CHARS] + "..."
+
+
+def _trim(value: Any, depth: int = 0) -> Any:
+    """Generic size-capped copy of a JSON-safe value."""
+    if isinstance(value, str):
+        return _cap_string(value)
+    if isinstance(value, dict):
+        if depth >= ACTIVITY_MAX_DEPTH:
+            return f"<{len(value)} keys>"
+        return {k: _trim(v, depth + 1) for k, v in value.items()}
+    if isinstance(value, list):
+        if depth >= ACTIVITY_MAX_DEPTH:
+            return f"<{len(value)} items>"
+        trimmed = [_trim(v, depth + 1) for v in value[:ACTIVITY_LIST_MAX_ITEMS]]
+        if len(value) > ACTIVITY_LIST_MAX_ITEMS:
+            trimmed.append(f"<{len(value) - ACTIVITY_LIST_MAX_ITEMS} more>")
+        return trimmed
+    return value
+
+
+def _text_preview(content: Any) -> str | None:
+    if isinstance(content, str):
+        return _cap_string(content)
+    if isinstance(content, list):
+        for block in content:
+            if isinstance(block, dict) and block.get("type") == "text" and isinstance(block.get("text"), str):
+                return _cap_string(block["text"])
+    return None
+
+
+def summarize_request(request: Any) -> Any:
+    """Summarize an Anthropic Messages request body."""
+    if not isinstance(request, dict):
+        return _trim(request)
+    messages = request.get("messages")
+    messages = messages if isinstance(messages, list) else []
+    tools = request.get("tools")
+    last = messages[-1] if messages and isinstance(messages[-1], dict) else {}
+    return {
+        "model": request.get("model"),
+        "stream": request.get("stream"),
+        "max_tokens": request.get("max_tokens"),
+        "message_count": len(messages),
+        "tool_count": len(tools) if isinstance(tools, list) else 0,
+        "last_message_role": last.get("role"),
+        "last_message_preview": _text_preview(last.get("content")),
+    }
+
+
+def summarize_response(response: Any) -> Any:
+    """Summarize an Anthropic Messages response body."""
+    if not isinstance(response, dict):
+        return _trim(response)
+    content = response.get("content")
+    content = content if isinstance(content, list) else []
+    return {
+        "id": response.get("id"),
+        "model": response.get("model"),
+        "stop_reason": response.get("stop_reason"),
+        "usage": _trim(response.get("usage")),
+        "content_types": [block.get("type") for block in content[:ACTIVITY_LIST_MAX_ITEMS] if isinstance(block, dict)],
+        "text_preview": _text_preview(content),
+    }
+
+
+_REQUEST_FIELDS = {"original_request": summarize_request, "final_request": summarize_request}
+_RESPONSE_FIELDS = {"original_response": summarize_response, "final_response": summarize_response}
+
+# Per event type: payload field -> summarizer. Other fields go through _trim.
+_FIELD_SUMMARIZERS: dict[str, dict[str, Callable[[Any], Any]]] = {
+    "transaction.request_recorded": _REQUEST_FIELDS,
+    "transaction.streaming_response_recorded": _RESPONSE_FIELDS,
+    "transaction.non_streaming_response_recorded": _RESPONSE_FIELDS,
+    "pipeline.client_request": {"payload": summarize_request},
+    "pipeline.backend_request": {"payload": summarize_request},
+    "pipeline.client_response": {"payload": summarize_response},
+}
+
+
+def project_activity_data(
+    call_id: str,
+    event_type: str,
+    data: dict[str, Any],
+    data_json: str | None = None,
+) -> tuple[dict[str, Any], str | None]:
+    """Return ``(live_data, live_json)`` to publish for one event.
+
+    ``data_json`` is ``data``'s JSON encoding if the caller already has it.
+    ``live_json`` is that same text when the payload passes through
+    unchanged, otherwise ``None`` (the publisher encodes the projection).
+    """
+    if data_json is None:
+        data_json = json.dumps(data)
+    if len(data_json) <= ACTIVITY_DATA_MAX_BYTES:
+        return data, data_json
+
+    summarizers = _FIELD_SUMMARIZERS.get(event_type, {})
+    projected = {
+        key: summarizers[key](value) if key in summarizers else _trim(value, depth=1) for key, value in data.items()
+    }
+    projected["truncated"] = True
+    projected["full_payload"] = f"/api/debug/calls/{quote(call_id, safe='')}"
+    return projected, None
+
+
+__all__ = [
+    "ACTIVITY_DATA_MAX_BYTES",
+    "ACTIVITY_LIST_MAX_ITEMS",
+    "ACTIVITY_MAX_DEPTH",
+    "ACTIVITY_STRING_MAX_CHARS",
+    "project_activity_data",
+    "summarize_request",
+    "summarize_response",
+]
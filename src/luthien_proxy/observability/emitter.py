@@ -3,6 +3,11 @@
 Provides a simple interface for recording events to multiple sinks (stdout, db, event publisher).
 Events are also added to the current OTel span as span events.
 
+The database sink has two modes. By default each event is written in its own
+transaction. With an ``EventWriteBuffer`` attached (write-behind mode), events
+are queued in a bounded in-memory buffer and a background drainer writes them
+in multi-row batches, one transaction per flush.
+
 The EventEmitter should be injected via PolicyContext or Dependencies, not accessed
 via global state.
 """
@@ -15,16 +20,26 @@ import json
 import logging
 import sqlite3
 import sys
+import time
+from collections import deque
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any, Protocol, cast
 
 import asyncpg
 from opentelemetry import trace
 
+from luthien_proxy.observability.activity_projection import project_activity_data
 from luthien_proxy.observability.event_publisher import EventPublisherProtocol
-from luthien_proxy.observability.session_summary import update_session_summary
+from luthien_proxy.observability.message_store import externalize_messages, store_message_blobs
+from luthien_proxy.observability.search_index import SearchIndexEvent, index_session_search_text
+from luthien_proxy.observability.session_summary import (
+    SessionSummaryDelta,
+    apply_session_summary_delta,
+    update_session_summary,
+)
 from luthien_proxy.utils.constants import OTEL_SPAN_ID_HEX_LENGTH, OTEL_TRACE_ID_HEX_LENGTH
-from luthien_proxy.utils.db import DatabasePool
+from luthien_proxy.utils.db import ConnectionProtocol, DatabasePool, chunk_rows, values_placeholders
 
 
 def _safe_serialize(obj: Any) -> Any:
@@ -68,6 +83,53 @@ def _safe_serialize(obj: Any) -> Any:
     return str(obj)
 
 
+def _json_default(obj: Any) -> Any:
+    """``json.dumps`` hook applying ``_safe_serialize``'s rules to one non-JSON value.
+
+    The encoder calls this only for values it cannot encode itself and
+    re-encodes whatever it returns, so nested values are handled as they are
+    reached instead of by a separate walk over the whole payload.
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, bytes):
+        return f"b64:{base64.b64encode(obj).decode('ascii')}"
+    if isinstance(obj, set):
+        return sorted(obj, key=str)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    if hasattr(obj, "__dict__"):
+        return obj.__dict__
+    return str(obj)
+
+
+def encode_event_data(data: Any) -> tuple[Any, str]:
+    """Encode an event payload once for every sink.
+
+    Returns ``(safe_data, data_json)``. Sinks that write JSON use
+    ``data_json`` verbatim; sinks that inspect the payload (session
+    summaries, message dedup, span attributes) use ``safe_data``. That is
+    ``data`` itself when the encoder needed no help, which is the common
+    case, so the payload is not walked a second time; sinks must treat it as
+    read-only. Only when the ``_json_default`` hook fired, or the C encoder
+    rejected the payload outright (e.g. dicts with tuple keys), is
+    ``safe_data`` the ``_safe_serialize`` copy.
+    """
+    hook_fired = False
+
+    def _default(obj: Any) -> Any:
+        nonlocal hook_fired
+        hook_fired = True
+        return _json_default(obj)
+
+    try:
+        data_json = json.dumps(data, default=_default)
+    except (TypeError, ValueError):
+        safe_data = _safe_serialize(data)
+        return safe_data, json.dumps(safe_data)
+    return (_safe_serialize(data) if hook_fired else data), data_json
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -80,6 +142,334 @@ def _log_task_exception(task: asyncio.Task[None]) -> None:
         logger.error(f"Exception in background emit task: {exc}", exc_info=exc)
 
 
+DEFAULT_WRITE_QUEUE_SIZE = 10_000
+DEFAULT_WRITE_FLUSH_SIZE = 200
+DEFAULT_WRITE_FLUSH_INTERVAL_SECONDS = 0.5
+
+# Exceptions that count as a dropped DB write rather than a bug. Postgres raises
+# asyncpg errors, SQLite (aiosqlite) raises sqlite3.Error subclasses. Both must
+# tick the dropped counter — without sqlite3.Error, a failed SQLite write (e.g.
+# in the session_summaries update, the widest SQL surface here) would escape
+# the sink and be silently absorbed, leaving dropped_db_writes misleadingly
+# flat. Genuine logic bugs (TypeError/ValueError/etc.) intentionally still
+# propagate.
+_DB_WRITE_ERRORS = (OSError, asyncpg.PostgresError, asyncpg.InternalClientError, sqlite3.Error)
+
+
+def _extract_ids(data: dict[str, Any]) -> tuple[Any, Any]:
+    """Pull (session_id, user_id) out of an event payload (see ``_write_db``)."""
+    if not isinstance(data, dict):
+        return None, None
+    return data.get("session_id"), data.get("user_id")
+
+
+@dataclass(frozen=True)
+class PendingEventWrite:
+    """One serialized event waiting in the write-behind buffer."""
+
+    transaction_id: str
+    event_type: str
+    data: dict[str, Any]
+    timestamp: datetime
+    # JSON encoding of ``data`` from ``encode_event_data``; encoded here if absent.
+    data_json: str | None = None
+
+
+async def write_event_batch(
+    conn: ConnectionProtocol,
+    batch: list[PendingEventWrite],
+    *,
+    dedup_messages: bool = False,
+) -> None:
+    """Write a batch of events with multi-row statements.
+
+    Produces the same rows as running ``EventEmitter._write_db`` once per event,
+    in order, but with O(1) statements per table instead of three per event:
+
+    * ``conversation_calls``: one row per distinct call_id. Postgres rejects an
+      ``ON CONFLICT DO UPDATE`` that touches the same row twice in one
+      statement, so duplicates are merged here first — earliest ``created_at``
+      and first non-null ``session_id``/``user_id``, which is what the
+      per-event COALESCE upserts would have converged to.
+    * ``conversation_events``: one row per event, in enqueue order.
+    * ``session_summaries``: one :class:`SessionSummaryDelta` per session.
+    * ``session_search_index``: the batch's new conversation text, one row per
+      request or response event that adds any (see
+      :mod:`luthien_proxy.observability.search_index`).
+    * ``conversation_message_blobs`` (``dedup_messages`` only): one row per
+      distinct message across the whole batch, written before the events.
+
+    The caller owns the transaction.
+    """
+    calls: dict[str, list[Any]] = {}
+    summaries: dict[str, SessionSummaryDelta] = {}
+    search_events: list[SearchIndexEvent] = []
+    event_rows: list[tuple[Any, ...]] = []
+    blobs: dict[str, str] = {}
+    for write in batch:
+        session_id, user_id = _extract_ids(write.data)
+        call = calls.get(write.transaction_id)
+        if call is None:
+            calls[write.transaction_id] = [write.transaction_id, write.timestamp, session_id, user_id]
+        else:
+            call[2] = call[2] if call[2] is not None else session_id
+            call[3] = call[3] if call[3] is not None else user_id
+
+        stored = write.data
+        if dedup_messages:
+            stored, event_blobs = externalize_messages(write.data)
+            blobs.update(event_blobs)
+        payload = write.data_json if stored is write.data and write.data_json is not None else json.dumps(stored)
+        event_rows.append((write.transaction_id, write.event_type, payload, write.timestamp, session_id))
+
+        if isinstance(session_id, str) and session_id:
+            delta = summaries.get(session_id)
+            if delta is None:
+                delta = SessionSummaryDelta(
+                    session_id=session_id, first_seen=write.timestamp, last_seen=write.timestamp
+                )
+                summaries[session_id] = delta
+            delta.add_event(
+                event_type=write.event_type,
+                data=write.data,
+                user_id=user_id if isinstance(user_id, str) else None,
+                timestamp=write.timestamp,
+            )
+            search_events.append(
+                SearchIndexEvent(
+                    call_id=write.transaction_id,
+                    session_id=session_id,
+                    event_type=write.event_type,
+                    data=write.data,
+                    timestamp=write.timestamp,
+                )
+            )
+
+    for chunk in chunk_rows(list(calls.values()), 4):
+        await conn.execute(
+            f"""
+            INSERT INTO conversation_calls (call_id, created_at, session_id, user_id)
+            VALUES {values_placeholders(len(chunk), 4)}
+            ON CONFLICT (call_id) DO UPDATE SET
+                session_id = COALESCE(conversation_calls.session_id, EXCLUDED.session_id),
+                user_id = COALESCE(conversation_calls.user_id, EXCLUDED.user_id)
+            """,
+            *[value for row in chunk for value in row],
+        )
+
+    if blobs:
+        await store_message_blobs(conn, blobs, batch[-1].timestamp)
+
+    for chunk in chunk_rows(event_rows, 5):
+        await conn.execute(
+            f"""
+            INSERT INTO conversation_events (call_id, event_type, payload, created_at, session_id)
+            VALUES {values_placeholders(len(chunk), 5)}
+            """,
+            *[value for row in chunk for value in row],
+        )
+
+    for delta in summaries.values():
+        await apply_session_summary_delta(conn, delta)
+
+    await index_session_search_text(conn, search_events)
+
+
+class EventWriteBuffer:
+    """Bounded write-behind queue for the EventEmitter database sink.
+
+    ``enqueue`` is synchronous and never waits on the database: it appends to a
+    bounded deque and returns. A single background drainer wakes every
+    ``flush_interval_seconds`` (or as soon as ``flush_size`` events are
+    pending), pops up to ``flush_size`` events and writes them with
+    :func:`write_event_batch` inside one transaction. The drainer holds at most
+    one pool connection at a time, so event recording can no longer saturate
+    the pool no matter how many events are in flight.
+
+    **Delivery semantics: at-most-once, best-effort**, same as the direct path.
+    When the queue is full new events are dropped and counted in
+    ``dropped_queue_full_count``. A failed flush drops the whole batch and
+    ticks ``EventEmitter.dropped_db_writes`` by the batch size (the batch
+    rolled back as a unit, so nothing is half-written). Events still queued at
+    ``stop()`` are flushed once more and later ``enqueue`` calls are no-ops; a
+    process crash loses whatever is queued.
+
+    Concurrency model: single-loop asyncio. ``enqueue`` has no ``await``, so
+    the length check and append are atomic with respect to the drainer.
+    """
+
+    def __init__(
+        self,
+        db_pool: DatabasePool,
+        *,
+        max_queue_size: int = DEFAULT_WRITE_QUEUE_SIZE,
+        flush_size: int = DEFAULT_WRITE_FLUSH_SIZE,
+        flush_interval_seconds: float = DEFAULT_WRITE_FLUSH_INTERVAL_SECONDS,
+        dedup_messages: bool = False,
+    ) -> None:
+        """Initialize the buffer.
+
+        Args:
+            db_pool: Database pool the drainer writes to.
+            max_queue_size: Maximum number of queued events. Events recorded
+                while the queue is full are dropped.
+            flush_size: Maximum number of events written per transaction.
+                Reaching this many pending events also wakes the drainer early.
+            flush_interval_seconds: Maximum time an event waits in the queue
+                before the drainer flushes it.
+            dedup_messages: Store request messages in the content-addressed
+                blob table (see :mod:`luthien_proxy.observability.message_store`).
+        """
+        if max_queue_size < 1:
+            raise ValueError(f"max_queue_size must be >= 1 (got {max_queue_size})")
+        if flush_size < 1:
+            raise ValueError(f"flush_size must be >= 1 (got {flush_size})")
+        if flush_interval_seconds <= 0:
+            raise ValueError(f"flush_interval_seconds must be > 0 (got {flush_interval_seconds})")
+        self._db_pool = db_pool
+        self._max_queue_size = max_queue_size
+        self._flush_size = flush_size
+        self._flush_interval_seconds = flush_interval_seconds
+        self._dedup_messages = dedup_messages
+        self._queue: deque[PendingEventWrite] = deque()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._stopped = False
+        self._dropped_queue_full = 0
+        self._written = 0
+        self._flushes = 0
+        self._failed_flushes = 0
+        self._high_water_mark = 0
+        self._last_flush_seconds = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of events currently waiting to be written."""
+        return len(self._queue)
+
+    @property
+    def max_queue_size(self) -> int:
+        """Configured queue capacity."""
+        return self._max_queue_size
+
+    @property
+    def dropped_queue_full_count(self) -> int:
+        """Cumulative count of events dropped because the queue was full."""
+        return self._dropped_queue_full
+
+    @property
+    def written_count(self) -> int:
+        """Cumulative count of events committed by the drainer."""
+        return self._written
+
+    @property
+    def failed_flush_count(self) -> int:
+        """Cumulative count of flushes that rolled back on a DB error."""
+        return self._failed_flushes
+
+    def stats(self) -> dict[str, int | float]:
+        """Snapshot of the buffer's backpressure counters."""
+        return {
+            "queue_depth": len(self._queue),
+            "max_queue_size": self._max_queue_size,
+            "high_water_mark": self._high_water_mark,
+            "dropped_queue_full": self._dropped_queue_full,
+            "written": self._written,
+            "flushes": self._flushes,
+            "failed_flushes": self._failed_flushes,
+            "last_flush_ms": round(self._last_flush_seconds * 1000, 3),
+        }
+
+    def start(self) -> None:
+        """Start the background drainer. Must be called under a running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="event-write-buffer")
+            self._task.add_done_callback(_log_task_exception)
+
+    def enqueue(self, write: PendingEventWrite) -> bool:
+        """Queue one event for the next flush. Returns False if it was dropped."""
+        if self._stopped:
+            return False
+        if len(self._queue) >= self._max_queue_size:
+            self._dropped_queue_full += 1
+            n = self._dropped_queue_full
+            # Decade thresholds for early signal, then every 1000 for sustained backpressure.
+            if n in (1, 10, 100, 1000) or n % 1000 == 0:
+                logger.warning(
+                    "Event write backpressure: dropped %d event(s) — queue cap %d reached",
+                    n,
+                    self._max_queue_size,
+                )
+            return False
+        self._queue.append(write)
+        self._high_water_mark = max(self._high_water_mark, len(self._queue))
+        if len(self._queue) >= self._flush_size:
+            self._wakeup.set()
+        return True
+
+    async def flush(self) -> None:
+        """Write everything currently queued, ``flush_size`` events per transaction."""
+        while self._queue:
+            batch = [self._queue.popleft() for _ in range(min(self._flush_size, len(self._queue)))]
+            await self._write_batch(batch)
+
+    async def stop(self) -> None:
+        """Stop the drainer and flush whatever is still queued. Idempotent.
+
+        The drainer is asked to exit rather than cancelled, so a batch it has
+        already taken off the queue finishes writing instead of being lost.
+        """
+        if self._stopped:
+            return
+        self._stopped = True
+        self._wakeup.set()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while not self._stopped:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval_seconds)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:
+                # DB errors are handled per batch in _write_batch; anything
+                # reaching here is a bug. Keep draining so one bad batch can't
+                # wedge the queue until it fills and drops everything.
+                logger.error("Unexpected error flushing event write buffer", exc_info=True)
+
+    async def _write_batch(self, batch: list[PendingEventWrite]) -> None:
+        started = time.perf_counter()
+        try:
+            async with self._db_pool.connection() as conn:
+                async with conn.transaction():
+                    await write_event_batch(conn, batch, dedup_messages=self._dedup_messages)
+        except _DB_WRITE_ERRORS as e:
+            self._failed_flushes += 1
+            EventEmitter.dropped_db_writes += len(batch)
+            logger.warning(
+                f"Failed to flush {len(batch)} event(s) to database "
+                f"({EventEmitter.dropped_db_writes} total dropped): {repr(e)}",
+                exc_info=True,
+            )
+            return
+        except asyncio.CancelledError:
+            # The batch is already off the queue; account for it before unwinding.
+            EventEmitter.dropped_db_writes += len(batch)
+            logger.warning(f"Event flush cancelled; dropped {len(batch)} event(s) already taken off the queue")
+            raise
+        finally:
+            self._last_flush_seconds = time.perf_counter() - started
+        self._flushes += 1
+        self._written += len(batch)
+        logger.debug(f"Flushed {len(batch)} event(s) to db")
+
+
 class EventEmitterProtocol(Protocol):
     """Protocol for event emission.
 
@@ -130,11 +520,31 @@ class EventEmitter:
         db_pool: "DatabasePool | None" = None,
         event_publisher: "EventPublisherProtocol | None" = None,
         stdout_enabled: bool = True,
+        db_write_buffer: "EventWriteBuffer | None" = None,
+        dedup_messages: bool = False,
     ):
-        """Initialize the event emitter with optional sinks."""
+        """Initialize the event emitter with optional sinks.
+
+        When ``db_write_buffer`` is given, the database sink runs in
+        write-behind mode: events are queued on the buffer instead of being
+        written directly, and ``db_pool`` is not used for event writes. The
+        caller owns the buffer's ``start()``/``stop()`` lifecycle.
+
+        ``dedup_messages`` applies to direct writes; in write-behind mode the
+        buffer's own ``dedup_messages`` setting is used.
+        """
         self._db_pool = db_pool
         self._event_publisher = event_publisher
         self._stdout_enabled = stdout_enabled
+        self._db_write_buffer = db_write_buffer
+        self._dedup_messages = dedup_messages
+
+    def db_write_stats(self) -> dict[str, int | float]:
+        """Database-sink counters: ``dropped_db_writes`` plus write-behind backpressure stats."""
+        stats: dict[str, int | float] = {"dropped_db_writes": EventEmitter.dropped_db_writes}
+        if self._db_write_buffer is not None:
+            stats.update(self._db_write_buffer.stats())
+        return stats
 
     async def emit(
         self,
@@ -151,8 +561,8 @@ class EventEmitter:
         """
         timestamp = datetime.now(UTC)
 
-        # Ensure data is JSON-serializable before passing to sinks
-        safe_data = _safe_serialize(data)
+        # Encode once; every sink reuses the same JSON text.
+        safe_data, data_json = encode_event_data(data)
 
         # Add to current OTel span as a span event
         span = trace.get_current_span()
@@ -162,11 +572,15 @@ class EventEmitter:
         # Emit to all sinks concurrently
         tasks = []
         if self._stdout_enabled:
-            tasks.append(self._write_stdout(transaction_id, event_type, safe_data, timestamp))
-        if self._db_pool:
-            tasks.append(self._write_db(transaction_id, event_type, safe_data, timestamp))
+            tasks.append(self._write_stdout(transaction_id, event_type, safe_data, timestamp, data_json))
+        if self._db_write_buffer is not None:
+            self._db_write_buffer.enqueue(
+                PendingEventWrite(transaction_id, event_type, safe_data, timestamp, data_json)
+            )
+        elif self._db_pool:
+            tasks.append(self._write_db(transaction_id, event_type, safe_data, timestamp, data_json))
         if self._event_publisher:
-            tasks.append(self._write_events(transaction_id, event_type, safe_data, timestamp))
+            tasks.append(self._write_events(transaction_id, event_type, safe_data, timestamp, data_json))
 
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
@@ -196,8 +610,9 @@ class EventEmitter:
         event_type: str,
         data: dict[str, Any],
         timestamp: datetime,
+        data_json: str | None = None,
     ) -> None:
-        """Write event to stdout as JSON."""
+        """Write event to stdout as JSON, splicing in ``data_json`` when given."""
         try:
             span = trace.get_current_span()
             ctx = span.get_span_context()
@@ -215,9 +630,11 @@ class EventEmitter:
                 "span_id": span_id,
                 "transaction_id": transaction_id,
                 "event_type": event_type,
-                "data": data,
             }
-            print(json.dumps(log_entry), file=sys.stdout, flush=True)
+            if data_json is None:
+                data_json = json.dumps(data)
+            # "data" stays the last key, as when the entry was dumped whole.
+            print(f'{json.dumps(log_entry)[:-1]}, "data": {data_json}}}', file=sys.stdout, flush=True)
         except Exception as e:
             logger.warning(f"Failed to write event to stdout: {repr(e)}", exc_info=True)
 
@@ -227,9 +644,13 @@ class EventEmitter:
         event_type: str,
         data: dict[str, Any],
         timestamp: datetime,
+        data_json: str | None = None,
     ) -> None:
         """Write event to PostgreSQL.
 
+        ``data_json`` is stored as the payload when the event has no messages
+        to externalize, instead of re-encoding ``data``.
+
         Session ID and User ID Propagation Convention:
             The session_id and user_id are extracted from the event data dict if present.
             Callers (e.g., processor.py) should include {"session_id": value, "user_id": value}
@@ -239,12 +660,11 @@ class EventEmitter:
         """
         db_pool = cast(DatabasePool, self._db_pool)
         # Extract session_id and user_id from data if present (set by processor via convention above)
-        session_id = data.get("session_id") if isinstance(data, dict) else None
-        user_id = data.get("user_id") if isinstance(data, dict) else None
+        session_id, user_id = _extract_ids(data)
 
         try:
             async with db_pool.connection() as conn:
-                # All three writes must commit together. Without an explicit
+                # All writes must commit together. Without an explicit
                 # transaction each statement auto-commits, so a failure in the
                 # session_summaries update would leave the event row already
                 # committed and the materialized summary permanently out of sync
@@ -267,6 +687,12 @@ class EventEmitter:
                         user_id,
                     )
 
+                    stored = data
+                    if self._dedup_messages:
+                        stored, blobs = externalize_messages(data)
+                        if blobs:
+                            await store_message_blobs(conn, blobs, timestamp)
+
                     # Insert event row. user_id is intentionally NOT stored on
                     # conversation_events — it lives on conversation_calls (which
                     # query paths join through). Denormalizing onto every event
@@ -278,14 +704,15 @@ class EventEmitter:
                         """,
                         transaction_id,
                         event_type,
-                        json.dumps(data),
+                        data_json if stored is data and data_json is not None else json.dumps(stored),
                         timestamp,
                         session_id,
                     )
 
-                    # Incrementally maintain the materialized session_summaries row.
-                    # Only sessions with a session_id are listed by the history page,
-                    # so events without one contribute nothing here.
+                    # Incrementally maintain the materialized session_summaries row
+                    # and the session search index. Only sessions with a session_id
+                    # are listed by the history page, so events without one
+                    # contribute nothing here.
                     if isinstance(session_id, str) and session_id:
                         await update_session_summary(
                             conn,
@@ -295,16 +722,22 @@ class EventEmitter:
                             user_id=user_id if isinstance(user_id, str) else None,
                             timestamp=timestamp,
                         )
+                        await index_session_search_text(
+                            conn,
+                            [
+                                SearchIndexEvent(
+                                    call_id=transaction_id,
+                                    session_id=session_id,
+                                    event_type=event_type,
+                                    data=data,
+                                    timestamp=timestamp,
+                                )
+                            ],
+                        )
 
             logger.debug(f"Wrote event to db: {event_type} (transaction_id={transaction_id})")
-        # Driver-agnostic DB failure handling: Postgres raises asyncpg errors,
-        # SQLite (aiosqlite) raises sqlite3.Error subclasses. Both must tick the
-        # dropped counter — without sqlite3.Error, a failed SQLite write (e.g. in
-        # the session_summaries update, the widest SQL surface here) would escape
-        # _write_db and be silently absorbed by emit()'s gather(return_exceptions=
-        # True), leaving dropped_db_writes misleadingly flat. Genuine logic bugs
-        # (TypeError/ValueError/etc.) intentionally still propagate.
-        except (OSError, asyncpg.PostgresError, asyncpg.InternalClientError, sqlite3.Error) as e:
+        # Driver-agnostic DB failure handling — see _DB_WRITE_ERRORS.
+        except _DB_WRITE_ERRORS as e:
             EventEmitter.dropped_db_writes += 1
             logger.warning(
                 f"Failed to write event to database ({EventEmitter.dropped_db_writes} total dropped): {repr(e)}",
@@ -317,14 +750,21 @@ class EventEmitter:
         event_type: str,
         data: dict[str, Any],
         timestamp: datetime,  # noqa: ARG002
+        data_json: str | None = None,
     ) -> None:
-        """Write event to the event publisher (Redis or in-process)."""
+        """Write event to the event publisher (Redis or in-process).
+
+        Large payloads are replaced by a compact projection (see
+        :mod:`luthien_proxy.observability.activity_projection`).
+        """
         publisher = cast("EventPublisherProtocol", self._event_publisher)
         try:
+            live_data, live_json = project_activity_data(transaction_id, event_type, data, data_json)
             await publisher.publish_event(
                 call_id=transaction_id,
                 event_type=event_type,
-                data=data,
+                data=live_data,
+                data_json=live_json,
             )
         except Exception as e:
             logger.warning(f"Failed to write event to redis: {repr(e)}", exc_info=True)
@@ -333,5 +773,9 @@ class EventEmitter:
 __all__ = [
     "EventEmitter",
     "EventEmitterProtocol",
+    "EventWriteBuffer",
     "NullEventEmitter",
+    "PendingEventWrite",
+    "encode_event_data",
+    "write_event_batch",
 ]
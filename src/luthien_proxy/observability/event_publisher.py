@@ -41,6 +41,44 @@ def build_activity_event(
     return event
 
 
+def encode_activity_event(
+    call_id: str,
+    event_type: str,
+    data: dict[str, Any] | None = None,
+    data_json: str | None = None,
+) -> str:
+    """JSON-encode the activity event for ``data``.
+
+    ``data_json`` is the already-encoded ``data`` (see
+    ``luthien_proxy.observability.emitter.encode_event_data``); when given it
+    is spliced in verbatim instead of encoding ``data`` again.
+    """
+    event = build_activity_event(call_id, event_type, data)
+    if data_json is None or "data" not in event:
+        return json.dumps(event)
+    del event["data"]
+    return f'{json.dumps(event)[:-1]}, "data": {data_json}}}'
+
+
+def parse_event_type_filter(raw: str | None) -> tuple[str, ...] | None:
+    """Parse a comma-separated event-type filter; None or blank means no filter.
+
+    Each entry is an exact event type (``policy.decision``) or, ending in a
+    dot, a prefix (``transaction.`` matches every ``transaction.*`` event).
+    """
+    if raw is None:
+        return None
+    entries = tuple(entry.strip() for entry in raw.split(",") if entry.strip())
+    return entries or None
+
+
+def event_type_matches(event_type: str, event_types: tuple[str, ...] | None) -> bool:
+    """Whether ``event_type`` passes a filter from :func:`parse_event_type_filter`."""
+    if event_types is None:
+        return True
+    return any(event_type == entry or (entry.endswith(".") and event_type.startswith(entry)) for entry in event_types)
+
+
 def format_sse_payload(payload: str) -> str:
     """Wrap a JSON string in SSE data frame format."""
     return f"data: {payload}\n\n"
@@ -68,15 +106,25 @@ class EventPublisherProtocol(Protocol):
         call_id: str,
         event_type: str,
         data: dict[str, Any] | None = None,
+        data_json: str | None = None,
     ) -> None:
-        """Publish an event to all subscribers."""
+        """Publish an event to all subscribers.
+
+        ``data_json``, when given, is ``data`` already JSON-encoded and is used
+        as-is rather than encoding ``data`` again.
+        """
         ...
 
     def stream_events(
         self,
         heartbeat_seconds: float = 15.0,
+        event_types: tuple[str, ...] | None = None,
     ) -> AsyncGenerator[str, None]:
-        """Async generator yielding SSE-formatted event strings."""
+        """Async generator yielding SSE-formatted event strings.
+
+        ``event_types`` (see :func:`parse_event_type_filter`) restricts the
+        stream to matching events; heartbeats are always sent.
+        """
         ...
 
 
@@ -87,25 +135,28 @@ class InProcessEventPublisher:
     """In-process event publisher using asyncio queues.
 
     For single-process local mode. Each SSE subscriber gets its own queue;
-    publish_event pushes to all subscriber queues.
+    publish_event pushes to the queue of every subscriber whose event-type
+    filter matches.
     """
 
     def __init__(self) -> None:
-        """Initialize with empty subscriber set."""
-        self._subscribers: set[asyncio.Queue[str]] = set()
+        """Initialize with no subscribers."""
+        self._subscribers: dict[asyncio.Queue[str], tuple[str, ...] | None] = {}
 
     async def publish_event(
         self,
         call_id: str,
         event_type: str,
         data: dict[str, Any] | None = None,
+        data_json: str | None = None,
     ) -> None:
         """Publish an event to all subscriber queues."""
-        event = build_activity_event(call_id, event_type, data)
-        payload = format_sse_payload(json.dumps(event))
+        payload = format_sse_payload(encode_activity_event(call_id, event_type, data, data_json))
 
         dead_queues: list[asyncio.Queue[str]] = []
-        for queue in list(self._subscribers):
+        for queue, event_types in list(self._subscribers.items()):
+            if not event_type_matches(event_type, event_types):
+                continue
             try:
                 queue.put_nowait(payload)
             except asyncio.QueueFull:
@@ -113,15 +164,16 @@ class InProcessEventPublisher:
                 logger.warning("Dropping slow event subscriber")
 
         for q in dead_queues:
-            self._subscribers.discard(q)
+            self._subscribers.pop(q, None)
 
     async def stream_events(
         self,
         heartbeat_seconds: float = 15.0,
+        event_types: tuple[str, ...] | None = None,
     ) -> AsyncGenerator[str, None]:
-        """Stream SSE events, yielding heartbeats when idle."""
+        """Stream SSE events matching ``event_types``, yielding heartbeats when idle."""
         queue: asyncio.Queue[str] = asyncio.Queue(maxsize=1000)
-        self._subscribers.add(queue)
+        self._subscribers[queue] = event_types
         last_heartbeat = time.monotonic()
 
         try:
@@ -139,4 +191,4 @@ class InProcessEventPublisher:
         except asyncio.CancelledError:
             raise
         finally:
-            self._subscribers.discard(queue)
+            self._subscribers.pop(queue, None)
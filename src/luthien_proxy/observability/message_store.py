@@ -0,0 +1,171 @@
+"""Content-addressed storage for conversation messages in event payloads.
+
+Clients like Claude Code resend the whole conversation on every turn, and each
+turn records the ``messages`` array several times (``pipeline.client_request``,
+``transaction.request_recorded`` original + final, ``pipeline.backend_request``).
+Stored inline, a long session writes the same history O(turns^2) times.
+
+With deduplication enabled the emitter calls :func:`externalize_messages` before
+writing: each message is hashed (sha256 over canonical JSON) and replaced by a
+``{"blob_ref": "<digest>"}`` stub, and the message body is written once to
+``conversation_message_blobs`` (migration 022). Hashing per message rather than
+per message-prefix means a turn only stores the messages it added — the shared
+prefix is already present under the same digests.
+
+Readers call :func:`rehydrate_payloads` to swap stubs back for message bodies.
+Rehydration is a no-op for payloads without stubs, so rows written before
+dedup was enabled (or with it disabled) read exactly as before.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from luthien_proxy.utils.db import ConnectionProtocol
+
+logger = logging.getLogger(__name__)
+
+BLOB_REF_KEY = "blob_ref"
+
+# Payload keys whose value is a request body with a ``messages`` list:
+# ``payload`` for pipeline.client_request / pipeline.backend_request,
+# ``original_request`` / ``final_request`` for transaction.request_recorded.
+_REQUEST_KEYS = ("payload", "original_request", "final_request")
+
+# Bound parameters per statement; stays under SQLite's default
+# SQLITE_MAX_VARIABLE_NUMBER (999).
+_MAX_DIGESTS_PER_STATEMENT = 900
+
+
+def message_digest(message: Any) -> str:
+    """Return the sha256 hex digest of a message's canonical JSON encoding."""
+    canonical = json.dumps(message, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _is_blob_ref(value: Any) -> bool:
+    return isinstance(value, dict) and len(value) == 1 and isinstance(value.get(BLOB_REF_KEY), str)
+
+
+def _message_lists(payload: dict[str, Any]) -> Iterable[tuple[dict[str, Any], list[Any]]]:
+    """Yield ``(request, messages)`` for every request body in an event payload."""
+    for key in _REQUEST_KEYS:
+        request = payload.get(key)
+        if isinstance(request, dict):
+            messages = request.get("messages")
+            if isinstance(messages, list):
+                yield request, messages
+
+
+def externalize_messages(data: dict[str, Any]) -> tuple[dict[str, Any], dict[str, str]]:
+    """Replace request messages with blob refs.
+
+    The input is not mutated: request dicts that contain messages are
+    shallow-copied, everything else is shared with ``data``.
+
+    Args:
+        data: JSON-safe event payload.
+
+    Returns:
+        ``(payload, blobs)`` where ``payload`` is the event payload to store and
+        ``blobs`` maps each referenced digest to the message's JSON encoding.
+        ``blobs`` is empty (and ``payload is data``) when there is nothing to
+        externalize.
+    """
+    blobs: dict[str, str] = {}
+    result = data
+    for key in _REQUEST_KEYS:
+        request = data.get(key)
+        if not isinstance(request, dict):
+            continue
+        messages = request.get("messages")
+        if not isinstance(messages, list) or not messages:
+            continue
+        refs: list[Any] = []
+        for message in messages:
+            if _is_blob_ref(message):
+                refs.append(message)
+                continue
+            digest = message_digest(message)
+            blobs.setdefault(digest, json.dumps(message))
+            refs.append({BLOB_REF_KEY: digest})
+        if result is data:
+            result = dict(data)
+        result[key] = {**request, "messages": refs}
+    return result, blobs
+
+
+async def store_message_blobs(conn: ConnectionProtocol, blobs: dict[str, str], timestamp: datetime) -> None:
+    """Insert message blobs, bumping ``last_seen_at`` on ones that already exist.
+
+    Digests are written in sorted order so concurrent writers sharing a
+    conversation prefix take row locks in the same order. Must run in the
+    same transaction as, and before, the event rows that reference the blobs
+    (the search-index triggers resolve refs at insert time).
+    """
+    digests = sorted(blobs)
+    rows_per_statement = _MAX_DIGESTS_PER_STATEMENT // 4
+    for start in range(0, len(digests), rows_per_statement):
+        chunk = digests[start : start + rows_per_statement]
+        values = ", ".join(f"(${i * 4 + 1}, ${i * 4 + 2}, ${i * 4 + 3}, ${i * 4 + 4})" for i in range(len(chunk)))
+        args: list[Any] = []
+        for digest in chunk:
+            args.extend((digest, blobs[digest], timestamp, timestamp))
+        await conn.execute(
+            f"""
+            INSERT INTO conversation_message_blobs (digest, content, created_at, last_seen_at)
+            VALUES {values}
+            ON CONFLICT (digest) DO UPDATE SET last_seen_at = EXCLUDED.last_seen_at
+            """,
+            *args,
+        )
+
+
+async def rehydrate_payloads(conn: ConnectionProtocol, payloads: Iterable[dict[str, Any]]) -> None:
+    """Replace blob refs in event payloads with the stored messages, in place.
+
+    All refs across ``payloads`` are resolved with one query per chunk of
+    distinct digests. A ref whose blob is missing (e.g. purged ahead of a
+    stale reader) is left as-is and logged.
+    """
+    targets = [(request, messages) for payload in payloads for request, messages in _message_lists(payload)]
+    digests = sorted(
+        {message[BLOB_REF_KEY] for _, messages in targets for message in messages if _is_blob_ref(message)}
+    )
+    if not digests:
+        return
+
+    resolved: dict[str, Any] = {}
+    for start in range(0, len(digests), _MAX_DIGESTS_PER_STATEMENT):
+        chunk = digests[start : start + _MAX_DIGESTS_PER_STATEMENT]
+        placeholders = ", ".join(f"${i + 1}" for i in range(len(chunk)))
+        rows = await conn.fetch(
+            f"SELECT digest, content FROM conversation_message_blobs WHERE digest IN ({placeholders})",
+            *chunk,
+        )
+        for row in rows:
+            content = row["content"]
+            resolved[str(row["digest"])] = json.loads(content) if isinstance(content, str) else content
+
+    missing = len(digests) - len(resolved)
+    if missing:
+        logger.warning("%d referenced conversation message blob(s) not found; leaving refs in place", missing)
+
+    for request, messages in targets:
+        request["messages"] = [
+            resolved.get(message[BLOB_REF_KEY], message) if _is_blob_ref(message) else message for message in messages
+        ]
+
+
+__all__ = [
+    "BLOB_REF_KEY",
+    "externalize_messages",
+    "message_digest",
+    "rehydrate_payloads",
+    "store_message_blobs",
+]
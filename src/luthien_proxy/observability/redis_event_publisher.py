@@ -20,7 +20,8 @@ import redis.asyncio as redis
 from redis.asyncio.client import PubSub
 
 from luthien_proxy.observability.event_publisher import (
-    build_activity_event,
+    encode_activity_event,
+    event_type_matches,
     format_sse_payload,
     heartbeat_event,
     should_send_heartbeat,
@@ -67,6 +68,7 @@ class RedisEventPublisher:
         call_id: str,
         event_type: str,
         data: dict[str, Any] | None = None,
+        data_json: str | None = None,
     ) -> None:
         """Publish a simplified event to Redis for real-time UI.
 
@@ -74,11 +76,10 @@ class RedisEventPublisher:
             call_id: Unique request identifier (correlates with trace_id)
             event_type: Event type (e.g., "policy.content_filtered")
             data: Optional event-specific data
+            data_json: ``data`` already JSON-encoded, used as-is if given
         """
-        event = build_activity_event(call_id, event_type, data)
-
         try:
-            await self.redis.publish(self.channel, json.dumps(event))
+            await self.redis.publish(self.channel, encode_activity_event(call_id, event_type, data, data_json))
             logger.debug(f"Published event: {event_type} for call {call_id}")
         except Exception as e:
             logger.error(f"Failed to publish event to Redis: {repr(e)}")
@@ -87,11 +88,13 @@ class RedisEventPublisher:
     async def stream_events(
         self,
         heartbeat_seconds: float = HEARTBEAT_INTERVAL_SECONDS,
+        event_types: tuple[str, ...] | None = None,
     ) -> AsyncGenerator[str, None]:
         """Stream activity events as SSE. Satisfies EventPublisherProtocol."""
         async for event in stream_activity_events(
             self.redis,
             heartbeat_seconds=heartbeat_seconds,
+            event_types=event_types,
         ):
             yield event
 
@@ -101,6 +104,15 @@ def _decode_payload(message: dict[str, Any]) -> str:
     return cast(bytes, payload).decode("utf-8")
 
 
+def _payload_event_type(payload: str) -> str:
+    try:
+        event = json.loads(payload)
+    except json.JSONDecodeError:
+        return ""
+    event_type = event.get("event_type") if isinstance(event, dict) else None
+    return event_type if isinstance(event_type, str) else ""
+
+
 async def _poll_pubsub_message(pubsub: PubSub, timeout_seconds: float) -> dict[str, Any] | None:
     try:
         return await asyncio.wait_for(
@@ -115,6 +127,7 @@ async def stream_activity_events(
     redis_client: redis.Redis,
     heartbeat_seconds: float = HEARTBEAT_INTERVAL_SECONDS,
     timeout_seconds: float = REDIS_PUBSUB_TIMEOUT_SECONDS,
+    event_types: tuple[str, ...] | None = None,
 ) -> AsyncGenerator[str, None]:
     r"""Stream activity events as Server-Sent Events.
 
@@ -122,6 +135,7 @@ async def stream_activity_events(
         redis_client: Redis client for pub/sub
         heartbeat_seconds: How often to send keepalive heartbeats
         timeout_seconds: Redis pub/sub poll timeout
+        event_types: Only forward matching events (see ``parse_event_type_filter``)
 
     Yields:
         SSE-formatted strings (data: {...}\\n\\n)
@@ -145,6 +159,8 @@ async def stream_activity_events(
                     continue
 
                 payload = _decode_payload(message)
+                if event_types is not None and not event_type_matches(_payload_event_type(payload), event_types):
+                    continue
 
                 yield format_sse_payload(payload)
 
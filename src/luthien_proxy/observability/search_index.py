@@ -0,0 +1,180 @@
+"""Incremental full-text index of session conversation text.
+
+Clients like Claude Code resend the whole conversation on every turn. The
+search trigger from migration 014 indexed each ``transaction.request_recorded``
+payload whole, so turn N re-tokenized the N-1 turns before it and both indexing
+cost and index size grew quadratically with session length.
+
+``session_search_index`` (migration 024) instead holds one row per call with
+only the text that call introduced:
+
+* ``transaction.request_recorded`` contributes the user text of the messages
+  past the previous call's message count. ``session_search_state`` keeps that
+  count per session.
+* ``transaction.*_response_recorded`` contributes the response's assistant text.
+
+Assistant turns that the client echoes back in later requests are skipped, as
+they were already indexed from the response that produced them. Requests are
+read from ``original_request`` (what the client sent), so gateway-injected
+``final_request`` context never enters the index. Probe requests
+(``max_tokens <= 1``) are skipped and leave the stored count alone. A request
+with fewer messages than the stored count (the client compacted or rewrote
+its history) is indexed whole and resets the count.
+
+The diff runs here in Python, from the payload the emitter holds before
+message deduplication, inside the same transaction as the event insert. Two
+concurrent calls of one session can read the same stored count and index the
+same messages twice. That only repeats text that already matches, so search
+results are unaffected.
+
+Postgres searches the row's generated ``search_vector`` column. SQLite searches
+the ``session_search_fts`` FTS5 table, kept in sync by triggers. See
+:mod:`luthien_proxy.utils.search` for the query side.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from luthien_proxy.observability.session_summary import is_probe_request
+from luthien_proxy.utils.db import ConnectionProtocol, chunk_rows, values_placeholders
+
+REQUEST_EVENT_TYPE = "transaction.request_recorded"
+RESPONSE_EVENT_TYPES = frozenset(
+    {"transaction.streaming_response_recorded", "transaction.non_streaming_response_recorded"}
+)
+
+
+@dataclass(frozen=True)
+class SearchIndexEvent:
+    """One written event, as seen by the search indexer."""
+
+    call_id: str
+    session_id: str
+    event_type: str
+    data: dict[str, Any]
+    timestamp: datetime
+
+
+def content_text(content: Any) -> str:
+    """Join the text of a message ``content`` (a string or a list of blocks)."""
+    if isinstance(content, str):
+        return content.strip()
+    if not isinstance(content, list):
+        return ""
+    texts = (
+        block["text"].strip()
+        for block in content
+        if isinstance(block, dict) and block.get("type") == "text" and isinstance(block.get("text"), str)
+    )
+    return " ".join(text for text in texts if text)
+
+
+def request_messages(data: dict[str, Any]) -> list[Any] | None:
+    """Return the client's messages from a ``transaction.request_recorded`` payload.
+
+    None for probe requests and payloads without a ``messages`` list.
+    """
+    request = data.get("original_request") or data.get("final_request")
+    if not isinstance(request, dict) or is_probe_request(request):
+        return None
+    messages = request.get("messages")
+    return messages if isinstance(messages, list) else None
+
+
+def new_user_text(messages: list[Any], previous_count: int) -> str:
+    """Return the user text of ``messages`` after the first ``previous_count``.
+
+    A list shorter than ``previous_count`` is not a continuation of the
+    previous call, so all of it counts as new.
+    """
+    start = previous_count if previous_count <= len(messages) else 0
+    texts = (
+        content_text(message.get("content"))
+        for message in messages[start:]
+        if isinstance(message, dict) and message.get("role") == "user"
+    )
+    return " ".join(text for text in texts if text)
+
+
+def response_text(data: dict[str, Any]) -> str:
+    """Return the assistant text of a response event's ``final_response``."""
+    response = data.get("final_response")
+    return content_text(response.get("content")) if isinstance(response, dict) else ""
+
+
+async def _load_message_counts(conn: ConnectionProtocol, session_ids: list[str]) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for chunk in chunk_rows(session_ids, 1):
+        placeholders = ", ".join(f"${i + 1}" for i in range(len(chunk)))
+        rows = await conn.fetch(
+            f"SELECT session_id, message_count FROM session_search_state WHERE session_id IN ({placeholders})",
+            *chunk,
+        )
+        counts.update({row["session_id"]: int(row["message_count"]) for row in rows})
+    return counts
+
+
+async def index_session_search_text(conn: ConnectionProtocol, events: Sequence[SearchIndexEvent]) -> None:
+    """Add the new text of ``events`` to ``session_search_index``.
+
+    ``events`` must be in write order: a request is diffed against the count
+    left by the previous request of its session, including earlier requests in
+    the same sequence. Costs no statements when no event carries indexable
+    text, one read of ``session_search_state`` per batch otherwise, plus
+    multi-row inserts. The caller owns the transaction.
+    """
+    indexable = [e for e in events if e.event_type == REQUEST_EVENT_TYPE or e.event_type in RESPONSE_EVENT_TYPES]
+    if not indexable:
+        return
+
+    request_sessions = sorted({e.session_id for e in indexable if e.event_type == REQUEST_EVENT_TYPE})
+    counts = await _load_message_counts(conn, request_sessions) if request_sessions else {}
+    new_counts: dict[str, int] = {}
+    rows: list[tuple[Any, ...]] = []
+    for event in indexable:
+        if event.event_type == REQUEST_EVENT_TYPE:
+            messages = request_messages(event.data)
+            if messages is None:
+                continue
+            text = new_user_text(messages, counts.get(event.session_id, 0))
+            counts[event.session_id] = new_counts[event.session_id] = len(messages)
+        else:
+            text = response_text(event.data)
+        if text:
+            rows.append((event.session_id, event.call_id, text, event.timestamp))
+
+    for chunk in chunk_rows(rows, 4):
+        await conn.execute(
+            f"""
+            INSERT INTO session_search_index (session_id, call_id, content, created_at)
+            VALUES {values_placeholders(len(chunk), 4)}
+            """,
+            *[value for row in chunk for value in row],
+        )
+
+    state_rows = list(new_counts.items())
+    for chunk in chunk_rows(state_rows, 2):
+        await conn.execute(
+            f"""
+            INSERT INTO session_search_state (session_id, message_count)
+            VALUES {values_placeholders(len(chunk), 2)}
+            ON CONFLICT (session_id) DO UPDATE SET message_count = EXCLUDED.message_count
+            """,
+            *[value for row in chunk for value in row],
+        )
+
+
+__all__ = [
+    "REQUEST_EVENT_TYPE",
+    "RESPONSE_EVENT_TYPES",
+    "SearchIndexEvent",
+    "content_text",
+    "index_session_search_text",
+    "new_user_text",
+    "request_messages",
+    "response_text",
+]
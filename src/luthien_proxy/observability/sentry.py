@@ -41,6 +41,7 @@ _LLM_CONTENT_VARS = {
     "final_response",
     "emitted",
     "accumulated_events",
+    "accumulator",
     "raw_http_request",
 }
 
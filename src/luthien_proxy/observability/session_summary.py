@@ -4,11 +4,11 @@
 a preview message, attributed user_id) so the history list page does not have
 to re-aggregate ``conversation_events`` on every load.
 
-It is updated *incrementally* from the per-event write path in
-:mod:`luthien_proxy.observability.emitter` — one upsert per event — rather than
-by a batched drain loop. That keeps the maintenance coupled to the existing
-event-write transaction and avoids depending on the (separate) bounded
-EventEmitter rework.
+It is updated *incrementally* from the event write path in
+:mod:`luthien_proxy.observability.emitter`, inside the same transaction as the
+event insert. The direct path issues one upsert per event; the write-behind
+path folds a flushed batch into one :class:`SessionSummaryDelta` per session
+and issues one upsert per session per flush.
 
 The SQL here is written to run unchanged on both Postgres and SQLite: the
 SQLite connection wrapper translates ``$N`` placeholders and strips ``::``
@@ -19,6 +19,7 @@ common to both backends.
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
@@ -36,10 +37,12 @@ _SYSTEM_REMINDER_RE = re.compile(r"<system-reminder>.*?</system-reminder>", re.D
 def _is_policy_event(event_type: str) -> bool:
     """True for policy-intervention events, excluding judge evaluations.
 
-    Mirrors the backfill predicate in migration 021 so the incremental counter
-    and the backfilled counter agree.
+    Judge lifecycle events may carry a prefix (``policy.anthropic_judge.evaluation_started``),
+    so any ``judge.evaluation`` after ``policy.`` is excluded. Mirrors the
+    history service's ``_INTERVENTION_PREDICATE`` and the recount in migration
+    023, so the list page reads the same count the aggregate path computes.
     """
-    return event_type.startswith("policy.") and not event_type.startswith("policy.judge.evaluation")
+    return event_type.startswith("policy.") and "judge.evaluation" not in event_type[len("policy.") :]
 
 
 def extract_model(data: dict[str, Any]) -> str | None:
@@ -48,6 +51,17 @@ def extract_model(data: dict[str, Any]) -> str | None:
     return model if isinstance(model, str) and model else None
 
 
+def is_probe_request(request: dict[str, Any]) -> bool:
+    """True for probe requests (``max_tokens <= 1``), which carry no real conversation turn."""
+    max_tokens = request.get("max_tokens")
+    if max_tokens is None:
+        return False
+    try:
+        return int(max_tokens) <= 1
+    except (TypeError, ValueError):
+        return False
+
+
 def extract_preview(data: dict[str, Any]) -> str | None:
     """Extract a short preview from the first user message of a request payload.
 
@@ -59,17 +73,9 @@ def extract_preview(data: dict[str, Any]) -> str | None:
     ``PREVIEW_MAX_LENGTH + 3`` characters).
     """
     request = data.get("final_request") or data.get("original_request")
-    if not isinstance(request, dict):
+    if not isinstance(request, dict) or is_probe_request(request):
         return None
 
-    max_tokens = request.get("max_tokens")
-    if max_tokens is not None:
-        try:
-            if int(max_tokens) <= 1:
-                return None  # probe request
-        except (TypeError, ValueError):
-            pass
-
     messages = request.get("messages")
     if not isinstance(messages, list):
         return None
@@ -98,6 +104,46 @@ def extract_preview(data: dict[str, Any]) -> str | None:
     return None
 
 
+@dataclass
+class SessionSummaryDelta:
+    """Accumulated contribution of one or more events to a ``session_summaries`` row.
+
+    The per-event path builds a delta from a single event; the write-behind
+    path in :mod:`luthien_proxy.observability.emitter` folds every event of a
+    flushed batch into one delta per session so each session costs one upsert
+    per flush instead of one per event. Folding preserves the per-event
+    semantics: counts add, ``first_seen``/``last_seen`` take the min/max, and
+    ``user_id``/``preview_message`` keep the first non-null value seen.
+    """
+
+    session_id: str
+    first_seen: datetime
+    last_seen: datetime
+    event_count: int = 0
+    call_count: int = 0
+    policy_event_count: int = 0
+    user_id: str | None = None
+    preview_message: str | None = None
+    models: list[str] = field(default_factory=list)
+
+    def add_event(self, *, event_type: str, data: dict[str, Any], user_id: str | None, timestamp: datetime) -> None:
+        """Fold one event into the delta."""
+        is_request = event_type == "transaction.request_recorded"
+        self.first_seen = min(self.first_seen, timestamp)
+        self.last_seen = max(self.last_seen, timestamp)
+        self.event_count += 1
+        self.call_count += 1 if is_request else 0
+        self.policy_event_count += 1 if _is_policy_event(event_type) else 0
+        if self.user_id is None:
+            self.user_id = user_id
+        if is_request:
+            model = extract_model(data)
+            if model is not None and model not in self.models:
+                self.models.append(model)
+            if self.preview_message is None:
+                self.preview_message = extract_preview(data)
+
+
 async def update_session_summary(
     conn: ConnectionProtocol,
     *,
@@ -123,12 +169,41 @@ async def update_session_summary(
     names are Anthropic/provider model identifiers, which don't contain commas;
     if that ever changes this should move to a side table (see PR follow-ups).
     """
-    is_request = event_type == "transaction.request_recorded"
-    model = extract_model(data) if is_request else None
-    preview = extract_preview(data) if is_request else None
-    policy_inc = 1 if _is_policy_event(event_type) else 0
-    call_inc = 1 if is_request else 0
+    delta = SessionSummaryDelta(session_id=session_id, first_seen=timestamp, last_seen=timestamp)
+    delta.add_event(event_type=event_type, data=data, user_id=user_id, timestamp=timestamp)
+    await apply_session_summary_delta(conn, delta)
+
+
+async def apply_session_summary_delta(conn: ConnectionProtocol, delta: SessionSummaryDelta) -> None:
+    """Upsert an accumulated :class:`SessionSummaryDelta` into ``session_summaries``.
+
+    Issues one upsert carrying the counts and the first new model. A delta that
+    saw more than one distinct model (rare: a model switch inside one flushed
+    batch) issues one extra zero-count upsert per additional model so each goes
+    through the same LIKE-based dedupe as the per-event path.
+    """
+    first_model = delta.models[0] if delta.models else None
+    await _upsert_session_summary(
+        conn,
+        delta=delta,
+        event_inc=delta.event_count,
+        call_inc=delta.call_count,
+        policy_inc=delta.policy_event_count,
+        model=first_model,
+    )
+    for model in delta.models[1:]:
+        await _upsert_session_summary(conn, delta=delta, event_inc=0, call_inc=0, policy_inc=0, model=model)
+
 
+async def _upsert_session_summary(
+    conn: ConnectionProtocol,
+    *,
+    delta: SessionSummaryDelta,
+    event_inc: int,
+    call_inc: int,
+    policy_inc: int,
+    model: str | None,
+) -> None:
     # New-model accumulation is a comma-joined set kept in a text column, dedup'd
     # inline. The membership test uses LIKE, so the model name must have LIKE
     # metacharacters escaped — otherwise a model containing '%' or '_' would
@@ -141,7 +216,7 @@ async def update_session_summary(
             session_id, first_seen, last_seen, event_count, call_count,
             policy_event_count, user_id, models_used, preview_message
         )
-        VALUES ($1, $2, $2, 1, $3, $4, $5, $6, $7)
+        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
         ON CONFLICT (session_id) DO UPDATE SET
             last_seen = CASE
                 WHEN EXCLUDED.last_seen > session_summaries.last_seen
@@ -149,33 +224,38 @@ async def update_session_summary(
             first_seen = CASE
                 WHEN EXCLUDED.first_seen < session_summaries.first_seen
                 THEN EXCLUDED.first_seen ELSE session_summaries.first_seen END,
-            event_count = session_summaries.event_count + 1,
-            call_count = session_summaries.call_count + $3,
-            policy_event_count = session_summaries.policy_event_count + $4,
+            event_count = session_summaries.event_count + $4,
+            call_count = session_summaries.call_count + $5,
+            policy_event_count = session_summaries.policy_event_count + $6,
             user_id = COALESCE(session_summaries.user_id, EXCLUDED.user_id),
             models_used = CASE
-                WHEN $6 IS NULL THEN session_summaries.models_used
-                WHEN session_summaries.models_used IS NULL THEN $6
+                WHEN $8 IS NULL THEN session_summaries.models_used
+                WHEN session_summaries.models_used IS NULL THEN $8
                 WHEN ',' || session_summaries.models_used || ',' LIKE
-                    '%,' || REPLACE(REPLACE(REPLACE($6, '\', '\\'), '%', '\%'), '_', '\_') || ',%'
+                    '%,' || REPLACE(REPLACE(REPLACE($8, '\', '\\'), '%', '\%'), '_', '\_') || ',%'
                     ESCAPE '\'
                     THEN session_summaries.models_used
-                ELSE session_summaries.models_used || ',' || $6 END,
+                ELSE session_summaries.models_used || ',' || $8 END,
             preview_message = COALESCE(session_summaries.preview_message, EXCLUDED.preview_message)
         """,
-        session_id,
-        timestamp,
+        delta.session_id,
+        delta.first_seen,
+        delta.last_seen,
+        event_inc,
         call_inc,
         policy_inc,
-        user_id,
+        delta.user_id,
         model,
-        preview,
+        delta.preview_message,
     )
 
 
 __all__ = [
     "PREVIEW_MAX_LENGTH",
+    "SessionSummaryDelta",
+    "apply_session_summary_delta",
     "extract_model",
     "extract_preview",
+    "is_probe_request",
     "update_session_summary",
 ]
@@ -26,7 +26,7 @@ import logging
 import time
 import uuid
 from collections.abc import AsyncGenerator, AsyncIterator
-from typing import Literal, TypedDict, TypeGuard, cast
+from typing import TypedDict, TypeGuard, cast
 
 from anthropic import APIConnectionError as AnthropicConnectionError
 from anthropic import APIStatusError as AnthropicStatusError
@@ -44,10 +44,8 @@ from luthien_proxy.exceptions import BackendAPIError
 from luthien_proxy.inference.registry import InferenceProviderRegistry
 from luthien_proxy.llm.anthropic_client import AnthropicClient
 from luthien_proxy.llm.types.anthropic import (
-    AnthropicContentBlock,
     AnthropicRequest,
     AnthropicResponse,
-    build_usage,
 )
 from luthien_proxy.observability.emitter import EventEmitterProtocol
 from luthien_proxy.pipeline.client_format import ClientFormat
@@ -58,15 +56,18 @@ from luthien_proxy.pipeline.session import (
     extract_user_id_from_authorization_header,
     extract_user_id_from_headers,
 )
-from luthien_proxy.pipeline.stream_protocol_validator import validate_anthropic_event_ordering
+from luthien_proxy.pipeline.sse_passthrough import SSEEventCollector
+from luthien_proxy.pipeline.stream_accumulator import StreamResponseAccumulator
 from luthien_proxy.pipeline.upstream_headers import expand_upstream_headers, merge_forwarded_headers
 from luthien_proxy.policy_core.anthropic_execution_interface import (
     AnthropicExecutionInterface,
     AnthropicPolicyEmission,
     AnthropicPolicyIOProtocol,
 )
+from luthien_proxy.policy_core.anthropic_hook_policy import observes_stream_events, stream_passthrough_supported
 from luthien_proxy.policy_core.base_policy import BasePolicy
 from luthien_proxy.policy_core.policy_context import PolicyContext
+from luthien_proxy.rate_limit import UsageReservation
 from luthien_proxy.request_log.recorder import RequestLogRecorder, create_recorder
 from luthien_proxy.settings import client_error_detail, get_settings
 from luthien_proxy.telemetry import restore_context
@@ -124,12 +125,11 @@ class _AnthropicPolicyIO(AnthropicPolicyIOProtocol):
         self._extra_headers = extra_headers
         self._request_recorded = False
         self._first_backend_response: AnthropicResponse | None = None
-        # Raw backend events are only buffered when needed for non-streaming
+        # Raw backend events are only folded in when needed for non-streaming
         # response reconstruction (e.g., diff recording). Streaming responses
-        # can reconstruct from the post-policy accumulated_events instead,
-        # avoiding duplicate event buffering that doubles memory usage.
-        self._buffer_raw_events = not is_streaming
-        self._raw_backend_events: list[MessageStreamEvent] = []
+        # reconstruct from the post-policy events instead, avoiding a second
+        # accumulator per request.
+        self._raw_backend_accumulator = None if is_streaming else StreamResponseAccumulator()
 
     @property
     def request(self) -> AnthropicRequest:
@@ -138,7 +138,13 @@ class _AnthropicPolicyIO(AnthropicPolicyIOProtocol):
 
     @property
     def first_backend_response(self) -> AnthropicResponse | None:
-        """First backend response observed during this request execution."""
+        """First backend response observed during this request execution.
+
+        Falls back to the response reconstructed from backend stream events
+        when the policy streamed from the backend in non-streaming mode.
+        """
+        if self._first_backend_response is None and self._raw_backend_accumulator is not None:
+            return self._raw_backend_accumulator.response()
         return self._first_backend_response
 
     def set_request(self, request: AnthropicRequest) -> None:
@@ -210,112 +216,45 @@ class _AnthropicPolicyIO(AnthropicPolicyIOProtocol):
                     # RawMessageStreamEvent members are a subset of MessageStreamEvent;
                     # cast bridges Pyright's strict union checking.
                     mse = cast(MessageStreamEvent, event)
-                    if self._buffer_raw_events:
-                        self._raw_backend_events.append(mse)
+                    if self._raw_backend_accumulator is not None:
+                        self._raw_backend_accumulator.add(mse)
                     yield mse
 
         return _stream()
 
+    def stream_raw(self, request: AnthropicRequest | None = None) -> AsyncIterator[bytes]:
+        """Execute a streaming backend request, yielding the raw SSE body."""
+        final_request = request or self._request
+        self._record_backend_request(final_request)
+
+        extra_headers = self._extra_headers
+
+        async def _stream() -> AsyncIterator[bytes]:
+            with tracer.start_as_current_span("send_upstream") as span:
+                span.set_attribute("luthien.phase", "send_upstream")
+                span.set_attribute("luthien.stream_passthrough", True)
+                async for chunk in self._anthropic_client.stream_raw(final_request, extra_headers=extra_headers):
+                    yield chunk
+
+        return _stream()
+
 
 def _reconstruct_response_from_stream_events(
     events: list[MessageStreamEvent],
 ) -> AnthropicResponse | None:
     """Reconstruct a complete AnthropicResponse from Anthropic SDK streaming events.
 
-    Accumulates message_start, content_block_*, and message_delta events to rebuild
-    the full response for storage in conversation history.
+    Convenience wrapper over ``StreamResponseAccumulator`` for callers that
+    already hold the full event list; the streaming pipeline folds events in
+    as they pass instead.
 
     Returns None if the stream lacked sufficient events to reconstruct (e.g., errored
     before message_start).
     """
-    message_id: str | None = None
-    model: str | None = None
-    input_tokens: int = 0
-    output_tokens: int = 0
-    cache_creation_input_tokens: int | None = None
-    cache_read_input_tokens: int | None = None
-    stop_reason: str | None = None
-    stop_sequence: str | None = None
-
-    # Index-keyed content block accumulation (handles multiple blocks / tool use)
-    blocks_by_index: dict[int, dict] = {}
-    json_bufs: dict[int, str] = {}  # partial JSON accumulator for tool_use inputs
-
+    accumulator = StreamResponseAccumulator()
     for event in events:
-        t = event.type  # type: ignore[union-attr]
-
-        if t == "message_start":
-            msg = event.message  # type: ignore[union-attr]
-            message_id = msg.id
-            model = msg.model
-            if msg.usage:
-                input_tokens = msg.usage.input_tokens
-                cache_creation_input_tokens = msg.usage.cache_creation_input_tokens
-                cache_read_input_tokens = msg.usage.cache_read_input_tokens
-
-        elif t == "content_block_start":
-            idx: int = event.index  # type: ignore[union-attr]
-            cb = event.content_block  # type: ignore[union-attr]
-            if cb.type == "text":
-                blocks_by_index[idx] = {"type": "text", "text": ""}
-            elif cb.type == "tool_use":
-                blocks_by_index[idx] = {"type": "tool_use", "id": cb.id, "name": cb.name, "input": {}}
-                json_bufs[idx] = ""
-            # thinking blocks are intentionally excluded from history
-
-        elif t == "content_block_delta":
-            idx = event.index  # type: ignore[union-attr]
-            delta = event.delta  # type: ignore[union-attr]
-            if idx in blocks_by_index:
-                block = blocks_by_index[idx]
-                if delta.type == "text_delta" and block["type"] == "text":  # type: ignore[union-attr]
-                    block["text"] += delta.text  # type: ignore[union-attr]
-                elif delta.type == "input_json_delta" and block["type"] == "tool_use":  # type: ignore[union-attr]
-                    json_bufs[idx] = json_bufs.get(idx, "") + delta.partial_json  # type: ignore[union-attr]
-
-        elif t == "content_block_stop":
-            idx = event.index  # type: ignore[union-attr]
-            if idx in json_bufs and idx in blocks_by_index:
-                try:
-                    blocks_by_index[idx]["input"] = json.loads(json_bufs[idx])
-                except (json.JSONDecodeError, ValueError) as e:
-                    logger.warning(f"Failed to parse tool input JSON for block {idx}: {repr(e)}")
-                del json_bufs[idx]
-
-        elif t == "message_delta":
-            delta = event.delta  # type: ignore[union-attr]
-            stop_reason = getattr(delta, "stop_reason", None)
-            stop_sequence = getattr(delta, "stop_sequence", None)
-            usage = getattr(event, "usage", None)
-            if usage:
-                output_tokens = getattr(usage, "output_tokens", 0)
-                _cache_create = getattr(usage, "cache_creation_input_tokens", None)
-                _cache_read = getattr(usage, "cache_read_input_tokens", None)
-                if _cache_create is not None:
-                    cache_creation_input_tokens = _cache_create
-                if _cache_read is not None:
-                    cache_read_input_tokens = _cache_read
-
-    if message_id is None or model is None:
-        return None
-
-    content = cast(
-        "list[AnthropicContentBlock]",
-        [blocks_by_index[i] for i in sorted(blocks_by_index.keys())],
-    )
-    return AnthropicResponse(
-        id=message_id,
-        type="message",
-        role="assistant",
-        content=content,
-        model=model,
-        stop_reason=cast(
-            "Literal['end_turn', 'max_tokens', 'stop_sequence', 'tool_use', 'pause_turn', 'refusal'] | None",
-            stop_reason,
-        ),
-        stop_sequence=stop_sequence,
-        usage=build_usage(input_tokens, output_tokens, cache_creation_input_tokens, cache_read_input_tokens),
-    )
+        accumulator.add(event)
+    return accumulator.response()
 
 
 def _is_anthropic_response_emission(emitted: AnthropicPolicyEmission) -> TypeGuard[AnthropicResponse]:
@@ -342,6 +281,7 @@ async def process_anthropic_request(
     credential_manager: CredentialManager | None = None,
     webhook_sender: WebhookSender | None = None,
     inference_provider_registry: InferenceProviderRegistry | None = None,
+    usage_reservation: UsageReservation | None = None,
 ) -> FastAPIStreamingResponse | JSONResponse:
     """Process an Anthropic API request through the native pipeline.
 
@@ -360,6 +300,8 @@ async def process_anthropic_request(
         webhook_sender: Optional webhook sender for conversation completion events
         inference_provider_registry: Registry of named inference providers
             used by judge policies that declare an inference_provider reference
+        usage_reservation: Token/concurrency rate-limit reservation, settled
+            with the response usage when the response completes
 
     Returns:
         StreamingResponse or JSONResponse depending on stream parameter
@@ -470,6 +412,7 @@ async def process_anthropic_request(
             usage_collector=usage_collector,
             webhook_sender=webhook_sender,
             request_start_time=request_start_time,
+            usage_reservation=usage_reservation,
         )
 
         # Propagate policy summaries if set
@@ -609,6 +552,66 @@ async def _run_policy_hooks(
     yield await policy.on_anthropic_response(response, ctx)
 
 
+# Unparsed passthrough bytes buffered before they are folded into the
+# accumulator; bounds per-request memory on long streams for policies that
+# don't observe events.
+_PASSTHROUGH_PARSE_BYTES = 64 * 1024
+
+
+class _StreamPassthrough:
+    """Streaming execution for policies that leave stream events unchanged.
+
+    The upstream SSE body is forwarded to the client as-is. Events are parsed
+    off the forwarding path by ``collector``, after each chunk has been
+    yielded: every chunk when the policy observes events (each parsed event is
+    shown to on_anthropic_stream_event, whose return value is ignored),
+    otherwise only once ``_PASSTHROUGH_PARSE_BYTES`` are buffered. Parsed
+    events are folded into ``accumulator``.
+    """
+
+    def __init__(self, policy: AnthropicExecutionInterface, io: _AnthropicPolicyIO, ctx: PolicyContext) -> None:
+        self._policy = policy
+        self._io = io
+        self._ctx = ctx
+        self._observe = observes_stream_events(policy)
+        self.collector = SSEEventCollector()
+        self.accumulator = StreamResponseAccumulator()
+
+    async def chunks(self) -> AsyncIterator[bytes | str]:
+        """Run the request hook, relay upstream bytes, then emit stream_complete events."""
+        request = await self._policy.on_anthropic_request(self._io.request, self._ctx)
+        self._io.set_request(request)
+
+        async for chunk in self._io.stream_raw(request):
+            self.collector.feed(chunk)
+            yield chunk
+            if self._observe:
+                for event in self.collector.drain():
+                    self.accumulator.add(event)
+                    await self._policy.on_anthropic_stream_event(event, self._ctx)
+            elif self.collector.buffered_bytes >= _PASSTHROUGH_PARSE_BYTES:
+                for event in self.collector.drain():
+                    self.accumulator.add(event)
+        self.flush()
+
+        for emitted in await self._policy.on_anthropic_stream_complete(self._ctx):
+            if _is_anthropic_response_emission(emitted):
+                raise TypeError(
+                    "Streaming Anthropic execution policies must emit streaming events, not full response objects."
+                )
+            event = cast(MessageStreamEvent, emitted)
+            self.accumulator.add(event)
+            yield _format_sse_event(event)
+
+    def flush(self) -> None:
+        """Fold every forwarded-but-unparsed upstream event into ``accumulator``.
+
+        Treats the stream as ended: a trailing unterminated frame is parsed too.
+        """
+        for event in self.collector.finish():
+            self.accumulator.add(event)
+
+
 async def _execute_anthropic_policy(
     execution_policy: AnthropicExecutionInterface,
     initial_request: AnthropicRequest,
@@ -623,6 +626,7 @@ async def _execute_anthropic_policy(
     extra_headers: dict[str, str] | None = None,
     usage_collector: UsageCollector | None = None,
     webhook_sender: WebhookSender | None = None,
+    usage_reservation: UsageReservation | None = None,
 ) -> FastAPIStreamingResponse | JSONResponse:
     """Execute an Anthropic policy using the hook-based runtime."""
     io = _AnthropicPolicyIO(
@@ -636,9 +640,12 @@ async def _execute_anthropic_policy(
         is_streaming=is_streaming,
         extra_headers=extra_headers,
     )
-    emissions = _run_policy_hooks(execution_policy, io, policy_ctx)
-
     if is_streaming:
+        emissions: AsyncIterator[AnthropicPolicyEmission] | _StreamPassthrough
+        if get_settings().stream_passthrough and stream_passthrough_supported(execution_policy):
+            emissions = _StreamPassthrough(execution_policy, io, policy_ctx)
+        else:
+            emissions = _run_policy_hooks(execution_policy, io, policy_ctx)
         return await _handle_execution_streaming(
             emissions=emissions,
             io=io,
@@ -650,10 +657,11 @@ async def _execute_anthropic_policy(
             usage_collector=usage_collector,
             webhook_sender=webhook_sender,
             request_start_time=request_start_time,
+            usage_reservation=usage_reservation,
         )
 
     return await _handle_execution_non_streaming(
-        emissions=emissions,
+        emissions=_run_policy_hooks(execution_policy, io, policy_ctx),
         io=io,
         emitter=emitter,
         policy_ctx=policy_ctx,
@@ -662,6 +670,7 @@ async def _execute_anthropic_policy(
         usage_collector=usage_collector,
         webhook_sender=webhook_sender,
         request_start_time=request_start_time,
+        usage_reservation=usage_reservation,
     )
 
 
@@ -718,7 +727,7 @@ def _fire_webhook_for_completion(
 
 
 async def _handle_execution_streaming(
-    emissions: AsyncIterator[AnthropicPolicyEmission],
+    emissions: AsyncIterator[AnthropicPolicyEmission] | _StreamPassthrough,
     io: _AnthropicPolicyIO,
     call_id: str,
     root_span: Span,
@@ -728,11 +737,18 @@ async def _handle_execution_streaming(
     request_start_time: float,
     usage_collector: UsageCollector | None = None,
     webhook_sender: WebhookSender | None = None,
+    usage_reservation: UsageReservation | None = None,
 ) -> FastAPIStreamingResponse:
-    """Handle streaming response flow for execution-oriented policies."""
+    """Handle streaming response flow for execution-oriented policies.
+
+    ``emissions`` is either the policy's event stream, re-serialized here one
+    event at a time, or a ``_StreamPassthrough`` whose upstream bytes are
+    forwarded unchanged and parsed off the forwarding path. Either way the
+    events are folded into a ``StreamResponseAccumulator`` rather than kept.
+    """
     parent_context = get_current()
 
-    async def streaming_with_spans() -> AsyncIterator[str]:
+    async def streaming_with_spans() -> AsyncIterator[str | bytes]:
         """Wrapper that creates proper span hierarchy for streaming."""
         with restore_context(parent_context):
             chunk_count = 0
@@ -740,7 +756,9 @@ async def _handle_execution_streaming(
             stream_completed = False
             cancelled = False
             final_status = 200
-            accumulated_events: list[MessageStreamEvent] = []
+            accumulator = (
+                emissions.accumulator if isinstance(emissions, _StreamPassthrough) else StreamResponseAccumulator()
+            )
             with tracer.start_as_current_span("process_response") as response_span:
                 response_span.set_attribute("luthien.phase", "process_response")
                 response_span.set_attribute("luthien.streaming", True)
@@ -748,18 +766,24 @@ async def _handle_execution_streaming(
                 caught_exception = False
                 try:
                     with tracer.start_as_current_span("policy_execute"):
-                        async for emitted in emissions:
-                            if _is_anthropic_response_emission(emitted):
-                                raise TypeError(
-                                    "Streaming Anthropic execution policies must emit streaming events, "
-                                    "not full response objects."
-                                )
-                            io.ensure_request_recorded()
-                            emitted_any = True
-                            cast_emitted = cast(MessageStreamEvent, emitted)
-                            accumulated_events.append(cast_emitted)
-                            chunk_count += 1
-                            yield _format_sse_event(cast_emitted)
+                        if isinstance(emissions, _StreamPassthrough):
+                            async for chunk in emissions.chunks():
+                                io.ensure_request_recorded()
+                                emitted_any = True
+                                yield chunk
+                        else:
+                            async for emitted in emissions:
+                                if _is_anthropic_response_emission(emitted):
+                                    raise TypeError(
+                                        "Streaming Anthropic execution policies must emit streaming events, "
+                                        "not full response objects."
+                                    )
+                                io.ensure_request_recorded()
+                                emitted_any = True
+                                cast_emitted = cast(MessageStreamEvent, emitted)
+                                accumulator.add(cast_emitted)
+                                chunk_count += 1
+                                yield _format_sse_event(cast_emitted)
                     stream_completed = True
                 except asyncio.CancelledError:
                     # CancelledError is BaseException; without this branch
@@ -798,6 +822,17 @@ async def _handle_execution_streaming(
                     error_event = _build_error_event(e, call_id)
                     yield _format_sse_event(error_event)
                 finally:
+                    if isinstance(emissions, _StreamPassthrough):
+                        # Parse whatever the forwarded bytes still hold (a
+                        # stream cut short skips the flush in chunks()).
+                        try:
+                            emissions.flush()
+                        except Exception:
+                            logger.exception("[%s] Parsing passthrough stream failed", call_id)
+                        chunk_count = accumulator.event_count
+                        upstream_error = emissions.collector.upstream_error
+                        if upstream_error is not None and final_status == 200:
+                            final_status = _status_for_stream_error(upstream_error)
                     # Cancellation is distinct from "policy emitted nothing": the
                     # except CancelledError above already set final_status=499 and
                     # we should not yield an error event to a client that's gone.
@@ -829,12 +864,11 @@ async def _handle_execution_streaming(
                         # webhook fire and recorder flush.
                     response_span.set_attribute("streaming.chunk_count", chunk_count)
 
-                    # Reconstruct first (in-process pure-Python iteration over
-                    # already-accumulated events; rare but possible to raise on
-                    # SDK shape drift). Wrap so failure → reconstructed=None
-                    # and the webhook still fires below.
+                    # Reconstruct first (joins the accumulated block parts;
+                    # rare but possible to raise on SDK shape drift). Wrap so
+                    # failure → reconstructed=None and the webhook still fires below.
                     try:
-                        reconstructed = _reconstruct_response_from_stream_events(accumulated_events)
+                        reconstructed = accumulator.response()
                     except Exception:
                         logger.exception("[%s] Stream reconstruction failed", call_id)
                         reconstructed = None
@@ -901,12 +935,12 @@ async def _handle_execution_streaming(
                     # delivery accounting. Consumers wanting strict
                     # protocol-conformant accounting should also subscribe to
                     # the `streaming.protocol_violation` event from the emitter.
-                    if accumulated_events and final_status == 200:
+                    if accumulator.event_count and final_status == 200:
                         # Wrap so SDK shape drift / a validator regression
                         # can't propagate into the cleanup path and skip
                         # recorder.flush + downstream emitter calls.
                         try:
-                            validation = validate_anthropic_event_ordering(accumulated_events)
+                            validation = accumulator.validation()
                             if not validation.valid:
                                 violation_details = [
                                     {"rule": v.rule, "message": v.message, "event_index": v.event_index}
@@ -935,14 +969,15 @@ async def _handle_execution_streaming(
 
                     if reconstructed is not None:
                         # Use raw backend events for original response if buffered,
-                        # Trade-off: for streaming requests, raw events are NOT buffered
-                        # separately (_AnthropicPolicyIO sets _buffer_raw_events=not is_streaming).
+                        # Trade-off: for streaming requests, raw events are NOT folded
+                        # separately (_AnthropicPolicyIO only keeps _raw_backend_accumulator
+                        # when not is_streaming).
                         # This means the diff viewer will show identical original and final
                         # responses for streaming requests. Non-streaming requests buffer
                         # raw events separately and capture true pre-policy vs post-policy
                         # diffs (handled by _handle_execution_non_streaming, not here).
                         #
-                        # Since this branch is streaming-only, raw_events IS accumulated_events
+                        # Since this branch is streaming-only, raw_events IS the emitted events
                         # and we reuse `reconstructed` directly. The previous conditional
                         # for the buffered-raw-events case was dead code in this codepath.
                         raw_reconstructed = reconstructed
@@ -977,6 +1012,8 @@ async def _handle_execution_streaming(
                                 input_tokens=usage.get("input_tokens", 0),
                                 output_tokens=usage.get("output_tokens", 0),
                             )
+                    if usage_reservation is not None:
+                        usage_reservation.settle(reconstructed.get("usage") if reconstructed is not None else None)
 
                     # Empty-stream error event yields LAST so any failure here
                     # (BrokenResourceError on a closed writer, GeneratorExit on
@@ -1013,6 +1050,7 @@ async def _handle_execution_non_streaming(
     request_start_time: float,
     usage_collector: UsageCollector | None = None,
     webhook_sender: WebhookSender | None = None,
+    usage_reservation: UsageReservation | None = None,
 ) -> JSONResponse:
     """Handle non-streaming response flow for execution-oriented policies."""
     final_response: AnthropicResponse | None = None
@@ -1160,6 +1198,8 @@ async def _handle_execution_non_streaming(
             success=final_status == 200 and final_response is not None,
             http_status=final_status,
         )
+        if usage_reservation is not None:
+            usage_reservation.settle(final_response.get("usage") if final_response is not None else None)
 
 
 def _format_sse_event(event: MessageStreamEvent | _StreamErrorEvent) -> str:
@@ -1232,6 +1272,16 @@ _ANTHROPIC_STATUS_ERROR_TYPE_MAP: dict[int, str] = {
 }
 
 
+def _status_for_stream_error(error_event: dict) -> int:
+    """Map an upstream in-stream ``error`` event to the HTTP status it stands for."""
+    error = error_event.get("error")
+    error_type = error.get("type") if isinstance(error, dict) else None
+    for status, mapped_type in _ANTHROPIC_STATUS_ERROR_TYPE_MAP.items():
+        if mapped_type == error_type:
+            return status
+    return 500
+
+
 def _handle_anthropic_error(e: Exception, call_id: str) -> None:
     """Handle Anthropic API errors by raising BackendAPIError.
 
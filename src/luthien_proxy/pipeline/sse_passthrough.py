@@ -0,0 +1,142 @@
+"""Side-channel parsing of Anthropic SSE bytes forwarded to the client unchanged.
+
+On the passthrough streaming path the upstream response body is relayed byte
+for byte; nothing on the forwarding path parses or re-serializes events.
+``SSEEventCollector`` keeps the forwarded chunks and turns them into SDK
+stream events only when asked: after each chunk (``drain``) for policies that
+observe each event or once enough bytes are buffered, and at the end
+(``finish``) for whatever is left. Parsed events are handed back to the
+caller rather than kept, so the collector holds at most the unparsed tail.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Annotated, Any
+
+from anthropic.lib.streaming import MessageStreamEvent
+from anthropic.types import (
+    RawContentBlockDeltaEvent,
+    RawContentBlockStartEvent,
+    RawContentBlockStopEvent,
+    RawMessageDeltaEvent,
+    RawMessageStartEvent,
+    RawMessageStopEvent,
+)
+from pydantic import Field, TypeAdapter, ValidationError
+
+logger = logging.getLogger(__name__)
+
+_STREAM_EVENT_ADAPTER: TypeAdapter[MessageStreamEvent] = TypeAdapter(
+    Annotated[
+        RawMessageStartEvent
+        | RawMessageDeltaEvent
+        | RawMessageStopEvent
+        | RawContentBlockStartEvent
+        | RawContentBlockDeltaEvent
+        | RawContentBlockStopEvent,
+        Field(discriminator="type"),
+    ]
+)
+
+# Wire event names that carry a message stream event (the SDK's own stream
+# parser uses the same list; ``ping`` and unknown events are skipped).
+_MESSAGE_EVENT_NAMES = frozenset(
+    {
+        "message_start",
+        "message_delta",
+        "message_stop",
+        "content_block_start",
+        "content_block_delta",
+        "content_block_stop",
+    }
+)
+
+
+def _parse_frame(frame: bytes) -> tuple[str | None, str]:
+    """Return ``(event name, data)`` for one SSE frame (blank-line terminated)."""
+    name: str | None = None
+    data_lines: list[str] = []
+    for raw_line in frame.decode("utf-8").split("\n"):
+        line = raw_line.rstrip("\r")
+        if not line or line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "event":
+            name = value
+        elif field == "data":
+            data_lines.append(value)
+    return name, "\n".join(data_lines)
+
+
+class SSEEventCollector:
+    """Accumulates forwarded SSE bytes and parses them into stream events on demand.
+
+    ``feed`` is the only call on the forwarding path and just appends the
+    chunk. Upstream ``error`` events are not stream events; the last one seen
+    is kept in ``upstream_error``.
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty collector."""
+        self._chunks: list[bytes] = []
+        self._pending = b""
+        self._buffered_bytes = 0
+        self.upstream_error: dict[str, Any] | None = None
+
+    @property
+    def buffered_bytes(self) -> int:
+        """Bytes fed but not yet parsed."""
+        return self._buffered_bytes
+
+    def feed(self, chunk: bytes) -> None:
+        """Record a chunk that was forwarded to the client."""
+        self._chunks.append(chunk)
+        self._buffered_bytes += len(chunk)
+
+    def drain(self) -> list[MessageStreamEvent]:
+        """Parse every complete frame fed so far and return the new events."""
+        buffer = (self._pending + b"".join(self._chunks)).replace(b"\r\n", b"\n")
+        self._chunks.clear()
+        *frames, self._pending = buffer.split(b"\n\n")
+        self._buffered_bytes = len(self._pending)
+        return self._parse_frames(frames)
+
+    def finish(self) -> list[MessageStreamEvent]:
+        """Parse everything not yet drained, including an unterminated final frame."""
+        events = self.drain()
+        if self._pending.strip():
+            events.extend(self._parse_frames([self._pending]))
+        self._pending = b""
+        self._buffered_bytes = 0
+        return events
+
+    def _parse_frames(self, frames: list[bytes]) -> list[MessageStreamEvent]:
+        parsed: list[MessageStreamEvent] = []
+        for frame in frames:
+            name, data = _parse_frame(frame)
+            if not data or (name not in _MESSAGE_EVENT_NAMES and name != "error"):
+                continue
+            try:
+                payload = json.loads(data)
+            except json.JSONDecodeError:
+                logger.warning("Skipping upstream SSE %s event with malformed JSON data", name)
+                continue
+            if name == "error":
+                self.upstream_error = payload if isinstance(payload, dict) else {"error": payload}
+                continue
+            if isinstance(payload, dict):
+                payload.setdefault("type", name)
+            try:
+                event = _STREAM_EVENT_ADAPTER.validate_python(payload)
+            except ValidationError as e:
+                logger.warning("Skipping unparseable upstream SSE %s event: %s", name, e.errors()[:1])
+                continue
+            parsed.append(event)
+        return parsed
+
+
+__all__ = ["SSEEventCollector"]
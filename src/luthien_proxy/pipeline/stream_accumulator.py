@@ -0,0 +1,170 @@
+"""Incremental reconstruction of an Anthropic response from streaming events.
+
+Streaming calls used to keep every emitted event and rebuild the response at
+the end, growing text blocks one ``+=`` at a time. ``StreamResponseAccumulator``
+folds each event in as it passes instead: text deltas go to per-block part
+lists joined once, tool input JSON is parsed when its block stops, and
+protocol ordering is checked incrementally. State is O(content blocks), not
+O(events), so a long response no longer pins thousands of event objects per
+in-flight request.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal, cast
+
+from anthropic.lib.streaming import MessageStreamEvent
+
+from luthien_proxy.llm.types.anthropic import AnthropicResponse, build_usage
+from luthien_proxy.pipeline.stream_protocol_validator import (
+    AnthropicEventOrderingValidator,
+    StreamValidationResult,
+)
+
+if TYPE_CHECKING:
+    from luthien_proxy.llm.types.anthropic import AnthropicContentBlock
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _BlockParts:
+    """One text or tool_use block under construction."""
+
+    block: dict
+    parts: list[str] = field(default_factory=list)
+    closed: bool = False
+
+
+class StreamResponseAccumulator:
+    """Folds Anthropic stream events into the response they describe.
+
+    Call ``add`` for each event in stream order. ``response`` returns the
+    response built so far (None until ``message_start`` has been seen) and can
+    be called at any point; ``validation`` reports protocol ordering
+    violations for the events seen. Thinking blocks are intentionally
+    excluded from the reconstructed content, matching conversation history.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty accumulator."""
+        self._message_id: str | None = None
+        self._model: str | None = None
+        self._input_tokens = 0
+        self._output_tokens = 0
+        self._cache_creation_input_tokens: int | None = None
+        self._cache_read_input_tokens: int | None = None
+        self._stop_reason: str | None = None
+        self._stop_sequence: str | None = None
+        self._blocks: dict[int, _BlockParts] = {}
+        self._validator = AnthropicEventOrderingValidator()
+
+    @property
+    def event_count(self) -> int:
+        """Number of events folded in so far."""
+        return self._validator.event_count
+
+    def add(self, event: MessageStreamEvent) -> None:
+        """Fold one stream event into the response."""
+        self._validator.add(event)
+        t = event.type
+
+        if t == "message_start":
+            msg = event.message  # type: ignore[union-attr]
+            self._message_id = msg.id
+            self._model = msg.model
+            if msg.usage:
+                self._input_tokens = msg.usage.input_tokens
+                self._cache_creation_input_tokens = msg.usage.cache_creation_input_tokens
+                self._cache_read_input_tokens = msg.usage.cache_read_input_tokens
+
+        elif t == "content_block_start":
+            cb = event.content_block  # type: ignore[union-attr]
+            idx: int = event.index  # type: ignore[union-attr]
+            if cb.type == "text":
+                self._blocks[idx] = _BlockParts({"type": "text", "text": ""})
+            elif cb.type == "tool_use":
+                self._blocks[idx] = _BlockParts({"type": "tool_use", "id": cb.id, "name": cb.name, "input": {}})
+
+        elif t == "content_block_delta":
+            entry = self._blocks.get(event.index)  # type: ignore[union-attr]
+            if entry is None:
+                return
+            delta = event.delta  # type: ignore[union-attr]
+            if delta.type == "text_delta" and entry.block["type"] == "text":
+                entry.parts.append(delta.text)
+            elif delta.type == "input_json_delta" and entry.block["type"] == "tool_use" and not entry.closed:
+                entry.parts.append(delta.partial_json)
+
+        elif t == "content_block_stop":
+            idx = event.index  # type: ignore[union-attr]
+            entry = self._blocks.get(idx)
+            if entry is None or entry.block["type"] != "tool_use" or entry.closed:
+                return
+            entry.closed = True
+            try:
+                entry.block["input"] = json.loads("".join(entry.parts))
+            except (json.JSONDecodeError, ValueError) as e:
+                logger.warning(f"Failed to parse tool input JSON for block {idx}: {repr(e)}")
+            entry.parts.clear()
+
+        elif t == "message_delta":
+            delta = event.delta  # type: ignore[union-attr]
+            self._stop_reason = getattr(delta, "stop_reason", None)
+            self._stop_sequence = getattr(delta, "stop_sequence", None)
+            usage = getattr(event, "usage", None)
+            if usage:
+                self._output_tokens = getattr(usage, "output_tokens", 0)
+                cache_create = getattr(usage, "cache_creation_input_tokens", None)
+                cache_read = getattr(usage, "cache_read_input_tokens", None)
+                if cache_create is not None:
+                    self._cache_creation_input_tokens = cache_create
+                if cache_read is not None:
+                    self._cache_read_input_tokens = cache_read
+
+    def response(self) -> AnthropicResponse | None:
+        """Return the response described by the events so far.
+
+        Returns None if the stream lacked sufficient events to reconstruct
+        (e.g., errored before message_start).
+        """
+        if self._message_id is None or self._model is None:
+            return None
+
+        content: list[dict] = []
+        for idx in sorted(self._blocks):
+            entry = self._blocks[idx]
+            if entry.block["type"] == "text" and entry.parts:
+                # Collapse the parts so repeated calls stay cheap.
+                entry.block["text"] += "".join(entry.parts)
+                entry.parts = []
+            content.append(dict(entry.block))
+
+        return AnthropicResponse(
+            id=self._message_id,
+            type="message",
+            role="assistant",
+            content=cast("list[AnthropicContentBlock]", content),
+            model=self._model,
+            stop_reason=cast(
+                "Literal['end_turn', 'max_tokens', 'stop_sequence', 'tool_use', 'pause_turn', 'refusal'] | None",
+                self._stop_reason,
+            ),
+            stop_sequence=self._stop_sequence,
+            usage=build_usage(
+                self._input_tokens,
+                self._output_tokens,
+                self._cache_creation_input_tokens,
+                self._cache_read_input_tokens,
+            ),
+        )
+
+    def validation(self) -> StreamValidationResult:
+        """Return protocol ordering violations for the events folded in so far."""
+        return self._validator.result()
+
+
+__all__ = ["StreamResponseAccumulator"]
@@ -83,90 +83,63 @@ def _get_block_index(event: dict | object) -> int | None:
     return getattr(event, "index", None)
 
 
-def validate_anthropic_event_ordering(
-    events: list,
-) -> StreamValidationResult:
-    """Validate that a list of Anthropic streaming events follows protocol ordering.
+class AnthropicEventOrderingValidator:
+    """Incremental form of ``validate_anthropic_event_ordering``.
 
-    Args:
-        events: List of event dicts or Pydantic model objects. Each must have
-                a ``type`` field/attribute.
-
-    Returns:
-        StreamValidationResult with any violations found.
+    Feed events one at a time with ``add`` as they stream past; ``result``
+    reports the same violations, in the same order, as validating the full
+    list would. State is O(content blocks), so callers need not keep the
+    events around.
     """
-    result = StreamValidationResult()
-
-    if not events:
-        result.violations.append(
-            StreamViolation(
-                rule="non_empty",
-                message="Event stream is empty",
-                event_index=-1,
-                event_type="(none)",
-            )
-        )
-        return result
-
-    event_types = [_get_event_type(e) for e in events]
-
-    # --- Rule 1: message_start must be first ---
-    if event_types[0] != "message_start":
-        result.violations.append(
-            StreamViolation(
-                rule="message_start_first",
-                message=f"First event must be message_start, got {event_types[0]!r}",
-                event_index=0,
-                event_type=event_types[0] or "(unknown)",
-            )
-        )
-
-    # --- Rule 2: message_stop must be last ---
-    if event_types[-1] != "message_stop":
-        result.violations.append(
-            StreamViolation(
-                rule="message_stop_last",
-                message=f"Last event must be message_stop, got {event_types[-1]!r}",
-                event_index=len(events) - 1,
-                event_type=event_types[-1] or "(unknown)",
-            )
-        )
-
-    # --- Rule 3: All content_block_* events must precede message_delta ---
-    message_delta_idx = None
-    for i, t in enumerate(event_types):
-        if t == "message_delta":
-            message_delta_idx = i
-            break
-
-    if message_delta_idx is not None:
-        for i, t in enumerate(event_types):
-            if t in _CONTENT_BLOCK_EVENTS and i > message_delta_idx:
-                result.violations.append(
-                    StreamViolation(
-                        rule="content_before_message_delta",
-                        message=(
-                            f"Content block event at position {i} "
-                            f"appears after message_delta at position {message_delta_idx}"
-                        ),
-                        event_index=i,
-                        event_type=t,
-                    )
-                )
 
-    # --- Rule 4: Block lifecycle (start → delta(s) → stop) ---
-    # Track which blocks have been started and stopped
-    started_blocks: set[int] = set()
-    stopped_blocks: set[int] = set()
-    highest_start_index = -1
+    def __init__(self) -> None:
+        """Create a validator that has seen no events."""
+        self._count = 0
+        self._first_type: str | None = None
+        self._last_type: str | None = None
+        self._message_delta_idx: int | None = None
+        self._content_after_delta: list[StreamViolation] = []
+        self._lifecycle: list[StreamViolation] = []
+        self._started_blocks: set[int] = set()
+        self._stopped_blocks: set[int] = set()
+        self._highest_start_index = -1
 
-    for i, (event, t) in enumerate(zip(events, event_types)):
+    @property
+    def event_count(self) -> int:
+        """Number of events fed so far."""
+        return self._count
+
+    def add(self, event: dict | object) -> None:
+        """Check one event against the ordering rules."""
+        i = self._count
+        self._count += 1
+        t = _get_event_type(event)
+        if i == 0:
+            self._first_type = t
+        self._last_type = t
+
+        # --- Rule 3: All content_block_* events must precede message_delta ---
+        if t == "message_delta" and self._message_delta_idx is None:
+            self._message_delta_idx = i
         if t not in _CONTENT_BLOCK_EVENTS:
-            continue
+            return
+        if self._message_delta_idx is not None:
+            self._content_after_delta.append(
+                StreamViolation(
+                    rule="content_before_message_delta",
+                    message=(
+                        f"Content block event at position {i} "
+                        f"appears after message_delta at position {self._message_delta_idx}"
+                    ),
+                    event_index=i,
+                    event_type=t,
+                )
+            )
 
+        # --- Rule 4: Block lifecycle (start → delta(s) → stop) ---
         idx = _get_block_index(event)
         if idx is None:
-            result.violations.append(
+            self._lifecycle.append(
                 StreamViolation(
                     rule="block_index_present",
                     message="Content block event missing index field",
@@ -174,12 +147,12 @@ def validate_anthropic_event_ordering(
                     event_type=t or "(unknown)",
                 )
             )
-            continue
+            return
 
         if t == "content_block_start":
             # Rule 5: Block indices must be non-negative and monotonically increasing for starts
             if idx < 0:
-                result.violations.append(
+                self._lifecycle.append(
                     StreamViolation(
                         rule="block_index_non_negative",
                         message=f"Block index {idx} is negative",
@@ -187,25 +160,26 @@ def validate_anthropic_event_ordering(
                         event_type=t,
                     )
                 )
-            if idx <= highest_start_index:
-                result.violations.append(
+            if idx <= self._highest_start_index:
+                self._lifecycle.append(
                     StreamViolation(
                         rule="block_start_monotonic",
                         message=(
-                            f"Block start index {idx} is not greater than previous start index {highest_start_index}"
+                            f"Block start index {idx} is not greater than previous start index "
+                            f"{self._highest_start_index}"
                         ),
                         event_index=i,
                         event_type=t,
                     )
                 )
             if idx >= 0:
-                highest_start_index = idx
-            started_blocks.add(idx)
+                self._highest_start_index = idx
+            self._started_blocks.add(idx)
 
         elif t == "content_block_delta":
             # Rule 6: No delta without a preceding start
-            if idx not in started_blocks:
-                result.violations.append(
+            if idx not in self._started_blocks:
+                self._lifecycle.append(
                     StreamViolation(
                         rule="delta_after_start",
                         message=f"content_block_delta for index {idx} without preceding start",
@@ -214,8 +188,8 @@ def validate_anthropic_event_ordering(
                     )
                 )
             # No delta after stop
-            if idx in stopped_blocks:
-                result.violations.append(
+            if idx in self._stopped_blocks:
+                self._lifecycle.append(
                     StreamViolation(
                         rule="delta_before_stop",
                         message=f"content_block_delta for index {idx} after it was already stopped",
@@ -225,8 +199,8 @@ def validate_anthropic_event_ordering(
                 )
 
         elif t == "content_block_stop":
-            if idx not in started_blocks:
-                result.violations.append(
+            if idx not in self._started_blocks:
+                self._lifecycle.append(
                     StreamViolation(
                         rule="stop_after_start",
                         message=f"content_block_stop for index {idx} without preceding start",
@@ -234,8 +208,8 @@ def validate_anthropic_event_ordering(
                         event_type=t,
                     )
                 )
-            if idx in stopped_blocks:
-                result.violations.append(
+            if idx in self._stopped_blocks:
+                self._lifecycle.append(
                     StreamViolation(
                         rule="block_stopped_once",
                         message=f"content_block_stop for index {idx} but block was already stopped",
@@ -243,18 +217,76 @@ def validate_anthropic_event_ordering(
                         event_type=t,
                     )
                 )
-            stopped_blocks.add(idx)
-
-    # All started blocks should be stopped (before message_delta)
-    unclosed = started_blocks - stopped_blocks
-    if unclosed:
-        result.violations.append(
-            StreamViolation(
-                rule="blocks_closed",
-                message=f"Content blocks started but never stopped: {sorted(unclosed)}",
-                event_index=len(events) - 1,
-                event_type="(end of stream)",
+            self._stopped_blocks.add(idx)
+
+    def result(self) -> StreamValidationResult:
+        """Return the violations for the events fed so far, treating them as the whole stream."""
+        result = StreamValidationResult()
+
+        if self._count == 0:
+            result.violations.append(
+                StreamViolation(
+                    rule="non_empty",
+                    message="Event stream is empty",
+                    event_index=-1,
+                    event_type="(none)",
+                )
             )
-        )
+            return result
 
-    return result
+        # --- Rule 1: message_start must be first ---
+        if self._first_type != "message_start":
+            result.violations.append(
+                StreamViolation(
+                    rule="message_start_first",
+                    message=f"First event must be message_start, got {self._first_type!r}",
+                    event_index=0,
+                    event_type=self._first_type or "(unknown)",
+                )
+            )
+
+        # --- Rule 2: message_stop must be last ---
+        if self._last_type != "message_stop":
+            result.violations.append(
+                StreamViolation(
+                    rule="message_stop_last",
+                    message=f"Last event must be message_stop, got {self._last_type!r}",
+                    event_index=self._count - 1,
+                    event_type=self._last_type or "(unknown)",
+                )
+            )
+
+        result.violations.extend(self._content_after_delta)
+        result.violations.extend(self._lifecycle)
+
+        # All started blocks should be stopped (before message_delta)
+        unclosed = self._started_blocks - self._stopped_blocks
+        if unclosed:
+            result.violations.append(
+                StreamViolation(
+                    rule="blocks_closed",
+                    message=f"Content blocks started but never stopped: {sorted(unclosed)}",
+                    event_index=self._count - 1,
+                    event_type="(end of stream)",
+                )
+            )
+
+        return result
+
+
+def validate_anthropic_event_ordering(
+    events: list,
+) -> StreamValidationResult:
+    """Validate that a list of Anthropic streaming events follows protocol ordering.
+
+    Args:
+        events: List of event dicts or Pydantic model objects. Each must have
+                a ``type`` field/attribute.
+
+    Returns:
+        StreamValidationResult with any violations found.
+    """
+    validator = AnthropicEventOrderingValidator()
+    for event in events:
+        validator.add(event)
+    return validator.result()
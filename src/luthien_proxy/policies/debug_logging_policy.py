@@ -46,6 +46,8 @@ class DebugLoggingPolicy(BasePolicy, AnthropicHookPolicy):
     DB persistence, and pass data through unchanged.
     """
 
+    observes_stream_events_only = True
+
     ui = UIMetadata(
         display_name="Debug Logging",
         short_description="Logs full requests, responses, and streaming events for debugging.",
@@ -33,6 +33,7 @@ from luthien_proxy.policy_core import (
     Category,
     UIMetadata,
 )
+from luthien_proxy.policy_core.anthropic_hook_policy import stream_passthrough_supported
 
 if TYPE_CHECKING:
     from typing import Any
@@ -106,6 +107,11 @@ class MultiSerialPolicy(BasePolicy, AnthropicExecutionInterface):
             names.extend(p.active_policy_names())
         return names
 
+    @property
+    def observes_stream_events_only(self) -> bool:
+        """True when every sub-policy leaves stream events unchanged."""
+        return all(stream_passthrough_supported(p) for p in self._sub_policies)
+
     def _validate_interface(self, interface: type, interface_name: str) -> None:
         """Raise TypeError if any sub-policy doesn't implement the required interface."""
         validate_sub_policies_interface(self._sub_policies, interface, interface_name, "MultiSerialPolicy")
@@ -20,6 +20,8 @@ class NoOpPolicy(BasePolicy, AnthropicHookPolicy):
     Implements AnthropicHookPolicy. All hooks use default passthrough behavior.
     """
 
+    observes_stream_events_only = True
+
     ui = UIMetadata(
         display_name="Passthrough",
         short_description="Passes through all data unchanged.",
@@ -1,8 +1,51 @@
 """Policy that blocks dangerous shell commands in tool calls."""
 
 from luthien_proxy.policies.simple_llm_policy import SimpleLLMJudgeConfig, SimpleLLMPolicy
+from luthien_proxy.policies.tool_prefilter import ToolPrefilterConfig
 from luthien_proxy.policy_core import CatalogBadge, Category, UIMetadata
 
+# Obvious cases are settled without the judge: read-only tools and plain
+# read-only commands pass, the listed destructive commands are blocked, and
+# anything else (pipelines into unknown programs, redirects, subshells) is
+# escalated.
+_PREFILTER = ToolPrefilterConfig(
+    safe_tools=("Read", "Glob", "Grep", "LS", "TodoWrite", "WebSearch"),
+    command_tools=("Bash",),
+    safe_commands=(
+        "ls",
+        "pwd",
+        "cat",
+        "head",
+        "tail",
+        "wc",
+        "echo",
+        "grep",
+        "rg",
+        "which",
+        "date",
+        "git status",
+        "git log",
+        "git diff",
+        "git show",
+        "git branch",
+        "pytest",
+        "uv run pytest",
+        "python -m pytest",
+        "npm test",
+    ),
+    command_block_patterns=(
+        r"\brm\s+(?:-\S+\s+)*-[a-zA-Z]*(?:r[a-zA-Z]*f|f[a-zA-Z]*r)[a-zA-Z]*\b",
+        r"\brm\s+(?:-\S+\s+)*-[a-zA-Z]*[rR][a-zA-Z]*\s+(?:/|~|\$HOME)/?\*?(?:\s|$)",
+        r"\bchmod\s+(?:-\S+\s+)*0?777\b",
+        r"\bmkfs(?:\.\w+)?\b",
+        r"\bdd\b[^|;&\n]*\bif=",
+        r"\b(?:fdisk|parted|shred|wipefs)\b",
+        r":\(\)\s*\{\s*:\s*\|\s*:\s*&\s*\}\s*;\s*:",
+        r">\s*/dev/(?:sd|hd|vd|xvd|nvme|disk)\w*",
+    ),
+    block_message=("[BLOCKED] Dangerous command detected: {match}. This command was blocked by the safety policy."),
+)
+
 
 class BlockDangerousCommandsPolicy(SimpleLLMPolicy):
     """Blocks dangerous shell commands like rm -rf, chmod 777, mkfs, and dd.
@@ -47,5 +90,7 @@ class BlockDangerousCommandsPolicy(SimpleLLMPolicy):
                 max_tokens=4096,
                 on_error="block",
                 auth_provider="user_credentials",
+                verdict_cache_ttl_seconds=3600,
+                prefilter=_PREFILTER,
             )
         )
@@ -1,8 +1,54 @@
 """Policy that blocks file writes to sensitive system paths."""
 
 from luthien_proxy.policies.simple_llm_policy import SimpleLLMJudgeConfig, SimpleLLMPolicy
+from luthien_proxy.policies.tool_prefilter import ToolPrefilterConfig
 from luthien_proxy.policy_core import CatalogBadge, Category, UIMetadata
 
+_SENSITIVE_DIRS = (
+    r"(?:/etc|/usr|/boot|/sys|/proc|/root|~/\.ssh|~/\.gnupg|~/\.aws|~/\.config/gcloud|~/\.kube|~/\.docker)/"
+)
+
+# Edits are decided from the target path alone; shell commands are only
+# settled when they plainly read or plainly redirect into a sensitive path.
+_PREFILTER = ToolPrefilterConfig(
+    safe_tools=("Read", "Glob", "Grep", "LS", "TodoWrite", "WebSearch", "WebFetch"),
+    command_tools=("Bash",),
+    safe_commands=(
+        "ls",
+        "pwd",
+        "cat",
+        "head",
+        "tail",
+        "wc",
+        "grep",
+        "rg",
+        "git status",
+        "git log",
+        "git diff",
+        "git show",
+    ),
+    command_block_patterns=(rf"(?:>>?|\btee\s+(?:-a\s+)?)\s*[\"']?{_SENSITIVE_DIRS}\S*",),
+    path_block_patterns=(
+        r"^(?:/etc|/usr|/boot|/sys|/proc|/root)(?:/|$)",
+        r"(?:^|/)\.(?:ssh|gnupg|aws|kube|docker)(?:/|$)",
+        r"(?:^|/)\.config/gcloud(?:/|$)",
+        r"^/etc/(?:shadow|passwd|sudoers)$",
+        r"(?:^|/)id_(?:rsa|ed25519)(?:\.pub)?$",
+        r"(?:^|/)(?:authorized_keys|known_hosts)$",
+    ),
+    # Names that only look sensitive (shadow.css, passwd_reset.py, api.key)
+    # are left to the judge rather than blocked or allowed by rule.
+    path_escalate_patterns=(
+        r"\.(?:pem|key|crt)$",
+        r"id_rsa|id_ed25519|authorized_keys|known_hosts|shadow|passwd|sudoers",
+    ),
+    allow_unmatched_tools=("Write", "Edit", "MultiEdit", "NotebookEdit"),
+    block_message=(
+        "[BLOCKED] Write to sensitive path detected: {match}. Writes to system and security files "
+        "are blocked by the safety policy."
+    ),
+)
+
 
 class BlockSensitiveFileWritesPolicy(SimpleLLMPolicy):
     """Blocks file write operations targeting sensitive paths like /etc, ~/.ssh, ~/.gnupg.
@@ -47,5 +93,7 @@ class BlockSensitiveFileWritesPolicy(SimpleLLMPolicy):
                 max_tokens=4096,
                 on_error="block",
                 auth_provider="user_credentials",
+                verdict_cache_ttl_seconds=3600,
+                prefilter=_PREFILTER,
             )
         )
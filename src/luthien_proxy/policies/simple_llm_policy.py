@@ -15,6 +15,7 @@ Example config:
           model: "claude-haiku-4-5"
           instructions: "Remove any PII from responses"
           on_error: "pass"
+          verdict_cache_ttl_seconds: 3600
 """
 
 from __future__ import annotations
@@ -44,9 +45,11 @@ from luthien_proxy.inference.dispatch import resolve_inference_provider
 from luthien_proxy.policies.simple_llm_utils import (
     BlockDescriptor,
     JudgeAction,
+    ReplacementBlock,
     SimpleLLMJudgeConfig,
     call_simple_llm_judge,
 )
+from luthien_proxy.policies.tool_prefilter import ToolPrefilter
 from luthien_proxy.policy_core import (
     AnthropicHookPolicy,
     BasePolicy,
@@ -59,6 +62,7 @@ from luthien_proxy.policy_core.anthropic_message_builder import (
     BufferedTool,
 )
 from luthien_proxy.policy_core.judge_orchestrator import Bailed, JudgeOrchestrator
+from luthien_proxy.policy_core.judge_verdict_cache import JudgeVerdictCache, judge_cache_key
 from luthien_proxy.settings import get_settings
 
 if TYPE_CHECKING:
@@ -129,6 +133,8 @@ class SimpleLLMPolicy(BasePolicy, AnthropicHookPolicy):
             with an injected warning, "block" rejects content entirely
         temperature: Sampling temperature for judge (default: 0.0)
         max_tokens: Max output tokens for judge (default: 4096)
+        verdict_cache_ttl_seconds: Reuse decisions for identical tool_use blocks
+            for this long (default: 0, disabled)
     """
 
     ui = UIMetadata(
@@ -168,6 +174,16 @@ class SimpleLLMPolicy(BasePolicy, AnthropicHookPolicy):
             auth_provider=parsed.auth_provider,
         )
 
+        # Shared across requests by design: a tool_use decision depends only on
+        # the instructions, model and the call itself. The surrounding blocks
+        # the judge also sees are deliberately not part of the key.
+        self._verdict_cache = JudgeVerdictCache(
+            f"judge_verdict:{type(self).__name__}",
+            ttl_seconds=self._config.verdict_cache_ttl_seconds,
+            max_entries=self._config.verdict_cache_max_entries,
+        )
+        self._prefilter = ToolPrefilter(self._config.prefilter) if self._config.prefilter is not None else None
+
         if self._config.on_error == "pass":
             logger.warning(
                 "SimpleLLMPolicy on_error='pass': judge failures will allow "
@@ -234,6 +250,62 @@ class SimpleLLMPolicy(BasePolicy, AnthropicHookPolicy):
             )
             return JudgeAction(action=self._config.on_error, judge_failed=True)
 
+    async def _judge_tool_block(
+        self,
+        tool_name: str,
+        tool_input: object,
+        previous_blocks: tuple[BlockDescriptor, ...],
+        context: "PolicyContext",
+    ) -> JudgeAction:
+        """Judge a tool_use block, reusing a cached decision for an identical call.
+
+        Calls the prefilter rules settle never reach the cache or the judge.
+        Only decisions from a successful judge call are cached; an on_error
+        fallback is never replayed.
+        """
+        if self._prefilter is not None:
+            verdict = self._prefilter.evaluate(tool_name, tool_input)
+            context.record_event(
+                "policy.simple_llm.prefilter_decision",
+                {
+                    "summary": f"Prefilter decided '{verdict.decision}' for {tool_name} tool_use block",
+                    "decision": verdict.decision,
+                    "tool_name": tool_name,
+                    "match": verdict.match,
+                    "escalation_ratio": self._prefilter.escalation_ratio,
+                },
+            )
+            if verdict.decision == "allow":
+                return JudgeAction(action="pass")
+            if verdict.decision == "block":
+                message = self._prefilter.block_message(tool_name, verdict.match)
+                return JudgeAction(action="replace", blocks=(ReplacementBlock(type="text", text=message),))
+
+        descriptor = BlockDescriptor(type="tool_use", content=f"{tool_name}({json.dumps(tool_input)})")
+        cache_key = judge_cache_key(
+            instructions=self._config.instructions,
+            model=self._config.model,
+            tool_name=tool_name,
+            tool_input=tool_input,
+        )
+        cached = await self._verdict_cache.get(cache_key, context)
+        if cached is not None:
+            action = JudgeAction.from_cache_value(cached)
+            context.record_event(
+                "policy.simple_llm.judge_cache_hit",
+                {
+                    "summary": f"Reused cached '{action.action}' decision for tool_use block",
+                    "action": action.action,
+                    "block_type": "tool_use",
+                },
+            )
+            return action
+
+        action = await self._judge_block(descriptor, previous_blocks, context)
+        if not action.judge_failed:
+            await self._verdict_cache.put(cache_key, action.to_cache_value(), context)
+        return action
+
     def _apply_replacement_to_builder(
         self,
         builder: AnthropicMessageBuilder,
@@ -292,16 +364,15 @@ class SimpleLLMPolicy(BasePolicy, AnthropicHookPolicy):
             block_type = block.get("type")
             if block_type == "text":
                 descriptor = BlockDescriptor(type="text", content=block.get("text", ""))
+                action = await self._judge_block(descriptor, builder.committed_descriptors, context)
             elif block_type == "tool_use":
-                descriptor = BlockDescriptor(
-                    type="tool_use",
-                    content=f"{block.get('name', '')}({json.dumps(block.get('input', {}))})",
+                action = await self._judge_tool_block(
+                    str(block.get("name", "")), block.get("input", {}), builder.committed_descriptors, context
                 )
             else:
                 builder.commit_raw_block(block)
                 continue
 
-            action = await self._judge_block(descriptor, builder.committed_descriptors, context)
             if action.judge_failed:
                 judge_error_occurred = True
 
@@ -434,8 +505,7 @@ class SimpleLLMPolicy(BasePolicy, AnthropicHookPolicy):
         sibling tool judges. Order-preserving collection happens in
         `_handle_message_delta`.
         """
-        descriptor = BlockDescriptor(type="tool_use", content=f"{tool.name}({json.dumps(tool.parsed_input)})")
-        coro = self._judge_block(descriptor, state.builder.committed_descriptors, context)
+        coro = self._judge_tool_block(tool.name, tool.parsed_input, state.builder.committed_descriptors, context)
         state.tool_judge.submit(_PendingTool(tool=tool), coro)
         return []
 
@@ -21,6 +21,7 @@ from pydantic import BaseModel, Field
 
 from luthien_proxy.inference.base import InferenceInvalidCredentialError
 from luthien_proxy.policies.tool_call_judge_utils import parse_judge_response
+from luthien_proxy.policies.tool_prefilter import ToolPrefilterConfig
 
 if TYPE_CHECKING:
     from luthien_proxy.credentials.credential import Credential
@@ -28,6 +29,7 @@ if TYPE_CHECKING:
     from luthien_proxy.llm.types.anthropic import JSONObject
 
 from luthien_proxy.policy_core.block_descriptor import BlockDescriptor
+from luthien_proxy.policy_core.judge_verdict_cache import DEFAULT_VERDICT_CACHE_MAX_ENTRIES
 
 logger = logging.getLogger(__name__)
 
@@ -83,6 +85,27 @@ class SimpleLLMJudgeConfig(BaseModel):
             "backwards compatibility; logs a warning when set."
         ),
     )
+    verdict_cache_ttl_seconds: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Reuse the judge's decision for an identical tool_use block (same name and input) for "
+            "this many seconds instead of calling the judge again. Text blocks are never cached. "
+            "0 disables the cache."
+        ),
+    )
+    verdict_cache_max_entries: int = Field(
+        default=DEFAULT_VERDICT_CACHE_MAX_ENTRIES,
+        ge=1,
+        description="Max decisions kept in process; the shared PolicyCache table has its own cap.",
+    )
+    prefilter: ToolPrefilterConfig | None = Field(
+        default=None,
+        description=(
+            "Deterministic rules checked before the judge for tool_use blocks. Calls the rules "
+            "allow or block skip the judge; everything else is escalated to it."
+        ),
+    )
 
     model_config = {"frozen": True}
 
@@ -105,6 +128,26 @@ class JudgeAction:
     blocks: tuple[ReplacementBlock, ...] | None = None
     judge_failed: bool = False
 
+    def to_cache_value(self) -> "JSONObject":
+        """JSON form stored in the judge verdict cache."""
+        value: JSONObject = {"action": self.action}
+        if self.blocks is not None:
+            value["blocks"] = [{"type": b.type, "text": b.text, "name": b.name, "input": b.input} for b in self.blocks]
+        return value
+
+    @classmethod
+    def from_cache_value(cls, value: "JSONObject") -> "JudgeAction":
+        """Rebuild a decision stored by ``to_cache_value``."""
+        raw_blocks = value.get("blocks")
+        blocks = None
+        if isinstance(raw_blocks, list):
+            blocks = tuple(
+                ReplacementBlock(type=b["type"], text=b.get("text"), name=b.get("name"), input=b.get("input"))
+                for b in raw_blocks
+                if isinstance(b, dict)
+            )
+        return cls(action=str(value["action"]), blocks=blocks)
+
 
 _JUDGE_SYSTEM_TEMPLATE = """\
 You are a content policy judge. Your job is to evaluate LLM response blocks \
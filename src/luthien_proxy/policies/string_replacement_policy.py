@@ -32,7 +32,8 @@ Example config:
 
 from __future__ import annotations
 
-import copy
+import hashlib
+import json
 import re
 from collections.abc import Sequence
 from dataclasses import dataclass, field
@@ -55,6 +56,7 @@ from luthien_proxy.policy_core import (
     UIMetadata,
 )
 from luthien_proxy.policy_core.anthropic_execution_interface import AnthropicPolicyEmission
+from luthien_proxy.policy_core.text_scrub_memo import TextScrubMemo, scrub_request_messages
 
 if TYPE_CHECKING:
     from luthien_proxy.llm.types.anthropic import (
@@ -96,6 +98,15 @@ class StringReplacementConfig(BaseModel):
         ),
     )
 
+    request_cache_ttl_seconds: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Also keep scrubbed request text in the shared policy cache for this many seconds. "
+            "0 (default) memoizes in process only."
+        ),
+    )
+
     @field_validator("replacements")
     @classmethod
     def _validate_replacement_pairs(cls, replacements: list[list[str]]) -> list[list[str]]:
@@ -256,6 +267,242 @@ def apply_replacements_with_count(
     return result, total
 
 
+def _overlaps(a: str, b: str) -> bool:
+    """True if ``a`` and ``b`` can share characters when laid over each other."""
+    if a in b or b in a:
+        return True
+    return any(a.endswith(b[:k]) or b.endswith(a[:k]) for k in range(1, min(len(a), len(b))))
+
+
+def _trie_regex(words: Sequence[str]) -> str:
+    """Build a regex that matches any of ``words``, factored as a prefix trie.
+
+    Shared prefixes are matched once, so the regex engine does roughly one
+    character comparison per trie level at each text position instead of one
+    attempt per word. Longer continuations are tried before shorter ones.
+    """
+    trie: dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict[str, Any]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return f"(?:{body})?"
+        return body
+
+    return build(trie)
+
+
+class _NeedsSequential(Exception):
+    """Raised mid-scan when the single pass can't guarantee the sequential result for this text."""
+
+
+# Relative costs (µs, CPython 3.13) of one trie-regex scan per character and
+# of one ``str.count`` pass per pair (fixed + per character), used to pick the
+# cheaper strategy for case-sensitive stages.
+_SCAN_COST_PER_CHAR = 0.12
+_STR_PASS_COST = 0.1
+_STR_PASS_COST_PER_CHAR = 0.0005
+
+
+class _SinglePassStage:
+    """A run of consecutive pairs applied in one scan.
+
+    Pairs land in the same stage only if no earlier pair's replacement text
+    can form part of a later pair's source (otherwise the sequential order
+    would create matches a single scan never sees). A later source that
+    contains an earlier one can never match once the earlier pair has run,
+    so it is dropped from the matcher.
+
+    The one remaining difference between one scan and the sequential order
+    is overlapping sources: the scan takes the leftmost match, while the
+    sequential order takes the earlier pair's match even if it starts later.
+    ``_conflicts`` lists, per source, the earlier sources that could start
+    inside it and run past its end; if one actually does, the stage is
+    re-run pair by pair for that text. Real text almost never hits this.
+    """
+
+    def __init__(self, match_capitalization: bool) -> None:
+        self.pairs: list[tuple[str, str]] = []
+        self._match_capitalization = match_capitalization
+        self._fold = str.lower if match_capitalization else str
+        self._outputs: set[str] = set()
+        self._deletes = False
+        self._targets: dict[str, str] = {}
+        self._conflicts: dict[str, list[tuple[int, str]]] = {}
+        self._pattern: re.Pattern[str] | None = None
+        self._lowered_pattern: re.Pattern[str] | None = None
+        self._key_patterns: dict[str, re.Pattern[str]] = {}
+        self._sequential_patterns: tuple[tuple[re.Pattern[str], str], ...] = ()
+
+    def accepts(self, source: str) -> bool:
+        """Whether a pair with this source can join without breaking sequential semantics."""
+        key = self._fold(source)
+        if self._deletes and len(key) > 1:
+            return False
+        return not any(_overlaps(output, key) for output in self._outputs)
+
+    def add(self, source: str, target: str) -> None:
+        """Append a pair (call ``accepts`` first)."""
+        self.pairs.append((source, target))
+        key = self._fold(source)
+        if any(earlier in key for earlier in self._targets):
+            return
+        self._targets[key] = target
+        if not target:
+            self._deletes = True
+            return
+        self._outputs.add(self._fold(target))
+        if self._match_capitalization:
+            # Capitalization can emit target.upper(), which isn't always a
+            # case variant of target (e.g. "ß" -> "SS").
+            self._outputs.add(target.upper().lower())
+
+    def compile(self) -> None:
+        """Build the matcher once every pair has been added."""
+        keys = list(self._targets)
+        priority = {key: i for i, key in enumerate(keys)}
+        by_prefix: dict[str, list[str]] = {}
+        for key in keys:
+            for k in range(1, len(key)):
+                by_prefix.setdefault(key[:k], []).append(key)
+        for key in keys:
+            conflicts = [
+                (offset, earlier)
+                for offset in range(1, len(key))
+                for earlier in by_prefix.get(key[offset:], ())
+                if priority[earlier] < priority[key]
+            ]
+            if conflicts:
+                self._conflicts[key] = conflicts
+        trie = _trie_regex(keys)
+        if not self._match_capitalization:
+            self._pattern = re.compile(trie)
+            return
+        self._sequential_patterns = _compile_case_insensitive_patterns(self.pairs)
+        # Non-ASCII case folding (e.g. "ſ" matching "s", "İ".lower() growing
+        # a character) doesn't line up with lower(), so those stages keep the
+        # per-pair IGNORECASE passes.
+        if not all(src.isascii() and dst.isascii() for src, dst in self.pairs):
+            return
+        self._pattern = re.compile(trie, re.IGNORECASE)
+        self._key_patterns = {key: re.compile(re.escape(key), re.IGNORECASE) for key in keys}
+        # For ASCII text, lower() is exactly IGNORECASE folding, and a
+        # case-sensitive scan of the lowered text is several times faster.
+        self._lowered_pattern = re.compile(trie)
+
+    def apply(self, text: str) -> tuple[str, int]:
+        """Apply this stage's pairs to ``text``."""
+        try:
+            if self._pattern is None:
+                raise _NeedsSequential
+            if self._match_capitalization:
+                if self._lowered_pattern is not None and text.isascii():
+                    return self._apply_lowered(text, self._lowered_pattern)
+                return self._pattern.subn(self._replace_with_case, text)
+            if not self._scan_is_cheaper(len(text)):
+                return apply_replacements_with_count(text, self.pairs, match_capitalization=False)
+            return self._pattern.subn(self._replace_exact, text)
+        except _NeedsSequential:
+            if self._match_capitalization:
+                return _apply_with_compiled_count(text, self._sequential_patterns)
+            return apply_replacements_with_count(text, self.pairs, match_capitalization=False)
+
+    def _scan_is_cheaper(self, length: int) -> bool:
+        """Case-sensitive only: whether one trie scan beats a ``str.count``/``str.replace`` pass per pair.
+
+        ``str`` searches are fast C loops, so for a few pairs or long text the
+        per-pair passes win; for many pairs on short deltas the fixed
+        per-pair overhead dominates and the scan wins.
+        """
+        pairs = len(self.pairs)
+        return length * (_SCAN_COST_PER_CHAR - pairs * _STR_PASS_COST_PER_CHAR) < pairs * _STR_PASS_COST
+
+    def _apply_lowered(self, text: str, pattern: re.Pattern[str]) -> tuple[str, int]:
+        pieces: list[str] = []
+        pos = 0
+        for match in pattern.finditer(text.lower()):
+            key = match.group(0)
+            self._check_conflicts(key, match)
+            start, end = match.span()
+            pieces.append(text[pos:start])
+            pieces.append(_apply_capitalization_pattern(text[start:end], self._targets[key]))
+            pos = end
+        if not pieces:
+            return text, 0
+        pieces.append(text[pos:])
+        return "".join(pieces), (len(pieces) - 1) // 2
+
+    def _check_conflicts(self, key: str, match: re.Match[str]) -> None:
+        for offset, earlier in self._conflicts.get(key, ()):
+            start = match.start() + offset
+            if self._match_capitalization:
+                if self._key_patterns[earlier].match(match.string, start):
+                    raise _NeedsSequential
+            elif match.string.startswith(earlier, start):
+                raise _NeedsSequential
+
+    def _replace_exact(self, match: re.Match[str]) -> str:
+        key = match.group(0)
+        self._check_conflicts(key, match)
+        return self._targets[key]
+
+    def _replace_with_case(self, match: re.Match[str]) -> str:
+        matched = match.group(0)
+        key = matched.lower()
+        if key not in self._targets:
+            # IGNORECASE matched non-ASCII text to an ASCII source (e.g. the
+            # Kelvin sign to "k"); leave those to the sequential pass.
+            raise _NeedsSequential
+        self._check_conflicts(key, match)
+        return _apply_capitalization_pattern(matched, self._targets[key])
+
+
+class _ReplacementEngine:
+    """Applies a replacement list with as few text scans as its semantics allow.
+
+    The reference semantics are sequential: each pair runs over the output of
+    the previous ones (see :func:`apply_replacements_with_count`), and the
+    count includes substitutions made on earlier output. Consecutive pairs
+    that can't see each other's output are grouped into one
+    ``_SinglePassStage``; a typical redaction list ("[REDACTED]" targets)
+    needs exactly one. Texts and counts are identical to the sequential pass.
+    """
+
+    def __init__(self, replacements: Sequence[tuple[str, str]], match_capitalization: bool) -> None:
+        self._stages: list[_SinglePassStage] = []
+        for source, target in replacements:
+            if not source:
+                continue
+            if not self._stages or not self._stages[-1].accepts(source):
+                self._stages.append(_SinglePassStage(match_capitalization))
+            self._stages[-1].add(source, target)
+        for stage in self._stages:
+            stage.compile()
+
+    @property
+    def stage_count(self) -> int:
+        """Number of scans per text (one per stage)."""
+        return len(self._stages)
+
+    def apply(self, text: str) -> tuple[str, int]:
+        """Apply every replacement; return ``(new_text, substitution_count)``."""
+        if not text:
+            return text, 0
+        total = 0
+        for stage in self._stages:
+            text, count = stage.apply(text)
+            total += count
+        return text, total
+
+
 def apply_replacements(
     text: str,
     replacements: Sequence[tuple[str, str]],
@@ -276,6 +523,11 @@ def apply_replacements(
     return transformed
 
 
+def _config_fingerprint(replacements: Sequence[tuple[str, str]], match_capitalization: bool) -> str:
+    material = json.dumps([list(replacements), match_capitalization], ensure_ascii=False)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
+
+
 class StringReplacementPolicy(BasePolicy, AnthropicHookPolicy):
     """Policy that replaces specified strings in response content.
 
@@ -312,11 +564,13 @@ class StringReplacementPolicy(BasePolicy, AnthropicHookPolicy):
         self._match_capitalization = self.config.match_capitalization
         self._apply_to_request: bool = self.config.apply_to in ("request", "both")
         self._apply_to_response: bool = self.config.apply_to in ("response", "both")
-        # Pre-compile case-insensitive patterns once; the streaming hot path
-        # would otherwise re-compile per chunk (and per replacement) on every
-        # text_delta event.
-        self._compiled_patterns: tuple[tuple[re.Pattern[str], str], ...] | None = (
-            _compile_case_insensitive_patterns(self._replacements) if self._match_capitalization else None
+        # Built once: the streaming hot path runs it on every text_delta, and
+        # a one-scan matcher keeps that cost flat as the pair list grows.
+        self._engine = _ReplacementEngine(self._replacements, self._match_capitalization)
+        self._request_memo = TextScrubMemo(
+            "string_replacement.request",
+            _config_fingerprint(self._replacements, self._match_capitalization),
+            shared_ttl_seconds=self.config.request_cache_ttl_seconds,
         )
 
         # Buffer size for streaming: hold back enough chars to catch replacements
@@ -328,14 +582,8 @@ class StringReplacementPolicy(BasePolicy, AnthropicHookPolicy):
         self._buffer_size = max(self._buffer_size - 1, 0)
 
     def _apply_replacements_with_count(self, text: str) -> tuple[str, int]:
-        """Apply all configured replacements and return (new_text, substitution_count).
-
-        Uses the precompiled patterns when ``match_capitalization=True`` so the
-        per-chunk streaming path doesn't re-compile regexes on every event.
-        """
-        if self._compiled_patterns is not None:
-            return _apply_with_compiled_count(text, self._compiled_patterns)
-        return apply_replacements_with_count(text, self._replacements, match_capitalization=False)
+        """Apply all configured replacements and return (new_text, substitution_count)."""
+        return self._engine.apply(text)
 
     async def on_anthropic_request(self, request: "AnthropicRequest", context: PolicyContext) -> "AnthropicRequest":
         """Apply replacements to incoming request messages when ``apply_to`` includes 'request'.
@@ -353,8 +601,12 @@ class StringReplacementPolicy(BasePolicy, AnthropicHookPolicy):
 
         **Mutation safety:** ``_initial_request`` is shallow-copied for
         ``original_request`` recording, so nested mutation corrupts history.
-        We deep-copy ``messages`` once, mutate the copy, and return a new
-        top-level request dict referencing the copied list.
+        Changed messages and blocks are copied on write and unchanged ones are
+        shared; the original request is never mutated.
+
+        Claude Code resends the full history every turn, so results are
+        memoized per text by content digest (``TextScrubMemo``): history that
+        was scrubbed on an earlier turn costs a hash, not a rescan.
         """
         if not self._apply_to_request or not self._replacements:
             return request
@@ -363,108 +615,28 @@ class StringReplacementPolicy(BasePolicy, AnthropicHookPolicy):
         if not isinstance(original_messages, list) or not original_messages:
             return request
 
-        # Deep-copy messages once; mutating the copy is safe.
-        new_messages = copy.deepcopy(original_messages)
-
-        blocks_modified = 0
-        total_replacements = 0
-        original_length = 0
-        transformed_length = 0
-
-        for message in new_messages:
-            if not isinstance(message, dict):
-                continue
-            content = message.get("content")
-            if isinstance(content, str):
-                transformed, count = self._apply_replacements_with_count(content)
-                if count > 0:
-                    blocks_modified += 1
-                    total_replacements += count
-                    original_length += len(content)
-                    transformed_length += len(transformed)
-                    message["content"] = transformed
-                continue
-            if not isinstance(content, list):
-                continue
-            for block in content:
-                stats = self._apply_to_block_in_place(block)
-                if stats is None:
-                    continue
-                count, before_len, after_len = stats
-                if count > 0:
-                    blocks_modified += 1
-                    total_replacements += count
-                    original_length += before_len
-                    transformed_length += after_len
-
-        if blocks_modified == 0:
-            # Nothing changed — return the original request untouched. We
-            # discard the deep copy rather than aliasing it back into a new
-            # top-level dict, since identity-of-input is the easiest contract
-            # to verify in tests when the hook is a true no-op.
+        result = await scrub_request_messages(
+            original_messages, self._request_memo, self._apply_replacements_with_count, context
+        )
+        if result.messages is None:
+            # Nothing changed — return the original request untouched.
             return request
 
         # Build a new top-level dict so reassigning ``messages`` doesn't mutate
         # the original request dict (which is aliased by ``_initial_request``).
         new_request: dict[str, Any] = dict(request)
-        new_request["messages"] = new_messages
+        new_request["messages"] = result.messages
         context.record_event(
             "policy.string_replacement.request_modified",
             {
-                "blocks_modified": blocks_modified,
-                "total_replacements": total_replacements,
-                "original_length": original_length,
-                "transformed_length": transformed_length,
+                "blocks_modified": result.blocks_modified,
+                "total_replacements": result.total_replacements,
+                "original_length": result.original_length,
+                "transformed_length": result.transformed_length,
             },
         )
         return new_request  # type: ignore[return-value]
 
-    def _apply_to_block_in_place(self, block: object) -> tuple[int, int, int] | None:
-        """Apply replacements to a single content block in place.
-
-        Returns ``(substitution_count, original_text_length, transformed_text_length)``
-        if the block is a recognized text-bearing shape, else ``None`` (block was
-        ignored). The lengths reflect only the text actually scrubbed within
-        this block.
-        """
-        if not isinstance(block, dict):
-            return None
-        block_type = block.get("type")
-        if block_type == "text":
-            text = block.get("text")
-            if not isinstance(text, str):
-                return None
-            transformed, count = self._apply_replacements_with_count(text)
-            if count > 0:
-                block["text"] = transformed
-            return (count, len(text), len(transformed))
-        if block_type == "tool_result":
-            content = block.get("content")
-            if isinstance(content, str):
-                transformed, count = self._apply_replacements_with_count(content)
-                if count > 0:
-                    block["content"] = transformed
-                return (count, len(content), len(transformed))
-            if isinstance(content, list):
-                total_count = 0
-                total_before = 0
-                total_after = 0
-                for inner in content:
-                    if not isinstance(inner, dict) or inner.get("type") != "text":
-                        continue
-                    text = inner.get("text")
-                    if not isinstance(text, str):
-                        continue
-                    transformed, count = self._apply_replacements_with_count(text)
-                    if count > 0:
-                        inner["text"] = transformed
-                        total_count += count
-                        total_before += len(text)
-                        total_after += len(transformed)
-                return (total_count, total_before, total_after)
-            return None
-        return None
-
     async def on_anthropic_response(self, response: "AnthropicResponse", context: PolicyContext) -> "AnthropicResponse":
         """Transform text content blocks with string replacements.
 
@@ -9,6 +9,11 @@ Streaming and non-streaming responses share the same `AnthropicMessageBuilder`
 primitives: text passes through, tool_use blocks buffer until judged, and the
 trailing-tool_use wire invariant (#708) is enforced by the builder.
 
+With `speculative_judging` enabled, a streamed tool's judge call starts as soon
+as its input JSON is complete (tracked incrementally as deltas arrive) and the
+stream keeps flowing; verdicts are collected just before `message_delta`, so
+the only wait left is whatever judge time the rest of the stream didn't cover.
+
 Example config:
     policy:
       class: "luthien_proxy.policies.tool_call_judge_policy:ToolCallJudgePolicy"
@@ -21,15 +26,22 @@ Example config:
         max_tokens: 256
         judge_instructions: "You are a security analyst..."
         blocked_message_template: "Tool '{tool_name}' blocked: {explanation}"
+        verdict_cache_ttl_seconds: 3600
+        speculative_judging: true
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import re
+import time
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, TypedDict
 
 from anthropic.lib.streaming import MessageStreamEvent
+from anthropic.types import InputJSONDelta, RawContentBlockDeltaEvent, RawMessageDeltaEvent
 from pydantic import BaseModel, Field
 
 from luthien_proxy.credentials import (
@@ -55,6 +67,11 @@ from luthien_proxy.policy_core.anthropic_message_builder import (
     BufferedTool,
     compose_tool_only_response,
 )
+from luthien_proxy.policy_core.judge_verdict_cache import (
+    DEFAULT_VERDICT_CACHE_MAX_ENTRIES,
+    JudgeVerdictCache,
+    judge_cache_key,
+)
 from luthien_proxy.settings import get_settings
 from luthien_proxy.utils.constants import DEFAULT_JUDGE_MAX_TOKENS, TOOL_ARGS_TRUNCATION_LENGTH
 
@@ -118,16 +135,112 @@ class ToolCallJudgeConfig(BaseModel):
             "backwards compatibility; logs a warning when set."
         ),
     )
+    verdict_cache_ttl_seconds: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Reuse a judge verdict for an identical tool call (same name and input) for this many "
+            "seconds instead of calling the judge again. 0 disables the cache."
+        ),
+    )
+    verdict_cache_max_entries: int = Field(
+        default=DEFAULT_VERDICT_CACHE_MAX_ENTRIES,
+        ge=1,
+        description="Max verdicts kept in process; the shared PolicyCache table has its own cap.",
+    )
+    speculative_judging: bool = Field(
+        default=False,
+        description=(
+            "Streaming only: start each tool's judge call as soon as its input JSON is complete and keep "
+            "streaming instead of waiting at the end of each tool block. Verdicts are applied before "
+            "message_delta."
+        ),
+    )
 
     model_config = {"frozen": True}
 
 
+_STRING_STOP = re.compile(r'["\\]')
+_JSON_STRUCTURE = re.compile(r'["{}\[\]]')
+
+
+class _JsonCompletionTracker:
+    """Tracks bracket depth of streamed input_json so completeness is known without re-parsing.
+
+    Each chunk is scanned once; string contents are skipped with a regex
+    search rather than per character.
+    """
+
+    __slots__ = ("_depth", "_in_string", "_escaped", "_opened")
+
+    def __init__(self) -> None:
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._opened = False
+
+    def feed(self, chunk: str) -> bool:
+        """Consume the next chunk; return True once the top-level value has closed."""
+        i, n = 0, len(chunk)
+        while i < n:
+            if self._escaped:
+                self._escaped = False
+                i += 1
+            elif self._in_string:
+                m = _STRING_STOP.search(chunk, i)
+                if m is None:
+                    break
+                if m.group() == "\\":
+                    self._escaped = True
+                else:
+                    self._in_string = False
+                i = m.end()
+            else:
+                m = _JSON_STRUCTURE.search(chunk, i)
+                if m is None:
+                    break
+                ch = m.group()
+                if ch == '"':
+                    self._in_string = True
+                elif ch in "{[":
+                    self._depth += 1
+                    self._opened = True
+                else:
+                    self._depth -= 1
+                i = m.end()
+        return self._opened and self._depth == 0
+
+
+@dataclass
+class _SpeculativeJudge:
+    """A judge call started before the stream needed its verdict."""
+
+    tool_call: ToolCallDict
+    task: "asyncio.Task[JudgeResult | None]"
+    started_at: float
+    finished_at: float | None = None
+
+    def _mark_finished(self, _task: "asyncio.Future[JudgeResult | None]") -> None:
+        self.finished_at = time.monotonic()
+
+
+@dataclass
+class _SpeculativeStreamState:
+    """Per-request state for speculative judging."""
+
+    builder: AnthropicMessageBuilder = field(default_factory=AnthropicMessageBuilder)
+    trackers: dict[str, _JsonCompletionTracker] = field(default_factory=dict)
+    in_flight: dict[str, _SpeculativeJudge] = field(default_factory=dict)
+    pending: list[tuple[BufferedTool, _SpeculativeJudge]] = field(default_factory=list)
+
+
 class ToolCallJudgePolicy(BasePolicy, AnthropicHookPolicy):
     """Evaluates each tool call with a judge LLM and blocks harmful ones.
 
-    Stateless across requests. Per-request streaming state is owned by an
-    `AnthropicMessageBuilder` stored on the request context; this policy
-    drives the builder via per-tool judge calls at block_stop.
+    Stateless across requests apart from the opt-in verdict cache. Per-request
+    streaming state is owned by an `AnthropicMessageBuilder` stored on the
+    request context; this policy drives the builder via per-tool judge calls
+    at block_stop.
     """
 
     # NOTE: ui_policy_preview is a UI hint. The runtime blocked message is
@@ -179,6 +292,11 @@ class ToolCallJudgePolicy(BasePolicy, AnthropicHookPolicy):
             "⛔ BLOCKED: Tool call '{tool_name}' with arguments {tool_arguments} rejected "
             "(probability {probability:.2f}). Explanation: {explanation}"
         )
+        self._verdict_cache = JudgeVerdictCache(
+            f"judge_verdict:{type(self).__name__}",
+            ttl_seconds=self.config.verdict_cache_ttl_seconds,
+            max_entries=self.config.verdict_cache_max_entries,
+        )
 
         logger.info(
             f"ToolCallJudgePolicy initialized: model={self._config.model}, "
@@ -214,6 +332,9 @@ class ToolCallJudgePolicy(BasePolicy, AnthropicHookPolicy):
         self, event: MessageStreamEvent, context: "PolicyContext"
     ) -> list[MessageStreamEvent]:
         """Stream events through the per-request builder; judge each tool at block_stop."""
+        if self.config.speculative_judging:
+            return await self._on_speculative_stream_event(event, context)
+
         builder = context.get_request_state(self, AnthropicMessageBuilder, AnthropicMessageBuilder)
 
         async def on_tool_stop(b: AnthropicMessageBuilder, tool: BufferedTool) -> list[MessageStreamEvent]:
@@ -232,8 +353,87 @@ class ToolCallJudgePolicy(BasePolicy, AnthropicHookPolicy):
         return await builder.dispatch_tool_only(event, on_tool_stop)
 
     async def on_anthropic_streaming_policy_complete(self, context: "PolicyContext") -> None:
-        """Drop the per-request builder."""
+        """Drop the per-request builder and cancel any judge call the stream outlived."""
         context.pop_request_state(self, AnthropicMessageBuilder)
+        state = context.pop_request_state(self, _SpeculativeStreamState)
+        if state is not None:
+            for judge in [*state.in_flight.values(), *(judge for _, judge in state.pending)]:
+                judge.task.cancel()
+
+    # ========================================================================
+    # Speculative streaming
+    # ========================================================================
+
+    async def _on_speculative_stream_event(
+        self, event: MessageStreamEvent, context: "PolicyContext"
+    ) -> list[MessageStreamEvent]:
+        """Like the default path, but judges run alongside the stream instead of blocking it."""
+        state = context.get_request_state(self, _SpeculativeStreamState, _SpeculativeStreamState)
+        builder = state.builder
+
+        async def on_tool_stop(b: AnthropicMessageBuilder, tool: BufferedTool) -> list[MessageStreamEvent]:
+            state.trackers.pop(tool.id, None)
+            arguments = tool.input_json or "{}"
+            judge = state.in_flight.pop(tool.id, None)
+            if judge is None or judge.tool_call["arguments"].strip() != arguments.strip():
+                if judge is not None:
+                    judge.task.cancel()
+                judge = self._start_speculative_judge(tool.id, tool.name, arguments, context)
+            state.pending.append((tool, judge))
+            return []
+
+        if isinstance(event, RawMessageDeltaEvent):
+            return await self._collect_speculative_verdicts(state, context) + builder.finalize(event)
+
+        events = await builder.dispatch_tool_only(event, on_tool_stop)
+        if isinstance(event, RawContentBlockDeltaEvent) and isinstance(event.delta, InputJSONDelta):
+            tool = builder.peek_tool(event.index)
+            if tool is not None:
+                tracker = state.trackers.setdefault(tool.id, _JsonCompletionTracker())
+                if tracker.feed(event.delta.partial_json) and tool.id not in state.in_flight:
+                    state.in_flight[tool.id] = self._start_speculative_judge(
+                        tool.id, tool.name, tool.input_json, context
+                    )
+        return events
+
+    def _start_speculative_judge(
+        self, tool_id: str, name: str, arguments: str, context: "PolicyContext"
+    ) -> _SpeculativeJudge:
+        tool_call: ToolCallDict = {"id": tool_id, "name": name, "arguments": arguments}
+        judge = _SpeculativeJudge(
+            tool_call=tool_call,
+            task=asyncio.ensure_future(self._evaluate_and_maybe_block(tool_call, context)),
+            started_at=time.monotonic(),
+        )
+        judge.task.add_done_callback(judge._mark_finished)
+        return judge
+
+    async def _collect_speculative_verdicts(
+        self, state: _SpeculativeStreamState, context: "PolicyContext"
+    ) -> list[MessageStreamEvent]:
+        """Apply verdicts in tool order and record how much judge time the stream hid."""
+        if not state.pending:
+            return []
+
+        events: list[MessageStreamEvent] = []
+        with context.span("tool_judge.collect_speculative") as span:
+            wait_started = time.monotonic()
+            hidden = 0.0
+            for tool, judge in state.pending:
+                blocked = await judge.task
+                hidden += max(0.0, min(judge.finished_at or wait_started, wait_started) - judge.started_at)
+                if blocked is not None:
+                    logger.info(f"Blocked tool call '{tool.name}'")
+                    events.extend(state.builder.commit_text(self._format_blocked_message(judge.tool_call, blocked)))
+                else:
+                    state.builder.buffer_tool(id=tool.id, name=tool.name, input_json=judge.tool_call["arguments"])
+            span.set_attribute("luthien.policy.tool_judge.count", len(state.pending))
+            span.set_attribute("luthien.policy.tool_judge.hidden_latency_ms", round(hidden * 1000, 1))
+            span.set_attribute(
+                "luthien.policy.tool_judge.blocking_ms", round((time.monotonic() - wait_started) * 1000, 1)
+            )
+        state.pending.clear()
+        return events
 
     # ========================================================================
     # Judge call
@@ -244,6 +444,41 @@ class ToolCallJudgePolicy(BasePolicy, AnthropicHookPolicy):
         name: str,
         arguments: str,
         context: "PolicyContext",
+    ) -> JudgeResult:
+        """Return the judge's verdict, from the verdict cache when an identical call was judged."""
+        cache_key = judge_cache_key(
+            instructions=self._judge_instructions, model=self._config.model, tool_name=name, tool_input=arguments
+        )
+        cached = await self._verdict_cache.get(cache_key, context)
+        if cached is not None:
+            context.record_event(
+                "policy.anthropic_judge.verdict_cache_hit",
+                {"summary": f"Reused cached judge verdict for '{name}'", "tool_name": name},
+            )
+            return JudgeResult(
+                probability=float(cached["probability"]),
+                explanation=str(cached.get("explanation", "")),
+                prompt=build_judge_prompt(name, arguments, self._judge_instructions),
+                response_text=str(cached.get("response_text", "")),
+            )
+
+        result = await self._run_judge(name, arguments, context)
+        await self._verdict_cache.put(
+            cache_key,
+            {
+                "probability": result.probability,
+                "explanation": result.explanation,
+                "response_text": result.response_text,
+            },
+            context,
+        )
+        return result
+
+    async def _run_judge(
+        self,
+        name: str,
+        arguments: str,
+        context: "PolicyContext",
     ) -> JudgeResult:
         """Resolve the inference provider and run a judge call."""
         prompt = build_judge_prompt(name, arguments, self._judge_instructions)
@@ -0,0 +1,270 @@
+"""Deterministic rule tier that runs before an LLM tool-call judge.
+
+Most tool calls a safety preset sees are obviously fine (``git status``, a
+``Read``) or obviously not (``rm -rf /``). ``ToolPrefilter`` settles those
+with compiled rules and only escalates the ambiguous rest to the judge:
+
+1. Tools in ``safe_tools`` are allowed outright.
+2. A shell command (``command_tools``) is searched with one compiled
+   alternation of the command block patterns, after blanking quoted text. A
+   match blocks only where a command actually starts (the start of a shell
+   segment, past ``sudo``/``env``-style wrappers and ``VAR=value``
+   assignments) or at a redirection operator. Any other match, including
+   one inside a quoted argument, escalates.
+3. File path fields of other tools are searched with the path block
+   patterns (a match blocks), then with the path escalate patterns (a
+   match escalates).
+4. Tools in ``allow_unmatched_tools`` are allowed when nothing matched and
+   every path is absolute with no ``..`` component (a relative path depends
+   on a working directory the rules can't see).
+5. A shell command is allowed when it parses (``shlex``) into a single
+   program invocation that starts with a ``safe_commands`` argv prefix and
+   has no chaining, redirection, command substitution or option that writes
+   files or runs other programs (``--output``, ``--pre``, ``--ext-diff``,
+   ``-c``).
+6. Everything else escalates.
+
+Decisions are counted so the escalation ratio (how often the judge is still
+needed) is visible per policy.
+"""
+
+from __future__ import annotations
+
+import re
+import shlex
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field, field_validator
+
+PrefilterDecision = Literal["allow", "block", "escalate"]
+
+# Input keys that carry the shell command / file path for Claude Code tools.
+_COMMAND_KEYS = ("command", "cmd")
+_PATH_KEYS = ("file_path", "path", "notebook_path")
+
+# Options that turn an otherwise read-only command into one that writes a
+# file (``git diff --output=...``) or runs another program (``rg --pre``,
+# ``git diff --ext-diff``, ``git -c core.pager=...``).
+_UNSAFE_OPTIONS = ("--output", "--pre", "--ext-diff", "-c")
+
+# Where a command starts in quote-blanked shell text: the beginning, or after
+# a separator / grouping character, past wrapper programs and assignments.
+_COMMAND_START = re.compile(
+    r"(?:^|[;&|\n({`])\s*(?:(?:sudo|doas|nohup|time|exec|command|env|xargs)\s+|[A-Za-z_]\w*=\S*\s+)*"
+)
+
+
+class ToolPrefilterConfig(BaseModel):
+    """Rules for the deterministic pre-judge tier."""
+
+    safe_tools: tuple[str, ...] = Field(
+        default=(),
+        description="Tool names that never need judging (e.g. read-only tools).",
+    )
+    command_tools: tuple[str, ...] = Field(
+        default=("Bash",),
+        description="Tool names whose 'command' input is a shell command.",
+    )
+    safe_commands: tuple[str, ...] = Field(
+        default=(),
+        description="Shell argv prefixes that are safe on their own, e.g. 'ls' or 'git status'.",
+    )
+    command_block_patterns: tuple[str, ...] = Field(
+        default=(),
+        description="Regexes searched in shell commands; any match blocks the call.",
+    )
+    path_block_patterns: tuple[str, ...] = Field(
+        default=(),
+        description="Regexes searched in file path inputs of other tools; any match blocks the call.",
+    )
+    path_escalate_patterns: tuple[str, ...] = Field(
+        default=(),
+        description="Regexes searched in file path inputs that send the call to the judge instead of allowing it.",
+    )
+    allow_unmatched_tools: tuple[str, ...] = Field(
+        default=(),
+        description="Non-shell tools that are allowed when no path pattern matches.",
+    )
+    block_message: str = Field(
+        default="[BLOCKED] Tool call '{tool_name}' matched a blocked pattern: {match}",
+        description="Replacement text for a blocked call. Variables: {tool_name}, {match}.",
+    )
+
+    model_config = {"frozen": True}
+
+    @field_validator("command_block_patterns", "path_block_patterns", "path_escalate_patterns")
+    @classmethod
+    def _patterns_compile(cls, patterns: tuple[str, ...]) -> tuple[str, ...]:
+        for pattern in patterns:
+            try:
+                re.compile(pattern)
+            except re.error as exc:
+                raise ValueError(f"invalid block pattern {pattern!r}: {exc}") from exc
+        return patterns
+
+
+@dataclass(frozen=True)
+class PrefilterResult:
+    """Outcome of the rule tier for one tool call."""
+
+    decision: PrefilterDecision
+    match: str | None = None
+
+
+def _compile_any(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{p})" for p in patterns))
+
+
+def _is_plain_absolute(path: str) -> bool:
+    return path.startswith("/") and ".." not in path.split("/")
+
+
+def _blank_quoted(command: str) -> str:
+    """Replace quoted text (and escaped characters) with spaces, keeping offsets.
+
+    Quote characters themselves stay, so a quoted argument still separates
+    the words around it. An unterminated quote blanks the rest of the string.
+    """
+    chars = list(command)
+    quote: str | None = None
+    i = 0
+    while i < len(chars):
+        char = command[i]
+        if quote is None:
+            if char == "\\":
+                chars[i : i + 2] = " " * len(chars[i : i + 2])
+                i += 2
+                continue
+            if char in "'\"":
+                quote = char
+        elif char == quote:
+            quote = None
+        elif quote == '"' and char == "\\":
+            chars[i : i + 2] = " " * len(chars[i : i + 2])
+            i += 2
+            continue
+        else:
+            chars[i] = " "
+        i += 1
+    return "".join(chars)
+
+
+def _plain_argv(command: str) -> list[str] | None:
+    """Parse a command that is a single plain program invocation, or return None.
+
+    Chaining, pipes, redirections, grouping, command substitution and
+    unparseable quoting all return None.
+    """
+    if "\n" in command or "$(" in command or "`" in command:
+        return None
+    lexer = shlex.shlex(command, posix=True, punctuation_chars=True)
+    lexer.whitespace_split = True
+    try:
+        tokens = list(lexer)
+    except ValueError:
+        return None
+    if any(token and set(token) <= set(lexer.punctuation_chars) for token in tokens):
+        return None
+    return tokens
+
+
+def _has_unsafe_option(argv: list[str]) -> bool:
+    return any(arg == option or arg.startswith(f"{option}=") for arg in argv for option in _UNSAFE_OPTIONS)
+
+
+class ToolPrefilter:
+    """Compiled form of a ``ToolPrefilterConfig`` plus decision counters.
+
+    One instance lives on a policy and is shared across its requests; the
+    counters are plain ints bumped without awaiting, so no lock is needed.
+    """
+
+    def __init__(self, config: ToolPrefilterConfig) -> None:
+        """Compile the configured rules."""
+        self.config = config
+        self._safe_tools = frozenset(config.safe_tools)
+        self._command_tools = frozenset(config.command_tools)
+        self._allow_unmatched_tools = frozenset(config.allow_unmatched_tools)
+        self._safe_commands = tuple(tuple(entry.split()) for entry in config.safe_commands if entry.strip())
+        self._command_patterns = _compile_any(config.command_block_patterns)
+        self._path_patterns = _compile_any(config.path_block_patterns)
+        self._path_escalate_patterns = _compile_any(config.path_escalate_patterns)
+        self.allowed = 0
+        self.blocked = 0
+        self.escalated = 0
+
+    @property
+    def escalation_ratio(self) -> float:
+        """Share of evaluated calls that still went to the judge."""
+        total = self.allowed + self.blocked + self.escalated
+        return self.escalated / total if total else 0.0
+
+    def evaluate(self, tool_name: str, tool_input: Any) -> PrefilterResult:
+        """Decide a tool call with the rules, counting the outcome."""
+        result = self._decide(tool_name, tool_input if isinstance(tool_input, dict) else {})
+        if result.decision == "allow":
+            self.allowed += 1
+        elif result.decision == "block":
+            self.blocked += 1
+        else:
+            self.escalated += 1
+        return result
+
+    def block_message(self, tool_name: str, match: str | None) -> str:
+        """Replacement text for a call the rules blocked."""
+        return self.config.block_message.format(tool_name=tool_name, match=match or "")
+
+    def _decide(self, tool_name: str, tool_input: dict[str, Any]) -> PrefilterResult:
+        if tool_name in self._safe_tools:
+            return PrefilterResult("allow")
+
+        if tool_name in self._command_tools:
+            command = next((v for k in _COMMAND_KEYS if isinstance(v := tool_input.get(k), str)), None)
+            if command is None:
+                return PrefilterResult("escalate")
+            if self._command_patterns is not None:
+                if (match := self._blocked_command_match(command)) is not None:
+                    return PrefilterResult("block", match)
+                if self._command_patterns.search(command):
+                    return PrefilterResult("escalate")
+            if self._is_safe_command(command):
+                return PrefilterResult("allow")
+            return PrefilterResult("escalate")
+
+        paths = [v for k in _PATH_KEYS if isinstance(v := tool_input.get(k), str)]
+        if self._path_patterns is not None:
+            for path in paths:
+                if self._path_patterns.search(path):
+                    return PrefilterResult("block", path)
+        if self._path_escalate_patterns is not None and any(map(self._path_escalate_patterns.search, paths)):
+            return PrefilterResult("escalate")
+        if tool_name in self._allow_unmatched_tools and paths and all(map(_is_plain_absolute, paths)):
+            return PrefilterResult("allow")
+        return PrefilterResult("escalate")
+
+    def _blocked_command_match(self, command: str) -> str | None:
+        """Return a block-pattern match that starts a command or a redirection, outside quotes."""
+        assert self._command_patterns is not None
+        blanked = _blank_quoted(command)
+        starts = {m.end() for m in _COMMAND_START.finditer(blanked)}
+        for start in sorted(starts):
+            if m := self._command_patterns.match(blanked, start):
+                return m.group(0)
+        for redirect in re.finditer(r"[<>]", blanked):
+            if m := self._command_patterns.match(blanked, redirect.start()):
+                return m.group(0)
+        return None
+
+    def _is_safe_command(self, command: str) -> bool:
+        if not self._safe_commands:
+            return False
+        argv = _plain_argv(command)
+        if not argv or _has_unsafe_option(argv):
+            return False
+        return any(tuple(argv[: len(prefix)]) == prefix for prefix in self._safe_commands)
+
+
+__all__ = ["PrefilterDecision", "PrefilterResult", "ToolPrefilter", "ToolPrefilterConfig"]
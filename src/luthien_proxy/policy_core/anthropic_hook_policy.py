@@ -6,7 +6,7 @@ subclasses only need to override the hooks they care about.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from anthropic.lib.streaming import MessageStreamEvent
 
@@ -31,8 +31,17 @@ class AnthropicHookPolicy:
         on_anthropic_response: Called on non-streaming response. Default: passthrough.
         on_anthropic_stream_event: Called per stream event. Default: passthrough.
         on_anthropic_stream_complete: Called after stream ends. Default: no extra events.
+
+    Set ``observes_stream_events_only = True`` on a policy whose
+    on_anthropic_stream_event never changes, drops or adds events and whose
+    on_anthropic_stream_complete only appends to a stream relayed as-is. Streaming
+    responses then take the passthrough path: upstream SSE bytes go to the
+    client unchanged and events are parsed off the forwarding path (see
+    ``stream_passthrough_supported``).
     """
 
+    observes_stream_events_only: ClassVar[bool] = False
+
     async def on_anthropic_request(self, request: AnthropicRequest, context: PolicyContext) -> AnthropicRequest:
         """Transform request before sending. Default: passthrough."""
         return request
@@ -52,4 +61,35 @@ class AnthropicHookPolicy:
         return []
 
 
-__all__ = ["AnthropicHookPolicy"]
+def _defining_class(policy_type: type, name: str) -> type | None:
+    return next((klass for klass in policy_type.__mro__ if name in vars(klass)), None)
+
+
+_STREAM_HOOKS = ("on_anthropic_stream_event", "on_anthropic_stream_complete")
+
+
+def stream_passthrough_supported(policy: object) -> bool:
+    """Whether policy declares that its stream hooks leave events unchanged.
+
+    The declaration only counts if it is made on the class that defines
+    each of on_anthropic_stream_event and on_anthropic_stream_complete or on
+    a subclass of it, so a subclass that overrides either hook of an
+    observe-only parent opts back out until it re-declares
+    ``observes_stream_events_only``.
+    """
+    if getattr(policy, "observes_stream_events_only", False) is not True:
+        return False
+    flag_owner = _defining_class(type(policy), "observes_stream_events_only")
+    for hook in _STREAM_HOOKS:
+        hook_owner = _defining_class(type(policy), hook)
+        if hook_owner is not None and (flag_owner is None or not issubclass(flag_owner, hook_owner)):
+            return False
+    return True
+
+
+def observes_stream_events(policy: object) -> bool:
+    """Whether policy overrides the default (no-op) on_anthropic_stream_event."""
+    return _defining_class(type(policy), "on_anthropic_stream_event") not in (None, AnthropicHookPolicy)
+
+
+__all__ = ["AnthropicHookPolicy", "observes_stream_events", "stream_passthrough_supported"]
@@ -250,6 +250,10 @@ class AnthropicMessageBuilder:
         """Pop the buffered tool at this index."""
         return self._state.tool_buffer.pop(index, None)
 
+    def peek_tool(self, index: int) -> BufferedTool | None:
+        """Return the tool still buffering at this index without popping it."""
+        return self._state.tool_buffer.get(index)
+
     @property
     def committed_descriptors(self) -> tuple[BlockDescriptor, ...]:
         """Descriptors for every block the builder has been told about, in commit order.
@@ -0,0 +1,152 @@
+"""Verdict cache for LLM tool-call judges.
+
+Agents re-issue identical tool calls constantly (``git status``, ``ls``, the
+same ``Read`` paths), and every one costs a judge round-trip on the stream.
+``JudgeVerdictCache`` remembers a judge's verdict under a hash of everything
+that determines it — judge instructions, judge model, tool name and the
+canonicalized tool input — so a repeat call skips the judge entirely.
+
+Lookups go to a bounded in-process TTL + LRU map first, then to the shared
+``PolicyCache`` table when the request context has a database (so verdicts
+survive restarts and are shared across replicas). Verdicts are plain JSON
+dicts; each policy decides what to store and how to rebuild its result.
+Only successful judge calls should be stored — a judge failure must never be
+replayed as a verdict.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from luthien_proxy.policy_core.policy_context import PolicyContext
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VERDICT_CACHE_MAX_ENTRIES = 1024
+
+
+def canonical_tool_input(tool_input: Any) -> str:
+    """Serialize tool input so semantically equal inputs hash the same.
+
+    Strings that hold JSON (e.g. buffered ``input_json``) are decoded first;
+    anything that isn't JSON is used verbatim.
+    """
+    if isinstance(tool_input, str):
+        try:
+            tool_input = json.loads(tool_input) if tool_input.strip() else {}
+        except json.JSONDecodeError:
+            return tool_input
+    return json.dumps(tool_input, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def judge_cache_key(*, instructions: str, model: str, tool_name: str, tool_input: Any) -> str:
+    """Return the cache key for one judge decision about one tool call."""
+    material = json.dumps(
+        [" ".join(instructions.split()), model, tool_name, canonical_tool_input(tool_input)],
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class JudgeVerdictCache:
+    """Two-tier (in-process, then ``PolicyCache``) store of judge verdicts.
+
+    One instance lives on a policy instance and is shared by every request
+    that policy serves. ``hits``, ``shared_hits`` and ``misses`` count lookups
+    answered in-process, answered by the shared table, and not answered.
+    The in-process tier is synchronous dict work and needs no lock.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        *,
+        ttl_seconds: int,
+        max_entries: int = DEFAULT_VERDICT_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            namespace: ``PolicyCache`` namespace for the shared tier.
+            ttl_seconds: Lifetime of a verdict in both tiers. 0 disables caching.
+            max_entries: In-process capacity; least-recently-used verdicts are
+                evicted first.
+        """
+        if ttl_seconds < 0:
+            raise ValueError(f"ttl_seconds must be >= 0 (got {ttl_seconds})")
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1 (got {max_entries})")
+        self._namespace = namespace
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether verdicts are cached at all."""
+        return self._ttl_seconds > 0
+
+    async def get(self, key: str, context: "PolicyContext") -> dict[str, Any] | None:
+        """Return the cached verdict for ``key``, or None on a miss."""
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            verdict, expires_at = entry
+            if time.monotonic() < expires_at:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return verdict
+            del self._entries[key]
+
+        if context.has_policy_cache:
+            try:
+                stored = await context.policy_cache(self._namespace).get(key)
+            except Exception as exc:
+                logger.warning("Judge verdict cache read failed (treating as miss): %r", exc)
+                stored = None
+            if isinstance(stored, dict):
+                # The shared row may have less life left than a full TTL, but
+                # an in-process copy living one TTL past it is harmless.
+                self._remember(key, stored)
+                self.shared_hits += 1
+                return stored
+
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, verdict: dict[str, Any], context: "PolicyContext") -> None:
+        """Store a verdict from a successful judge call."""
+        if not self.enabled:
+            return
+        self._remember(key, verdict)
+        if context.has_policy_cache:
+            try:
+                await context.policy_cache(self._namespace).put(key, verdict, self._ttl_seconds)
+            except Exception as exc:
+                logger.warning("Judge verdict cache write failed (in-process copy kept): %r", exc)
+
+    def _remember(self, key: str, verdict: dict[str, Any]) -> None:
+        self._entries[key] = (verdict, time.monotonic() + self._ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+__all__ = [
+    "DEFAULT_VERDICT_CACHE_MAX_ENTRIES",
+    "JudgeVerdictCache",
+    "canonical_tool_input",
+    "judge_cache_key",
+]
@@ -13,13 +13,18 @@ Anthropic API invariant that text blocks must precede tool_use blocks.
 
 If the response contains no text blocks at all (e.g. tool_use only), the
 extra_text suffix is dropped and an error is logged.
+
+Setting ``modify_requests = True`` also runs modify_text over request message
+text. Clients resend the whole conversation each turn, so request results are
+memoized per text (see ``text_scrub_memo``) and only changed blocks are copied.
 """
 
 from __future__ import annotations
 
+import json
 import logging
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from anthropic.lib.streaming import MessageStreamEvent
 from anthropic.types import (
@@ -36,6 +41,7 @@ from luthien_proxy.policy_core import (
     AnthropicPolicyEmission,
     BasePolicy,
 )
+from luthien_proxy.policy_core.text_scrub_memo import TextScrubMemo, scrub_request_messages, text_digest
 
 if TYPE_CHECKING:
     from luthien_proxy.llm.types.anthropic import AnthropicRequest, AnthropicResponse
@@ -65,8 +71,17 @@ class TextModifierPolicy(BasePolicy):
     If a response has no text blocks (e.g. tool_use only), extra_text is
     dropped and an error is logged. Tool calls, thinking blocks, and images
     are always passed through unchanged.
+
+    Set ``modify_requests = True`` to also apply modify_text to request
+    message text (string content, text blocks, tool results). modify_text
+    must then be a pure function of its input, since results are memoized.
+    ``request_memo_ttl_seconds > 0`` additionally shares them through the
+    policy cache — worthwhile only when modify_text is expensive.
     """
 
+    modify_requests: ClassVar[bool] = False
+    request_memo_ttl_seconds: ClassVar[int] = 0
+
     def modify_text(self, text: str) -> str:
         """Transform response text. Default: passthrough."""
         return text
@@ -100,9 +115,33 @@ class TextModifierPolicy(BasePolicy):
 
     # -- Anthropic lifecycle hooks ------------------------------------------------
 
+    def _request_memo(self) -> TextScrubMemo:
+        """Return this instance's request memo, creating it on first use."""
+        memo = self.__dict__.get("_scrub_memo")
+        if memo is None:
+            name = type(self).__qualname__
+            fingerprint = text_digest(json.dumps([name, self.get_config()], sort_keys=True, default=repr))
+            memo = TextScrubMemo(f"text_modifier.{name}", fingerprint, shared_ttl_seconds=self.request_memo_ttl_seconds)
+            self._scrub_memo = memo
+        return memo
+
+    def _modify_request_text(self, text: str) -> tuple[str, int]:
+        modified = self.modify_text(text)
+        return modified, int(modified != text)
+
     async def on_anthropic_request(self, request: AnthropicRequest, context: PolicyContext) -> AnthropicRequest:
-        """Pass through request unchanged."""
-        return request
+        """Apply modify_text to request messages if ``modify_requests`` is set; otherwise pass through."""
+        if not self.modify_requests:
+            return request
+        messages = request.get("messages")
+        if not isinstance(messages, list) or not messages:
+            return request
+        result = await scrub_request_messages(messages, self._request_memo(), self._modify_request_text, context)
+        if result.messages is None:
+            return request
+        new_request: dict[str, Any] = dict(request)
+        new_request["messages"] = result.messages
+        return new_request  # type: ignore[return-value]
 
     async def on_anthropic_response(self, response: AnthropicResponse, context: PolicyContext) -> AnthropicResponse:
         """Apply modify_text and extra_text to the non-streaming response."""
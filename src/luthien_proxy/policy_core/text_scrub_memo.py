@@ -0,0 +1,279 @@
+"""Memoized, copy-on-write scrubbing of request message text.
+
+Claude Code resends the whole conversation on every turn, so a policy that
+rewrites request text would otherwise re-scrub (and deep-copy) all of history
+per request — O(history) each turn, quadratic over a session. ``TextScrubMemo``
+remembers the result of a text transform under a digest of the input text, and
+``scrub_request_messages`` walks ``messages`` through it, copying only the
+messages and blocks whose text actually changes.
+
+The memo has a bounded in-process LRU tier and an optional ``PolicyCache``
+tier (``shared_ttl_seconds > 0``) so results survive restarts and are shared
+across replicas. The shared tier costs a database round-trip per in-process
+miss; it only pays off for transforms that are expensive compared to that.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from luthien_proxy.policy_core.policy_context import PolicyContext
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCRUB_MEMO_MAX_ENTRIES = 16_384
+
+# A transform returns (new_text, substitution_count). count == 0 means unchanged.
+TextTransform = Callable[[str], tuple[str, int]]
+
+
+def text_digest(text: str) -> str:
+    """Return the memo key for a piece of text."""
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+
+class TextScrubMemo:
+    """Digest-keyed memo of one policy's text transform.
+
+    One instance lives on a policy instance, whose configuration fixes the
+    transform; ``fingerprint`` must change whenever the transform's output
+    could (it prefixes shared-tier keys). Unchanged texts are remembered as
+    ``None`` so history that needs no scrubbing costs only its key.
+    ``hits``, ``shared_hits`` and ``misses`` count lookups per tier.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        fingerprint: str,
+        *,
+        max_entries: int = DEFAULT_SCRUB_MEMO_MAX_ENTRIES,
+        shared_ttl_seconds: int = 0,
+    ) -> None:
+        """Initialize an empty memo.
+
+        Args:
+            namespace: ``PolicyCache`` namespace for the shared tier.
+            fingerprint: Identifies the transform (e.g. a hash of the policy config).
+            max_entries: In-process capacity; least-recently-used entries are evicted first.
+            shared_ttl_seconds: Lifetime of shared-tier entries. 0 keeps the memo in process only.
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1 (got {max_entries})")
+        if shared_ttl_seconds < 0:
+            raise ValueError(f"shared_ttl_seconds must be >= 0 (got {shared_ttl_seconds})")
+        self._namespace = namespace
+        self._fingerprint = fingerprint
+        self._max_entries = max_entries
+        self._shared_ttl_seconds = shared_ttl_seconds
+        self._entries: OrderedDict[str, tuple[str | None, int]] = OrderedDict()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    async def apply(self, text: str, transform: TextTransform, context: "PolicyContext") -> tuple[str, int]:
+        """Return ``transform(text)``, from the memo when it has been seen before."""
+        key = text_digest(text)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._expand(text, entry)
+
+        use_shared = self._shared_ttl_seconds > 0 and context.has_policy_cache
+        if use_shared:
+            entry = await self._shared_get(key, context)
+            if entry is not None:
+                self._remember(key, entry)
+                self.shared_hits += 1
+                return self._expand(text, entry)
+
+        self.misses += 1
+        transformed, count = transform(text)
+        entry = (transformed if count > 0 else None, count)
+        self._remember(key, entry)
+        if use_shared:
+            await self._shared_put(key, entry, context)
+        return transformed, count
+
+    @staticmethod
+    def _expand(text: str, entry: tuple[str | None, int]) -> tuple[str, int]:
+        transformed, count = entry
+        return (text if transformed is None else transformed), count
+
+    def _remember(self, key: str, entry: tuple[str | None, int]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def _shared_get(self, key: str, context: "PolicyContext") -> tuple[str | None, int] | None:
+        try:
+            stored = await context.policy_cache(self._namespace).get(f"{self._fingerprint}:{key}")
+        except Exception as exc:
+            logger.warning("Scrub memo read failed (treating as miss): %r", exc)
+            return None
+        if (
+            isinstance(stored, list)
+            and len(stored) == 2
+            and (stored[0] is None or isinstance(stored[0], str))
+            and isinstance(stored[1], int)
+        ):
+            return stored[0], stored[1]
+        return None
+
+    async def _shared_put(self, key: str, entry: tuple[str | None, int], context: "PolicyContext") -> None:
+        try:
+            await context.policy_cache(self._namespace).put(
+                f"{self._fingerprint}:{key}", list(entry), self._shared_ttl_seconds
+            )
+        except Exception as exc:
+            logger.warning("Scrub memo write failed (in-process copy kept): %r", exc)
+
+
+@dataclass
+class ScrubResult:
+    """Outcome of ``scrub_request_messages``.
+
+    ``messages`` is None when nothing changed; otherwise it is a new list in
+    which only changed messages (and, within them, changed blocks) are copies.
+    """
+
+    messages: list[Any] | None = None
+    blocks_modified: int = 0
+    total_replacements: int = 0
+    original_length: int = 0
+    transformed_length: int = 0
+
+    def record(self, before: str, after: str, count: int) -> None:
+        """Count one modified block."""
+        self.blocks_modified += 1
+        self.total_replacements += count
+        self.original_length += len(before)
+        self.transformed_length += len(after)
+
+
+async def scrub_request_messages(
+    messages: list[Any],
+    memo: TextScrubMemo,
+    transform: TextTransform,
+    context: "PolicyContext",
+) -> ScrubResult:
+    """Apply ``transform`` to the text-bearing parts of request messages.
+
+    Targets string message content, ``text`` blocks, and ``tool_result``
+    blocks whose content is a string or a list of ``text`` blocks (counted as
+    one block). Other block types are left untouched. The input list and
+    everything reachable from it are never mutated: a changed message is
+    shallow-copied along with its content list and the changed blocks, and
+    every other message is shared with the input.
+    """
+    result = ScrubResult()
+    new_messages: list[Any] | None = None
+
+    for index, message in enumerate(messages):
+        if not isinstance(message, dict):
+            continue
+        content = message.get("content")
+        new_content: Any = None
+        if isinstance(content, str):
+            transformed, count = await memo.apply(content, transform, context)
+            if count > 0:
+                result.record(content, transformed, count)
+                new_content = transformed
+        elif isinstance(content, list):
+            new_content = await _scrub_blocks(content, memo, transform, context, result)
+
+        if new_content is not None:
+            if new_messages is None:
+                new_messages = list(messages)
+            new_messages[index] = {**message, "content": new_content}
+
+    result.messages = new_messages
+    return result
+
+
+async def _scrub_blocks(
+    blocks: list[Any],
+    memo: TextScrubMemo,
+    transform: TextTransform,
+    context: "PolicyContext",
+    result: ScrubResult,
+) -> list[Any] | None:
+    """Return a copy of ``blocks`` with changed blocks replaced, or None if none changed."""
+    new_blocks: list[Any] | None = None
+    for index, block in enumerate(blocks):
+        if not isinstance(block, dict):
+            continue
+        block_type = block.get("type")
+        new_block: dict[str, Any] | None = None
+        if block_type == "text":
+            text = block.get("text")
+            if isinstance(text, str):
+                transformed, count = await memo.apply(text, transform, context)
+                if count > 0:
+                    result.record(text, transformed, count)
+                    new_block = {**block, "text": transformed}
+        elif block_type == "tool_result":
+            inner = block.get("content")
+            if isinstance(inner, str):
+                transformed, count = await memo.apply(inner, transform, context)
+                if count > 0:
+                    result.record(inner, transformed, count)
+                    new_block = {**block, "content": transformed}
+            elif isinstance(inner, list):
+                new_inner = await _scrub_tool_result_parts(inner, memo, transform, context, result)
+                if new_inner is not None:
+                    new_block = {**block, "content": new_inner}
+        if new_block is not None:
+            if new_blocks is None:
+                new_blocks = list(blocks)
+            new_blocks[index] = new_block
+    return new_blocks
+
+
+async def _scrub_tool_result_parts(
+    parts: list[Any],
+    memo: TextScrubMemo,
+    transform: TextTransform,
+    context: "PolicyContext",
+    result: ScrubResult,
+) -> list[Any] | None:
+    new_parts: list[Any] | None = None
+    total_count = total_before = total_after = 0
+    for index, part in enumerate(parts):
+        if not isinstance(part, dict) or part.get("type") != "text":
+            continue
+        text = part.get("text")
+        if not isinstance(text, str):
+            continue
+        transformed, count = await memo.apply(text, transform, context)
+        if count > 0:
+            total_count += count
+            total_before += len(text)
+            total_after += len(transformed)
+            if new_parts is None:
+                new_parts = list(parts)
+            new_parts[index] = {**part, "text": transformed}
+    if new_parts is not None:
+        result.blocks_modified += 1
+        result.total_replacements += total_count
+        result.original_length += total_before
+        result.transformed_length += total_after
+    return new_parts
+
+
+__all__ = [
+    "DEFAULT_SCRUB_MEMO_MAX_ENTRIES",
+    "ScrubResult",
+    "TextScrubMemo",
+    "TextTransform",
+    "scrub_request_messages",
+    "text_digest",
+]
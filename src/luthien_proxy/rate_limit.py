@@ -1,4 +1,14 @@
-"""In-process asyncio-safe token bucket rate limiter for per-key request limiting."""
+"""Token bucket rate limiters for per-key request limiting.
+
+Two implementations share the ``check(key) -> RateLimitDecision`` contract:
+
+- ``TokenBucketRateLimiter``: in-process buckets, one set per replica.
+- ``RedisTokenBucketRateLimiter``: one bucket per key in Redis, updated by an
+  atomic Lua script, so the limit holds across replicas.
+
+``UsageRateLimiter`` adds per-key input/output token-per-minute buckets and a
+concurrent-request cap on top of the request-count limiters.
+"""
 
 from __future__ import annotations
 
@@ -8,10 +18,21 @@ import logging
 import math
 import time
 from collections import OrderedDict
-from dataclasses import dataclass
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Any, Protocol
+
+import redis.asyncio as redis
 
 logger = logging.getLogger(__name__)
 
+RATE_LIMIT_BACKEND_MEMORY = "memory"
+RATE_LIMIT_BACKEND_REDIS = "redis"
+VALID_RATE_LIMIT_BACKENDS = frozenset({RATE_LIMIT_BACKEND_MEMORY, RATE_LIMIT_BACKEND_REDIS})
+
+DEFAULT_REDIS_KEY_PREFIX = "luthien:ratelimit:"
+
 
 @dataclass(frozen=True, slots=True)
 class RateLimitDecision:
@@ -37,6 +58,29 @@ class RateLimitDecision:
     reset_unix: int
 
 
+class RateLimiterProtocol(Protocol):
+    """Interface shared by the in-process and Redis-backed limiters."""
+
+    async def check(self, key: str) -> RateLimitDecision:
+        """Consume one token for key and report whether the request is allowed."""
+        ...
+
+
+def tightest_decision(*decisions: RateLimitDecision | None) -> RateLimitDecision | None:
+    """Pick the decision closest to exhaustion, for the X-RateLimit-* headers.
+
+    The request and usage limiters count different units, so they are
+    compared by the fraction of their limit that remains. Decisions that are
+    None or carry no limit are ignored.
+    """
+    limited = [d for d in decisions if d is not None and d.limit > 0]
+    return min(limited, key=lambda d: d.remaining / d.limit, default=None)
+
+
+def _hash_key(key: str) -> str:
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
 class TokenBucketRateLimiter:
     """Per-key token bucket rate limiter.
 
@@ -55,9 +99,9 @@ class TokenBucketRateLimiter:
     primary purpose of eviction is bounding memory, not preventing limit resets.
 
     Note: in multi-replica deployments each replica maintains independent buckets,
-    so the effective per-key limit is replicas × RPM. This is an in-process
-    implementation; a shared Redis backend would be needed for exact cross-replica
-    limiting.
+    so the effective per-key limit is replicas × RPM. Use
+    RedisTokenBucketRateLimiter (RATE_LIMIT_BACKEND=redis) for a limit shared
+    across replicas.
 
     Note: unauthenticated requests are not rate-limited — check_rate_limit depends
     on verify_token, so only authenticated callers consume bucket capacity. This is
@@ -113,7 +157,7 @@ class TokenBucketRateLimiter:
         self._meta_lock = asyncio.Lock()
 
     def _hash_key(self, key: str) -> str:
-        return hashlib.sha256(key.encode()).hexdigest()
+        return _hash_key(key)
 
     async def _get_or_create_bucket(self, key: str) -> tuple[asyncio.Lock, list[float]]:
         # Fast-path: bucket already exists, no lock needed.
@@ -207,4 +251,491 @@ class TokenBucketRateLimiter:
             )
 
 
-__all__ = ["RateLimitDecision", "TokenBucketRateLimiter"]
+# Atomic token bucket. State lives in a hash {tokens, ts}; the clock is Redis
+# server TIME so replicas with skewed clocks agree on refill.
+#
+# KEYS[1] = bucket key
+# ARGV[1] = refill rate (tokens/second), ARGV[2] = burst capacity,
+# ARGV[3] = lease size (max tokens to hand out in one call)
+#
+# Grants `lease` tokens when the bucket holds at least twice that many (the key
+# is far below its limit), otherwise one token, otherwise none.
+# Returns {granted, tokens_left (string, Lua numbers truncate to integers on
+# the way out), retry_after_ms}.
+_TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local lease = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+    tokens = burst
+    ts = now
+end
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local granted = 0
+local retry_ms = 0
+if tokens >= 1 then
+    granted = 1
+    if lease > 1 and tokens >= 2 * lease then
+        granted = lease
+    end
+    tokens = tokens - granted
+else
+    retry_ms = math.ceil((1 - tokens) / rate * 1000)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+return {granted, tostring(tokens), retry_ms}
+"""
+
+
+@dataclass(slots=True)
+class _Lease:
+    """Tokens pre-admitted from the shared bucket for local consumption."""
+
+    tokens: int
+    shared_remaining: int
+    expires_at: float
+
+
+class RedisTokenBucketRateLimiter:
+    """Per-key token bucket shared across replicas via Redis.
+
+    Each check runs one Lua script that refills and debits the key's bucket
+    atomically, so concurrent checks from any number of replicas see a single
+    consistent bucket. Keys are SHA-256 hashed before they are sent to Redis.
+
+    Local pre-admission: when the shared bucket holds at least 2 × lease_size
+    tokens, the script hands out lease_size tokens at once. This replica keeps
+    the extra ones and admits the next lease_size - 1 requests for that key
+    without a round trip. Leases expire after lease_ttl_seconds so a replica
+    never sits on tokens for long; unused leased tokens are forfeited, which
+    only ever errs on the strict side. Keys close to their limit always go to
+    Redis one token at a time, so the limit stays exact where it matters.
+    lease_size=1 disables pre-admission.
+
+    Redis failures fail over to an in-process TokenBucketRateLimiter with the
+    same settings (per-replica limits) rather than failing requests or
+    admitting everything.
+    """
+
+    _FALLBACK_LOG_INTERVAL: float = 60.0
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        rpm: int,
+        burst: int,
+        *,
+        lease_size: int = 1,
+        lease_ttl_seconds: float = 1.0,
+        max_keys: int = 10_000,
+        key_prefix: str = DEFAULT_REDIS_KEY_PREFIX,
+    ) -> None:
+        """Initialise the rate limiter.
+
+        Args:
+            redis_client: Async Redis client holding the shared buckets.
+            rpm: Requests per minute. 0 disables rate limiting. Must be >= 0.
+            burst: Absolute token bucket capacity. 0 defaults to rpm.
+            lease_size: Tokens to pre-admit locally per Redis round trip for keys
+                far below their limit. 1 disables pre-admission.
+            lease_ttl_seconds: How long locally held tokens stay usable.
+            max_keys: Maximum number of keys with a local lease, and the bucket
+                cap of the in-process fallback limiter.
+            key_prefix: Redis key prefix for bucket hashes.
+
+        Raises:
+            ValueError: If rpm or burst is negative, lease_size < 1,
+                lease_ttl_seconds <= 0, or max_keys < 1.
+        """
+        if lease_size < 1:
+            raise ValueError(f"lease_size must be >= 1, got {lease_size}")
+        if lease_ttl_seconds <= 0:
+            raise ValueError(f"lease_ttl_seconds must be > 0, got {lease_ttl_seconds}")
+        # Validates rpm/burst/max_keys and serves checks while Redis is unreachable.
+        self._fallback = TokenBucketRateLimiter(rpm=rpm, burst=burst, max_keys=max_keys)
+        self.rpm = rpm
+        self.burst = self._fallback.burst
+        self.max_keys = max_keys
+        self.lease_size = lease_size
+        self.lease_ttl_seconds = lease_ttl_seconds
+        self._key_prefix = key_prefix
+        self._script = redis_client.register_script(_TOKEN_BUCKET_SCRIPT)
+        self._leases: OrderedDict[str, _Lease] = OrderedDict()
+        self.redis_checks = 0
+        self.local_admissions = 0
+        self.fallback_checks = 0
+        self._last_fallback_log = float("-inf")
+
+    def _take_lease(self, hashed: str) -> RateLimitDecision | None:
+        lease = self._leases.get(hashed)
+        if lease is None:
+            return None
+        if lease.tokens <= 0 or time.monotonic() >= lease.expires_at:
+            del self._leases[hashed]
+            return None
+        lease.tokens -= 1
+        self._leases.move_to_end(hashed)
+        self.local_admissions += 1
+        return RateLimitDecision(
+            allowed=True,
+            remaining=lease.shared_remaining + lease.tokens,
+            limit=self.rpm,
+            retry_after=0,
+            reset_unix=int(time.time()),
+        )
+
+    def _store_lease(self, hashed: str, tokens: int, shared_remaining: int) -> None:
+        self._leases[hashed] = _Lease(
+            tokens=tokens,
+            shared_remaining=shared_remaining,
+            expires_at=time.monotonic() + self.lease_ttl_seconds,
+        )
+        self._leases.move_to_end(hashed)
+        if len(self._leases) > self.max_keys:
+            self._leases.popitem(last=False)
+
+    def _note_fallback(self, error: Exception) -> None:
+        self.fallback_checks += 1
+        now = time.monotonic()
+        if now - self._last_fallback_log >= self._FALLBACK_LOG_INTERVAL:
+            logger.warning(
+                "Redis rate limiter unavailable (%s); using per-replica in-process buckets (%d checks so far)",
+                repr(error),
+                self.fallback_checks,
+            )
+            self._last_fallback_log = now
+
+    async def check(self, key: str) -> RateLimitDecision:
+        """Check whether key is within its rate limit.
+
+        Args:
+            key: Rate limit key (e.g. credential token value). Hashed internally.
+
+        Returns:
+            RateLimitDecision describing whether the request is allowed plus the
+            metadata needed to build X-RateLimit-* / Retry-After headers.
+        """
+        if self.rpm == 0:
+            return RateLimitDecision(allowed=True, remaining=0, limit=0, retry_after=0, reset_unix=int(time.time()))
+
+        hashed = _hash_key(key)
+        local = self._take_lease(hashed)
+        if local is not None:
+            return local
+
+        try:
+            granted, tokens_left, retry_after_ms = await self._script(
+                keys=[self._key_prefix + hashed],
+                args=[self.rpm / 60.0, self.burst, self.lease_size],
+            )
+        except redis.RedisError as e:
+            self._note_fallback(e)
+            return await self._fallback.check(key)
+        self.redis_checks += 1
+
+        granted = int(granted)
+        shared_remaining = int(float(tokens_left))
+        if granted <= 0:
+            retry_after = max(1, math.ceil(int(retry_after_ms) / 1000))
+            return RateLimitDecision(
+                allowed=False,
+                remaining=0,
+                limit=self.rpm,
+                retry_after=retry_after,
+                reset_unix=int(time.time()) + retry_after,
+            )
+        if granted > 1:
+            self._store_lease(hashed, granted - 1, shared_remaining)
+        return RateLimitDecision(
+            allowed=True,
+            remaining=shared_remaining + granted - 1,
+            limit=self.rpm,
+            retry_after=0,
+            reset_unix=int(time.time()),
+        )
+
+
+# Rough chars-per-token ratio for English text and code.
+_CHARS_PER_TOKEN = 4
+# Flat per-attachment estimate for base64 images/documents, whose encoded size
+# says little about their token cost.
+_ATTACHMENT_TOKEN_ESTIMATE = 1_600
+# Request body fields that are sent to the model as input.
+_INPUT_FIELDS = ("system", "messages", "tools")
+
+
+def _count_input_chars(value: Any) -> tuple[int, int]:
+    """Return (text chars, attachment count) for a request body fragment."""
+    if isinstance(value, str):
+        return len(value), 0
+    if isinstance(value, Mapping):
+        source = value.get("source")
+        if isinstance(source, Mapping) and source.get("type") == "base64":
+            return 0, 1
+        items: Iterable[Any] = value.values()
+    elif isinstance(value, list):
+        items = value
+    else:
+        return 0, 0
+    chars = attachments = 0
+    for item in items:
+        item_chars, item_attachments = _count_input_chars(item)
+        chars += item_chars
+        attachments += item_attachments
+    return chars, attachments
+
+
+def estimate_input_tokens(body: Mapping[str, Any]) -> int:
+    """Estimate the input tokens of an Anthropic Messages request body.
+
+    Counts the text in ``system``, ``messages`` and ``tools`` at ~4 chars per
+    token, plus a flat estimate per base64 image or document. Only used to admit
+    a request up front; the reservation is corrected from the response's
+    ``usage`` once it completes.
+    """
+    chars = attachments = 0
+    for name in _INPUT_FIELDS:
+        field_chars, field_attachments = _count_input_chars(body.get(name))
+        chars += field_chars
+        attachments += field_attachments
+    return math.ceil(chars / _CHARS_PER_TOKEN) + attachments * _ATTACHMENT_TOKEN_ESTIMATE
+
+
+def usage_input_tokens(usage: Mapping[str, Any]) -> int:
+    """Total input tokens processed for a response, cached or not.
+
+    Cache reads and writes are included so the input budget reflects context
+    size, matching what ``estimate_input_tokens`` predicts.
+    """
+    return sum(
+        int(usage.get(name) or 0) for name in ("input_tokens", "cache_creation_input_tokens", "cache_read_input_tokens")
+    )
+
+
+@dataclass(slots=True)
+class _UsageState:
+    """Per-key token buckets and in-flight requests for UsageRateLimiter."""
+
+    input_tokens: float
+    output_tokens: float
+    updated: float
+    # reservation id -> monotonic acquire time
+    in_flight: dict[int, float] = field(default_factory=dict)
+
+
+class UsageReservation:
+    """An admitted request's hold on its key's token budgets and concurrency slot.
+
+    Created by ``UsageRateLimiter.acquire``. Call ``settle`` with the response's
+    ``usage`` once the request finishes (or ``release`` if it failed without
+    usage); both are idempotent, so cleanup paths can call them unconditionally.
+    """
+
+    def __init__(self, limiter: UsageRateLimiter, state: _UsageState, reservation_id: int, estimated_input: int):
+        """Initialise the reservation (use ``UsageRateLimiter.acquire``)."""
+        self._limiter = limiter
+        self._state = state
+        self._id = reservation_id
+        self.estimated_input_tokens = estimated_input
+        self.settled = False
+
+    def settle(self, usage: Mapping[str, Any] | None) -> None:
+        """Reconcile the token buckets with actual usage and free the slot.
+
+        Args:
+            usage: The response's Anthropic ``usage`` object. ``None`` keeps the
+                up-front input estimate and charges no output tokens.
+        """
+        if self.settled:
+            return
+        self.settled = True
+        self._state.in_flight.pop(self._id, None)
+        if usage is None:
+            return
+        self._limiter._charge(
+            self._state,
+            input_tokens=usage_input_tokens(usage) - self.estimated_input_tokens,
+            output_tokens=int(usage.get("output_tokens") or 0),
+        )
+
+    def release(self) -> None:
+        """Free the concurrency slot without usage (request failed or was cancelled)."""
+        self.settle(None)
+
+
+class UsageRateLimiter:
+    """Per-key input/output tokens-per-minute and concurrency limits.
+
+    Complements the request-count limiters: a single request carrying a large
+    context costs as much input budget as many small ones.
+
+    - Input TPM: the request's estimated input tokens are debited at admission
+      and corrected from the response's ``usage`` afterwards. A request is
+      admitted when the bucket covers its estimate (or is full, so a request
+      larger than the whole budget isn't blocked forever); corrections may
+      drive the bucket negative, delaying the key's next request.
+    - Output TPM: output length isn't known up front, so admission only needs
+      a positive balance and the actual output tokens are debited on settle.
+    - Concurrency: at most ``max_concurrent`` unsettled reservations per key.
+      Reservations older than ``stale_after_seconds`` no longer count, so a
+      request whose cleanup never ran cannot hold a slot forever.
+
+    Each bucket holds one minute's worth of tokens and refills continuously.
+    A limit of 0 disables that dimension. State is in-process, so with several
+    replicas each enforces the limits independently.
+
+    Keys are SHA-256 hashed before storage; at most ``max_keys`` keys are
+    tracked (LRU eviction, evicted keys start over with full buckets).
+    """
+
+    def __init__(
+        self,
+        input_tpm: int = 0,
+        output_tpm: int = 0,
+        max_concurrent: int = 0,
+        *,
+        max_keys: int = 10_000,
+        stale_after_seconds: float = 900.0,
+    ) -> None:
+        """Initialise the limiter.
+
+        Args:
+            input_tpm: Input tokens per minute per key. 0 disables.
+            output_tpm: Output tokens per minute per key. 0 disables.
+            max_concurrent: Maximum in-flight requests per key. 0 disables.
+            max_keys: Maximum number of tracked keys (LRU eviction when exceeded).
+            stale_after_seconds: Age after which an unsettled reservation stops
+                counting against the concurrency limit.
+
+        Raises:
+            ValueError: If a limit is negative, max_keys < 1, or
+                stale_after_seconds <= 0.
+        """
+        for name, value in (("input_tpm", input_tpm), ("output_tpm", output_tpm), ("max_concurrent", max_concurrent)):
+            if value < 0:
+                raise ValueError(f"{name} must be >= 0, got {value}")
+        if max_keys < 1:
+            raise ValueError(f"max_keys must be >= 1, got {max_keys}")
+        if stale_after_seconds <= 0:
+            raise ValueError(f"stale_after_seconds must be > 0, got {stale_after_seconds}")
+        self.input_tpm = input_tpm
+        self.output_tpm = output_tpm
+        self.max_concurrent = max_concurrent
+        self.max_keys = max_keys
+        self.stale_after_seconds = stale_after_seconds
+        self._states: OrderedDict[str, _UsageState] = OrderedDict()
+        self._ids = count()
+
+    def _get_state(self, hashed: str, now: float) -> _UsageState:
+        state = self._states.get(hashed)
+        if state is None:
+            state = _UsageState(input_tokens=float(self.input_tpm), output_tokens=float(self.output_tpm), updated=now)
+            self._states[hashed] = state
+            if len(self._states) > self.max_keys:
+                self._states.popitem(last=False)
+        else:
+            self._states.move_to_end(hashed)
+        return state
+
+    def _refill(self, state: _UsageState, now: float) -> None:
+        elapsed = max(0.0, now - state.updated)
+        state.updated = now
+        state.input_tokens = min(float(self.input_tpm), state.input_tokens + elapsed * self.input_tpm / 60.0)
+        state.output_tokens = min(float(self.output_tpm), state.output_tokens + elapsed * self.output_tpm / 60.0)
+
+    def _charge(self, state: _UsageState, *, input_tokens: int, output_tokens: int) -> None:
+        self._refill(state, time.monotonic())
+        if self.input_tpm:
+            state.input_tokens = min(float(self.input_tpm), state.input_tokens - input_tokens)
+        if self.output_tpm:
+            state.output_tokens -= output_tokens
+
+    def _denied(self, limit: int, shortfall: float, per_minute: int) -> RateLimitDecision:
+        retry_after = max(1, math.ceil(shortfall / (per_minute / 60.0))) if per_minute else 1
+        return RateLimitDecision(
+            allowed=False,
+            remaining=0,
+            limit=limit,
+            retry_after=retry_after,
+            reset_unix=int(time.time()) + retry_after,
+        )
+
+    def _allowed(self, state: _UsageState) -> RateLimitDecision:
+        """Admission decision describing the enabled dimension with the least headroom."""
+        headroom: list[tuple[int, int]] = []
+        if self.input_tpm:
+            headroom.append((self.input_tpm, int(max(0.0, state.input_tokens))))
+        if self.output_tpm:
+            headroom.append((self.output_tpm, int(max(0.0, state.output_tokens))))
+        if self.max_concurrent:
+            headroom.append((self.max_concurrent, max(0, self.max_concurrent - len(state.in_flight))))
+        limit, remaining = min(headroom, key=lambda h: h[1] / h[0], default=(0, 0))
+        return RateLimitDecision(
+            allowed=True,
+            remaining=remaining,
+            limit=limit,
+            retry_after=0,
+            reset_unix=int(time.time()),
+        )
+
+    async def acquire(self, key: str, estimated_input_tokens: int) -> tuple[RateLimitDecision, UsageReservation | None]:
+        """Admit a request for key, reserving its estimated input tokens and a slot.
+
+        Args:
+            key: Rate limit key (e.g. credential token value). Hashed internally.
+            estimated_input_tokens: Up-front input estimate (see
+                ``estimate_input_tokens``).
+
+        Returns:
+            ``(decision, reservation)``. ``reservation`` is None when denied;
+            the decision's limit/retry_after describe the exhausted dimension.
+            When admitted, limit/remaining describe the dimension with the
+            smallest fraction of its limit left.
+        """
+        now = time.monotonic()
+        state = self._get_state(_hash_key(key), now)
+        self._refill(state, now)
+
+        if self.max_concurrent:
+            cutoff = now - self.stale_after_seconds
+            for reservation_id in [rid for rid, started in state.in_flight.items() if started < cutoff]:
+                del state.in_flight[reservation_id]
+            if len(state.in_flight) >= self.max_concurrent:
+                return self._denied(self.max_concurrent, 0, 0), None
+
+        if self.input_tpm:
+            needed = min(float(estimated_input_tokens), float(self.input_tpm))
+            if state.input_tokens < needed:
+                return self._denied(self.input_tpm, needed - state.input_tokens, self.input_tpm), None
+
+        if self.output_tpm and state.output_tokens < 1.0:
+            return self._denied(self.output_tpm, 1.0 - state.output_tokens, self.output_tpm), None
+
+        if self.input_tpm:
+            state.input_tokens -= estimated_input_tokens
+        reservation_id = next(self._ids)
+        state.in_flight[reservation_id] = now
+        return self._allowed(state), UsageReservation(self, state, reservation_id, estimated_input_tokens)
+
+
+__all__ = [
+    "DEFAULT_REDIS_KEY_PREFIX",
+    "RATE_LIMIT_BACKEND_MEMORY",
+    "RATE_LIMIT_BACKEND_REDIS",
+    "RateLimitDecision",
+    "RateLimiterProtocol",
+    "RedisTokenBucketRateLimiter",
+    "TokenBucketRateLimiter",
+    "UsageRateLimiter",
+    "UsageReservation",
+    "VALID_RATE_LIMIT_BACKENDS",
+    "estimate_input_tokens",
+    "tightest_decision",
+    "usage_input_tokens",
+]
@@ -10,10 +10,24 @@ This makes the archive useful as a technical reference: the actual
 request/response payloads, policy decisions, and judge verdicts live in the
 child tables, not on `conversation_calls` itself.
 
-The archiver only handles a single batch's worth of work per call. The
-purger drives the per-batch archive-then-delete loop so memory and DB
-work are bounded to one batch — even on a first-run backfill of millions
-of rows.
+The archiver only handles a single batch's worth of DB work per call. The
+purger drives the per-batch loop, streaming batches into an
+``ArchiveSegmentWriter``: one S3 object per segment, gzip-compressed by
+default, uploaded as a multipart upload once it outgrows one part. Memory
+stays bounded to one batch plus one part however large the backlog or the
+segment. A segment's rows are deleted only after the object is complete —
+multipart parts are invisible (and not durable) until then.
+
+When conversation_events / request_logs are partitioned (see
+``retention/partitions.py``), the purger drops expired partitions whole and
+``archive_partition`` archives each one first, as flat JSONL rows of that
+table. Events in a dropped partition are then absent from the per-call
+records written afterwards for the same calls; restores join the two on
+``call_id``.
+
+``RETENTION_ARCHIVE_FORMAT=parquet`` swaps the per-call segments for Parquet
+objects laid out for analytics (see ``retention/parquet_archive.py``).
+Partition archives stay JSONL in either format.
 
 boto3 is an optional dependency — imported lazily. If `ARCHIVE_S3_BUCKET` is
 unset, this module is never instantiated and boto3 is never imported.
@@ -25,17 +39,29 @@ import asyncio
 import json
 import logging
 import uuid
+import zlib
 from collections.abc import Iterable
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
+
+from luthien_proxy.observability.message_store import rehydrate_payloads
+from luthien_proxy.retention.partitions import Partition, quote_identifier
+from luthien_proxy.utils.db import MAX_PARAMS_PER_STATEMENT
+
+if TYPE_CHECKING:
+    from luthien_proxy.retention.parquet_archive import ParquetSegmentWriter
+    from luthien_proxy.utils.db import DatabasePool
 
 logger = logging.getLogger(__name__)
 
 VALID_ENCRYPTION_MODES: frozenset[str] = frozenset({"AES256", "aws:kms", "bucket-default"})
+VALID_COMPRESSION_MODES: frozenset[str] = frozenset({"gzip", "none"})
+VALID_ARCHIVE_FORMATS: frozenset[str] = frozenset({"jsonl", "parquet"})
+
+DEFAULT_SEGMENT_MAX_BYTES = 64 * 1024 * 1024
 
 # Explicit column lists keep the archive shape stable across schema changes.
-# `user_id` is intentionally absent — `conversation_calls` has no such column
-# on the supported schema (only `session_id` was added in migration 006).
 _CALL_COLUMNS = (
     "call_id",
     "model_name",
@@ -44,6 +70,7 @@ _CALL_COLUMNS = (
     "created_at",
     "completed_at",
     "session_id",
+    "user_id",
 )
 # `sequence` was dropped from conversation_events in migration 004; events
 # are ordered by created_at now.
@@ -84,6 +111,35 @@ _JUDGE_COLUMNS = (
     "judge_config",
     "created_at",
 )
+_REQUEST_LOG_COLUMNS = (
+    "id",
+    "transaction_id",
+    "session_id",
+    "user_id",
+    "direction",
+    "http_method",
+    "url",
+    "request_headers",
+    "request_body",
+    "response_status",
+    "response_headers",
+    "response_body",
+    "started_at",
+    "completed_at",
+    "duration_ms",
+    "model",
+    "is_streaming",
+    "endpoint",
+    "error",
+    "created_at",
+)
+_PARTITION_COLUMNS: dict[str, tuple[str, ...]] = {
+    "conversation_events": _EVENT_COLUMNS,
+    "request_logs": _REQUEST_LOG_COLUMNS,
+}
+# Rows per S3 object when archiving a whole partition. Bounds memory the same
+# way batch_size does for the per-call path; event rows are the large ones.
+_PARTITION_PAGE_ROWS = 1_000
 
 
 def _serialize_value(v: Any) -> Any:
@@ -140,16 +196,25 @@ class S3ConversationArchiver:
             so we reject it instead.
         s3_client: Optional pre-built boto3 S3 client (for testing). If
             None, a client is created lazily using `boto3.client("s3")`.
+        compression: `gzip` (objects end in `.jsonl.gz`) or `none`.
+        segment_max_bytes: Close the current object and start a new one
+            once it reaches this many (compressed) bytes. The purger deletes
+            a segment's rows only when its object is complete, so this also
+            bounds how much work a failed run has to redo.
+        archive_format: `jsonl` or `parquet`. Parquet needs pyarrow and
+            writes Hive-partitioned objects under ``{prefix}calls/``.
 
     Raises:
-        ValueError: If encryption settings are invalid.
+        ValueError: If encryption, compression or sizing settings are invalid.
     """
 
-    # SQLite's default SQLITE_MAX_VARIABLE_NUMBER is 999. _fetch_children
-    # binds one positional placeholder per call_id in an IN clause, so the
-    # batch size must stay strictly below that to leave headroom for any
-    # additional placeholders added in future query forms.
-    _MAX_BATCH_SIZE = 900
+    # Child-table fetches are chunked to MAX_PARAMS_PER_STATEMENT ids, so
+    # the batch size is no longer pinned by SQLite's variable limit. This
+    # cap only guards against a batch whose rows blow the memory budget.
+    _MAX_BATCH_SIZE = 10_000
+    # Bytes buffered before a multipart part is sent. S3 requires every part
+    # but the last to be at least 5 MiB.
+    _PART_SIZE = 8 * 1024 * 1024
 
     def __init__(
         self,
@@ -160,6 +225,9 @@ class S3ConversationArchiver:
         encryption_mode: str = "AES256",
         kms_key_id: str = "",
         s3_client: Any = None,
+        compression: str = "gzip",
+        segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+        archive_format: str = "jsonl",
     ) -> None:
         """Initialize archiver. Validates encryption + sizing up-front."""
         if encryption_mode not in VALID_ENCRYPTION_MODES:
@@ -175,9 +243,26 @@ class S3ConversationArchiver:
         if batch_size < 1 or batch_size > self._MAX_BATCH_SIZE:
             raise ValueError(
                 f"batch_size={batch_size} out of range. Must be in [1, {self._MAX_BATCH_SIZE}]. "
-                "Upper bound is set by SQLite's SQLITE_MAX_VARIABLE_NUMBER (default 999); "
-                "the IN clause for child-table fetches binds one placeholder per call_id."
+                "Each batch's rows (with all child rows) are held in memory at once."
             )
+        if compression not in VALID_COMPRESSION_MODES:
+            raise ValueError(
+                f"compression={compression!r} is not valid. Must be one of: {sorted(VALID_COMPRESSION_MODES)}"
+            )
+        if segment_max_bytes < 1:
+            raise ValueError(f"segment_max_bytes must be >= 1 (got {segment_max_bytes})")
+        if archive_format not in VALID_ARCHIVE_FORMATS:
+            raise ValueError(
+                f"archive_format={archive_format!r} is not valid. Must be one of: {sorted(VALID_ARCHIVE_FORMATS)}"
+            )
+        if archive_format == "parquet":
+            try:
+                import pyarrow  # noqa: F401, PLC0415
+            except ImportError as exc:
+                raise RuntimeError(
+                    "RETENTION_ARCHIVE_FORMAT=parquet requires pyarrow. "
+                    "Install it with: pip install 'luthien-proxy[parquet]'"
+                ) from exc
         # If the operator didn't inject an S3 client, probe that boto3 is
         # importable now rather than at first archive-run, weeks after
         # deployment. Otherwise a mistyped extras_require survives until
@@ -206,6 +291,9 @@ class S3ConversationArchiver:
         self._encryption_mode = encryption_mode
         self._kms_key_id = kms_key_id
         self._s3_client = s3_client
+        self.compression = compression
+        self.segment_max_bytes = segment_max_bytes
+        self.archive_format = archive_format
 
     def _get_s3_client(self) -> Any:
         """Return the S3 client, creating it lazily if needed."""
@@ -220,33 +308,64 @@ class S3ConversationArchiver:
         self._s3_client = boto3.client("s3")
         return self._s3_client
 
-    def _build_s3_key(self, cutoff: datetime, run_id: str, batch_index: int) -> str:
-        """Build a date-partitioned S3 key for one batch of an archive run.
+    @property
+    def _suffix(self) -> str:
+        return ".jsonl.gz" if self.compression == "gzip" else ".jsonl"
 
-        Format: ``{prefix}{run-YYYY-MM-DD}/cutoff-{cutoff-YYYY-MM-DD}-{timestamp}-{run_id}-{batch:04d}.jsonl``
+    def _build_s3_key(
+        self,
+        cutoff: datetime,
+        run_id: str,
+        segment_index: int,
+        *,
+        dt: str | None = None,
+        model: str | None = None,
+    ) -> str:
+        """Build a date-partitioned S3 key for one segment of an archive run.
+
+        Format: ``{prefix}{run-YYYY-MM-DD}/cutoff-{cutoff-YYYY-MM-DD}-{timestamp}-{run_id}-{segment:04d}.jsonl[.gz]``
+
+        Parquet format: ``{prefix}calls/dt={dt}/model={model}/cutoff-...-{segment:04d}.parquet``.
+        ``dt`` and ``model`` come from the calls in the object, not the run,
+        so date and model filters prune partitions. The model is
+        percent-encoded, as Hive does, since names may contain ``/``.
 
         Partition by *run date* (when the archive happened), not cutoff date.
         Operators expect ``s3://bucket/luthien-archive/<today>/`` to contain
         what was archived today. The cutoff date is encoded inside the
         filename for restore queries that need it.
 
-        run_id is shared across batches in one purge; batch_index increments
-        per batch. Together they make object listing / restore deterministic.
+        run_id is shared across segments in one purge; segment_index
+        increments per segment. Together they make object listing / restore
+        deterministic.
         """
         now = datetime.now(UTC)
         run_date = now.strftime("%Y-%m-%d")
         cutoff_date = cutoff.strftime("%Y-%m-%d")
         ts_str = now.strftime("%Y%m%dT%H%M%SZ")
-        return f"{self.prefix}{run_date}/cutoff-{cutoff_date}-{ts_str}-{run_id}-{batch_index:04d}.jsonl"
-
-    def _build_put_kwargs(self, key: str, body: bytes) -> dict[str, Any]:
-        """Build kwargs for `s3.put_object`, honouring the configured encryption mode."""
-        kwargs: dict[str, Any] = {
-            "Bucket": self.bucket,
-            "Key": key,
-            "Body": body,
-            "ContentType": "application/x-ndjson",
-        }
+        if self.archive_format == "parquet":
+            if dt is None or model is None:
+                raise ValueError("Parquet archive keys need dt and model partition values")
+            return (
+                f"{self.prefix}calls/dt={dt}/model={quote(model, safe='')}/"
+                f"cutoff-{cutoff_date}-{ts_str}-{run_id}-{segment_index:04d}.parquet"
+            )
+        return f"{self.prefix}{run_date}/cutoff-{cutoff_date}-{ts_str}-{run_id}-{segment_index:04d}{self._suffix}"
+
+    def _build_object_kwargs(self, key: str) -> dict[str, Any]:
+        """Build the object kwargs shared by `put_object` and `create_multipart_upload`.
+
+        Honours the configured encryption mode. Gzip objects keep the NDJSON
+        content type and declare ``Content-Encoding: gzip``; Parquet files
+        compress internally and carry neither.
+        """
+        kwargs: dict[str, Any] = {"Bucket": self.bucket, "Key": key}
+        if key.endswith(".parquet"):
+            kwargs["ContentType"] = "application/vnd.apache.parquet"
+        else:
+            kwargs["ContentType"] = "application/x-ndjson"
+            if self.compression == "gzip":
+                kwargs["ContentEncoding"] = "gzip"
         if self._encryption_mode == "bucket-default":
             return kwargs
         kwargs["ServerSideEncryption"] = self._encryption_mode
@@ -290,21 +409,25 @@ class S3ConversationArchiver:
         """
         if not call_ids:
             return {}
-        placeholders = ",".join(f"${i + 1}" for i in range(len(call_ids)))
         cols = _select_clause(columns)
-        rows = await db_conn.fetch(
-            f"SELECT {cols} FROM {table} WHERE call_id IN ({placeholders})",
-            *call_ids,
-        )
         grouped: dict[str, list[dict[str, Any]]] = {cid: [] for cid in call_ids}
-        for row in rows:
-            grouped[row["call_id"]].append(_row_to_dict(row, columns))
+        for start in range(0, len(call_ids), MAX_PARAMS_PER_STATEMENT):
+            chunk = call_ids[start : start + MAX_PARAMS_PER_STATEMENT]
+            placeholders = ",".join(f"${i + 1}" for i in range(len(chunk)))
+            rows = await db_conn.fetch(f"SELECT {cols} FROM {table} WHERE call_id IN ({placeholders})", *chunk)
+            for row in rows:
+                grouped[row["call_id"]].append(_row_to_dict(row, columns))
         return grouped
 
     async def _build_batch_records(self, db_conn: Any, call_rows: list[Any]) -> list[str]:
         """Build per-call JSONL lines for one batch of call rows."""
         call_ids = [row["call_id"] for row in call_rows]
         events = await self._fetch_children(db_conn, "conversation_events", _EVENT_COLUMNS, call_ids)
+        # Archives are self-contained: inline deduplicated messages so restores
+        # don't depend on conversation_message_blobs.
+        await rehydrate_payloads(
+            db_conn, [e["payload"] for rows in events.values() for e in rows if isinstance(e["payload"], dict)]
+        )
         policy_events = await self._fetch_children(db_conn, "policy_events", _POLICY_EVENT_COLUMNS, call_ids)
         judge_decisions = await self._fetch_children(db_conn, "conversation_judge_decisions", _JUDGE_COLUMNS, call_ids)
         lines: list[str] = []
@@ -362,34 +485,91 @@ class S3ConversationArchiver:
         archived_ids = [row["call_id"] for row in call_rows]
         return body, archived_ids, len(call_rows) >= self.batch_size
 
-    async def upload_batch(
-        self,
-        *,
-        body: bytes,
-        cutoff: datetime,
-        run_id: str,
-        batch_index: int,
-        record_count: int,
-    ) -> None:
-        """Upload one batch of JSONL to S3.
+    def open_segment(
+        self, *, cutoff: datetime, run_id: str, segment_index: int
+    ) -> "ArchiveSegmentWriter | ParquetSegmentWriter":
+        """Start a new archive object for one segment of a purge run."""
+        if self.archive_format == "parquet":
+            # pyarrow is optional; only load it once Parquet is in use.
+            from luthien_proxy.retention.parquet_archive import ParquetSegmentWriter  # noqa: PLC0415
+
+            return ParquetSegmentWriter(self, cutoff=cutoff, run_id=run_id, segment_index=segment_index)
+        return ArchiveSegmentWriter(self, self._build_s3_key(cutoff, run_id, segment_index))
+
+    async def archive_partition(self, *, db_pool: "DatabasePool", partition: Partition, run_id: str) -> int:
+        """Archive every row of one partition to S3 before it is dropped.
+
+        Pages through the partition in ``(created_at, id)`` order into
+        segment objects (rotated at ``segment_max_bytes``), holding a
+        connection only while a page is fetched. The partition's range is
+        entirely in the past, so nothing writes to it while this runs.
 
-        S3-only; does not touch the DB. The caller passes ``record_count``
-        purely so the success log can include it.
+        Returns:
+            The number of rows archived.
 
         Raises:
-            Exception: If the S3 upload fails. The caller should skip the
-                DELETE for this batch and stop the run.
+            Exception: If a fetch or upload fails. The caller must not drop
+                the partition; the next run archives it again from the start.
         """
-        key = self._build_s3_key(cutoff, run_id, batch_index)
-        put_kwargs = self._build_put_kwargs(key=key, body=body)
-        await asyncio.to_thread(self._get_s3_client().put_object, **put_kwargs)
+        columns = _PARTITION_COLUMNS[partition.table]
+        select = f"SELECT {_select_clause(columns)} FROM {quote_identifier(partition.name)}"
+        order = f"ORDER BY created_at, id LIMIT {_PARTITION_PAGE_ROWS}"
+        cursor: tuple[Any, Any] | None = None
+        writer: ArchiveSegmentWriter | None = None
+        segments = 0
+        total = 0
+        while True:
+            async with db_pool.connection() as conn:
+                if cursor is None:
+                    rows = await conn.fetch(f"{select} {order}")
+                else:
+                    rows = await conn.fetch(f"{select} WHERE (created_at, id) > ($1, $2) {order}", *cursor)
+                records = [_row_to_dict(row, columns) for row in rows]
+                if partition.table == "conversation_events":
+                    await rehydrate_payloads(conn, [r["payload"] for r in records if isinstance(r["payload"], dict)])
+            if not rows:
+                break
+            if writer is None:
+                writer = ArchiveSegmentWriter(self, self._build_partition_key(partition, run_id, segments))
+            try:
+                await writer.write("".join(json.dumps(record) + "\n" for record in records).encode("utf-8"))
+                if writer.size >= self.segment_max_bytes:
+                    await writer.complete()
+                    writer = None
+                    segments += 1
+            except BaseException:
+                await writer.abort()
+                raise
+            total += len(rows)
+            cursor = (rows[-1]["created_at"], rows[-1]["id"])
+            if len(rows) < _PARTITION_PAGE_ROWS:
+                break
+        if writer is not None:
+            try:
+                await writer.complete()
+            except BaseException:
+                await writer.abort()
+                raise
+            segments += 1
         logger.info(
-            "Archived batch %d (%d records) to s3://%s/%s",
-            batch_index,
-            record_count,
+            "Archived partition %s (%d rows, %d object(s)) to s3://%s/%s",
+            partition.name,
+            total,
+            segments,
             self.bucket,
-            key,
+            self.prefix,
         )
+        return total
+
+    def _build_partition_key(self, partition: Partition, run_id: str, segment_index: int) -> str:
+        """Build the S3 key for one segment of an archived partition.
+
+        Same run-date prefix as ``_build_s3_key``; the partition name (which
+        encodes its day) replaces the cutoff date.
+        """
+        now = datetime.now(UTC)
+        ts_str = now.strftime("%Y%m%dT%H%M%SZ")
+        return f"{self.prefix}{now:%Y-%m-%d}/partition-{partition.name}-{ts_str}-{run_id}-{segment_index:04d}{self._suffix}"
 
     @staticmethod
     def new_run_id() -> str:
@@ -403,3 +583,113 @@ class S3ConversationArchiver:
         keeps the cost ~zero (S3 keys are cheap) and removes the risk.
         """
         return uuid.uuid4().hex
+
+
+class ArchiveSegmentWriter:
+    """Streams JSONL batches into one (optionally gzip-compressed) S3 object.
+
+    Compressed bytes are buffered until a full part is ready; the first
+    full part starts a multipart upload. An object that never fills a part
+    is sent with a single ``put_object`` on ``complete()``, so small runs
+    cost one request as before. Nothing is visible in the bucket until
+    ``complete()`` returns; on failure call ``abort()`` so S3 discards the
+    uploaded parts.
+
+    ``size`` is the compressed byte count written so far.
+    """
+
+    def __init__(self, archiver: S3ConversationArchiver, key: str) -> None:
+        """Prepare an empty object at ``key``; no S3 request is made yet."""
+        self._archiver = archiver
+        self.key = key
+        # wbits=31 selects the gzip container.
+        self._compressor = zlib.compressobj(wbits=31) if archiver.compression == "gzip" else None
+        self._buffer = bytearray()
+        self._upload_id: str | None = None
+        self._parts: list[dict[str, Any]] = []
+        self.size = 0
+
+    def _append(self, data: bytes) -> None:
+        self._buffer += data
+        self.size += len(data)
+
+    async def write(self, body: bytes) -> None:
+        """Append uncompressed JSONL, uploading a part whenever one fills."""
+        self._append(self._compressor.compress(body) if self._compressor is not None else body)
+        part_size = self._archiver._PART_SIZE
+        while len(self._buffer) >= part_size:
+            chunk = bytes(self._buffer[:part_size])
+            del self._buffer[:part_size]
+            await self._upload_part(chunk)
+
+    async def _upload_part(self, chunk: bytes) -> None:
+        client = self._archiver._get_s3_client()
+        if self._upload_id is None:
+            response = await asyncio.to_thread(
+                client.create_multipart_upload, **self._archiver._build_object_kwargs(self.key)
+            )
+            self._upload_id = response["UploadId"]
+        part_number = len(self._parts) + 1
+        response = await asyncio.to_thread(
+            client.upload_part,
+            Bucket=self._archiver.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=chunk,
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+    async def complete(self) -> None:
+        """Flush the compressor and make the object visible.
+
+        Raises:
+            Exception: If the final upload fails. Call ``abort()``; the
+                object does not exist.
+        """
+        if self._compressor is not None:
+            self._append(self._compressor.flush())
+            self._compressor = None
+        client = self._archiver._get_s3_client()
+        if self._upload_id is None:
+            kwargs = self._archiver._build_object_kwargs(self.key)
+            await asyncio.to_thread(client.put_object, Body=bytes(self._buffer), **kwargs)
+        else:
+            # The last part may be smaller than the S3 minimum.
+            if self._buffer:
+                await self._upload_part(bytes(self._buffer))
+            await asyncio.to_thread(
+                client.complete_multipart_upload,
+                Bucket=self._archiver.bucket,
+                Key=self.key,
+                UploadId=self._upload_id,
+                MultipartUpload={"Parts": self._parts},
+            )
+        self._buffer.clear()
+        logger.info(
+            "Archived %d bytes (%d part(s)) to s3://%s/%s",
+            self.size,
+            max(1, len(self._parts)),
+            self._archiver.bucket,
+            self.key,
+        )
+
+    async def abort(self) -> None:
+        """Discard an unfinished multipart upload. Never raises."""
+        self._buffer.clear()
+        if self._upload_id is None:
+            return
+        try:
+            await asyncio.to_thread(
+                self._archiver._get_s3_client().abort_multipart_upload,
+                Bucket=self._archiver.bucket,
+                Key=self.key,
+                UploadId=self._upload_id,
+            )
+        except Exception:
+            # A bucket lifecycle rule for incomplete multipart uploads is the
+            # backstop; log so the orphaned upload is traceable.
+            logger.exception(
+                "Failed to abort multipart upload %s for s3://%s/%s", self._upload_id, self._archiver.bucket, self.key
+            )
+        self._upload_id = None
@@ -0,0 +1,226 @@
+"""Parquet archive objects for analytical queries over archived calls.
+
+With ``RETENTION_ARCHIVE_FORMAT=parquet`` the purger's per-call archive
+records (see ``archiver.py``) are written as Parquet instead of JSONL: one
+row per call, with the fields usage questions group and filter on as typed
+columns and the bulky child rows kept as JSON text columns. A query such
+as "tokens per model per day" then reads a handful of small columns rather
+than decompressing and parsing every payload.
+
+Objects are laid out Hive-style under ``{prefix}calls/dt=YYYY-MM-DD/model=<model>/``
+(partition values taken from each call's own ``created_at`` and final
+model), so Athena / Glue / Spark prune by date and model from the key
+alone. A segment therefore becomes one object per (dt, model) pair it
+contains.
+
+Every column is zstd-compressed inside the file; dictionary encoding is
+limited to the low-cardinality columns, where it pays off.
+
+pyarrow is optional (``pip install 'luthien-proxy[parquet]'``). This module
+imports it at the top, so only import it when the Parquet format is
+selected; the archiver probes for it at construction.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import logging
+from collections import defaultdict
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+if TYPE_CHECKING:
+    from luthien_proxy.retention.archiver import S3ConversationArchiver
+
+logger = logging.getLogger(__name__)
+
+# Partition value for calls with no recorded model (e.g. rejected before the
+# request was recorded).
+UNKNOWN_MODEL = "unknown"
+
+_RESPONSE_EVENT_TYPES = frozenset(
+    {"transaction.streaming_response_recorded", "transaction.non_streaming_response_recorded"}
+)
+_USAGE_FIELDS = ("input_tokens", "output_tokens", "cache_creation_input_tokens", "cache_read_input_tokens")
+_TIMESTAMP = pa.timestamp("us", tz="UTC")
+
+ARCHIVE_SCHEMA = pa.schema(
+    [
+        pa.field("call_id", pa.string(), nullable=False),
+        pa.field("session_id", pa.string()),
+        pa.field("user_id", pa.string()),
+        pa.field("model", pa.string(), nullable=False),
+        pa.field("provider", pa.string()),
+        pa.field("status", pa.string()),
+        pa.field("created_at", _TIMESTAMP),
+        pa.field("completed_at", _TIMESTAMP),
+        pa.field("event_types", pa.list_(pa.string())),
+        *(pa.field(name, pa.int64()) for name in _USAGE_FIELDS),
+        pa.field("events", pa.string()),
+        pa.field("policy_events", pa.string()),
+        pa.field("judge_decisions", pa.string()),
+    ]
+)
+_DICTIONARY_COLUMNS = ["session_id", "user_id", "model", "provider", "status"]
+
+
+def _parse_ts(value: Any) -> datetime | None:
+    """Parse an archived ISO timestamp; naive values are UTC (SQLite)."""
+    if not isinstance(value, str):
+        return None
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+
+
+def _final_model(record: dict[str, Any]) -> str:
+    """Return the model the call was sent to, falling back to the call row."""
+    for event in record["events"]:
+        payload = event.get("payload")
+        if event.get("event_type") == "transaction.request_recorded" and isinstance(payload, dict):
+            model = payload.get("final_model")
+            if isinstance(model, str) and model:
+                return model
+    model = record["call"].get("model_name")
+    return model if isinstance(model, str) and model else UNKNOWN_MODEL
+
+
+def _token_counts(record: dict[str, Any]) -> dict[str, int | None]:
+    """Sum response ``usage`` fields over the call's response events.
+
+    A field stays None (not 0) when no response event reported it, so
+    "unknown" and "zero tokens" remain distinguishable in aggregates.
+    """
+    totals: dict[str, int | None] = dict.fromkeys(_USAGE_FIELDS)
+    for event in record["events"]:
+        payload = event.get("payload")
+        if event.get("event_type") not in _RESPONSE_EVENT_TYPES or not isinstance(payload, dict):
+            continue
+        response = payload.get("final_response")
+        usage = response.get("usage") if isinstance(response, dict) else None
+        if not isinstance(usage, dict):
+            continue
+        for name in _USAGE_FIELDS:
+            value = usage.get(name)
+            if isinstance(value, int):
+                totals[name] = (totals[name] or 0) + value
+    return totals
+
+
+def record_to_row(record: dict[str, Any]) -> dict[str, Any]:
+    """Flatten one per-call archive record into an ``ARCHIVE_SCHEMA`` row."""
+    call = record["call"]
+    return {
+        "call_id": call["call_id"],
+        "session_id": call.get("session_id"),
+        "user_id": call.get("user_id"),
+        "model": _final_model(record),
+        "provider": call.get("provider"),
+        "status": call.get("status"),
+        "created_at": _parse_ts(call.get("created_at")),
+        "completed_at": _parse_ts(call.get("completed_at")),
+        "event_types": [event.get("event_type") for event in record["events"]],
+        **_token_counts(record),
+        "events": json.dumps(record["events"]),
+        "policy_events": json.dumps(record["policy_events"]),
+        "judge_decisions": json.dumps(record["judge_decisions"]),
+    }
+
+
+def partition_of(row: dict[str, Any]) -> tuple[str, str]:
+    """Return the (dt, model) Hive partition values for a row."""
+    created_at = row["created_at"]
+    dt = created_at.astimezone(UTC).strftime("%Y-%m-%d") if created_at is not None else "unknown"
+    return dt, row["model"]
+
+
+def encode_table(rows: list[dict[str, Any]]) -> bytes:
+    """Serialize rows into one zstd-compressed Parquet file."""
+    table = pa.Table.from_pylist(rows, schema=ARCHIVE_SCHEMA)
+    sink = io.BytesIO()
+    pq.write_table(table, sink, compression="zstd", use_dictionary=_DICTIONARY_COLUMNS)
+    return sink.getvalue()
+
+
+class ParquetSegmentWriter:
+    """Collects one segment's calls and uploads them as Parquet on ``complete()``.
+
+    Takes the same JSONL batches as ``ArchiveSegmentWriter`` so the purge
+    loop is format-agnostic. A Parquet file is only readable once its
+    footer is written, so rows are held until ``complete()`` and each
+    (dt, model) group is then sent with one ``put_object``; ``size`` counts
+    the JSONL bytes received, which keeps a segment's memory bounded by
+    ``segment_max_bytes``.
+
+    Objects become visible one group at a time. If an upload fails,
+    ``abort()`` deletes the groups already written so the retry of the
+    segment's (undeleted) calls does not duplicate them.
+    """
+
+    def __init__(
+        self, archiver: "S3ConversationArchiver", *, cutoff: datetime, run_id: str, segment_index: int
+    ) -> None:
+        """Prepare an empty segment; no S3 request is made yet."""
+        self._archiver = archiver
+        self._cutoff = cutoff
+        self._run_id = run_id
+        self._segment_index = segment_index
+        self._groups: dict[tuple[str, str], list[dict[str, Any]]] = defaultdict(list)
+        self.keys: list[str] = []
+        self.size = 0
+
+    async def write(self, body: bytes) -> None:
+        """Add one batch of JSONL archive records to the segment."""
+        for line in body.splitlines():
+            if line:
+                row = record_to_row(json.loads(line))
+                self._groups[partition_of(row)].append(row)
+        self.size += len(body)
+
+    async def complete(self) -> None:
+        """Encode and upload one Parquet object per (dt, model) group.
+
+        Raises:
+            Exception: If an upload fails. Call ``abort()`` to remove the
+                groups that were already written.
+        """
+        client = self._archiver._get_s3_client()
+        for (dt, model), rows in sorted(self._groups.items()):
+            key = self._archiver._build_s3_key(self._cutoff, self._run_id, self._segment_index, dt=dt, model=model)
+            body = await asyncio.to_thread(encode_table, rows)
+            await asyncio.to_thread(client.put_object, Body=body, **self._archiver._build_object_kwargs(key))
+            self.keys.append(key)
+            logger.info(
+                "Archived %d call(s) as %d Parquet bytes to s3://%s/%s",
+                len(rows),
+                len(body),
+                self._archiver.bucket,
+                key,
+            )
+        self._groups.clear()
+
+    async def abort(self) -> None:
+        """Delete any objects this segment already wrote. Never raises."""
+        self._groups.clear()
+        for key in self.keys:
+            try:
+                await asyncio.to_thread(
+                    self._archiver._get_s3_client().delete_object, Bucket=self._archiver.bucket, Key=key
+                )
+            except Exception:
+                logger.exception("Failed to delete partial Parquet archive s3://%s/%s", self._archiver.bucket, key)
+        self.keys.clear()
+
+
+__all__ = [
+    "ARCHIVE_SCHEMA",
+    "UNKNOWN_MODEL",
+    "ParquetSegmentWriter",
+    "encode_table",
+    "partition_of",
+    "record_to_row",
+]
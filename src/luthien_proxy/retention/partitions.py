@@ -0,0 +1,237 @@
+"""Daily range partitions for conversation_events and request_logs (Postgres).
+
+``migrations/optional/postgres_partition_by_created_at.sql`` converts those
+two tables into tables range-partitioned on ``created_at``, one partition
+per UTC day named ``<table>_pYYYYMMDD``, with all pre-conversion rows in a
+single ``<table>_legacy`` partition. Nothing here runs until that script
+has been applied: every method checks the catalog and treats an
+unpartitioned table as "not managed".
+
+``PartitionManager`` does two jobs:
+
+- keeps ``premake_days`` of future partitions in place, checked on startup
+  and then every ``interval_seconds``. An insert whose ``created_at`` has no
+  partition fails, so running out would drop event writes.
+- lists and drops partitions wholly older than a retention cutoff, for
+  ``ConversationPurger``. ``DETACH`` + ``DROP`` is a catalog operation: no
+  per-row DELETE, no dead tuples, no vacuum debt, which is what makes
+  retention on the large payload tables cheap.
+
+conversation_calls is deliberately not partitioned (see the conversion
+script); the purger keeps deleting those rows by call_id.
+
+SQLite has no declarative partitioning; the gateway never builds a manager
+there.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from luthien_proxy.utils.db import DatabasePool
+
+logger = logging.getLogger(__name__)
+
+# Tables the conversion script partitions. Names are interpolated into DDL,
+# so only these (and catalog-reported partition names that pass
+# _IDENTIFIER_RE) are ever used.
+PARTITIONED_TABLES: tuple[str, ...] = ("conversation_events", "request_logs")
+
+DEFAULT_PREMAKE_DAYS = 7
+DEFAULT_INTERVAL_SECONDS = 3_600
+
+_IDENTIFIER_RE = re.compile(r"^[a-z_][a-z0-9_]*$")
+# pg_get_expr(relpartbound) renders e.g.
+#   FOR VALUES FROM ('2026-10-16 00:00:00+00') TO ('2026-10-17 00:00:00+00')
+#   FOR VALUES FROM (MINVALUE) TO ('2026-10-17 00:00:00+00')
+#   DEFAULT
+_UPPER_BOUND_RE = re.compile(r"\bTO \('([^']+)'\)")
+
+
+@dataclass(frozen=True)
+class Partition:
+    """One partition of a managed table.
+
+    ``upper_bound`` is the exclusive end of its ``created_at`` range; None
+    for a DEFAULT or ``MAXVALUE`` partition, which never expires.
+    """
+
+    table: str
+    name: str
+    upper_bound: datetime | None
+
+
+def partition_name(table: str, day: date) -> str:
+    """Return the name of ``table``'s partition for one UTC day."""
+    return f"{table}_p{day:%Y%m%d}"
+
+
+def parse_upper_bound(bound: str) -> datetime | None:
+    """Return the upper bound of a ``pg_get_expr(relpartbound)`` string, or None."""
+    match = _UPPER_BOUND_RE.search(bound)
+    if match is None:
+        return None
+    parsed = datetime.fromisoformat(match.group(1))
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+
+
+def quote_identifier(identifier: str) -> str:
+    """Double-quote a table name after checking it is a plain lowercase identifier."""
+    if not _IDENTIFIER_RE.match(identifier):
+        raise ValueError(f"refusing to use {identifier!r} as a table name")
+    return f'"{identifier}"'
+
+
+def _log_task_exception(task: asyncio.Task[None]) -> None:
+    """Log exceptions from fire-and-forget tasks to prevent silent failures."""
+    if not task.cancelled() and (exc := task.exception()):
+        logger.exception("Partition manager background task raised an unexpected exception", exc_info=exc)
+
+
+class PartitionManager:
+    """Creates future partitions and drops expired ones.
+
+    Args:
+        db_pool: Postgres connection pool.
+        premake_days: Days of partitions kept ahead of today (today included).
+        interval_seconds: Seconds between background premake checks.
+    """
+
+    def __init__(
+        self,
+        *,
+        db_pool: "DatabasePool",
+        premake_days: int = DEFAULT_PREMAKE_DAYS,
+        interval_seconds: int = DEFAULT_INTERVAL_SECONDS,
+    ) -> None:
+        """Initialize with a pool and premake horizon."""
+        if premake_days < 1:
+            raise ValueError(f"premake_days must be >= 1 (got {premake_days})")
+        self._db_pool = db_pool
+        self._premake_days = premake_days
+        self._interval_seconds = interval_seconds
+        self._task: asyncio.Task[None] | None = None
+
+    async def partitioned_tables(self) -> list[str]:
+        """Return the managed tables that are currently partitioned."""
+        if self._db_pool.is_sqlite:
+            return []
+        async with self._db_pool.connection() as conn:
+            rows = await conn.fetch(
+                "SELECT relname FROM pg_class"
+                " WHERE relkind = 'p' AND relnamespace = current_schema()::regnamespace"
+                " AND relname = ANY($1::text[])",
+                list(PARTITIONED_TABLES),
+            )
+        found = {row["relname"] for row in rows}
+        return [table for table in PARTITIONED_TABLES if table in found]
+
+    async def list_partitions(self, table: str) -> list[Partition]:
+        """Return ``table``'s partitions ordered by upper bound (open-ended last)."""
+        async with self._db_pool.connection() as conn:
+            rows = await conn.fetch(
+                "SELECT child.relname AS name, pg_get_expr(child.relpartbound, child.oid) AS bound"
+                " FROM pg_inherits JOIN pg_class child ON child.oid = pg_inherits.inhrelid"
+                " WHERE pg_inherits.inhparent = $1::regclass",
+                table,
+            )
+        partitions = [Partition(table, row["name"], parse_upper_bound(row["bound"])) for row in rows]
+        far_future = datetime.max.replace(tzinfo=UTC)
+        return sorted(partitions, key=lambda p: (p.upper_bound or far_future, p.name))
+
+    async def ensure_future_partitions(self, now: datetime | None = None) -> int:
+        """Create missing daily partitions through ``premake_days`` from today.
+
+        Starts after the latest existing bound, so a gap left by a long
+        gateway outage is filled and nothing overlaps the legacy partition.
+
+        Returns:
+            The number of partitions created.
+        """
+        today = (now or datetime.now(UTC)).astimezone(UTC).date()
+        horizon = today + timedelta(days=self._premake_days)
+        created = 0
+        for table in await self.partitioned_tables():
+            bounds = [p.upper_bound for p in await self.list_partitions(table) if p.upper_bound is not None]
+            day = max(bounds).astimezone(UTC).date() if bounds else today
+            while day < horizon:
+                await self._create_partition(table, day)
+                created += 1
+                day += timedelta(days=1)
+        if created:
+            logger.info("Created %d partition(s) through %s", created, horizon.isoformat())
+        return created
+
+    async def _create_partition(self, table: str, day: date) -> None:
+        start = datetime.combine(day, time(), tzinfo=UTC)
+        end = start + timedelta(days=1)
+        # DDL takes no bind parameters; both bounds are generated here.
+        async with self._db_pool.connection() as conn:
+            await conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {quote_identifier(partition_name(table, day))} PARTITION OF {quote_identifier(table)}"
+                f" FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+
+    async def expired_partitions(self, cutoff: datetime) -> list[Partition]:
+        """Return partitions whose whole range is older than ``cutoff``, oldest first."""
+        expired: list[Partition] = []
+        for table in await self.partitioned_tables():
+            expired.extend(
+                p for p in await self.list_partitions(table) if p.upper_bound is not None and p.upper_bound <= cutoff
+            )
+        return sorted(expired, key=lambda p: (p.upper_bound, p.table))
+
+    async def drop_partition(self, partition: Partition) -> None:
+        """Detach and drop one partition in a single transaction."""
+        async with self._db_pool.connection() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    f"ALTER TABLE {quote_identifier(partition.table)} DETACH PARTITION {quote_identifier(partition.name)}"
+                )
+                await conn.execute(f"DROP TABLE {quote_identifier(partition.name)}")
+        logger.info("Dropped partition %s of %s", partition.name, partition.table)
+
+    async def _run_loop(self) -> None:
+        while True:
+            try:
+                await self.ensure_future_partitions()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Partition premake failed — retrying next interval")
+            await asyncio.sleep(self._interval_seconds)
+
+    def start(self) -> None:
+        """Start the periodic premake loop (first check runs immediately)."""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run_loop())
+        self._task.add_done_callback(_log_task_exception)
+
+    async def stop(self) -> None:
+        """Cancel the premake loop and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+
+__all__ = [
+    "DEFAULT_INTERVAL_SECONDS",
+    "DEFAULT_PREMAKE_DAYS",
+    "PARTITIONED_TABLES",
+    "Partition",
+    "PartitionManager",
+    "parse_upper_bound",
+    "partition_name",
+    "quote_identifier",
+]
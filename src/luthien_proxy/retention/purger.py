@@ -1,20 +1,32 @@
 """Background task that purges old conversation data from the database.
 
 Runs on a configurable interval (default: daily). When an archiver is
-configured, the purger drives an archive-then-delete-per-batch loop:
+configured, the purger drives an archive-then-delete loop:
 
     1. fetch a batch of calls older than cutoff (outside any DB transaction)
-    2. upload the batch to S3 (also outside any DB transaction)
-    3. open a short transaction; DELETE WHERE call_id IN (this batch)
+    2. start fetching the next batch while this one is compressed into the
+       current archive segment (also outside any DB transaction)
+    3. once the segment object is complete in S3, open short transactions;
+       DELETE WHERE call_id IN (the segment's calls)
     4. advance the cursor; loop
 
-This keeps memory bounded to one batch even on a million-row first-run
-backfill, and decouples S3 latency from DB lock duration. If a batch's
-upload fails, earlier batches are already archived and deleted, and the
-unarchived rows remain for the next run to retry.
+This keeps memory bounded to a couple of batches even on a million-row
+first-run backfill, and decouples S3 latency from DB lock duration. If a
+segment's upload fails, earlier segments are already archived and deleted,
+and the unarchived rows remain for the next run to retry.
 
 Cascading FK deletes handle conversation_events, policy_events, and
-conversation_judge_decisions.
+conversation_judge_decisions. Deduplicated message blobs
+(``conversation_message_blobs``, migration 022) have no FK to the events that
+reference them; with ``purge_message_blobs`` set, each run sweeps the ones no
+surviving event can reference — see ``_purge_message_blobs``.
+
+With a ``PartitionManager`` (conversation_events and request_logs converted
+to daily partitions — see ``retention/partitions.py``), each run first
+archives and then DETACH/DROPs every partition wholly older than the cutoff.
+That removes the bulk of the data without row-level deletes; the per-call
+loop below then only has conversation_calls and the small child tables left.
+request_logs, which has no call FK, is only purged this way.
 
 Index strategy: the existing ``idx_conversation_calls_created`` on
 ``conversation_calls(created_at)`` (from migration 003) is the index
@@ -45,8 +57,11 @@ import logging
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
+from luthien_proxy.utils.db import parse_db_ts
+
 if TYPE_CHECKING:
     from luthien_proxy.retention.archiver import S3ConversationArchiver
+    from luthien_proxy.retention.partitions import PartitionManager
     from luthien_proxy.utils.db import DatabasePool
 
 logger = logging.getLogger(__name__)
@@ -80,6 +95,12 @@ class ConversationPurger:
             batch (and the rest of the run is aborted).
         initial_delay_seconds: Seconds to wait after start() before first run.
         interval_seconds: Seconds between subsequent runs.
+        purge_message_blobs: Also delete unreferenced rows from
+            conversation_message_blobs after each run. Enabled when
+            CONVERSATION_MESSAGE_DEDUP is on.
+        partitions: Optional partition manager (Postgres only). When given,
+            expired partitions are archived (if an archiver is set) and
+            dropped before the per-call loop runs.
     """
 
     def __init__(
@@ -90,6 +111,8 @@ class ConversationPurger:
         archiver: "S3ConversationArchiver | None" = None,
         initial_delay_seconds: int = DEFAULT_INITIAL_DELAY_SECONDS,
         interval_seconds: int = DEFAULT_INTERVAL_SECONDS,
+        purge_message_blobs: bool = False,
+        partitions: "PartitionManager | None" = None,
     ) -> None:
         """Initialize purger with DB pool, retention policy, and optional archiver."""
         self._db_pool = db_pool
@@ -97,6 +120,8 @@ class ConversationPurger:
         self._archiver = archiver
         self._initial_delay_seconds = initial_delay_seconds
         self._interval_seconds = interval_seconds
+        self._purge_message_blobs_enabled = purge_message_blobs
+        self._partitions = partitions
         self._task: asyncio.Task[None] | None = None
 
     def _cutoff_datetime(self) -> datetime:
@@ -187,20 +212,30 @@ class ConversationPurger:
                 break
         return total
 
+    async def _fetch_archive_batch(self, cutoff: datetime, last_call_id: str | None) -> tuple[bytes, list[str], bool]:
+        """Fetch + serialize one batch on its own connection (released before returning)."""
+        if self._archiver is None:
+            raise RuntimeError("_fetch_archive_batch called without an archiver")
+        async with self._db_pool.connection() as conn:
+            return await self._archiver.fetch_batch(db_conn=conn, cutoff=cutoff, last_call_id=last_call_id)
+
     async def _archive_and_delete_per_batch(self, cutoff: datetime) -> int:
-        """Archive one batch, delete it, advance cursor; loop until done.
+        """Stream batches into archive segments; delete each segment once it is durable.
 
-        Each iteration follows three phases with the DB connection only
-        held for phases 1 and 3:
+        Per batch:
 
           1. fetch the batch + child rows from the DB; release the conn
-          2. PUT the JSONL to S3 (no DB held — S3 latency doesn't pin a
-             pool slot)
-          3. acquire a fresh conn for the short DELETE transaction
-
-        Memory and per-statement DB load stay bounded to one batch, so a
-        first-run backfill of millions of rows doesn't OOM the gateway or
-        hold long transactions.
+          2. start fetching the next batch, then write this one into the
+             open segment (which may upload a multipart part) — DB fetch
+             of batch N+1 overlaps the S3 work for batch N
+          3. when the segment reaches ``segment_max_bytes`` (or the run
+             ends), complete the object, then DELETE every call in it in
+             short transactions
+
+        Rows are only deleted after the object holding them is complete;
+        until then the parts are neither visible nor durable. Memory stays
+        bounded to two batches plus one upload part, however large the
+        backlog.
         """
         # Plain `if archiver is None: raise`: assertions are stripped under
         # `python -O` so an `assert` here would crash less informatively if
@@ -209,88 +244,137 @@ class ConversationPurger:
             raise RuntimeError("_archive_and_delete_per_batch called without an archiver")
         archiver = self._archiver
         run_id = archiver.new_run_id()
-        last_call_id: str | None = None
         batch_index = 0
+        segment_index = 0
         total_deleted = 0
+        writer = None
+        pending_ids: list[str] = []
+        next_fetch: asyncio.Task[tuple[bytes, list[str], bool]] | None = asyncio.create_task(
+            self._fetch_archive_batch(cutoff, None)
+        )
 
-        while True:
-            # Phase 1: fetch + serialize. Connection released at end of `with`.
-            try:
-                async with self._db_pool.connection() as conn:
-                    body, archived_ids, has_more = await archiver.fetch_batch(
-                        db_conn=conn,
-                        cutoff=cutoff,
-                        last_call_id=last_call_id,
+        try:
+            while next_fetch is not None:
+                try:
+                    body, archived_ids, has_more = await next_fetch
+                except Exception:
+                    logger.exception(
+                        "Fetch failed on batch %d (run=%s); stopping. %d records archived+deleted so far.",
+                        batch_index,
+                        run_id,
+                        total_deleted,
                     )
-            except Exception:
-                logger.exception(
-                    "Fetch failed on batch %d (run=%s); stopping. "
-                    "%d batch(es) succeeded earlier in this run; %d records archived+deleted so far.",
-                    batch_index,
-                    run_id,
-                    batch_index,
-                    total_deleted,
-                )
-                return total_deleted
+                    return total_deleted
+                next_fetch = None
+                if archived_ids:
+                    # Cursor advances regardless of whether the batch was full —
+                    # if it wasn't, has_more is False and the loop ends.
+                    if has_more:
+                        next_fetch = asyncio.create_task(self._fetch_archive_batch(cutoff, archived_ids[-1]))
+                    if writer is None:
+                        writer = archiver.open_segment(cutoff=cutoff, run_id=run_id, segment_index=segment_index)
+                elif writer is None:
+                    break
+                # else: an empty batch with a segment open just closes it.
+                try:
+                    if archived_ids:
+                        await writer.write(body)
+                        pending_ids.extend(archived_ids)
+                        batch_index += 1
+                        if writer.size < archiver.segment_max_bytes and next_fetch is not None:
+                            continue
+                    await writer.complete()
+                except Exception:
+                    logger.exception(
+                        "Archive upload failed on segment %d (run=%s); stopping. "
+                        "%d records archived+deleted in earlier segments of this run.",
+                        segment_index,
+                        run_id,
+                        total_deleted,
+                    )
+                    await writer.abort()
+                    return total_deleted
+                writer = None
+                segment_index += 1
+
+                try:
+                    total_deleted += await self._delete_by_call_ids(pending_ids)
+                except Exception:
+                    logger.exception(
+                        "DELETE failed for archived segment %d (run=%s); stopping. "
+                        "S3 has this segment's archive; DB still has the rows. Next run will re-archive. "
+                        "%d records archived+deleted in earlier segments of this run.",
+                        segment_index - 1,
+                        run_id,
+                        total_deleted,
+                    )
+                    return total_deleted
+                pending_ids = []
+        finally:
+            if next_fetch is not None:
+                next_fetch.cancel()
+                await asyncio.gather(next_fetch, return_exceptions=True)
 
-            if not archived_ids:
-                break
+        if total_deleted > 0:
+            logger.info(
+                "Archive run %s complete: %d records across %d batch(es), %d object(s)",
+                run_id,
+                total_deleted,
+                batch_index,
+                segment_index,
+            )
+        return total_deleted
 
-            # Phase 2: S3 upload, no DB held.
-            try:
-                await archiver.upload_batch(
-                    body=body,
-                    cutoff=cutoff,
-                    run_id=run_id,
-                    batch_index=batch_index,
-                    record_count=len(archived_ids),
-                )
-            except Exception:
-                logger.exception(
-                    "Archive upload failed on batch %d (run=%s); stopping. "
-                    "%d batch(es) succeeded earlier in this run; %d records archived+deleted so far.",
-                    batch_index,
-                    run_id,
-                    batch_index,
-                    total_deleted,
-                )
-                return total_deleted
+    async def _drop_expired_partitions(self, cutoff: datetime) -> int:
+        """Archive (when configured) and drop partitions older than the cutoff.
+
+        Stops at the first failure: a partition is only dropped after its
+        archive upload succeeded, and whatever is left is retried next run.
 
-            # Phase 3: DELETE in a short transaction with a fresh conn.
+        Returns:
+            The number of partitions dropped.
+        """
+        if self._partitions is None:
+            return 0
+        run_id = self._archiver.new_run_id() if self._archiver is not None else ""
+        dropped = 0
+        for partition in await self._partitions.expired_partitions(cutoff):
             try:
-                total_deleted += await self._delete_by_call_ids(archived_ids)
+                if self._archiver is not None:
+                    await self._archiver.archive_partition(db_pool=self._db_pool, partition=partition, run_id=run_id)
+                await self._partitions.drop_partition(partition)
             except Exception:
                 logger.exception(
-                    "DELETE failed for archived batch %d (run=%s); stopping. "
-                    "S3 has this batch's archive; DB still has the rows. Next run will re-archive. "
-                    "%d records archived+deleted in earlier batches of this run.",
-                    batch_index,
+                    "Dropping partition %s failed (run=%s); stopping. %d partition(s) dropped earlier in this run.",
+                    partition.name,
                     run_id,
-                    total_deleted,
+                    dropped,
                 )
-                return total_deleted
-
-            # Advance the cursor regardless of whether the batch was full —
-            # if it wasn't, the next iteration will return zero rows and exit.
-            last_call_id = archived_ids[-1]
-            batch_index += 1
-            if not has_more:
                 break
-
-        if total_deleted > 0:
-            logger.info(
-                "Archive run %s complete: %d records across %d batch(es)",
-                run_id,
-                total_deleted,
-                batch_index,
-            )
-        return total_deleted
+            dropped += 1
+        return dropped
+
+    async def _purge_message_blobs(self, cutoff: datetime) -> None:
+        """Delete message blobs that no surviving event can reference.
+
+        A blob's ``last_seen_at`` is bumped by every event write that
+        references it, and an event is never older than its call's
+        ``created_at``. So a blob last seen before the oldest remaining
+        conversation_calls row is unreferenced. Bounding by that (rather
+        than by the cutoff alone) keeps blobs alive for calls a failed
+        archive run left behind.
+        """
+        async with self._db_pool.connection() as conn, conn.transaction():
+            oldest = await conn.fetchval("SELECT MIN(created_at) FROM conversation_calls")
+            horizon = cutoff if oldest is None else min(cutoff, parse_db_ts(oldest))
+            await conn.execute("DELETE FROM conversation_message_blobs WHERE last_seen_at < $1", horizon)
 
     async def purge_once(self) -> int:
         """Run a single purge cycle.
 
-        With an archiver: drive an archive-then-delete-per-batch loop.
-        Without: paginated DELETE-by-id loop, no S3.
+        Expired partitions (if partitioned) go first. Then, with an
+        archiver: drive an archive-then-delete-per-batch loop. Without:
+        paginated DELETE-by-id loop, no S3.
 
         Returns:
             The number of conversation_calls rows actually archived+deleted
@@ -307,6 +391,14 @@ class ConversationPurger:
             self._retention_days,
         )
 
+        try:
+            partitions_dropped = await self._drop_expired_partitions(cutoff)
+        except Exception:
+            logger.exception("Listing expired partitions failed")
+            partitions_dropped = 0
+        if partitions_dropped:
+            logger.info("Dropped %d expired partition(s) (cutoff=%s)", partitions_dropped, cutoff.isoformat())
+
         try:
             if self._archiver is not None:
                 count = await self._archive_and_delete_per_batch(cutoff)
@@ -316,6 +408,14 @@ class ConversationPurger:
             logger.exception("Conversation purge failed")
             return 0
 
+        # Runs even after a partial archive run: the horizon is bounded by the
+        # oldest surviving call, so blobs for calls left behind are kept.
+        if self._purge_message_blobs_enabled:
+            try:
+                await self._purge_message_blobs(cutoff)
+            except Exception:
+                logger.exception("Conversation message blob purge failed")
+
         if count > 0:
             logger.info("Purged %d conversation_calls (cutoff=%s)", count, cutoff.isoformat())
         else:
@@ -52,21 +52,35 @@ class Settings(_SettingsBase):
     admin_api_key: str | None = None
     auth_mode: AuthMode = AuthMode.BOTH
     localhost_auth_bypass: bool = True
+    credential_l1_cache_ttl_seconds: int = 30
+    credential_l1_cache_max_entries: int = 10000
+    credential_touch_flush_interval_seconds: int = 30
 
     # ── rate_limiting ───────────────────────────────────────────────
     rate_limit_rpm: int = 0
     rate_limit_burst: int = 0
     rate_limit_max_keys: int = 10000
+    rate_limit_input_tpm: int = 0
+    rate_limit_output_tpm: int = 0
+    rate_limit_max_concurrent: int = 0
+    rate_limit_backend: str = "memory"
+    rate_limit_local_lease: int = 5
 
     # ── policy ──────────────────────────────────────────────────────
     policy_source: str = "db-fallback-file"
     policy_config: str = ""
     inject_policy_context: bool = True
+    stream_passthrough: bool = True
     dogfood_mode: bool = False
     policy_cache_max_entries: int = 10000
+    policy_cache_write_behind: bool = False
+    policy_cache_l1_max_entries: int = 10000
+    policy_cache_l1_ttl_seconds: int = 60
+    policy_cache_flush_interval_seconds: float = 0.5
 
     # ── database ────────────────────────────────────────────────────
     database_url: str = ""
+    sqlite_read_connections: int = 4
     redis_url: str = ""
     migrations_dir: str | None = None
 
@@ -75,6 +89,10 @@ class Settings(_SettingsBase):
     llm_judge_model: str | None = None
     llm_judge_api_base: str | None = None
     anthropic_client_cache_size: int = 16
+    upstream_http_max_connections: int = 100
+    upstream_http_max_keepalive_connections: int = 20
+    upstream_http_keepalive_expiry_seconds: float = 60.0
+    upstream_http2: bool = True
 
     # ── security ────────────────────────────────────────────────────
     credential_encryption_key: str | None = None
@@ -89,6 +107,11 @@ class Settings(_SettingsBase):
     environment: str = "development"
     railway_service_name: str = ""
     enable_request_logging: bool = False
+    event_write_behind: bool = False
+    event_write_queue_size: int = 10000
+    event_write_flush_size: int = 200
+    event_write_flush_interval_seconds: float = 0.5
+    conversation_message_dedup: bool = False
 
     # ── telemetry ───────────────────────────────────────────────────
     usage_telemetry: bool | None = None
@@ -99,8 +122,12 @@ class Settings(_SettingsBase):
     archive_s3_bucket: str | None = None
     archive_s3_prefix: str = "luthien-archive/"
     retention_archive_batch_size: int = 100
+    retention_archive_compression: str = "gzip"
+    retention_archive_segment_mb: int = 64
+    retention_archive_format: str = "jsonl"
     retention_s3_encryption: str = "AES256"
     retention_s3_kms_key_id: str = ""
+    retention_partition_premake_days: int = 7
 
     # ── webhook ─────────────────────────────────────────────────────
     webhook_url: str = ""
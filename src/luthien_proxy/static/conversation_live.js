@@ -17,6 +17,9 @@ function escapeHtml(str) {
         .replace(/'/g, '&#39;');
 }
 
+// Turns before the end of the loaded list that refreshTurns() fetches again.
+const REFRESH_OVERLAP_TURNS = 3;
+
 function conversationViewer() {
     return {
         conversationId: '',
@@ -201,13 +204,17 @@ function conversationViewer() {
 
         async refreshTurns() {
             try {
+                // Only the tail can change: re-fetch the last few loaded turns
+                // (a response or late annotation may still land on them) plus
+                // anything new, and keep the earlier turns we already have.
+                const offset = Math.max(0, this._rawTurns.length - REFRESH_OVERLAP_TURNS);
                 const resp = await fetch(
-                    `/api/history/sessions/${encodeURIComponent(this.conversationId)}`,
+                    `/api/history/sessions/${encodeURIComponent(this.conversationId)}?offset=${offset}`,
                     { headers: { 'Accept': 'application/json' } }
                 );
                 if (!resp.ok) return;
                 const data = await resp.json();
-                const rawTurns = data.turns || [];
+                const rawTurns = this._rawTurns.slice(0, data.turn_offset || 0).concat(data.turns || []);
                 const newTurns = this.presentTurns(rawTurns);
                 if (rawTurns.length !== newTurns.length) {
                     console.error('presentTurns must map 1:1 with rawTurns');
@@ -9,13 +9,13 @@ from __future__ import annotations
 import os
 from html import escape as html_escape
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse
 from fastapi.responses import StreamingResponse as FastAPIStreamingResponse
 
 from luthien_proxy.auth import check_auth_or_redirect, get_base_url, verify_admin_token
 from luthien_proxy.dependencies import get_admin_key, get_event_publisher
-from luthien_proxy.observability.event_publisher import EventPublisherProtocol
+from luthien_proxy.observability.event_publisher import EventPublisherProtocol, parse_event_type_filter
 
 router = APIRouter(prefix="", tags=["ui"])
 
@@ -27,11 +27,17 @@ STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "static")
 async def activity_stream(
     _: str = Depends(verify_admin_token),
     publisher: EventPublisherProtocol | None = Depends(get_event_publisher),
+    event_types: str | None = Query(
+        default=None,
+        description="Comma-separated event types to stream; entries ending in '.' match as prefixes",
+    ),
 ):
     """Server-Sent Events stream of activity events.
 
     This endpoint streams all gateway activity in real-time for debugging.
     Events include: request received, policy events, responses sent, etc.
+    Large payloads arrive as compact summaries with a ``full_payload`` link
+    to the stored events.
 
     Returns:
         StreamingResponse with Server-Sent Events (text/event-stream)
@@ -43,7 +49,7 @@ async def activity_stream(
         )
 
     return FastAPIStreamingResponse(
-        publisher.stream_events(),
+        publisher.stream_events(event_types=parse_event_type_filter(event_types)),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
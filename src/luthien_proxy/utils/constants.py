@@ -132,3 +132,16 @@ HISTORY_SESSIONS_DEFAULT_LIMIT = 50
 
 # Maximum number of sessions allowed in history list endpoint.
 HISTORY_SESSIONS_MAX_LIMIT = 10000
+
+# How long the history list caches its session total (per pool and filter set).
+# The total is read from session_summaries with COUNT(*), which still scans the
+# table; paging through a list re-reads it on every page otherwise.
+HISTORY_SESSIONS_TOTAL_CACHE_TTL_SECONDS = 30.0
+
+# Turns whose events are loaded per query when building a session detail or
+# export. Every request event carries the conversation so far, so late turns of
+# long agent sessions are large; paging bounds what is held in memory at once.
+HISTORY_SESSION_TURNS_PAGE_SIZE = 25
+
+# Maximum number of turns one session detail request may ask for via ?limit=.
+HISTORY_SESSION_TURNS_MAX_LIMIT = 1000
@@ -1,17 +1,29 @@
 """Credential cache protocol and implementations.
 
 Provides a protocol for TTL key-value caching used by CredentialManager,
-with both Redis-backed and in-process implementations.
+with both Redis-backed and in-process implementations, plus a Redis pub/sub
+channel that fans credential invalidations out to every replica's in-process
+L1 cache.
 """
 
 from __future__ import annotations
 
+import asyncio
 import fnmatch
+import logging
 import time
-from typing import AsyncIterator, Protocol, runtime_checkable
+from typing import AsyncIterator, Callable, Protocol, runtime_checkable
 
 import redis.asyncio as redis
 
+logger = logging.getLogger(__name__)
+
+CREDENTIAL_INVALIDATION_CHANNEL = "luthien:auth:cred-invalidate"
+# Published in place of a key hash to drop every L1 entry (invalidate_all).
+INVALIDATE_ALL = "*"
+# Pause before resubscribing after the pub/sub connection drops.
+_RESUBSCRIBE_DELAY_SECONDS = 1.0
+
 
 @runtime_checkable
 class CredentialCacheProtocol(Protocol):
@@ -144,3 +156,55 @@ class RedisCredentialCache:
     async def unlink(self, *keys: str) -> int:
         """Delete multiple keys, returning the count of keys removed."""
         return int(await self._redis.unlink(*keys))
+
+
+@runtime_checkable
+class CredentialInvalidationBusProtocol(Protocol):
+    """Broadcasts credential invalidations to every gateway replica."""
+
+    async def publish(self, key_hash: str) -> None:
+        """Announce that ``key_hash`` (or ``INVALIDATE_ALL``) was invalidated."""
+        ...
+
+    async def listen(self, on_invalidate: Callable[[str], None]) -> None:
+        """Call ``on_invalidate`` for every announcement until cancelled."""
+        ...
+
+
+class RedisCredentialInvalidationBus:
+    """Redis pub/sub implementation of the invalidation bus.
+
+    Delivery is best-effort (pub/sub has no replay): a replica that is
+    disconnected when a message is published keeps its L1 entry until the
+    L1 TTL expires. That TTL is the staleness bound, this bus just makes the
+    common case immediate.
+    """
+
+    def __init__(self, client: redis.Redis, channel: str = CREDENTIAL_INVALIDATION_CHANNEL) -> None:
+        """Initialize with a Redis client and channel name."""
+        self._redis = client
+        self._channel = channel
+
+    async def publish(self, key_hash: str) -> None:
+        """Publish an invalidation. Failures are logged, never raised."""
+        try:
+            await self._redis.publish(self._channel, key_hash)
+        except Exception as e:
+            logger.warning(f"Failed to publish credential invalidation: {repr(e)}")
+
+    async def listen(self, on_invalidate: Callable[[str], None]) -> None:
+        """Subscribe and dispatch invalidations, resubscribing after errors."""
+        while True:
+            try:
+                async with self._redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self._channel)
+                    async for message in pubsub.listen():
+                        if message.get("type") != "message":
+                            continue
+                        data = message["data"]
+                        on_invalidate(data if isinstance(data, str) else data.decode())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Credential invalidation subscriber error, resubscribing: {repr(e)}")
+                await asyncio.sleep(_RESUBSCRIBE_DELAY_SECONDS)
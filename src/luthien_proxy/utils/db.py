@@ -9,7 +9,7 @@ from typing import AsyncContextManager, AsyncIterator, Awaitable, Callable, Mapp
 
 import asyncpg
 
-from luthien_proxy.utils.db_sqlite import SqlitePool, create_sqlite_pool, is_sqlite_url
+from luthien_proxy.utils.db_sqlite import DEFAULT_SQLITE_READERS, SqlitePool, create_sqlite_pool, is_sqlite_url
 
 
 class ConnectionProtocol(Protocol):
@@ -87,10 +87,14 @@ class DatabasePool:
         url: str,
         *,
         factory: PoolFactory | None = None,
+        sqlite_readers: int = DEFAULT_SQLITE_READERS,
         **pool_kwargs: object,
     ) -> None:
         """Initialize the database connection pool.
 
+        ``sqlite_readers`` sets how many read-only connections a SQLite pool
+        opens next to its writer (see ``SqlitePool``); Postgres ignores it.
+
         Tests that need an in-memory SQLite DatabasePool with schema set up
         ahead of time should construct it directly and prime the cached pool
         via the public API:
@@ -113,6 +117,7 @@ class DatabasePool:
         self._is_sqlite = is_sqlite_url(url)
         self._factory = factory or get_pool_factory()
         self._pool_kwargs = pool_kwargs
+        self._sqlite_readers = sqlite_readers
         self._pool: PoolProtocol | None = None
         self._sqlite_pool: SqlitePool | None = None
         self._lock = asyncio.Lock()
@@ -139,7 +144,7 @@ class DatabasePool:
                 return cast(PoolProtocol, self._sqlite_pool)
             async with self._lock:
                 if self._sqlite_pool is None:
-                    self._sqlite_pool = await create_sqlite_pool(self._url)
+                    self._sqlite_pool = await create_sqlite_pool(self._url, readers=self._sqlite_readers)
             return cast(PoolProtocol, self._sqlite_pool)
 
         if self._pool is not None:
@@ -186,6 +191,27 @@ def parse_db_ts(value: object) -> datetime:
     raise TypeError(f"Expected datetime or str for timestamp column, got {type(value).__name__}")
 
 
+# Bind-parameter budget per multi-row INSERT. SQLite builds before 3.32 cap a
+# statement at 999 variables (same constraint as the archiver's batch size);
+# staying under 900 keeps the batch SQL portable across both backends.
+MAX_PARAMS_PER_STATEMENT = 900
+
+
+def values_placeholders(row_count: int, column_count: int) -> str:
+    """Build ``($1, $2), ($3, $4), ...`` for a multi-row INSERT."""
+    rows = []
+    for r in range(row_count):
+        base = r * column_count
+        rows.append("(" + ", ".join(f"${base + c + 1}" for c in range(column_count)) + ")")
+    return ", ".join(rows)
+
+
+def chunk_rows[T](items: list[T], column_count: int) -> list[list[T]]:
+    """Split rows so each multi-row INSERT stays under the bind-parameter budget."""
+    size = max(1, MAX_PARAMS_PER_STATEMENT // column_count)
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
 class DatabaseWriteError(Exception):
     """A database write failed.
 
@@ -203,6 +229,8 @@ class DatabaseWriteError(Exception):
 
 
 __all__ = [
+    "DEFAULT_SQLITE_READERS",
+    "MAX_PARAMS_PER_STATEMENT",
     "ConnectFn",
     "DatabaseWriteError",
     "DatabasePool",
@@ -210,5 +238,7 @@ __all__ = [
     "create_pool",
     "get_connector",
     "get_pool_factory",
+    "chunk_rows",
     "parse_db_ts",
+    "values_placeholders",
 ]
@@ -10,6 +10,7 @@ import asyncio
 import json
 import re
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import AsyncIterator, Mapping, Sequence
 
@@ -25,6 +26,27 @@ _STRING_LITERAL_DOLLAR_N = re.compile(
 )
 _DOLLAR_N = re.compile(r"\$(\d+)")
 
+DEFAULT_SQLITE_READERS = 4
+
+# Distinct query strings whose translation is kept. The application issues a
+# few hundred distinct statements; chunked IN (...) lists add one per size.
+TRANSLATED_QUERY_CACHE_SIZE = 1024
+# Per-connection prepared-statement cache (sqlite3 defaults to 128), keyed
+# on the translated SQL text.
+_STATEMENT_CACHE_SIZE = 512
+
+# Applied to the writer and every reader. With WAL, synchronous=NORMAL only
+# fsyncs at checkpoints: a power loss can drop the last few commits but
+# cannot corrupt the file. mmap serves reads from the page cache without a
+# copy; cache_size is per connection (negative = KiB).
+_CONNECTION_PRAGMAS = (
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-16000",
+)
+
 
 def _reject_dollar_n_in_literals(query: str) -> None:
     """Raise if a quoted string/identifier contains a $N-looking token.
@@ -47,23 +69,13 @@ def _reject_dollar_n_in_literals(query: str) -> None:
             )
 
 
-def _translate_params(query: str, args: tuple[object, ...]) -> tuple[str, tuple[object, ...]]:
-    """Translate asyncpg-style $1,$2 parameters to SQLite ? placeholders.
-
-    Handles positional reuse (e.g. `VALUES ($1, $1)`): each occurrence of $N
-    maps to one `?` in the output and the args tuple is rebuilt in the order
-    `?` placeholders appear, so the N-th `?` gets args[ordered[N-1]-1].
-    asyncpg/Postgres accept reuse natively; SQLite's `?` is strictly positional
-    and does not, so we expand on the args side.
-
-    Does NOT parse SQL. `$N`-substitution, `::` cast stripping, and LEAST/NOW
-    rewriting all run as regex over the raw query. If a quoted literal contains
-    a `$N`-looking token, the translator rejects the query up-front with a
-    ValueError rather than silently corrupting arg binding. SQL comments
-    (`--`, `/* */`) are also not parsed; a `$N` inside a comment will be
-    rewritten to `?`, which is usually harmless but can still shift arg counts.
+@lru_cache(maxsize=TRANSLATED_QUERY_CACHE_SIZE)
+def _translate_query(query: str) -> tuple[str, tuple[int, ...]]:
+    """Translate one query's text; cached because only the args vary per call.
 
-    Also rewrites PostgreSQL-specific SQL constructs to SQLite equivalents.
+    Returns the SQLite query and, for each ``?`` in it, the 1-indexed
+    asyncpg placeholder it stands for. Invalid queries raise ValueError and
+    are not cached.
     """
     _reject_dollar_n_in_literals(query)
 
@@ -77,16 +89,10 @@ def _translate_params(query: str, args: tuple[object, ...]) -> tuple[str, tuple[
         # via Python's negative indexing without this guard.
         if n < 1:
             raise ValueError(f"Invalid parameter placeholder ${n}: asyncpg placeholders are 1-indexed")
-        if n > len(args):
-            raise ValueError(f"Parameter ${n} exceeds number of provided arguments ({len(args)})")
         consumed.append(n)
         return "?"
 
     translated = _DOLLAR_N.sub(_sub_placeholder, query)
-    if consumed:
-        reordered = tuple(args[idx - 1] for idx in consumed)
-    else:
-        reordered = args
 
     # Strip PostgreSQL type casts (::jsonb, ::text, ::float, ::int[], etc.)
     translated = re.sub(r"::\w+(\[\])?", "", translated)
@@ -103,7 +109,41 @@ def _translate_params(query: str, args: tuple[object, ...]) -> tuple[str, tuple[
     # ILIKE → LIKE (SQLite LIKE is case-insensitive for ASCII by default)
     translated = translated.replace(" ILIKE ", " LIKE ")
 
-    return translated, reordered
+    return translated, tuple(consumed)
+
+
+def _translate_params(query: str, args: tuple[object, ...]) -> tuple[str, tuple[object, ...]]:
+    """Translate asyncpg-style $1,$2 parameters to SQLite ? placeholders.
+
+    Handles positional reuse (e.g. `VALUES ($1, $1)`): each occurrence of $N
+    maps to one `?` in the output and the args tuple is rebuilt in the order
+    `?` placeholders appear, so the N-th `?` gets args[ordered[N-1]-1].
+    asyncpg/Postgres accept reuse natively; SQLite's `?` is strictly positional
+    and does not, so we expand on the args side.
+
+    Does NOT parse SQL. `$N`-substitution, `::` cast stripping, and LEAST/NOW
+    rewriting all run as regex over the raw query. If a quoted literal contains
+    a `$N`-looking token, the translator rejects the query up-front with a
+    ValueError rather than silently corrupting arg binding. SQL comments
+    (`--`, `/* */`) are also not parsed; a `$N` inside a comment will be
+    rewritten to `?`, which is usually harmless but can still shift arg counts.
+
+    Also rewrites PostgreSQL-specific SQL constructs to SQLite equivalents.
+    The text rewrite is cached per query string (``_translate_query``); only
+    the arg reordering runs on every call.
+    """
+    translated, consumed = _translate_query(query)
+    if not consumed:
+        return translated, args
+    for n in consumed:
+        if n > len(args):
+            raise ValueError(f"Parameter ${n} exceeds number of provided arguments ({len(args)})")
+    return translated, tuple(args[idx - 1] for idx in consumed)
+
+
+async def _apply_pragmas(conn: aiosqlite.Connection) -> None:
+    for pragma in _CONNECTION_PRAGMAS:
+        await conn.execute(pragma)
 
 
 def _convert_arg(value: object) -> object:
@@ -140,22 +180,56 @@ class _RowProxy(Mapping[str, object]):
 
 
 class SqliteConnection:
-    """Wraps an aiosqlite connection to match ConnectionProtocol."""
+    """Routes ConnectionProtocol calls onto a SqlitePool's connections.
+
+    Writes (``execute``, ``executescript``, ``transaction``) run on the
+    pool's single writer connection under its write lock, held per
+    statement or for the whole transaction. Reads outside a transaction run
+    on a read-only connection when the pool has any, so they neither wait
+    for nor block writers; inside a transaction they stay on the writer and
+    see its uncommitted rows. Statements outside a transaction commit before
+    returning, so a later read through any connection sees them.
+
+    A handle is not exclusive: outside ``transaction()`` another handle may
+    write between two of its statements, just as with a pooled asyncpg
+    connection. (Before the reader pool, ``acquire()`` held one lock for the
+    handle's lifetime, which serialized such sequences on SQLite only.) A
+    read-modify-write sequence must run inside ``transaction()``, which
+    holds the write lock from BEGIN to COMMIT.
+    """
 
-    def __init__(self, conn: aiosqlite.Connection) -> None:  # noqa: D107
-        self._conn = conn
+    def __init__(self, pool: SqlitePool) -> None:  # noqa: D107
+        self._pool = pool
         self._in_transaction = False
 
     async def close(self) -> None:
-        """Close the underlying connection."""
-        await self._conn.close()
+        """No-op: connections belong to the pool and close with it."""
+
+    @asynccontextmanager
+    async def _writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        # Inside transaction() this handle already holds the write lock.
+        if self._in_transaction:
+            yield await self._pool._get_conn()
+            return
+        async with self._pool._write_lock:
+            yield await self._pool._get_conn()
+
+    @asynccontextmanager
+    async def _reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        if self._in_transaction or not self._pool.reader_count:
+            async with self._writer() as conn:
+                yield conn
+            return
+        async with self._pool._reader() as conn:
+            yield conn
 
     async def fetch(self, query: str, *args: object) -> Sequence[Mapping[str, object]]:
         """Execute query and return all rows."""
         translated, targs = _translate_params(query, args)
         targs = _convert_args(targs)
-        cursor = await self._conn.execute(translated, targs)
-        rows = await cursor.fetchall()
+        async with self._reader() as conn:
+            cursor = await conn.execute(translated, targs)
+            rows = await cursor.fetchall()
         if not rows or cursor.description is None:
             return []
         keys = tuple(d[0] for d in cursor.description)
@@ -165,8 +239,9 @@ class SqliteConnection:
         """Execute query and return the first row."""
         translated, targs = _translate_params(query, args)
         targs = _convert_args(targs)
-        cursor = await self._conn.execute(translated, targs)
-        row = await cursor.fetchone()
+        async with self._reader() as conn:
+            cursor = await conn.execute(translated, targs)
+            row = await cursor.fetchone()
         if row is None or cursor.description is None:
             return None
         keys = tuple(d[0] for d in cursor.description)
@@ -183,9 +258,10 @@ class SqliteConnection:
         """Execute a query (INSERT/UPDATE/DELETE)."""
         translated, targs = _translate_params(query, args)
         targs = _convert_args(targs)
-        cursor = await self._conn.execute(translated, targs)
-        if not self._in_transaction:
-            await self._conn.commit()
+        async with self._writer() as conn:
+            cursor = await conn.execute(translated, targs)
+            if not self._in_transaction:
+                await conn.commit()
         return f"OK {cursor.rowcount}"
 
     async def executescript(self, script: str) -> None:
@@ -194,54 +270,106 @@ class SqliteConnection:
         Unlike :meth:`execute`, this understands trigger ``BEGIN ... END`` blocks,
         so semicolons inside trigger bodies do not get split into broken fragments.
         """
-        await self._conn.executescript(script)
+        async with self._writer() as conn:
+            await conn.executescript(script)
 
     @asynccontextmanager
     async def transaction(self) -> AsyncIterator[None]:
-        """Context manager for explicit transactions."""
-        self._in_transaction = True
-        await self._conn.execute("BEGIN")
-        try:
-            yield
-            await self._conn.commit()
-        except Exception:
-            await self._conn.rollback()
-            raise
-        finally:
-            self._in_transaction = False
+        """Context manager for explicit transactions (holds the write lock throughout)."""
+        async with self._pool._write_lock:
+            conn = await self._pool._get_conn()
+            self._in_transaction = True
+            await conn.execute("BEGIN")
+            try:
+                yield
+                await conn.commit()
+            except BaseException:
+                # Including cancellation: an open BEGIN would otherwise make
+                # the writer's next transaction fail.
+                await conn.rollback()
+                raise
+            finally:
+                self._in_transaction = False
 
 
 class SqlitePool:
-    """Lightweight pool that serializes access to a single SQLite connection.
+    """One writer connection plus a few read-only connections to a WAL database.
 
-    SQLite only supports one writer at a time, so we use a lock to serialize access.
-    For the single-user local dev use case this is fine.
+    SQLite allows a single writer, so every write goes through one
+    connection behind a lock. In WAL mode readers do not block the writer
+    (or each other), so ``readers`` extra read-only connections serve
+    reads made outside a transaction: a history page scan no longer stalls
+    the event writes of in-flight requests. See ``SqliteConnection`` for the
+    routing rules.
+
+    ``:memory:`` databases are private to their connection, so they always
+    run on the writer alone.
     """
 
-    def __init__(self, db_path: str) -> None:  # noqa: D107
+    def __init__(self, db_path: str, *, readers: int = DEFAULT_SQLITE_READERS) -> None:  # noqa: D107
+        if readers < 0:
+            raise ValueError(f"readers must be >= 0 (got {readers})")
         self._db_path = db_path
+        self._reader_target = 0 if db_path == ":memory:" else readers
         self._conn: aiosqlite.Connection | None = None
-        self._lock = asyncio.Lock()
+        self._readers: list[aiosqlite.Connection] = []
+        self._idle_readers: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._write_lock = asyncio.Lock()
+        self._open_lock = asyncio.Lock()
+
+    @property
+    def reader_count(self) -> int:
+        """Number of read-only connections (0 until the pool is opened)."""
+        return len(self._readers)
 
     async def _get_conn(self) -> aiosqlite.Connection:
-        if self._conn is None:
-            self._conn = await aiosqlite.connect(self._db_path)
-            # WAL mode for better concurrent read performance
-            await self._conn.execute("PRAGMA journal_mode=WAL")
-            await self._conn.execute("PRAGMA foreign_keys=ON")
-            # Return rows as tuples (we wrap them in _RowProxy)
-            self._conn.row_factory = None  # type: ignore[assignment]
+        """Return the writer connection, opening the pool on first use."""
+        if self._conn is not None:
+            return self._conn
+        async with self._open_lock:
+            if self._conn is None:
+                conn = await aiosqlite.connect(self._db_path, cached_statements=_STATEMENT_CACHE_SIZE)
+                # WAL lets readers run alongside the writer.
+                await conn.execute("PRAGMA journal_mode=WAL")
+                await conn.execute("PRAGMA foreign_keys=ON")
+                await _apply_pragmas(conn)
+                # Return rows as tuples (we wrap them in _RowProxy)
+                conn.row_factory = None  # type: ignore[assignment]
+                # Readers open after the writer has switched the file to WAL.
+                uri = f"{Path(self._db_path).resolve().as_uri()}?mode=ro"
+                for _ in range(self._reader_target):
+                    reader = await aiosqlite.connect(uri, uri=True, cached_statements=_STATEMENT_CACHE_SIZE)
+                    await _apply_pragmas(reader)
+                    reader.row_factory = None  # type: ignore[assignment]
+                    self._readers.append(reader)
+                    self._idle_readers.put_nowait(reader)
+                self._conn = conn
         return self._conn
 
+    @asynccontextmanager
+    async def _reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        reader = await self._idle_readers.get()
+        try:
+            yield reader
+        finally:
+            self._idle_readers.put_nowait(reader)
+
     @asynccontextmanager
     async def acquire(self) -> AsyncIterator[SqliteConnection]:
-        """Yield a connection, serializing access with a lock."""
-        async with self._lock:
-            conn = await self._get_conn()
-            yield SqliteConnection(conn)
+        """Yield a connection handle; locking happens per statement, not per handle.
+
+        See ``SqliteConnection`` for what that means for read-modify-write
+        sequences.
+        """
+        await self._get_conn()
+        yield SqliteConnection(self)
 
     async def close(self) -> None:
-        """Close the underlying connection."""
+        """Close the writer and all read connections."""
+        readers, self._readers = self._readers, []
+        self._idle_readers = asyncio.Queue()
+        for reader in readers:
+            await reader.close()
         if self._conn is not None:
             await self._conn.close()
             self._conn = None
@@ -278,15 +406,15 @@ def parse_sqlite_url(url: str) -> str:
     raise ValueError(f"Invalid SQLite URL: {url}. Expected sqlite:///path or sqlite://:memory:")
 
 
-async def create_sqlite_pool(url: str) -> SqlitePool:
-    """Create a SqlitePool from a sqlite:// URL."""
+async def create_sqlite_pool(url: str, *, readers: int = DEFAULT_SQLITE_READERS) -> SqlitePool:
+    """Create a SqlitePool from a sqlite:// URL with ``readers`` read connections."""
     db_path = parse_sqlite_url(url)
 
     # Ensure parent directory exists for file-based databases
     if db_path != ":memory:":
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
-    pool = SqlitePool(db_path)
+    pool = SqlitePool(db_path, readers=readers)
     # Eagerly open connection to validate the path
     async with pool.acquire():
         pass
@@ -299,6 +427,7 @@ def is_sqlite_url(url: str) -> bool:
 
 
 __all__ = [
+    "DEFAULT_SQLITE_READERS",
     "SqliteConnection",
     "SqlitePool",
     "create_sqlite_pool",
@@ -78,6 +78,9 @@ async def _apply_sqlite_migrations(
         logger.warning(f"No migration files in {migrations_dir} -- skipping")
         return
 
+    # Not wrapped in transaction(): executescript() commits on its own. This
+    # runs at startup before anything else uses the pool, so the handle's
+    # read-then-write steps cannot interleave with other writers.
     async with db_pool.connection() as conn:
         # Ensure _migrations table exists
         await conn.execute(
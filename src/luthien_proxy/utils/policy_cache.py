@@ -11,10 +11,13 @@ import json
 import re
 from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from luthien_proxy.settings import get_settings
-from luthien_proxy.utils.db import DatabasePool
+from luthien_proxy.utils.db import DatabasePool, parse_db_ts
+
+if TYPE_CHECKING:
+    from luthien_proxy.utils.policy_cache_front import PolicyCacheFront
 
 # Type alias for the factory function injected into PolicyContext
 type PolicyCacheFactory = Callable[[str], PolicyCache]
@@ -46,7 +49,25 @@ def build_factory(db_pool: DatabasePool | None) -> PolicyCacheFactory | None:
         return None
     cap_setting = get_settings().policy_cache_max_entries
     cap: int | None = cap_setting if cap_setting > 0 else None
-    return lambda name: PolicyCache(db_pool, name, max_entries=cap)
+    front = _front if _front is not None and _front.db_pool is db_pool else None
+    return lambda name: PolicyCache(db_pool, name, max_entries=cap, front=front)
+
+
+_front: PolicyCacheFront | None = None
+
+
+def install_front(front: PolicyCacheFront | None) -> None:
+    """Route caches built by :func:`build_factory` through ``front`` (None uninstalls).
+
+    The front only applies to caches over the same ``DatabasePool`` it writes to.
+    """
+    global _front
+    _front = front
+
+
+def installed_front() -> PolicyCacheFront | None:
+    """Return the front installed by :func:`install_front`, if any."""
+    return _front
 
 
 # SQLite stores expires_at as TEXT and compares it with datetime('now'), which
@@ -57,6 +78,95 @@ _SQLITE_EXPIRES_FORMAT = "%Y-%m-%d %H:%M:%S"
 _SQLITE_EXPIRES_REGEX = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$")
 
 
+def format_expires_at(expires_at: datetime, *, is_sqlite: bool) -> str:
+    """Render an aware UTC ``expires_at`` for the ``policy_cache`` table."""
+    if not is_sqlite:
+        return expires_at.isoformat()
+    # WHY: see _SQLITE_EXPIRES_FORMAT — must stay space-separated, no "T",
+    # no timezone suffix, so lex-compare against datetime('now') stays valid.
+    expires_str = expires_at.strftime(_SQLITE_EXPIRES_FORMAT)
+    assert _SQLITE_EXPIRES_REGEX.match(expires_str), (
+        f"SQLite expires_at format drift detected: {expires_str!r} — "
+        "must match 'YYYY-MM-DD HH:MM:SS' for lex-compare invariant"
+    )
+    return expires_str
+
+
+def decode_value(raw: object) -> Any:
+    """Decode a ``value_json`` column value."""
+    # WHY: asyncpg may hand back JSONB as either an already-decoded dict/list
+    # or a raw str depending on connection/codec configuration; SQLite's TEXT
+    # column is always str. Mirror the dual-path pattern used by
+    # request_log.service._parse_jsonb and debug.service so a Postgres
+    # deployment with JSONB auto-decoding doesn't trip an assertion.
+    if isinstance(raw, str):
+        return json.loads(raw)
+    if isinstance(raw, (dict, list)):
+        return raw
+    raise TypeError(f"unexpected value_json type {type(raw).__name__}")
+
+
+async def fetch_entry(db: DatabasePool, policy_name: str, key: str) -> tuple[Any, datetime] | None:
+    """Return ``(value, expires_at)`` for a live entry, or None on a miss or expired entry."""
+    pool = await db.get_pool()
+    now_expr = "datetime('now')" if db.is_sqlite else "NOW()"
+    row = await pool.fetchrow(
+        f"SELECT value_json, expires_at FROM policy_cache "
+        f"WHERE policy_name = $1 AND cache_key = $2 AND expires_at > {now_expr}",
+        policy_name,
+        key,
+    )
+    if row is None:
+        return None
+    expires_at = parse_db_ts(row["expires_at"])
+    if expires_at.tzinfo is None:
+        # SQLite stores naive UTC (see format_expires_at).
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return decode_value(row["value_json"]), expires_at
+
+
+async def enforce_cap(conn: Any, policy_name: str, cap: int) -> None:
+    """Evict oldest-by-creation entries until ``policy_name`` fits within ``cap``.
+
+    Must run inside a transaction on ``conn`` — callers are responsible
+    for opening one so the count/delete pair is consistent with the
+    preceding writes. Under concurrent writers on Postgres this is still
+    only a soft cap (see ``PolicyCache``), but a convergent one: every
+    subsequent put re-runs this check and trims any excess.
+
+    Eviction order: ``ORDER BY created_at ASC, cache_key ASC``. The
+    secondary sort on cache_key gives deterministic ordering when
+    multiple rows share a created_at (identical DEFAULT NOW() within
+    a single statement), which keeps tests stable and prevents
+    concurrent evictors from picking different "oldest" sets.
+    """
+    count_raw = await conn.fetchval(
+        "SELECT COUNT(*) FROM policy_cache WHERE policy_name = $1",
+        policy_name,
+    )
+    assert isinstance(count_raw, int), f"unexpected COUNT(*) return type {type(count_raw).__name__}"
+    excess = count_raw - cap
+    if excess <= 0:
+        return
+
+    # SELECT-then-DELETE-in-a-loop keeps the shim's $N → ? rewrite simple
+    # (it cannot dedupe a repeated $1 across a correlated subquery, so a
+    # single DELETE...WHERE IN (SELECT...) is awkward to write portably).
+    # The loop is O(excess) single-row deletes, and excess is 1 in the
+    # steady state (one put, one eviction).
+    victims = await conn.fetch(
+        "SELECT cache_key FROM policy_cache WHERE policy_name = $1 ORDER BY created_at ASC, cache_key ASC LIMIT $2",
+        policy_name,
+        excess,
+    )
+    for row in victims:
+        await conn.execute(
+            "DELETE FROM policy_cache WHERE policy_name = $1 AND cache_key = $2",
+            policy_name,
+            row["cache_key"],
+        )
+
+
 class PolicyCache:
     """DB-backed key-value cache scoped to a single policy.
 
@@ -79,6 +189,11 @@ class PolicyCache:
     the cap without unbounded growth. On SQLite the shim serializes all
     writes through a single connection, so the cap is effectively hard
     there.
+
+    With a ``front`` (see :mod:`luthien_proxy.utils.policy_cache_front`),
+    reads are served from an in-process LRU and writes are coalesced and
+    flushed in the background, so ``get``/``put``/``delete`` rarely touch
+    the database on the request path.
     """
 
     def __init__(
@@ -86,6 +201,7 @@ class PolicyCache:
         db_pool: DatabasePool,
         policy_name: str,
         max_entries: int | None = DEFAULT_MAX_ENTRIES,
+        front: PolicyCacheFront | None = None,
     ) -> None:
         """Initialize cache for a specific policy.
 
@@ -97,12 +213,15 @@ class PolicyCache:
                 ``None`` disables the cap (use sparingly — unbounded growth
                 is the exact footgun this class exists to avoid). Must be
                 positive if set. Defaults to :data:`DEFAULT_MAX_ENTRIES`.
+            front: Optional in-process read cache and write-behind buffer
+                over the same ``db_pool``.
         """
         if max_entries is not None and max_entries <= 0:
             raise ValueError(f"max_entries must be positive or None, got {max_entries}")
         self._db = db_pool
         self._policy_name = policy_name
         self._max_entries = max_entries
+        self._front = front
 
     @property
     def max_entries(self) -> int | None:
@@ -115,13 +234,10 @@ class PolicyCache:
         Returns None on cache miss or expired entry. The returned value is
         whatever JSON-serializable value was stored (dict, list, scalar, etc.).
         """
+        if self._front is not None:
+            return await self._front.get(self._policy_name, key)
         pool = await self._db.get_pool()
-
-        if self._db.is_sqlite:
-            now_expr = "datetime('now')"
-        else:
-            now_expr = "NOW()"
-
+        now_expr = "datetime('now')" if self._db.is_sqlite else "NOW()"
         row = await pool.fetchrow(
             f"SELECT value_json FROM policy_cache "
             f"WHERE policy_name = $1 AND cache_key = $2 AND expires_at > {now_expr}",
@@ -130,18 +246,7 @@ class PolicyCache:
         )
         if row is None:
             return None
-
-        raw = row["value_json"]
-        # WHY: asyncpg may hand back JSONB as either an already-decoded dict/list
-        # or a raw str depending on connection/codec configuration; SQLite's TEXT
-        # column is always str. Mirror the dual-path pattern used by
-        # request_log.service._parse_jsonb and debug.service so a Postgres
-        # deployment with JSONB auto-decoding doesn't trip an assertion.
-        if isinstance(raw, str):
-            return json.loads(raw)
-        if isinstance(raw, (dict, list)):
-            return raw
-        raise TypeError(f"unexpected value_json type {type(raw).__name__}")
+        return decode_value(row["value_json"])
 
     async def put(self, key: str, value: Any, ttl_seconds: int) -> None:
         """Upsert a cache entry with the given TTL and enforce the size cap.
@@ -155,19 +260,13 @@ class PolicyCache:
             value: Any JSON-serializable value (dict, list, scalar, etc.)
             ttl_seconds: Time-to-live in seconds
         """
+        if self._front is not None:
+            self._front.put(self._policy_name, key, value, ttl_seconds, self._max_entries)
+            return
         pool = await self._db.get_pool()
         value_json = json.dumps(value)
         expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
-        if self._db.is_sqlite:
-            # WHY: see _SQLITE_EXPIRES_FORMAT — must stay space-separated, no "T",
-            # no timezone suffix, so lex-compare against datetime('now') stays valid.
-            expires_str = expires_at.strftime(_SQLITE_EXPIRES_FORMAT)
-            assert _SQLITE_EXPIRES_REGEX.match(expires_str), (
-                f"SQLite expires_at format drift detected: {expires_str!r} — "
-                "must match 'YYYY-MM-DD HH:MM:SS' for lex-compare invariant"
-            )
-        else:
-            expires_str = expires_at.isoformat()
+        expires_str = format_expires_at(expires_at, is_sqlite=self._db.is_sqlite)
 
         # Single SQL works on both backends: _translate_params in db_sqlite.py
         # strips ::jsonb/::timestamptz casts and rewrites NOW() to datetime('now').
@@ -186,51 +285,13 @@ class PolicyCache:
                     expires_str,
                 )
                 if self._max_entries is not None:
-                    await self._enforce_cap(conn, self._max_entries)
-
-    async def _enforce_cap(self, conn: Any, cap: int) -> None:
-        """Evict oldest-by-creation entries until the namespace fits within ``cap``.
-
-        Must run inside a transaction on ``conn`` — callers are responsible
-        for opening one so the count/delete pair is consistent with the
-        preceding put. Under concurrent writers on Postgres this is still
-        only a soft cap (see class docstring), but a convergent one: every
-        subsequent put re-runs this check and trims any excess.
-
-        Eviction order: ``ORDER BY created_at ASC, cache_key ASC``. The
-        secondary sort on cache_key gives deterministic ordering when
-        multiple rows share a created_at (identical DEFAULT NOW() within
-        a single statement), which keeps tests stable and prevents
-        concurrent evictors from picking different "oldest" sets.
-        """
-        count_raw = await conn.fetchval(
-            "SELECT COUNT(*) FROM policy_cache WHERE policy_name = $1",
-            self._policy_name,
-        )
-        assert isinstance(count_raw, int), f"unexpected COUNT(*) return type {type(count_raw).__name__}"
-        excess = count_raw - cap
-        if excess <= 0:
-            return
-
-        # SELECT-then-DELETE-in-a-loop keeps the shim's $N → ? rewrite simple
-        # (it cannot dedupe a repeated $1 across a correlated subquery, so a
-        # single DELETE...WHERE IN (SELECT...) is awkward to write portably).
-        # The loop is O(excess) single-row deletes, and excess is 1 in the
-        # steady state (one put, one eviction).
-        victims = await conn.fetch(
-            "SELECT cache_key FROM policy_cache WHERE policy_name = $1 ORDER BY created_at ASC, cache_key ASC LIMIT $2",
-            self._policy_name,
-            excess,
-        )
-        for row in victims:
-            await conn.execute(
-                "DELETE FROM policy_cache WHERE policy_name = $1 AND cache_key = $2",
-                self._policy_name,
-                row["cache_key"],
-            )
+                    await enforce_cap(conn, self._policy_name, self._max_entries)
 
     async def delete(self, key: str) -> None:
         """Remove a cache entry."""
+        if self._front is not None:
+            self._front.delete(self._policy_name, key)
+            return
         pool = await self._db.get_pool()
         await pool.execute(
             "DELETE FROM policy_cache WHERE policy_name = $1 AND cache_key = $2",
@@ -268,4 +329,15 @@ class PolicyCache:
         return count_raw
 
 
-__all__ = ["PolicyCache", "PolicyCacheFactory", "DEFAULT_MAX_ENTRIES", "build_factory"]
+__all__ = [
+    "PolicyCache",
+    "PolicyCacheFactory",
+    "DEFAULT_MAX_ENTRIES",
+    "build_factory",
+    "decode_value",
+    "enforce_cap",
+    "fetch_entry",
+    "format_expires_at",
+    "install_front",
+    "installed_front",
+]
@@ -0,0 +1,406 @@
+"""In-process read cache and write-behind buffer in front of ``PolicyCache``.
+
+Without a front, every ``PolicyCache.get`` is a SELECT and every ``put`` an
+upsert plus a count-and-evict, all on the request path. ``PolicyCacheFront``
+is one per-process object shared by every policy namespace:
+
+* **Reads** are served from a bounded TTL + LRU map. Misses load the row from
+  the database and keep it for at most ``l1_ttl_seconds`` (or the row's own
+  expiry, if sooner).
+* **Writes** update the map immediately and land in a pending map keyed by
+  ``(namespace, key)``, so repeated puts of one key coalesce into one row. A
+  background task flushes pending writes every ``flush_interval_seconds`` (or
+  once ``flush_size`` are pending) in one transaction: one multi-row upsert
+  and one delete per namespace, then one cap check per namespace.
+* **Invalidation**: after a flush commits, the written keys are published on
+  the invalidation bus (Redis pub/sub when available) and other replicas drop
+  them from their maps. Delivery is best-effort, so ``l1_ttl_seconds`` is the
+  staleness bound for a replica that misses a message.
+
+**Durability**: pending writes are lost if the process crashes before a
+flush, and a failed flush drops its batch (logged and counted). For a cache
+that only costs a recomputation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Protocol, runtime_checkable
+
+import redis.asyncio as redis
+
+from luthien_proxy.utils.db import DatabasePool, chunk_rows, values_placeholders
+from luthien_proxy.utils.policy_cache import enforce_cap, fetch_entry, format_expires_at
+
+logger = logging.getLogger(__name__)
+
+POLICY_CACHE_INVALIDATION_CHANNEL = "luthien:policy_cache:invalidate"
+DEFAULT_L1_MAX_ENTRIES = 10_000
+DEFAULT_L1_TTL_SECONDS = 60
+DEFAULT_FLUSH_SIZE = 200
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.5
+DEFAULT_MAX_PENDING = 10_000
+
+_RESUBSCRIBE_DELAY_SECONDS = 1.0
+
+type _EntryKey = tuple[str, str]
+
+
+@runtime_checkable
+class PolicyCacheInvalidationBusProtocol(Protocol):
+    """Broadcasts flushed policy-cache keys to every gateway replica."""
+
+    async def publish(self, message: str) -> None:
+        """Announce an invalidation message."""
+        ...
+
+    async def listen(self, on_message: Callable[[str], None]) -> None:
+        """Call ``on_message`` for every announcement until cancelled."""
+        ...
+
+
+class RedisPolicyCacheInvalidationBus:
+    """Redis pub/sub implementation of the invalidation bus (best-effort, no replay)."""
+
+    def __init__(self, client: redis.Redis, channel: str = POLICY_CACHE_INVALIDATION_CHANNEL) -> None:
+        """Initialize with a Redis client and channel name."""
+        self._redis = client
+        self._channel = channel
+
+    async def publish(self, message: str) -> None:
+        """Publish an invalidation. Failures are logged, never raised."""
+        try:
+            await self._redis.publish(self._channel, message)
+        except Exception as e:
+            logger.warning(f"Failed to publish policy cache invalidation: {repr(e)}")
+
+    async def listen(self, on_message: Callable[[str], None]) -> None:
+        """Subscribe and dispatch invalidations, resubscribing after errors."""
+        while True:
+            try:
+                async with self._redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self._channel)
+                    async for message in pubsub.listen():
+                        if message.get("type") != "message":
+                            continue
+                        data = message["data"]
+                        on_message(data if isinstance(data, str) else data.decode())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Policy cache invalidation subscriber error, resubscribing: {repr(e)}")
+                await asyncio.sleep(_RESUBSCRIBE_DELAY_SECONDS)
+
+
+@dataclass(slots=True)
+class _PendingWrite:
+    """A coalesced write waiting for the next flush. ``value_json`` None means delete."""
+
+    value_json: str | None
+    expires_at: datetime
+    cap: int | None
+
+
+class PolicyCacheFront:
+    """Shared L1 read cache and coalescing write-behind buffer for ``PolicyCache``.
+
+    Values are held as JSON text and decoded on every hit, so callers get a
+    fresh object exactly as they would from the database. ``get`` and the
+    synchronous ``put``/``delete`` have no ``await`` between reading and
+    updating the maps, so no lock is needed on a single event loop.
+    """
+
+    def __init__(
+        self,
+        db_pool: DatabasePool,
+        *,
+        l1_max_entries: int = DEFAULT_L1_MAX_ENTRIES,
+        l1_ttl_seconds: int = DEFAULT_L1_TTL_SECONDS,
+        flush_size: int = DEFAULT_FLUSH_SIZE,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        invalidation_bus: PolicyCacheInvalidationBusProtocol | None = None,
+    ) -> None:
+        """Initialize the front.
+
+        Args:
+            db_pool: Database pool the backing ``policy_cache`` table lives in.
+            l1_max_entries: In-process capacity; least-recently-used entries are evicted first.
+            l1_ttl_seconds: Longest an entry is served from memory without
+                rereading the database. Bounds staleness across replicas.
+            flush_size: Pending writes that wake the flusher early.
+            flush_interval_seconds: Longest a write waits before being flushed.
+            max_pending: Pending writes held at most; further writes to new
+                keys are dropped (and counted) until the next flush.
+            invalidation_bus: Fan-out for keys written by this replica.
+        """
+        if l1_max_entries < 1:
+            raise ValueError(f"l1_max_entries must be >= 1 (got {l1_max_entries})")
+        if l1_ttl_seconds < 1:
+            raise ValueError(f"l1_ttl_seconds must be >= 1 (got {l1_ttl_seconds})")
+        if flush_size < 1:
+            raise ValueError(f"flush_size must be >= 1 (got {flush_size})")
+        if flush_interval_seconds <= 0:
+            raise ValueError(f"flush_interval_seconds must be > 0 (got {flush_interval_seconds})")
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be >= 1 (got {max_pending})")
+        self.db_pool = db_pool
+        self._l1_max_entries = l1_max_entries
+        self._l1_ttl_seconds = l1_ttl_seconds
+        self._flush_size = flush_size
+        self._flush_interval_seconds = flush_interval_seconds
+        self._max_pending = max_pending
+        self._bus = invalidation_bus
+        self._origin = uuid.uuid4().hex
+        self._entries: OrderedDict[_EntryKey, tuple[str, float]] = OrderedDict()
+        self._pending: dict[_EntryKey, _PendingWrite] = {}
+        self._wakeup = asyncio.Event()
+        self._flush_task: asyncio.Task[None] | None = None
+        self._listen_task: asyncio.Task[None] | None = None
+        # Bumped by every local write and remote invalidation; a DB read that
+        # sees it change while in flight must not populate L1.
+        self._write_seq = 0
+        self._flush_lock = asyncio.Lock()
+        self._stopped = False
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._dropped_writes = 0
+        self._written = 0
+        self._flushes = 0
+        self._failed_flushes = 0
+        self._invalidations_received = 0
+        self._last_flush_seconds = 0.0
+        self._max_flush_seconds = 0.0
+
+    def stats(self) -> dict[str, int | float]:
+        """Snapshot of hit-rate and flush counters."""
+        lookups = self._hits + self._misses
+        return {
+            "l1_entries": len(self._entries),
+            "l1_max_entries": self._l1_max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            "pending_writes": len(self._pending),
+            "coalesced_writes": self._coalesced,
+            "dropped_writes": self._dropped_writes,
+            "written": self._written,
+            "flushes": self._flushes,
+            "failed_flushes": self._failed_flushes,
+            "last_flush_ms": round(self._last_flush_seconds * 1000, 3),
+            "max_flush_ms": round(self._max_flush_seconds * 1000, 3),
+            "invalidations_received": self._invalidations_received,
+        }
+
+    def start(self) -> None:
+        """Start the flusher (and invalidation listener). Must be called under a running event loop."""
+        if self._flush_task is not None:
+            return
+        self._flush_task = asyncio.create_task(self._run(), name="policy-cache-flush")
+        self._flush_task.add_done_callback(_log_task_exception)
+        if self._bus is not None:
+            self._listen_task = asyncio.create_task(self._bus.listen(self._on_invalidation), name="policy-cache-inval")
+            self._listen_task.add_done_callback(_log_task_exception)
+
+    async def stop(self) -> None:
+        """Stop background tasks and flush pending writes. Idempotent.
+
+        The flusher is asked to exit rather than cancelled, so a flush already
+        in flight completes instead of dropping its batch.
+        """
+        if self._stopped:
+            return
+        self._stopped = True
+        self._wakeup.set()
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            await asyncio.gather(self._listen_task, return_exceptions=True)
+            self._listen_task = None
+        if self._flush_task is not None:
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        await self.flush()
+
+    async def get(self, namespace: str, key: str) -> Any:
+        """Return the live value for ``key``, or None."""
+        entry_key = (namespace, key)
+        pending = self._pending.get(entry_key)
+        if pending is not None:
+            self._hits += 1
+            if pending.value_json is None or pending.expires_at <= datetime.now(timezone.utc):
+                return None
+            return json.loads(pending.value_json)
+
+        cached = self._entries.get(entry_key)
+        if cached is not None:
+            value_json, expires_at = cached
+            if time.monotonic() < expires_at:
+                self._entries.move_to_end(entry_key)
+                self._hits += 1
+                return json.loads(value_json)
+            del self._entries[entry_key]
+
+        self._misses += 1
+        write_seq = self._write_seq
+        loaded = await fetch_entry(self.db_pool, namespace, key)
+        if loaded is None:
+            return None
+        value, expires_at = loaded
+        # A write (possibly already flushed) or an invalidation may have
+        # landed while the SELECT was in flight; the row may be stale, so
+        # don't cache it.
+        if write_seq == self._write_seq:
+            remaining = (expires_at - datetime.now(timezone.utc)).total_seconds()
+            self._remember(entry_key, json.dumps(value), remaining)
+        return value
+
+    def put(self, namespace: str, key: str, value: Any, ttl_seconds: int, cap: int | None) -> None:
+        """Record a write; it reaches the database on the next flush."""
+        value_json = json.dumps(value)
+        self._remember((namespace, key), value_json, ttl_seconds)
+        self._enqueue((namespace, key), _PendingWrite(value_json, _expiry(ttl_seconds), cap))
+
+    def delete(self, namespace: str, key: str) -> None:
+        """Record a delete; it reaches the database on the next flush."""
+        self._entries.pop((namespace, key), None)
+        self._enqueue((namespace, key), _PendingWrite(None, _expiry(0), None))
+
+    async def flush(self) -> None:
+        """Write every pending change in one transaction and announce the keys."""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, {}
+            started = time.perf_counter()
+            try:
+                async with self.db_pool.connection() as conn:
+                    async with conn.transaction():
+                        await self._write_batch(conn, batch)
+            except asyncio.CancelledError:
+                # Put the batch back (newer writes to the same keys win) so the
+                # next flush retries it.
+                self._pending = {**batch, **self._pending}
+                raise
+            except Exception as e:
+                self._failed_flushes += 1
+                logger.warning(f"Failed to flush {len(batch)} policy cache write(s): {repr(e)}", exc_info=True)
+                return
+            finally:
+                elapsed = time.perf_counter() - started
+                self._last_flush_seconds = elapsed
+                self._max_flush_seconds = max(self._max_flush_seconds, elapsed)
+            self._flushes += 1
+            self._written += len(batch)
+            if self._bus is not None:
+                await self._bus.publish(json.dumps({"origin": self._origin, "keys": [list(k) for k in batch]}))
+
+    def _enqueue(self, entry_key: _EntryKey, write: _PendingWrite) -> None:
+        self._write_seq += 1
+        if entry_key in self._pending:
+            self._coalesced += 1
+        elif len(self._pending) >= self._max_pending:
+            self._dropped_writes += 1
+            n = self._dropped_writes
+            if n in (1, 10, 100, 1000) or n % 1000 == 0:
+                logger.warning("Policy cache write-behind full: dropped %d write(s)", n)
+            return
+        self._pending[entry_key] = write
+        if len(self._pending) >= self._flush_size:
+            self._wakeup.set()
+
+    def _remember(self, entry_key: _EntryKey, value_json: str, ttl_seconds: float) -> None:
+        lifetime = min(ttl_seconds, self._l1_ttl_seconds)
+        if lifetime <= 0:
+            self._entries.pop(entry_key, None)
+            return
+        self._entries[entry_key] = (value_json, time.monotonic() + lifetime)
+        self._entries.move_to_end(entry_key)
+        while len(self._entries) > self._l1_max_entries:
+            self._entries.popitem(last=False)
+
+    async def _write_batch(self, conn: Any, batch: dict[_EntryKey, _PendingWrite]) -> None:
+        is_sqlite = self.db_pool.is_sqlite
+        upserts: list[tuple[str, str, str, str]] = []
+        deletes: dict[str, list[str]] = {}
+        caps: dict[str, int] = {}
+        for (namespace, key), write in batch.items():
+            if write.value_json is None:
+                deletes.setdefault(namespace, []).append(key)
+                continue
+            upserts.append((namespace, key, write.value_json, format_expires_at(write.expires_at, is_sqlite=is_sqlite)))
+            if write.cap is not None:
+                caps[namespace] = min(write.cap, caps.get(namespace, write.cap))
+
+        for chunk in chunk_rows(upserts, 4):
+            await conn.execute(
+                f"""
+                INSERT INTO policy_cache (policy_name, cache_key, value_json, expires_at)
+                VALUES {values_placeholders(len(chunk), 4)}
+                ON CONFLICT (policy_name, cache_key) DO UPDATE SET
+                    value_json = EXCLUDED.value_json,
+                    expires_at = EXCLUDED.expires_at
+                """,
+                *[value for row in chunk for value in row],
+            )
+        for namespace, keys in deletes.items():
+            for chunk in chunk_rows(keys, 1):
+                placeholders = ", ".join(f"${i + 2}" for i in range(len(chunk)))
+                await conn.execute(
+                    f"DELETE FROM policy_cache WHERE policy_name = $1 AND cache_key IN ({placeholders})",
+                    namespace,
+                    *chunk,
+                )
+        for namespace, cap in caps.items():
+            await enforce_cap(conn, namespace, cap)
+
+    def _on_invalidation(self, message: str) -> None:
+        try:
+            payload = json.loads(message)
+            if payload.get("origin") == self._origin:
+                return
+            keys = [(str(ns), str(key)) for ns, key in payload.get("keys", [])]
+        except (ValueError, TypeError, AttributeError):
+            logger.warning("Ignoring malformed policy cache invalidation message")
+            return
+        self._invalidations_received += 1
+        self._write_seq += 1
+        for entry_key in keys:
+            self._entries.pop(entry_key, None)
+
+    async def _run(self) -> None:
+        while not self._stopped:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval_seconds)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.error("Unexpected error flushing policy cache writes", exc_info=True)
+
+
+def _expiry(ttl_seconds: int) -> datetime:
+    return datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+
+
+def _log_task_exception(task: asyncio.Task[None]) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Policy cache background task failed", exc_info=task.exception())
+
+
+__all__ = [
+    "POLICY_CACHE_INVALIDATION_CHANNEL",
+    "PolicyCacheFront",
+    "PolicyCacheInvalidationBusProtocol",
+    "RedisPolicyCacheInvalidationBus",
+]
@@ -1,10 +1,12 @@
-"""Dialect-agnostic helpers for conversation-event full-text search.
+"""Dialect-agnostic helpers for session full-text search.
 
-Postgres uses the ``conversation_events.search_vector`` tsvector column (see
-migration 014). SQLite uses the ``conversation_events_fts`` FTS5 virtual
-table. Callers use :func:`session_fts_filter_sql` to get a dialect-correct
-SQL predicate plus a sanitized bind value and never branch on
-``is_postgres`` themselves.
+Both backends search ``session_search_index`` (migration 024), which holds the
+new conversation text of each call (see
+:mod:`luthien_proxy.observability.search_index`). Postgres matches its
+``search_vector`` generated tsvector column; SQLite matches the
+``session_search_fts`` FTS5 table that indexes it. Callers use
+:func:`session_fts_filter_sql` to get a dialect-correct SQL predicate plus a
+sanitized bind value and never branch on ``is_postgres`` themselves.
 
 Parity goals between backends:
 * Stemming: Postgres `to_tsvector('english', ...)` + `plainto_tsquery('english', ...)`
@@ -50,7 +52,7 @@ def session_fts_filter_sql(
     *,
     placeholder: str,
 ) -> tuple[str, str]:
-    """Return ``(sql_fragment, bind_value)`` for a full-text filter on conversation events.
+    """Return ``(sql_fragment, bind_value)`` for a full-text filter on the session search index.
 
     Args:
         pool: Pool used only to dispatch on dialect.
@@ -66,18 +68,16 @@ def session_fts_filter_sql(
     Returns:
         ``(sql_fragment, bind_value)``:
 
-        * ``sql_fragment`` references the alias ``ce`` (i.e. the caller's query
-          must use ``FROM conversation_events ce``) and matches events whose
-          full-text index contains the query bound to ``placeholder``.
+        * ``sql_fragment`` references the alias ``si`` (i.e. the caller's query
+          must use ``FROM session_search_index si``) and matches index rows
+          whose text contains the query bound to ``placeholder``.
         * ``bind_value`` is the string the caller should append to its
           parameter list at the position matching ``placeholder``.
     """
     if pool.is_sqlite:
-        fragment = (
-            f"ce.id IN (SELECT event_id FROM conversation_events_fts WHERE conversation_events_fts MATCH {placeholder})"
-        )
+        fragment = f"si.id IN (SELECT rowid FROM session_search_fts WHERE session_search_fts MATCH {placeholder})"
         return fragment, _fts5_query_from_user_input(query)
-    fragment = f"ce.search_vector @@ plainto_tsquery('english', {placeholder})"
+    fragment = f"si.search_vector @@ plainto_tsquery('english', {placeholder})"
     return fragment, query
 
 
@@ -0,0 +1,146 @@
+-- ABOUTME: Replaces the per-event conversation_events_fts triggers (014/022) with session_search_index,
+-- ABOUTME: which holds only the user and assistant text each call introduced.
+-- ABOUTME: session_search_fts is an external-content FTS5 index over it, synced by triggers.
+--
+-- See the Postgres migration for the rationale. The porter tokenizer keeps stemming
+-- parity with the Postgres to_tsvector('english', ...) column.
+
+CREATE TABLE IF NOT EXISTS session_search_index (
+    id INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    call_id TEXT NOT NULL REFERENCES conversation_calls(call_id) ON DELETE CASCADE,
+    content TEXT NOT NULL,
+    created_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_session_search_index_call
+    ON session_search_index(call_id);
+
+CREATE TABLE IF NOT EXISTS session_search_state (
+    session_id TEXT PRIMARY KEY,
+    message_count INTEGER NOT NULL
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS session_search_fts USING fts5(
+    content,
+    content = 'session_search_index',
+    content_rowid = 'id',
+    tokenize = 'porter'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_session_search_index_fts_insert
+AFTER INSERT ON session_search_index
+BEGIN
+    INSERT INTO session_search_fts(rowid, content) VALUES (NEW.id, NEW.content);
+END;
+
+-- Fires for the ON DELETE CASCADE from conversation_calls as well.
+CREATE TRIGGER IF NOT EXISTS trg_session_search_index_fts_delete
+AFTER DELETE ON session_search_index
+BEGIN
+    INSERT INTO session_search_fts(session_search_fts, rowid, content) VALUES ('delete', OLD.id, OLD.content);
+END;
+
+-- Backfill from the stored events with the same rules as the Python indexer (see
+-- the Postgres migration). json_each keys are 0-based, so a message is new when
+-- its key is at least the previous call's message count.
+CREATE TEMP TABLE _search_requests AS
+SELECT
+    session_id,
+    call_id,
+    created_at,
+    json_extract(body, '$.messages') AS messages,
+    json_array_length(body, '$.messages') AS message_count,
+    LAG(json_array_length(body, '$.messages')) OVER (
+        PARTITION BY session_id ORDER BY created_at, id
+    ) AS previous_count,
+    ROW_NUMBER() OVER (PARTITION BY session_id ORDER BY created_at DESC, id DESC) AS recency
+FROM (
+    SELECT
+        ce.id,
+        ce.session_id,
+        ce.call_id,
+        ce.created_at,
+        COALESCE(json_extract(ce.payload, '$.original_request'), json_extract(ce.payload, '$.final_request')) AS body
+    FROM conversation_events ce
+    WHERE ce.event_type = 'transaction.request_recorded'
+      AND ce.session_id IS NOT NULL
+)
+WHERE json_type(body, '$.messages') = 'array'
+  AND CASE
+      WHEN json_type(body, '$.max_tokens') IN ('integer', 'real') THEN json_extract(body, '$.max_tokens') > 1
+      ELSE 1
+  END;
+
+WITH new_messages AS (
+    SELECT sr.session_id, sr.call_id, sr.created_at, m.key AS ord, COALESCE(b.content, m.value) AS body
+    FROM _search_requests sr
+    JOIN json_each(sr.messages) AS m
+    LEFT JOIN conversation_message_blobs b ON b.digest = json_extract(m.value, '$.blob_ref')
+    WHERE m.type = 'object'
+      AND m.key >= CASE
+          WHEN sr.previous_count IS NULL OR sr.message_count < sr.previous_count THEN 0
+          ELSE sr.previous_count
+      END
+),
+user_texts AS (
+    SELECT session_id, call_id, created_at, ord, 0 AS block_ord, TRIM(json_extract(body, '$.content')) AS text
+    FROM new_messages
+    WHERE json_extract(body, '$.role') = 'user'
+      AND json_type(body, '$.content') = 'text'
+    UNION ALL
+    SELECT nm.session_id, nm.call_id, nm.created_at, nm.ord, block.key, TRIM(json_extract(block.value, '$.text'))
+    FROM new_messages nm
+    JOIN json_each(nm.body, '$.content') AS block
+    WHERE json_extract(nm.body, '$.role') = 'user'
+      AND json_type(nm.body, '$.content') = 'array'
+      AND json_extract(block.value, '$.type') = 'text'
+)
+INSERT INTO session_search_index (session_id, call_id, content, created_at)
+SELECT session_id, call_id, group_concat(text, ' '), created_at
+FROM (
+    SELECT * FROM user_texts
+    WHERE text IS NOT NULL AND text != ''
+    ORDER BY call_id, ord, block_ord
+)
+GROUP BY session_id, call_id, created_at;
+
+INSERT INTO session_search_index (session_id, call_id, content, created_at)
+SELECT session_id, call_id, group_concat(text, ' '), created_at
+FROM (
+    SELECT * FROM (
+        SELECT ce.id, ce.session_id, ce.call_id, ce.created_at, 0 AS ord,
+               TRIM(json_extract(ce.payload, '$.final_response.content')) AS text
+        FROM conversation_events ce
+        WHERE ce.event_type IN (
+                'transaction.streaming_response_recorded', 'transaction.non_streaming_response_recorded'
+            )
+          AND ce.session_id IS NOT NULL
+          AND json_type(ce.payload, '$.final_response.content') = 'text'
+        UNION ALL
+        SELECT ce.id, ce.session_id, ce.call_id, ce.created_at, block.key,
+               TRIM(json_extract(block.value, '$.text'))
+        FROM conversation_events ce
+        JOIN json_each(ce.payload, '$.final_response.content') AS block
+        WHERE ce.event_type IN (
+                'transaction.streaming_response_recorded', 'transaction.non_streaming_response_recorded'
+            )
+          AND ce.session_id IS NOT NULL
+          AND json_type(ce.payload, '$.final_response.content') = 'array'
+          AND json_extract(block.value, '$.type') = 'text'
+    )
+    WHERE text IS NOT NULL AND text != ''
+    ORDER BY id, ord
+)
+GROUP BY id, session_id, call_id, created_at;
+
+INSERT INTO session_search_state (session_id, message_count)
+SELECT session_id, message_count FROM _search_requests WHERE recency = 1
+ON CONFLICT (session_id) DO NOTHING;
+
+DROP TABLE _search_requests;
+
+-- Retire the per-event index.
+DROP TRIGGER IF EXISTS trg_conversation_events_fts_insert;
+DROP TRIGGER IF EXISTS trg_conversation_events_fts_delete;
+DROP TABLE IF EXISTS conversation_events_fts;
@@ -17,21 +17,20 @@ import pytest
 MIGRATIONS_ROOT = Path(__file__).resolve().parents[3] / "migrations"
 
 # Tables that legitimately diverge between backends.
-# - conversation_events_fts*: SQLite FTS5 virtual table + shadow tables. The
-#   Postgres equivalent is a tsvector column, not a separate table.
+# - session_search_fts*: SQLite FTS5 virtual table + shadow tables over
+#   session_search_index. The Postgres equivalent is a tsvector column.
 FTS_SQLITE_TABLES = {
-    "conversation_events_fts",
-    "conversation_events_fts_data",
-    "conversation_events_fts_idx",
-    "conversation_events_fts_docsize",
-    "conversation_events_fts_config",
-    "conversation_events_fts_content",
+    "session_search_fts",
+    "session_search_fts_data",
+    "session_search_fts_idx",
+    "session_search_fts_docsize",
+    "session_search_fts_config",
 }
 
 # Columns that legitimately diverge between backends.
-# - conversation_events.search_vector: Postgres tsvector, no SQLite equivalent.
+# - session_search_index.search_vector: Postgres tsvector, no SQLite equivalent.
 DIVERGENT_COLUMNS: dict[str, set[str]] = {
-    "conversation_events": {"search_vector"},
+    "session_search_index": {"search_vector"},
 }
 
 # Dialect type normalization: map Postgres types to their SQLite equivalents
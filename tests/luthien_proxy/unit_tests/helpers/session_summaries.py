@@ -0,0 +1,60 @@
+"""Test helpers for the ``session_summaries`` materialized table.
+
+The history list reads ``session_summaries``, which the event write path
+maintains. Tests that seed ``conversation_events`` with raw INSERTs bypass that
+path, so they rebuild the table from the seeded events before listing.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from luthien_proxy.history import service
+from luthien_proxy.history.models import SessionListResponse
+from luthien_proxy.utils.db import DatabasePool
+
+
+async def rebuild_session_summaries(pool: DatabasePool) -> None:
+    """Recompute every ``session_summaries`` row from ``conversation_events`` (SQLite).
+
+    Same aggregation as the migration 021 backfill, with the intervention
+    predicate from migration 023. Also drops cached list totals.
+    """
+    async with pool.connection() as conn:
+        await conn.execute("DELETE FROM session_summaries")
+        await conn.execute(
+            """
+            INSERT INTO session_summaries (
+                session_id, first_seen, last_seen, event_count, call_count, policy_event_count, user_id, models_used
+            )
+            SELECT
+                ce.session_id,
+                MIN(ce.created_at),
+                MAX(ce.created_at),
+                COUNT(*),
+                SUM(CASE WHEN ce.event_type = 'transaction.request_recorded' THEN 1 ELSE 0 END),
+                SUM(CASE
+                    WHEN ce.event_type LIKE 'policy.%'
+                    AND ce.event_type NOT LIKE 'policy.%judge.evaluation%'
+                    THEN 1 ELSE 0
+                END),
+                (SELECT cc.user_id FROM conversation_calls cc
+                   WHERE cc.session_id = ce.session_id AND cc.user_id IS NOT NULL
+                   ORDER BY cc.created_at LIMIT 1),
+                (SELECT GROUP_CONCAT(DISTINCT json_extract(ce2.payload, '$.final_model'))
+                   FROM conversation_events ce2
+                   WHERE ce2.session_id = ce.session_id
+                     AND ce2.event_type = 'transaction.request_recorded'
+                     AND json_extract(ce2.payload, '$.final_model') IS NOT NULL)
+            FROM conversation_events ce
+            WHERE ce.session_id IS NOT NULL
+            GROUP BY ce.session_id
+            """
+        )
+    service._clear_session_total_cache()
+
+
+async def fetch_session_list(limit: int, db_pool: DatabasePool, *args: Any, **kwargs: Any) -> SessionListResponse:
+    """``service.fetch_session_list`` over summaries rebuilt from the seeded events."""
+    await rebuild_session_summaries(db_pool)
+    return await service.fetch_session_list(limit, db_pool, *args, **kwargs)
@@ -22,9 +22,11 @@ from luthien_proxy.history.models import (
 )
 from luthien_proxy.history.routes import (
     export_session,
+    export_session_jsonl_endpoint,
     get_session,
     list_sessions,
 )
+from luthien_proxy.history.service import SessionOutline, export_session_jsonl, export_session_markdown
 
 AUTH_TOKEN = "test-admin-key"
 
@@ -63,6 +65,7 @@ class TestListSessionsRoute:
                 db_pool=mock_db_pool,
                 limit=50,
                 offset=0,
+                cursor=None,
                 user_id=None,
                 model=None,
                 from_time=None,
@@ -77,7 +80,9 @@ class TestListSessionsRoute:
             assert result.has_more is True
             assert len(result.sessions) == 1
             assert result.sessions[0].session_id == "session-1"
-            mock_fetch.assert_called_once_with(50, mock_db_pool, 0, user_id=None, search=SessionSearchParams())
+            mock_fetch.assert_called_once_with(
+                50, mock_db_pool, 0, user_id=None, search=SessionSearchParams(), cursor=None
+            )
 
     @pytest.mark.asyncio
     async def test_list_sessions_custom_limit(self):
@@ -94,6 +99,7 @@ class TestListSessionsRoute:
                 db_pool=mock_db_pool,
                 limit=100,
                 offset=0,
+                cursor=None,
                 user_id=None,
                 model=None,
                 from_time=None,
@@ -101,7 +107,9 @@ class TestListSessionsRoute:
                 q=None,
                 policy_intervention=False,
             )
-            mock_fetch.assert_called_once_with(100, mock_db_pool, 0, user_id=None, search=SessionSearchParams())
+            mock_fetch.assert_called_once_with(
+                100, mock_db_pool, 0, user_id=None, search=SessionSearchParams(), cursor=None
+            )
 
     @pytest.mark.asyncio
     async def test_list_sessions_with_offset(self):
@@ -124,6 +132,7 @@ class TestListSessionsRoute:
                 db_pool=mock_db_pool,
                 limit=50,
                 offset=50,
+                cursor=None,
                 user_id=None,
                 model=None,
                 from_time=None,
@@ -134,7 +143,9 @@ class TestListSessionsRoute:
 
             assert result.offset == 50
             assert result.has_more is True
-            mock_fetch.assert_called_once_with(50, mock_db_pool, 50, user_id=None, search=SessionSearchParams())
+            mock_fetch.assert_called_once_with(
+                50, mock_db_pool, 50, user_id=None, search=SessionSearchParams(), cursor=None
+            )
 
     @pytest.mark.asyncio
     async def test_list_sessions_forwards_search_filters(self):
@@ -152,6 +163,7 @@ class TestListSessionsRoute:
                 db_pool=mock_db_pool,
                 limit=50,
                 offset=0,
+                cursor=None,
                 user_id="sami",
                 model="claude-opus-4-6",
                 from_time=datetime(2026, 4, 1),
@@ -171,6 +183,7 @@ class TestListSessionsRoute:
                     q="error",
                     policy_intervention=True,
                 ),
+                cursor=None,
             )
 
     @pytest.mark.asyncio
@@ -188,6 +201,7 @@ class TestListSessionsRoute:
                 db_pool=mock_db_pool,
                 limit=50,
                 offset=0,
+                cursor=None,
                 user_id=None,
                 model=None,
                 from_time=None,
@@ -200,6 +214,33 @@ class TestListSessionsRoute:
             assert result.sessions == []
             assert result.has_more is False
 
+    @pytest.mark.asyncio
+    async def test_list_sessions_invalid_cursor_returns_400(self):
+        """A malformed cursor (ValueError from the service) maps to 400."""
+        mock_db_pool = MagicMock()
+
+        with patch(
+            "luthien_proxy.history.routes.fetch_session_list",
+            new_callable=AsyncMock,
+            side_effect=ValueError("Invalid session list cursor: 'garbage'"),
+        ):
+            with pytest.raises(HTTPException) as exc_info:
+                await list_sessions(
+                    _=AUTH_TOKEN,
+                    db_pool=mock_db_pool,
+                    limit=50,
+                    offset=0,
+                    cursor="garbage",
+                    user_id=None,
+                    model=None,
+                    from_time=None,
+                    to_time=None,
+                    q=None,
+                    policy_intervention=False,
+                )
+
+            assert exc_info.value.status_code == 400
+
 
 class TestGetSessionRoute:
     """Test get_session route handler."""
@@ -232,12 +273,24 @@ class TestGetSessionRoute:
             new_callable=AsyncMock,
             return_value=expected_detail,
         ) as mock_fetch:
-            result = await get_session(session_id="test-session", _=AUTH_TOKEN, db_pool=mock_db_pool)
+            result = await get_session(
+                session_id="test-session", offset=0, limit=None, _=AUTH_TOKEN, db_pool=mock_db_pool
+            )
 
             assert isinstance(result, SessionDetail)
             assert result.session_id == "test-session"
             assert len(result.turns) == 1
-            mock_fetch.assert_called_once_with("test-session", mock_db_pool)
+            mock_fetch.assert_called_once_with("test-session", mock_db_pool, offset=0, limit=None)
+
+    @pytest.mark.asyncio
+    async def test_get_session_passes_turn_range(self):
+        """offset/limit query params are forwarded to the service."""
+        mock_db_pool = MagicMock()
+
+        with patch("luthien_proxy.history.routes.fetch_session_detail", new_callable=AsyncMock) as mock_fetch:
+            await get_session(session_id="test-session", offset=10, limit=5, _=AUTH_TOKEN, db_pool=mock_db_pool)
+
+            mock_fetch.assert_called_once_with("test-session", mock_db_pool, offset=10, limit=5)
 
     @pytest.mark.asyncio
     async def test_get_session_not_found(self):
@@ -250,49 +303,98 @@ class TestGetSessionRoute:
             side_effect=ValueError("No events found for session_id: nonexistent"),
         ):
             with pytest.raises(HTTPException) as exc_info:
-                await get_session(session_id="nonexistent", _=AUTH_TOKEN, db_pool=mock_db_pool)
+                await get_session(session_id="nonexistent", offset=0, limit=None, _=AUTH_TOKEN, db_pool=mock_db_pool)
 
             assert exc_info.value.status_code == 404
             assert exc_info.value.detail == "Session not found."
 
 
+def _outline(session_id: str, call_ids: list[str]) -> SessionOutline:
+    return SessionOutline(
+        session_id=session_id,
+        first_timestamp="2025-01-15T10:00:00",
+        last_timestamp="2025-01-15T11:00:00",
+        call_ids=call_ids,
+        models_used=["gpt-4"],
+        total_policy_interventions=0,
+    )
+
+
+def _patch_turns(turns: list[ConversationTurn]):
+    async def iter_turns(*args, **kwargs):
+        for turn in turns:
+            yield turn
+
+    return patch("luthien_proxy.history.service.iter_session_turns", iter_turns)
+
+
+async def _read_body(response) -> str:
+    return "".join([chunk async for chunk in response.body_iterator])
+
+
 class TestExportSessionRoute:
-    """Test export_session route handler."""
+    """Test export route handlers."""
+
+    _TURN = ConversationTurn(
+        call_id="call-1",
+        timestamp="2025-01-15T10:00:00",
+        model="gpt-4",
+        request_messages=[ConversationMessage(message_type=MessageType.USER, content="Hello")],
+        response_messages=[ConversationMessage(message_type=MessageType.ASSISTANT, content="Hi!")],
+        annotations=[],
+        had_policy_intervention=False,
+    )
 
     @pytest.mark.asyncio
     async def test_successful_export(self):
-        """Test successful export returns markdown."""
+        """Test successful export streams markdown."""
+        mock_db_pool = MagicMock()
+
+        with (
+            patch(
+                "luthien_proxy.history.routes.fetch_session_outline",
+                new_callable=AsyncMock,
+                return_value=_outline("test-session", ["call-1"]),
+            ),
+            _patch_turns([self._TURN]),
+        ):
+            result = await export_session(session_id="test-session", _=AUTH_TOKEN, db_pool=mock_db_pool)
+            body = await _read_body(result)
+
+        assert result.media_type == "text/markdown"
+        assert "# Conversation History: test-session" in body
+        assert "## Turn 1" in body
+        assert "Content-Disposition" in result.headers
+        assert 'filename="conversation_test-session.md"' in result.headers["Content-Disposition"]
+
+    @pytest.mark.asyncio
+    async def test_streamed_export_matches_whole_export(self):
+        """Streaming produces byte-for-byte the same document as export_session_markdown."""
         mock_db_pool = MagicMock()
-        session_detail = SessionDetail(
+        outline = _outline("test-session", ["call-1", "call-2"])
+        turns = [self._TURN, self._TURN.model_copy(update={"call_id": "call-2"})]
+        detail = SessionDetail(
             session_id="test-session",
-            first_timestamp="2025-01-15T10:00:00",
-            last_timestamp="2025-01-15T11:00:00",
-            turns=[
-                ConversationTurn(
-                    call_id="call-1",
-                    timestamp="2025-01-15T10:00:00",
-                    model="gpt-4",
-                    request_messages=[ConversationMessage(message_type=MessageType.USER, content="Hello")],
-                    response_messages=[ConversationMessage(message_type=MessageType.ASSISTANT, content="Hi!")],
-                    annotations=[],
-                    had_policy_intervention=False,
-                )
-            ],
+            first_timestamp=outline.first_timestamp,
+            last_timestamp=outline.last_timestamp,
+            turns=turns,
             total_policy_interventions=0,
             models_used=["gpt-4"],
         )
 
-        with patch(
-            "luthien_proxy.history.routes.fetch_session_detail",
-            new_callable=AsyncMock,
-            return_value=session_detail,
+        with (
+            patch("luthien_proxy.history.routes.fetch_session_outline", new_callable=AsyncMock, return_value=outline),
+            _patch_turns(turns),
         ):
-            result = await export_session(session_id="test-session", _=AUTH_TOKEN, db_pool=mock_db_pool)
+            markdown = await _read_body(
+                await export_session(session_id="test-session", _=AUTH_TOKEN, db_pool=mock_db_pool)
+            )
+            jsonl = await _read_body(
+                await export_session_jsonl_endpoint(session_id="test-session", _=AUTH_TOKEN, db_pool=mock_db_pool)
+            )
 
-            assert result.media_type == "text/markdown"
-            assert "# Conversation History: test-session" in result.body.decode()
-            assert "Content-Disposition" in result.headers
-            assert 'filename="conversation_test-session.md"' in result.headers["Content-Disposition"]
+        assert markdown == export_session_markdown(detail)
+        assert jsonl == export_session_jsonl(detail)
 
     @pytest.mark.asyncio
     async def test_export_not_found(self):
@@ -300,7 +402,7 @@ class TestExportSessionRoute:
         mock_db_pool = MagicMock()
 
         with patch(
-            "luthien_proxy.history.routes.fetch_session_detail",
+            "luthien_proxy.history.routes.fetch_session_outline",
             new_callable=AsyncMock,
             side_effect=ValueError("No events found for session_id: nonexistent"),
         ):
@@ -310,23 +412,30 @@ class TestExportSessionRoute:
             assert exc_info.value.status_code == 404
             assert exc_info.value.detail == "Session not found."
 
+    @pytest.mark.asyncio
+    async def test_jsonl_export_not_found(self):
+        """The JSONL export checks the session exists before streaming."""
+        mock_db_pool = MagicMock()
+
+        with patch(
+            "luthien_proxy.history.routes.fetch_session_outline",
+            new_callable=AsyncMock,
+            side_effect=ValueError("No events found for session_id: nonexistent"),
+        ):
+            with pytest.raises(HTTPException) as exc_info:
+                await export_session_jsonl_endpoint(session_id="nonexistent", _=AUTH_TOKEN, db_pool=mock_db_pool)
+
+            assert exc_info.value.status_code == 404
+
     @pytest.mark.asyncio
     async def test_export_filename_sanitization(self):
         """Test that session IDs with special characters are sanitized in filename."""
         mock_db_pool = MagicMock()
-        session_detail = SessionDetail(
-            session_id="test<script>alert(1)</script>",
-            first_timestamp="2025-01-15T10:00:00",
-            last_timestamp="2025-01-15T11:00:00",
-            turns=[],
-            total_policy_interventions=0,
-            models_used=[],
-        )
 
         with patch(
-            "luthien_proxy.history.routes.fetch_session_detail",
+            "luthien_proxy.history.routes.fetch_session_outline",
             new_callable=AsyncMock,
-            return_value=session_detail,
+            return_value=_outline("test<script>alert(1)</script>", []),
         ):
             result = await export_session(
                 session_id="test<script>alert(1)</script>",
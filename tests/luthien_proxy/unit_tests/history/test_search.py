@@ -3,7 +3,8 @@
 The end-to-end filter behavior (model / time range / full-text ``q`` /
 policy_intervention) is exercised against a real in-memory SQLite database with
 all migrations applied, so the FTS5 virtual table and its sync triggers are
-live — these are integration-grade unit tests, not mock-driven.
+live — these are integration-grade unit tests, not mock-driven. Seeded request
+events go through the same search indexer as the emitter's write path.
 
 The Postgres dialect has no test tier in this repo, so its clause shape is
 covered by direct unit tests of ``_build_session_filter_sql`` with a fake
@@ -18,9 +19,11 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
+from tests.luthien_proxy.unit_tests.helpers.session_summaries import fetch_session_list
 
 from luthien_proxy.history.models import SessionSearchParams
-from luthien_proxy.history.service import _build_session_filter_sql, fetch_session_list
+from luthien_proxy.history.service import _build_session_filter_sql
+from luthien_proxy.observability.search_index import SearchIndexEvent, index_session_search_text
 from luthien_proxy.utils.db import DatabasePool
 from luthien_proxy.utils.db_sqlite import SqliteConnection
 
@@ -51,9 +54,15 @@ async def _seed_request(
 ) -> None:
     """Insert one conversation_calls row + one request_recorded event.
 
-    The FTS5 insert trigger fires on the event, indexing ``content`` from the
-    payload's first user message.
+    ``content`` is the payload's only user message. It is added to the session
+    search index as if the request opened its session: the stored message
+    count is reset first, since every seeded request carries a one-message
+    history rather than a growing one.
     """
+    payload = {
+        "final_model": model,
+        "final_request": {"messages": [{"role": "user", "content": content}]},
+    }
     async with pool.connection() as conn:
         await conn.execute(
             """
@@ -76,15 +85,23 @@ async def _seed_request(
             event_id or f"event-{call_id}",
             call_id,
             "transaction.request_recorded",
-            json.dumps(
-                {
-                    "final_model": model,
-                    "final_request": {"messages": [{"role": "user", "content": content}]},
-                }
-            ),
+            json.dumps(payload),
             session_id,
             created_at,
         )
+        await conn.execute("DELETE FROM session_search_state WHERE session_id = ?", session_id)
+        await index_session_search_text(
+            conn,
+            [
+                SearchIndexEvent(
+                    call_id=call_id,
+                    session_id=session_id,
+                    event_type="transaction.request_recorded",
+                    data=payload,
+                    timestamp=datetime.fromisoformat(created_at),
+                )
+            ],
+        )
 
 
 async def _add_event(
@@ -407,7 +424,7 @@ class TestSearchInjectionSafe:
         result = await fetch_session_list(
             limit=10,
             db_pool=sqlite_pool,
-            search=SessionSearchParams(q="needle'; DROP TABLE conversation_events_fts;--"),
+            search=SessionSearchParams(q="needle'; DROP TABLE session_search_index;--"),
         )
         assert result.sessions == []
         # FTS table and base data both intact.
@@ -420,7 +437,7 @@ class TestUserScopedSearch:
     async def test_q_filter_does_not_match_another_users_text_in_shared_session(self, sqlite_pool: DatabasePool):
         """Under ?user_id=alice, q must only match alice's events — not bob's, in a shared session.
 
-        This is the cross-user content-isolation property the user_scope_sql threading exists for:
+        This is the cross-user content-isolation property the user_id_placeholder threading exists for:
         without it, the q gate subquery would qualify the shared session on bob's matching text.
         """
         # Bob's call carries the searched term; alice's does not.
@@ -508,13 +525,14 @@ class TestBuildSessionFilterSql:
         args: list = []
         gates, having = _build_session_filter_sql(SessionSearchParams(q="needle"), _FakePool(is_postgres=True), args)
         assert len(gates) == 1
-        assert "search_vector @@ plainto_tsquery('english', $1)" in gates[0]
+        assert "FROM session_search_index si" in gates[0]
+        assert "si.search_vector @@ plainto_tsquery('english', $1)" in gates[0]
         assert args == ["needle"]  # raw value bound; PG sanitizes via plainto_tsquery
 
     def test_sqlite_q_uses_fts_match_table(self):
         args: list = []
         gates, _ = _build_session_filter_sql(SessionSearchParams(q="needle"), _FakePool(is_postgres=False), args)
-        assert "conversation_events_fts MATCH $1" in gates[0]
+        assert "session_search_fts MATCH $1" in gates[0]
         assert args == ['"needle"']  # phrase-quoted for FTS5
 
     def test_postgres_model_uses_jsonb_arrow(self):
@@ -560,13 +578,14 @@ class TestBuildSessionFilterSql:
         )
         assert sqlite_args == [dt.isoformat(), dt.isoformat()]
 
-    def test_user_scope_sql_appended_to_gate_subqueries(self):
-        args: list = []
-        scope = "AND ce.call_id IN (SELECT call_id FROM conversation_calls WHERE user_id = $3)"
+    def test_user_scope_appended_to_gate_subqueries(self):
+        args: list = ["limit", "offset", "alice"]
         gates, _ = _build_session_filter_sql(
-            SessionSearchParams(model="gpt-4"), _FakePool(is_postgres=True), args, user_scope_sql=scope
+            SessionSearchParams(model="gpt-4", q="needle"), _FakePool(is_postgres=True), args, user_id_placeholder="$3"
         )
-        assert scope in gates[0]
+        users_calls = "(SELECT call_id FROM conversation_calls WHERE user_id = $3)"
+        assert f"AND ce.call_id IN {users_calls}" in gates[0]
+        assert f"AND si.call_id IN {users_calls}" in gates[1]
 
 
 __all__ = []
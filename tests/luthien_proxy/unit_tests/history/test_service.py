@@ -975,75 +975,131 @@ class TestBuildTurn:
 class TestFetchSessionList:
     """Test fetching session list from database."""
 
+    @staticmethod
+    def _summary_row(session_id: str, **overrides):
+        row = {
+            "session_id": session_id,
+            "first_ts": datetime(2025, 1, 15, 10, 0, 0),
+            "last_ts": datetime(2025, 1, 15, 11, 0, 0),
+            "total_events": 5,
+            "turn_count": 2,
+            "policy_interventions": 0,
+            "models_used": "gpt-4",
+        }
+        row.update(overrides)
+        return row
+
+    @staticmethod
+    def _pg_pool(mock_conn):
+        mock_pool = MagicMock()
+        mock_pool.is_sqlite = False
+        mock_pool.is_postgres = True
+        mock_pool.connection.return_value.__aenter__.return_value = mock_conn
+        return mock_pool
+
     @pytest.mark.asyncio
     async def test_successful_fetch(self):
         """Test successful session list fetching."""
         mock_rows = [
+            self._summary_row(
+                "session-1", total_events=10, turn_count=3, policy_interventions=1, models_used="gpt-4,claude-3"
+            ),
+        ]
+        preview_rows = [
             {
                 "session_id": "session-1",
-                "first_ts": datetime(2025, 1, 15, 10, 0, 0),
-                "last_ts": datetime(2025, 1, 15, 11, 0, 0),
-                "total_events": 10,
-                "turn_count": 3,
-                "policy_interventions": 1,
-                "models": ["gpt-4", "claude-3"],
                 "request_payload": {"final_request": {"messages": [{"role": "user", "content": "Hello world"}]}},
-            },
+            }
         ]
 
         mock_conn = AsyncMock()
         mock_conn.fetchval.return_value = 1  # Total count
-        # First fetch() = main session aggregation; second = user_ids lookup.
-        mock_conn.fetch.side_effect = [mock_rows, []]
+        # session_summaries page, then the page's previews, then its user_ids.
+        mock_conn.fetch.side_effect = [mock_rows, preview_rows, []]
 
-        mock_pool = MagicMock()
-        mock_pool.is_sqlite = False
-        mock_pool.connection.return_value.__aenter__.return_value = mock_conn
-
-        result = await fetch_session_list(limit=10, db_pool=mock_pool)
+        result = await fetch_session_list(limit=10, db_pool=self._pg_pool(mock_conn))
 
         assert result.total == 1
         assert result.offset == 0
         assert result.has_more is False
+        assert result.next_cursor is None
         assert len(result.sessions) == 1
         assert result.sessions[0].session_id == "session-1"
         assert result.sessions[0].turn_count == 3
         assert result.sessions[0].policy_interventions == 1
-        assert "gpt-4" in result.sessions[0].models_used
+        assert result.sessions[0].models_used == ["gpt-4", "claude-3"]
         assert result.sessions[0].preview_message == "Hello world"
         assert result.sessions[0].user_ids == []
+        page_query = mock_conn.fetch.call_args_list[0].args[0]
+        assert "FROM session_summaries ss" in page_query
+        assert "conversation_events" not in page_query
 
     @pytest.mark.asyncio
     async def test_fetch_with_offset(self):
         """Test fetching with offset for pagination."""
-        mock_rows = [
-            {
-                "session_id": "session-2",
-                "first_ts": datetime(2025, 1, 15, 10, 0, 0),
-                "last_ts": datetime(2025, 1, 15, 11, 0, 0),
-                "total_events": 5,
-                "turn_count": 2,
-                "policy_interventions": 0,
-                "models": ["gpt-4"],
-                "request_payload": None,  # Test with no first message
-            },
-        ]
+        # limit=1 fetches 2 rows; the extra row only signals has_more.
+        mock_rows = [self._summary_row("session-2"), self._summary_row("session-3")]
 
         mock_conn = AsyncMock()
         mock_conn.fetchval.return_value = 100  # Total count
-        mock_conn.fetch.side_effect = [mock_rows, []]
+        mock_conn.fetch.side_effect = [mock_rows, [], []]
 
-        mock_pool = MagicMock()
-        mock_pool.is_sqlite = False
-        mock_pool.connection.return_value.__aenter__.return_value = mock_conn
-
-        result = await fetch_session_list(limit=10, db_pool=mock_pool, offset=50)
+        result = await fetch_session_list(limit=1, db_pool=self._pg_pool(mock_conn), offset=50)
 
         assert result.total == 100
         assert result.offset == 50
-        assert result.has_more is True  # 50 + 1 < 100
-        assert len(result.sessions) == 1
+        assert result.has_more is True
+        assert [s.session_id for s in result.sessions] == ["session-2"]
         assert result.sessions[0].preview_message is None
+        assert mock_conn.fetch.call_args_list[0].args[1:3] == (2, 50)
+
+    @pytest.mark.asyncio
+    async def test_next_cursor_round_trips_as_keyset(self):
+        """next_cursor encodes the last row; passing it back binds a keyset predicate."""
+        mock_conn = AsyncMock()
+        mock_conn.fetchval.return_value = 3
+        mock_conn.fetch.side_effect = [
+            [self._summary_row("session-b"), self._summary_row("session-a")],
+            [],
+            [],
+        ]
+        pool = self._pg_pool(mock_conn)
+
+        first = await fetch_session_list(limit=1, db_pool=pool)
+        assert first.has_more is True
+        assert first.next_cursor is not None
+
+        mock_conn.fetch.side_effect = [[self._summary_row("session-a")], [], []]
+        second = await fetch_session_list(limit=1, db_pool=pool, cursor=first.next_cursor)
+
+        assert [s.session_id for s in second.sessions] == ["session-a"]
+        assert second.has_more is False
+        assert second.next_cursor is None
+        page_call = mock_conn.fetch.call_args_list[-3]
+        assert "ss.last_seen < $3 OR (ss.last_seen = $3 AND ss.session_id < $4)" in page_call.args[0]
+        assert page_call.args[1:] == (2, 0, datetime(2025, 1, 15, 11, 0, 0), "session-b")
+        # The total is cached per pool and filter set, not recounted per page.
+        assert mock_conn.fetchval.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_raises_value_error(self):
+        mock_conn = AsyncMock()
+        with pytest.raises(ValueError, match="Invalid session list cursor"):
+            await fetch_session_list(limit=10, db_pool=self._pg_pool(mock_conn), cursor="not-a-cursor")
+        mock_conn.fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_user_filter_uses_event_aggregate(self):
+        """user_id can't be answered by session_summaries (first user only), so it aggregates events."""
+        mock_conn = AsyncMock()
+        mock_conn.fetchval.return_value = 0
+        mock_conn.fetch.return_value = []
+
+        await fetch_session_list(limit=10, db_pool=self._pg_pool(mock_conn), user_id="alice")
+
+        page_query = mock_conn.fetch.call_args_list[0].args[0]
+        assert "FROM conversation_events ce" in page_query
+        assert "session_summaries" not in page_query
 
     @pytest.mark.asyncio
     async def test_empty_result(self):
@@ -1063,12 +1119,26 @@ class TestFetchSessionList:
         assert result.sessions == []
 
 
+def _outline_row(call_id: str, first_ts, last_ts=None, model: str | None = None, annotation_count: int = 0) -> dict:
+    """A row of the grouped per-call query behind ``fetch_session_outline``."""
+    return {
+        "call_id": call_id,
+        "first_ts": first_ts,
+        "last_ts": last_ts if last_ts is not None else first_ts,
+        "model": model,
+        "annotation_count": annotation_count,
+    }
+
+
 class TestFetchSessionDetail:
     """Test fetching session detail from database."""
 
     @pytest.mark.asyncio
     async def test_successful_fetch(self):
         """Test successful session detail fetching."""
+        outline_rows = [
+            _outline_row("call-1", datetime(2025, 1, 15, 10, 0, 0), datetime(2025, 1, 15, 10, 0, 1), "gpt-4"),
+        ]
         mock_rows = [
             {
                 "call_id": "call-1",
@@ -1092,7 +1162,7 @@ class TestFetchSessionDetail:
         ]
 
         mock_conn = AsyncMock()
-        mock_conn.fetch.return_value = mock_rows
+        mock_conn.fetch.side_effect = [outline_rows, mock_rows]
 
         mock_pool = MagicMock()
         mock_pool.connection.return_value.__aenter__.return_value = mock_conn
@@ -1102,6 +1172,9 @@ class TestFetchSessionDetail:
         assert result.session_id == "session-1"
         assert len(result.turns) == 1
         assert result.turns[0].model == "gpt-4"
+        assert result.models_used == ["gpt-4"]
+        assert result.last_timestamp == "2025-01-15T10:00:01"
+        assert result.total_turns == 1
 
     @pytest.mark.asyncio
     async def test_no_events_found(self):
@@ -1128,7 +1201,7 @@ class TestFetchSessionDetail:
         ]
 
         mock_conn = AsyncMock()
-        mock_conn.fetch.return_value = mock_rows
+        mock_conn.fetch.side_effect = [[_outline_row("call-1", datetime(2025, 1, 15, 10, 0, 0))], mock_rows]
 
         mock_pool = MagicMock()
         mock_pool.connection.return_value.__aenter__.return_value = mock_conn
@@ -1149,34 +1222,86 @@ class TestFetchSessionDetail:
         ]
 
         mock_conn = AsyncMock()
-        mock_conn.fetch.return_value = mock_rows
+        mock_conn.fetch.side_effect = [[_outline_row("call-1", "2025-01-15T10:00:00", model="gpt-4")], mock_rows]
 
         mock_pool = MagicMock()
         mock_pool.connection.return_value.__aenter__.return_value = mock_conn
 
         result = await fetch_session_detail("session-1", mock_pool)
         assert result.first_timestamp == "2025-01-15T10:00:00"
+        assert result.turns[0].timestamp == "2025-01-15T10:00:00"
 
     @pytest.mark.asyncio
     async def test_unexpected_created_at_type_raises_error(self):
         """Test that unexpected created_at type raises TypeError."""
-        mock_rows = [
+        mock_conn = AsyncMock()
+        mock_conn.fetch.return_value = [_outline_row("call-1", 12345)]  # Not datetime or str
+
+        mock_pool = MagicMock()
+        mock_pool.connection.return_value.__aenter__.return_value = mock_conn
+
+        with pytest.raises(TypeError, match="got int"):
+            await fetch_session_detail("session-1", mock_pool)
+
+    @pytest.mark.asyncio
+    async def test_turn_range_loads_only_requested_calls(self):
+        """offset/limit slice the outline's call order; only those calls' events are fetched."""
+        outline_rows = [
+            _outline_row(f"call-{i}", datetime(2025, 1, 15, 10, i), model="gpt-4", annotation_count=1) for i in range(4)
+        ]
+        event_rows = [
             {
-                "call_id": "call-1",
+                "call_id": "call-2",
                 "event_type": "transaction.request_recorded",
                 "payload": {"final_model": "gpt-4", "final_request": {"messages": []}},
-                "created_at": 12345,  # Unexpected type (not datetime or str)
+                "created_at": datetime(2025, 1, 15, 10, 2),
             },
         ]
 
         mock_conn = AsyncMock()
-        mock_conn.fetch.return_value = mock_rows
+        mock_conn.fetch.side_effect = [outline_rows, event_rows]
 
         mock_pool = MagicMock()
         mock_pool.connection.return_value.__aenter__.return_value = mock_conn
 
-        with pytest.raises(TypeError, match="got int"):
-            await fetch_session_detail("session-1", mock_pool)
+        result = await fetch_session_detail("session-1", mock_pool, offset=2, limit=1)
+
+        assert [turn.call_id for turn in result.turns] == ["call-2"]
+        assert result.turn_offset == 2
+        assert result.total_turns == 4
+        # Header totals still describe the whole session.
+        assert result.total_policy_interventions == 4
+        assert result.first_timestamp == "2025-01-15T10:00:00"
+        assert mock_conn.fetch.call_args_list[1].args[1:] == ("session-1", "call-2")
+
+    @pytest.mark.asyncio
+    async def test_turns_are_loaded_in_pages(self, monkeypatch):
+        """Each page of calls is fetched (and rehydrated) with its own query."""
+        monkeypatch.setattr("luthien_proxy.history.service.HISTORY_SESSION_TURNS_PAGE_SIZE", 2)
+        outline_rows = [_outline_row(f"call-{i}", datetime(2025, 1, 15, 10, i)) for i in range(3)]
+
+        def events(*call_ids: str) -> list[dict]:
+            return [
+                {
+                    "call_id": call_id,
+                    "event_type": "transaction.request_recorded",
+                    "payload": {"final_request": {"messages": []}},
+                    "created_at": datetime(2025, 1, 15, 10, int(call_id[-1])),
+                }
+                for call_id in call_ids
+            ]
+
+        mock_conn = AsyncMock()
+        mock_conn.fetch.side_effect = [outline_rows, events("call-0", "call-1"), events("call-2")]
+
+        mock_pool = MagicMock()
+        mock_pool.connection.return_value.__aenter__.return_value = mock_conn
+
+        result = await fetch_session_detail("session-1", mock_pool)
+
+        assert [turn.call_id for turn in result.turns] == ["call-0", "call-1", "call-2"]
+        page_args = [call.args[1:] for call in mock_conn.fetch.call_args_list[1:]]
+        assert page_args == [("session-1", "call-0", "call-1"), ("session-1", "call-2")]
 
 
 class TestExportSessionMarkdown:
@@ -1,7 +1,7 @@
 """Tests for SQLite-specific path in conversation history service.
 
-Tests the `_fetch_session_list_sqlite` code path using a real in-memory
-SQLite database with the schema applied.
+Tests the `_fetch_session_list_sqlite` code path and the session detail and
+export queries using a real in-memory SQLite database with the schema applied.
 """
 
 from __future__ import annotations
@@ -10,8 +10,16 @@ import json
 from pathlib import Path
 
 import pytest
-
-from luthien_proxy.history.service import fetch_session_list
+from tests.luthien_proxy.unit_tests.helpers.session_summaries import fetch_session_list
+
+from luthien_proxy.history.service import (
+    export_session_jsonl,
+    export_session_markdown,
+    fetch_session_detail,
+    fetch_session_outline,
+    stream_session_jsonl,
+    stream_session_markdown,
+)
 from luthien_proxy.utils.db import DatabasePool
 from luthien_proxy.utils.db_sqlite import SqliteConnection
 
@@ -328,6 +336,53 @@ class TestFetchSessionListSqlite:
         assert result.offset == 2
         assert result.has_more is False
 
+    @pytest.mark.parametrize("user_id", [None, "alice"], ids=["summaries", "user-aggregate"])
+    @pytest.mark.asyncio
+    async def test_cursor_pagination_walks_every_session_once(self, sqlite_pool: DatabasePool, user_id: str | None):
+        """Keyset pages cover all sessions exactly once, including ties on last activity."""
+        timestamps = ["2025-01-15T10:00:00", "2025-01-15T11:00:00", "2025-01-15T11:00:00", "2025-01-15T12:00:00"]
+        async with sqlite_pool.connection() as conn:
+            for i, ts in enumerate(timestamps):
+                await conn.execute(
+                    """
+                    INSERT INTO conversation_calls
+                    (call_id, model_name, provider, status, session_id, user_id, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    f"call-{i}",
+                    "gpt-4",
+                    "openai",
+                    "completed",
+                    f"session-{i}",
+                    "alice",
+                    ts,
+                )
+                await conn.execute(
+                    """
+                    INSERT INTO conversation_events
+                    (id, call_id, event_type, payload, session_id, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    f"event-{i}",
+                    f"call-{i}",
+                    "transaction.request_recorded",
+                    json.dumps({"final_model": "gpt-4", "final_request": {"messages": []}}),
+                    f"session-{i}",
+                    ts,
+                )
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            result = await fetch_session_list(limit=1, db_pool=sqlite_pool, user_id=user_id, cursor=cursor)
+            seen.extend(s.session_id for s in result.sessions)
+            if not result.has_more:
+                assert result.next_cursor is None
+                break
+            cursor = result.next_cursor
+
+        assert seen == ["session-3", "session-2", "session-1", "session-0"]
+
     @pytest.mark.asyncio
     async def test_empty_database(self, sqlite_pool: DatabasePool):
         """Test with empty database."""
@@ -927,4 +982,55 @@ class TestFetchSessionListUserFilter:
         assert len(all_rows.sessions) == 1
 
 
+class TestSessionDetailSqlite:
+    """Outline query, turn-range pagination and streamed exports against SQLite."""
+
+    @pytest.mark.asyncio
+    async def test_outline_summarizes_session(self, populated_sqlite_pool: DatabasePool):
+        outline = await fetch_session_outline("session-1", populated_sqlite_pool)
+
+        assert outline.call_ids == ["call-1", "call-2"]
+        assert outline.first_timestamp == "2025-01-15T10:00:00"
+        assert outline.last_timestamp == "2025-01-15T10:05:01"
+        assert outline.models_used == ["claude-3-sonnet", "gpt-4"]
+        assert outline.total_policy_interventions == 0
+
+    @pytest.mark.asyncio
+    async def test_outline_excludes_evaluation_events(self, populated_with_interventions_pool: DatabasePool):
+        outline = await fetch_session_outline("session-2", populated_with_interventions_pool)
+        detail = await fetch_session_detail("session-2", populated_with_interventions_pool)
+
+        assert outline.total_policy_interventions == 1
+        assert detail.total_policy_interventions == sum(len(turn.annotations) for turn in detail.turns)
+
+    @pytest.mark.asyncio
+    async def test_missing_session_raises(self, sqlite_pool: DatabasePool):
+        with pytest.raises(ValueError, match="No events found"):
+            await fetch_session_outline("missing", sqlite_pool)
+
+    @pytest.mark.asyncio
+    async def test_turn_range(self, populated_sqlite_pool: DatabasePool):
+        full = await fetch_session_detail("session-1", populated_sqlite_pool)
+        tail = await fetch_session_detail("session-1", populated_sqlite_pool, offset=1, limit=5)
+
+        assert [turn.call_id for turn in full.turns] == ["call-1", "call-2"]
+        assert tail.turns == full.turns[1:]
+        assert (tail.turn_offset, tail.total_turns) == (1, 2)
+        assert tail.first_timestamp == full.first_timestamp
+        assert tail.models_used == full.models_used
+
+    @pytest.mark.asyncio
+    async def test_streamed_exports_match_whole_exports(self, populated_sqlite_pool: DatabasePool, monkeypatch):
+        monkeypatch.setattr("luthien_proxy.history.service.HISTORY_SESSION_TURNS_PAGE_SIZE", 1)
+        detail = await fetch_session_detail("session-1", populated_sqlite_pool)
+        outline = await fetch_session_outline("session-1", populated_sqlite_pool)
+
+        markdown = "".join([chunk async for chunk in stream_session_markdown(outline, populated_sqlite_pool)])
+        jsonl = "".join([chunk async for chunk in stream_session_jsonl(outline, populated_sqlite_pool)])
+
+        assert markdown == export_session_markdown(detail)
+        assert jsonl == export_session_jsonl(detail)
+        assert len(jsonl.splitlines()) == 2
+
+
 __all__ = []
@@ -37,6 +37,8 @@ from luthien_proxy.inference.claude_code import (
     _build_child_env,
     _redact_argv_for_log,
     _render_prompt,
+    _warm_pools,
+    close_warm_pools,
 )
 
 SIMPLE_SCHEMA = {
@@ -738,6 +740,349 @@ class TestCancellationPath:
         assert getattr(record, "inference_provider_name", None) == "test-provider"
 
 
+class _FakeStdin:
+    """Stand-in for a spare's stdin pipe; `broken` makes the write fail like a dead reader."""
+
+    def __init__(self) -> None:
+        self.written: bytes | None = None
+        self.broken = False
+        self.closed = False
+
+    def write(self, data: bytes) -> None:
+        self.written = data
+
+    async def drain(self) -> None:
+        if self.broken:
+            raise BrokenPipeError("reader exited")
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _PooledFakeProcess:
+    """Stand-in for a pooled child: a warm spare (stdin pipe) or a cold argv-prompt spawn."""
+
+    def __init__(self, args: tuple, env: dict[str, str], stdin_pipe: bool) -> None:
+        self.args = args
+        self.env = env
+        self.stdin = _FakeStdin() if stdin_pipe else None
+        self.returncode: int | None = None
+        self.kill_called = False
+        # (stdout, stderr, returncode) to finish with instead of a success.
+        self.result: tuple[bytes, bytes, int] | None = None
+
+    @property
+    def stdin_input(self) -> bytes | None:
+        return self.stdin.written if self.stdin is not None else None
+
+    async def communicate(self, input: bytes | None = None) -> tuple[bytes, bytes]:
+        if self.result is not None:
+            stdout, stderr, self.returncode = self.result
+            return stdout, stderr
+        self.returncode = 0
+        stdout, stderr, _ = _mock_run_result()
+        return stdout, stderr
+
+    def kill(self) -> None:
+        self.kill_called = True
+        self.returncode = -9
+
+    async def wait(self) -> int | None:
+        return self.returncode
+
+
+class _PooledSpawner:
+    """Fake `create_subprocess_exec` recording every spawned process and its argv."""
+
+    def __init__(self) -> None:
+        self.procs: list[_PooledFakeProcess] = []
+        self.calls: list[tuple[tuple, dict]] = []
+
+    async def __call__(self, *args, **kwargs) -> _PooledFakeProcess:
+        proc = _PooledFakeProcess(args, kwargs["env"], kwargs["stdin"] == asyncio.subprocess.PIPE)
+        self.procs.append(proc)
+        self.calls.append((args, kwargs))
+        return proc
+
+
+async def _settle_pools() -> None:
+    """Wait for background spare spawns and disposals to finish."""
+    for pool in list(_warm_pools.values()):
+        while pool._tasks:
+            await asyncio.gather(*pool._tasks)
+
+
+class TestWarmPool:
+    """Opt-in warm pool: pre-spawned one-shot children fed their prompt on stdin."""
+
+    @pytest.fixture(autouse=True)
+    async def _close_pools(self):
+        yield
+        await close_warm_pools()
+
+    @pytest.mark.asyncio
+    async def test_second_call_uses_prespawned_spare(self):
+        """A miss spawns cold and tops up a spare; the next call runs on that spare."""
+        spawner = _PooledSpawner()
+        provider = _provider(warm_pool_size=1)
+        with patch("luthien_proxy.inference.claude_code.asyncio.create_subprocess_exec", new=spawner):
+            first = await provider.complete(messages=[{"role": "user", "content": "one"}])
+            await _settle_pools()
+            assert len(spawner.procs) == 2
+            second = await provider.complete(messages=[{"role": "user", "content": "two"}])
+            await _settle_pools()
+
+        assert first.text == second.text == "pong"
+        # The miss ran cold with the prompt in argv; the spare got it on stdin.
+        assert spawner.procs[0].args[-1] == "User: one"
+        assert spawner.procs[0].stdin is None
+        assert spawner.procs[1].stdin_input == b"User: two"
+        assert spawner.procs[1].stdin.closed is True
+        # One spare is back in the pool for the next call.
+        assert len(spawner.procs) == 3
+        assert spawner.procs[2].stdin_input is None
+
+    @pytest.mark.asyncio
+    async def test_spares_are_spawned_without_the_prompt(self):
+        """Spares carry every flag but the prompt, and a stdin pipe."""
+        spawner = _PooledSpawner()
+        provider = _provider(warm_pool_size=1, default_model="claude-haiku-4-5")
+        with patch("luthien_proxy.inference.claude_code.asyncio.create_subprocess_exec", new=spawner):
+            await provider.complete(messages=[{"role": "user", "content": "secret prompt"}])
+            await _settle_pools()
+            await provider.complete(messages=[{"role": "user", "content": "secret prompt"}])
+            await _settle_pools()
+
+        spares = [proc for proc in spawner.procs if proc.stdin is not None]
+        assert len(spares) == 2
+        for proc in spares:
+            assert list(proc.args[:5]) == ["claude", "-p", "--bare", "--output-format", "json"]
+            assert proc.args[-1] == "claude-haiku-4-5"
+            assert not any("secret prompt" in arg for arg in proc.args)
+        assert spares[0].stdin_input == b"User: secret prompt"
+
+    @pytest.mark.asyncio
+    async def test_concurrency_only_keeps_argv_prompt_spawn(self):
+        """Without a warm pool, admission control wraps the usual argv-prompt spawn."""
+        spawner = _PooledSpawner()
+        with patch("luthien_proxy.inference.claude_code.asyncio.create_subprocess_exec", new=spawner):
+            result = await _provider(max_concurrency=1).complete(messages=[{"role": "user", "content": "hi"}])
+
+        assert result.text == "pong"
+        assert len(spawner.procs) == 1
+        assert spawner.procs[0].args[-1] == "User: hi"
+        assert spawner.procs[0].stdin is None
+        assert _warm_pools == {}
+
+    @pytest.mark.asyncio
+    async def test_each_spare_gets_own_scratch_home_removed_after_use(self):
+        """Isolation is per process: own scratch HOME, credential in env, dir gone after the call."""
+        spawner = _PooledSpawner()
+        secret = "sk-ant-oat01-POOLSECRET"
+        with patch("luthien_proxy.inference.claude_code.asyncio.create_subprocess_exec", new=spawner):
+            await _provider(credential=_oauth_cred(secret), warm_pool_size=1).complete(
+                messages=[{"role": "user", "content": "hi"}],
+            )
+            await _settle_pools()
+            used, spare = spawner.procs
+            assert used.env["HOME"] != spare.env["HOME"]
+            assert used.env["CLAUDE_CONFIG_DIR"] == used.env["HOME"]
+            assert used.env["ANTHROPIC_API_KEY"] == secret
+            assert not os.path.exists(used.env["HOME"])
+            assert os.path.isdir(spare.env["HOME"])
+            await close_warm_pools()
+
+        assert spare.kill_called is True
+        assert not os.path.exists(spare.env["HOME"])
+
+    @pytest.mark.asyncio
+    async def test_expired_or_dead_spare_is_reaped_not_used(self):
+        """A spare past `spare_max_idle_seconds` is killed and the call spawns fresh."""
+        spawner = _PooledSpawner()
+        provider = _provider(warm_pool_size=1, spare_max_idle_seconds=0.0)
+        with patch("luthien_proxy.inference.claude_code.asyncio.create_subprocess_exec", new=spawner):
+            await provider.complete(messages=[{"role": "user", "content": "one"}])
+            await _settle_pools()
+            stale = spawner.procs[1]
+            await provider.complete(messages=[{"role": "user", "content": "two"}])
+            await _settle_pools()
+
+        assert stale.kill_called is True
+        assert stale.stdin_input is None
+        assert not os.path.exists(stale.env["HOME"])
+        assert [proc.args[-1] for proc in spawner.procs].count("User: two") == 1
+
+    @pytest.mark.asyncio
+    async def test_spare_dead_at_prompt_write_falls_back_to_cold_spawn(self, caplog):
+        """A broken pipe on the prompt write means the spare never ran it: the call runs cold instead."""
+        spawner = _PooledSpawner()
+        provider = _provider(warm_pool_size=1)
+        caplog.set_level("WARNING", logger="luthien_proxy.inference.claude_code")
+        with patch("luthien_proxy.inference.claude_code.asyncio.create_subprocess_exec", new=spawner):
+            await provider.complete(messages=[{"role": "user", "content": "one"}])
+            await _settle_pools()
+            dead = spawner.procs[1]
+            dead.stdin.broken = True
+            result = await provider.complete(messages=[{"role": "user", "content": "two"}])
+            await _settle_pools()
+
+        assert result.text == "pong"
+        assert dead.kill_called is True
+        assert not os.path.exists(dead.env["HOME"])
+        cold = [proc for proc in spawner.procs if proc.args[-1] == "User: two"]
+        assert len(cold) == 1
+        assert not os.path.exists(cold[0].env["HOME"])
+        assert [r.message for r in caplog.records] == ["inference.claude_code.warm_spare_died"]
+
+    @pytest.mark.asyncio
+    async def test_spare_failing_after_reading_prompt_is_not_retried(self):
+        """Once the prompt is written, a failure is the call's result, even with empty stdout."""
+        spawner = _PooledSpawner()
+        provider = _provider(warm_pool_size=1)
+        with patch("luthien_proxy.inference.claude_code.asyncio.create_subprocess_exec", new=spawner):
+            await provider.complete(messages=[{"role": "user", "content": "one"}])
+            await _settle_pools()
+            spawner.procs[1].result = (b"", b"boom", 1)
+            with pytest.raises(InferenceProviderError):
+                await provider.complete(messages=[{"role": "user", "content": "two"}])
+            await _settle_pools()
+
+        assert spawner.procs[1].stdin_input == b"User: two"
+        assert not any(proc.args[-1] == "User: two" for proc in spawner.procs)
+
+    @pytest.mark.asyncio
+    async def test_slot_wait_counts_against_the_call_timeout(self):
+        """Time spent queued for a slot is taken out of the run's timeout, not added to it."""
+        release = asyncio.Event()
+        started = asyncio.Event()
+        timeouts: list[float] = []
+
+        async def _blocking_communicate(*args, timeout_seconds, **kwargs):
+            timeouts.append(timeout_seconds)
+            started.set()
+            await release.wait()
+            return _mock_run_result()
+
+        provider = _provider(max_concurrency=1, max_queued=1, timeout_seconds=5.0)
+        with (
+            patch("luthien_proxy.inference.claude_code._communicate_child", new=_blocking_communicate),
+            patch("luthien_proxy.inference.claude_code.asyncio.create_subprocess_exec", new=_PooledSpawner()),
+        ):
+            first = asyncio.create_task(provider.complete(messages=[{"role": "user", "content": "one"}]))
+            await started.wait()
+            second = asyncio.create_task(provider.complete(messages=[{"role": "user", "content": "two"}]))
+            await asyncio.sleep(0.3)
+            release.set()
+            await asyncio.gather(first, second)
+
+        assert timeouts[0] <= 5.0
+        assert timeouts[1] <= 4.7
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_is_shared_across_pool_configurations(self):
+        """Providers on one credential share its slots even when their pool settings differ."""
+        release = asyncio.Event()
+        started = asyncio.Event()
+
+        async def _blocking_communicate(*args, **kwargs):
+            started.set()
+            await release.wait()
+            return _mock_run_result()
+
+        cold = _provider(max_concurrency=1, max_queued=0)
+        warm = _provider(max_concurrency=1, max_queued=0, warm_pool_size=1)
+        with (
+            patch("luthien_proxy.inference.claude_code._communicate_child", new=_blocking_communicate),
+            patch("luthien_proxy.inference.claude_code.asyncio.create_subprocess_exec", new=_PooledSpawner()),
+        ):
+            first = asyncio.create_task(cold.complete(messages=[{"role": "user", "content": "one"}]))
+            await started.wait()
+            with pytest.raises(InferenceProviderError, match="queue is full"):
+                await warm.complete(messages=[{"role": "user", "content": "two"}])
+            release.set()
+            await first
+            await _settle_pools()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_without_spawning(self):
+        """With every slot busy and `max_queued` callers waiting, the next call fails fast."""
+        release = asyncio.Event()
+        started = asyncio.Event()
+
+        async def _blocking_communicate(*args, **kwargs):
+            started.set()
+            await release.wait()
+            return _mock_run_result()
+
+        provider = _provider(max_concurrency=1, max_queued=0)
+        with (
+            patch(
+                "luthien_proxy.inference.claude_code._communicate_child",
+                new=_blocking_communicate,
+            ),
+            patch(
+                "luthien_proxy.inference.claude_code.asyncio.create_subprocess_exec",
+                new=_PooledSpawner(),
+            ),
+        ):
+            first = asyncio.create_task(provider.complete(messages=[{"role": "user", "content": "one"}]))
+            await started.wait()
+            with pytest.raises(InferenceProviderError, match="queue is full"):
+                await provider.complete(messages=[{"role": "user", "content": "two"}])
+            release.set()
+            assert (await first).text == "pong"
+
+    @pytest.mark.asyncio
+    async def test_queued_call_times_out_waiting_for_slot(self):
+        """A queued call waits at most `timeout_seconds` for a slot."""
+        release = asyncio.Event()
+        started = asyncio.Event()
+
+        async def _blocking_communicate(*args, **kwargs):
+            started.set()
+            await release.wait()
+            return _mock_run_result()
+
+        provider = _provider(max_concurrency=1, max_queued=1, timeout_seconds=0.05)
+        with (
+            patch(
+                "luthien_proxy.inference.claude_code._communicate_child",
+                new=_blocking_communicate,
+            ),
+            patch(
+                "luthien_proxy.inference.claude_code.asyncio.create_subprocess_exec",
+                new=_PooledSpawner(),
+            ),
+        ):
+            first = asyncio.create_task(provider.complete(messages=[{"role": "user", "content": "one"}]))
+            await started.wait()
+            with pytest.raises(InferenceTimeoutError, match="slot"):
+                await provider.complete(messages=[{"role": "user", "content": "two"}])
+            release.set()
+            await first
+
+    @pytest.mark.asyncio
+    async def test_spawn_failure_for_spare_is_logged_not_raised(self, caplog):
+        """A failing background spawn leaves the call's own result intact."""
+        spawner = _PooledSpawner()
+        calls = 0
+
+        async def _fail_after_first(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls > 1:
+                raise FileNotFoundError("claude")
+            return await spawner(*args, **kwargs)
+
+        caplog.set_level("WARNING", logger="luthien_proxy.inference.claude_code")
+        with patch("luthien_proxy.inference.claude_code.asyncio.create_subprocess_exec", new=_fail_after_first):
+            result = await _provider(warm_pool_size=1).complete(messages=[{"role": "user", "content": "hi"}])
+            await _settle_pools()
+
+        assert result.text == "pong"
+        assert [r.message for r in caplog.records] == ["inference.claude_code.spare_spawn_failed"]
+
+
 class TestPromptRendering:
     """`_render_prompt` flattens messages into one prompt + optional system."""
 
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
@@ -34,6 +35,7 @@ from luthien_proxy.inference.registry import (
     ProviderNotFoundError,
     ProviderRecord,
     UnknownBackendTypeError,
+    _build_claude_code,
     _build_direct_api,
 )
 from luthien_proxy.utils.db import DatabasePool
@@ -349,6 +351,30 @@ async def test_null_credential_direct_api_provider_raises_without_override() ->
         )
 
 
+# --- claude_code warm-pool config ---
+
+
+def test_claude_code_factory_reads_warm_pool_config() -> None:
+    """Warm-pool keys in `config` reach the provider; omitted keys keep cold spawning."""
+    credential = Credential(value="sk-ant-oat01-x", credential_type=CredentialType.AUTH_TOKEN)
+    record = ProviderRecord(
+        name="sub",
+        backend_type="claude_code",
+        credential_name="sub-cred",
+        default_model="claude-sonnet-4-6",
+        config={"warm_pool_size": 2, "max_concurrency": 4, "max_queued": 8, "spare_max_idle_seconds": 60},
+    )
+    pooled = _build_claude_code(record, credential)
+    assert pooled._warm_pool_size == 2  # type: ignore[attr-defined]
+    assert pooled._max_concurrency == 4  # type: ignore[attr-defined]
+    assert pooled._max_queued == 8  # type: ignore[attr-defined]
+    assert pooled._spare_max_idle_seconds == 60.0  # type: ignore[attr-defined]
+
+    cold = _build_claude_code(replace(record, config={}), credential)
+    assert cold._warm_pool_size == 0  # type: ignore[attr-defined]
+    assert cold._max_concurrency == 0  # type: ignore[attr-defined]
+
+
 # --- put() cache invalidation ---
 
 
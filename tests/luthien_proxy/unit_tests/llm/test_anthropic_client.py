@@ -19,6 +19,7 @@ from anthropic.types import (
 from anthropic.types.raw_message_delta_event import Delta
 from tests.constants import DEFAULT_TEST_MODEL
 
+from luthien_proxy.llm import upstream_http
 from luthien_proxy.llm.anthropic_client import AnthropicClient
 from luthien_proxy.llm.types.anthropic import AnthropicRequest
 
@@ -130,6 +131,19 @@ class TestAnthropicClientInit:
         assert client._client.api_key is not None
         assert client._client.api_key == "test-api-key"
 
+    def test_clients_share_the_upstream_pool(self):
+        """Different credentials send through the one shared HTTP client."""
+        c1 = AnthropicClient(api_key="key-1")
+        c2 = AnthropicClient(auth_token="token-2", base_url="https://custom.api.com")
+        assert c1._client._client is upstream_http.shared_http_client()
+        assert c2._client._client is upstream_http.shared_http_client()
+
+    async def test_close_leaves_shared_pool_open(self):
+        client = AnthropicClient(api_key="test-key")
+        await client.close()
+        assert not upstream_http.shared_http_client().is_closed
+        assert client._client._client is upstream_http.shared_http_client()
+
 
 def _mock_stream_for_message(mock_async_client: AsyncMock, message: Message) -> None:
     """Set up mock_async_client.messages.stream to return a context manager
@@ -0,0 +1,145 @@
+"""Tests for the shared upstream HTTP pool."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from luthien_proxy.llm import upstream_http
+
+
+@pytest.fixture(autouse=True)
+async def _fresh_pool():
+    await upstream_http.close()
+    upstream_http.reset_stats()
+    yield
+    await upstream_http.close()
+    upstream_http.reset_stats()
+
+
+async def _replay(trace, events: list[str], clock: list[float]) -> None:
+    """Feed httpcore trace events to ``trace`` with a patched perf_counter."""
+    with patch("luthien_proxy.llm.upstream_http.time.perf_counter", side_effect=clock):
+        for event in events:
+            await trace(event, {})
+
+
+class TestSharedClient:
+    def test_returns_one_client_until_closed(self):
+        assert upstream_http.shared_http_client() is upstream_http.shared_http_client()
+
+    async def test_close_then_get_builds_a_new_client(self):
+        first = upstream_http.shared_http_client()
+        await upstream_http.close()
+        assert first.is_closed
+        assert upstream_http.shared_http_client() is not first
+
+    def test_pool_limits_come_from_settings(self, monkeypatch):
+        settings = SimpleNamespace(
+            upstream_http_max_connections=7,
+            upstream_http_max_keepalive_connections=3,
+            upstream_http_keepalive_expiry_seconds=12.0,
+            upstream_http2=False,
+        )
+        monkeypatch.setattr(upstream_http, "get_settings", lambda: settings)
+        with patch("luthien_proxy.llm.upstream_http.anthropic.DefaultAsyncHttpxClient") as mock_cls:
+            mock_cls.return_value.aclose = AsyncMock()
+            upstream_http.shared_http_client()
+
+        kwargs = mock_cls.call_args.kwargs
+        assert kwargs["limits"] == httpx.Limits(max_connections=7, max_keepalive_connections=3, keepalive_expiry=12.0)
+        assert kwargs["http2"] is False
+
+    def test_http2_requires_h2(self, monkeypatch):
+        monkeypatch.setattr(upstream_http.importlib.util, "find_spec", lambda name: None)
+        with patch("luthien_proxy.llm.upstream_http.anthropic.DefaultAsyncHttpxClient") as mock_cls:
+            mock_cls.return_value.aclose = AsyncMock()
+            upstream_http.shared_http_client()
+
+        assert mock_cls.call_args.kwargs["http2"] is False
+        assert upstream_http.stats()["http2"] is False
+
+    def test_client_discards_cookies(self):
+        client = upstream_http.shared_http_client()
+        request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+        response = httpx.Response(200, headers={"set-cookie": "__cf_bm=abc; Path=/"}, request=request)
+        client.cookies.extract_cookies(response)
+        assert len(client.cookies.jar) == 0
+
+
+class TestConnectTrace:
+    async def test_tls_connect_time_is_recorded(self):
+        request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+        await upstream_http._attach_connect_trace(request)
+        await _replay(
+            request.extensions["trace"],
+            [
+                "connection.connect_tcp.started",
+                "connection.connect_tcp.complete",
+                "connection.start_tls.started",
+                "connection.start_tls.complete",
+            ],
+            [10.0, 10.025],
+        )
+
+        stats = upstream_http.stats()
+        assert stats["connects"] == 1
+        assert stats["last_connect_ms"] == pytest.approx(25.0)
+        assert stats["max_connect_ms"] == pytest.approx(25.0)
+
+    async def test_plain_http_connect_ends_at_tcp(self):
+        request = httpx.Request("GET", "http://localhost:8080/v1/models")
+        await upstream_http._attach_connect_trace(request)
+        await _replay(
+            request.extensions["trace"],
+            ["connection.connect_tcp.started", "connection.connect_tcp.complete"],
+            [1.0, 1.002],
+        )
+
+        assert upstream_http.stats()["avg_connect_ms"] == pytest.approx(2.0)
+
+    async def test_failed_connect_is_counted(self):
+        request = httpx.Request("GET", "https://api.anthropic.com/v1/models")
+        await upstream_http._attach_connect_trace(request)
+        await _replay(
+            request.extensions["trace"], ["connection.connect_tcp.started", "connection.connect_tcp.failed"], [1.0]
+        )
+
+        stats = upstream_http.stats()
+        assert (stats["connects"], stats["failed_connects"]) == (0, 1)
+
+    async def test_reused_connection_records_nothing(self):
+        request = httpx.Request("GET", "https://api.anthropic.com/v1/models")
+        await upstream_http._attach_connect_trace(request)
+        await _replay(request.extensions["trace"], ["http11.send_request_headers.started"], [])
+
+        assert upstream_http.stats()["connects"] == 0
+
+    async def test_existing_trace_is_chained(self):
+        seen: list[str] = []
+
+        async def caller_trace(event, info):
+            seen.append(event)
+
+        request = httpx.Request("GET", "https://api.anthropic.com/v1/models", extensions={"trace": caller_trace})
+        await upstream_http._attach_connect_trace(request)
+        await request.extensions["trace"]("http11.response_closed.complete", {})
+
+        assert seen == ["http11.response_closed.complete"]
+
+
+class TestStats:
+    def test_no_client_reports_empty_pool(self):
+        stats = upstream_http.stats()
+        assert (stats["open_connections"], stats["active_connections"], stats["idle_connections"]) == (0, 0, 0)
+
+    def test_occupancy_counts_idle_and_active_connections(self, monkeypatch):
+        idle, busy = MagicMock(), MagicMock()
+        idle.is_idle.return_value = True
+        busy.is_idle.return_value = False
+        upstream_http.shared_http_client()
+        monkeypatch.setattr(upstream_http, "_pool_connections", lambda client: [idle, busy, busy])
+
+        stats = upstream_http.stats()
+        assert (stats["open_connections"], stats["active_connections"], stats["idle_connections"]) == (3, 2, 1)
@@ -0,0 +1,84 @@
+"""Tests for live activity payload projection."""
+
+import json
+
+from luthien_proxy.observability.activity_projection import (
+    ACTIVITY_DATA_MAX_BYTES,
+    ACTIVITY_LIST_MAX_ITEMS,
+    ACTIVITY_STRING_MAX_CHARS,
+    project_activity_data,
+)
+from luthien_proxy.observability.event_publisher import event_type_matches, parse_event_type_filter
+
+_LONG = "x" * (ACTIVITY_DATA_MAX_BYTES + 1)
+
+
+class TestProjectActivityData:
+    def test_small_payload_passes_through_with_its_encoding(self) -> None:
+        data = {"session_id": "s", "reason": "ok"}
+        data_json = json.dumps(data)
+        assert project_activity_data("call-1", "policy.decision", data, data_json) == (data, data_json)
+
+    def test_request_event_is_summarized(self) -> None:
+        request = {
+            "model": "claude-x",
+            "max_tokens": 100,
+            "messages": [{"role": "user", "content": [{"type": "text", "text": _LONG}]}],
+            "tools": [{"name": "bash"}],
+        }
+        data = {"original_request": request, "final_request": request, "session_id": "s", "user_id": "u"}
+
+        projected, projected_json = project_activity_data("call/1", "transaction.request_recorded", data)
+
+        assert projected_json is None
+        assert projected["session_id"] == "s"
+        assert projected["user_id"] == "u"
+        assert projected["truncated"] is True
+        assert projected["full_payload"] == "/api/debug/calls/call%2F1"
+        summary = projected["final_request"]
+        assert summary["model"] == "claude-x"
+        assert summary["message_count"] == 1
+        assert summary["tool_count"] == 1
+        assert summary["last_message_preview"] == "x" * ACTIVITY_STRING_MAX_CHARS + "..."
+        assert len(json.dumps(projected)) < ACTIVITY_DATA_MAX_BYTES
+
+    def test_response_event_is_summarized(self) -> None:
+        response = {
+            "id": "msg_1",
+            "model": "claude-x",
+            "stop_reason": "end_turn",
+            "usage": {"input_tokens": 3, "output_tokens": 4},
+            "content": [{"type": "text", "text": _LONG}, {"type": "tool_use", "input": {}}],
+        }
+        data = {"payload": response, "session_id": "s"}
+
+        projected, _ = project_activity_data("call-1", "pipeline.client_response", data)
+
+        assert projected["payload"]["stop_reason"] == "end_turn"
+        assert projected["payload"]["usage"] == {"input_tokens": 3, "output_tokens": 4}
+        assert projected["payload"]["content_types"] == ["text", "tool_use"]
+
+    def test_unknown_event_is_trimmed_generically(self) -> None:
+        data = {"blob": _LONG, "items": list(range(50)), "deep": {"a": {"b": {"c": 1}}}}
+
+        projected, _ = project_activity_data("call-1", "policy.custom", data)
+
+        assert len(projected["blob"]) == ACTIVITY_STRING_MAX_CHARS + 3
+        assert projected["items"][:ACTIVITY_LIST_MAX_ITEMS] == list(range(ACTIVITY_LIST_MAX_ITEMS))
+        assert projected["items"][-1] == f"<{50 - ACTIVITY_LIST_MAX_ITEMS} more>"
+        assert projected["deep"] == {"a": {"b": "<1 keys>"}}
+
+
+class TestEventTypeFilter:
+    def test_parse(self) -> None:
+        assert parse_event_type_filter(None) is None
+        assert parse_event_type_filter(" , ") is None
+        assert parse_event_type_filter("policy., pipeline.client_request") == ("policy.", "pipeline.client_request")
+
+    def test_matches_exact_types_and_dot_prefixes(self) -> None:
+        event_types = ("policy.", "pipeline.client_request")
+        assert event_type_matches("policy.judge.tool_call_blocked", event_types)
+        assert event_type_matches("pipeline.client_request", event_types)
+        assert not event_type_matches("pipeline.client_response", event_types)
+        assert not event_type_matches("policyx.decision", event_types)
+        assert event_type_matches("anything", None)
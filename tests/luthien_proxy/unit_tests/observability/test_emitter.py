@@ -3,7 +3,7 @@
 import asyncio
 import json
 from contextlib import asynccontextmanager
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
@@ -13,8 +13,12 @@ from pydantic import BaseModel
 
 from luthien_proxy.observability.emitter import (
     EventEmitter,
+    EventWriteBuffer,
     NullEventEmitter,
+    PendingEventWrite,
     _safe_serialize,
+    encode_event_data,
+    write_event_batch,
 )
 
 
@@ -150,6 +154,45 @@ class TestSafeSerialize:
         assert isinstance(json_str, str)
 
 
+class TestEncodeEventData:
+    """encode_event_data must agree with _safe_serialize."""
+
+    def test_matches_safe_serialize(self) -> None:
+        class SampleModel(BaseModel):
+            name: str
+
+        class CustomObject:
+            def __init__(self) -> None:
+                self.x = 1
+
+        data = {
+            "at": datetime(2024, 1, 15, tzinfo=UTC),
+            "raw": b"bytes",
+            "tags": {"b", "a"},
+            "model": SampleModel(name="m"),
+            "obj": CustomObject(),
+            "pair": (1, 2),
+            "nested": [{"at": datetime(2024, 1, 16, tzinfo=UTC)}],
+        }
+        safe_data, data_json = encode_event_data(data)
+        assert safe_data == _safe_serialize(data)
+        assert json.loads(data_json) == safe_data
+
+    def test_json_native_payload_is_not_copied(self) -> None:
+        data = {"session_id": "s1", "payload": {"messages": [{"role": "user", "content": "hi"}], "n": 1.5}}
+        with patch("luthien_proxy.observability.emitter._safe_serialize") as walk:
+            safe_data, data_json = encode_event_data(data)
+        walk.assert_not_called()
+        assert safe_data is data
+        assert json.loads(data_json) == data
+
+    def test_falls_back_for_keys_the_encoder_rejects(self) -> None:
+        data = {(1, 2): "tuple key"}
+        safe_data, data_json = encode_event_data(data)
+        assert safe_data == {"(1, 2)": "tuple key"}
+        assert json.loads(data_json) == safe_data
+
+
 class TestNullEventEmitter:
     """Tests for NullEventEmitter."""
 
@@ -253,8 +296,43 @@ class TestEventEmitter:
             call_id="tx-123",
             event_type="test.event",
             data={"key": "value"},
+            data_json='{"key": "value"}',
         )
 
+    @pytest.mark.asyncio
+    async def test_emit_publishes_projection_of_large_payloads(self) -> None:
+        """The live activity stream gets a summary, not the whole request."""
+        mock_publisher = AsyncMock()
+        emitter = EventEmitter(event_publisher=mock_publisher, stdout_enabled=False)
+        request = {"model": "claude-x", "messages": [{"role": "user", "content": "x" * 10_000}]}
+        await emitter.emit("tx-1", "pipeline.client_request", {"payload": request, "session_id": "s"})
+
+        kwargs = mock_publisher.publish_event.call_args.kwargs
+        assert kwargs["data_json"] is None
+        assert kwargs["data"]["session_id"] == "s"
+        assert kwargs["data"]["truncated"] is True
+        assert kwargs["data"]["payload"]["message_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_emit_shares_one_encoding_across_sinks(self, capsys) -> None:
+        """stdout, the DB buffer and the publisher all receive the same JSON text."""
+        mock_publisher = AsyncMock()
+        buffer = EventWriteBuffer(AsyncMock())
+        emitter = EventEmitter(event_publisher=mock_publisher, db_write_buffer=buffer)
+
+        with patch("luthien_proxy.observability.emitter.json.dumps", wraps=json.dumps) as dumps:
+            await emitter.emit("tx-1", "test.event", {"at": datetime(2024, 1, 15, tzinfo=UTC), "raw": b"hi"})
+
+        data_json = '{"at": "2024-01-15T00:00:00+00:00", "raw": "b64:aGk="}'
+        payload_dumps = [c for c in dumps.call_args_list if isinstance(c.args[0], dict) and "at" in c.args[0]]
+        assert len(payload_dumps) == 1
+        assert buffer._queue[0].data_json == data_json
+        assert mock_publisher.publish_event.call_args.kwargs["data_json"] == data_json
+        line = json.loads(capsys.readouterr().out)
+        assert line["event_type"] == "test.event"
+        assert list(line)[-1] == "data"
+        assert line["data"] == json.loads(data_json)
+
     @pytest.mark.asyncio
     async def test_write_db_increments_dropped_counter_on_db_error(self) -> None:
         """_write_db() increments dropped_db_writes on asyncpg errors."""
@@ -400,3 +478,229 @@ class TestWriteDbAtomicity:
         async with pool.connection() as conn:
             events = await conn.fetch("SELECT * FROM conversation_events WHERE call_id = $1", "tx-3")
         assert events == []
+
+
+class TestWriteEventBatch:
+    """write_event_batch must produce the same rows as per-event _write_db calls."""
+
+    @pytest.fixture
+    async def pool(self):
+        from luthien_proxy.utils.db import DatabasePool
+        from luthien_proxy.utils.migration_check import check_migrations
+
+        p = DatabasePool("sqlite://:memory:")
+        await check_migrations(p)
+        return p
+
+    @staticmethod
+    def _events() -> list[PendingEventWrite]:
+        t0 = datetime(2026, 1, 1, tzinfo=UTC)
+        request = {
+            "session_id": "sess",
+            "user_id": "u1",
+            "final_model": "claude-a",
+            "final_request": {"messages": [{"role": "user", "content": "hello"}]},
+        }
+        return [
+            PendingEventWrite("tx-1", "pipeline.client_request", {"session_id": "sess"}, t0),
+            PendingEventWrite("tx-1", "transaction.request_recorded", request, t0 + timedelta(seconds=1)),
+            PendingEventWrite("tx-1", "policy.modified", {"session_id": "sess"}, t0 + timedelta(seconds=2)),
+            PendingEventWrite(
+                "tx-2",
+                "transaction.request_recorded",
+                {**request, "user_id": "u2", "final_model": "claude-b"},
+                t0 + timedelta(seconds=3),
+            ),
+            PendingEventWrite("tx-3", "no.session", {"key": "value"}, t0 + timedelta(seconds=4)),
+        ]
+
+    async def _snapshot(self, pool) -> tuple[list, list, list]:
+        async with pool.connection() as conn:
+            calls = await conn.fetch("SELECT call_id, session_id, user_id FROM conversation_calls ORDER BY call_id")
+            events = await conn.fetch(
+                "SELECT call_id, event_type, payload, session_id FROM conversation_events ORDER BY created_at"
+            )
+            summaries = await conn.fetch("SELECT * FROM session_summaries")
+        return [dict(r) for r in calls], [dict(r) for r in events], [dict(r) for r in summaries]
+
+    @pytest.mark.asyncio
+    async def test_batch_matches_per_event_writes(self, pool) -> None:
+        from luthien_proxy.utils.db import DatabasePool
+        from luthien_proxy.utils.migration_check import check_migrations
+
+        reference = DatabasePool("sqlite://:memory:")
+        await check_migrations(reference)
+        emitter = EventEmitter(db_pool=reference, stdout_enabled=False)
+        for e in self._events():
+            await emitter._write_db(e.transaction_id, e.event_type, e.data, e.timestamp)
+
+        async with pool.connection() as conn:
+            async with conn.transaction():
+                await write_event_batch(conn, self._events())
+
+        assert await self._snapshot(pool) == await self._snapshot(reference)
+        _, _, summaries = await self._snapshot(pool)
+        assert summaries[0]["event_count"] == 4
+        assert summaries[0]["call_count"] == 2
+        assert summaries[0]["policy_event_count"] == 1
+        assert summaries[0]["models_used"] == "claude-a,claude-b"
+        assert summaries[0]["user_id"] == "u1"
+
+    @pytest.mark.asyncio
+    async def test_batch_larger_than_param_budget_is_chunked(self, pool) -> None:
+        t0 = datetime(2026, 1, 1, tzinfo=UTC)
+        batch = [PendingEventWrite(f"tx-{i}", "test.event", {"i": i}, t0) for i in range(500)]
+        async with pool.connection() as conn:
+            async with conn.transaction():
+                await write_event_batch(conn, batch)
+            assert await conn.fetchval("SELECT COUNT(*) FROM conversation_events") == 500
+            assert await conn.fetchval("SELECT COUNT(*) FROM conversation_calls") == 500
+
+
+class TestEventWriteBuffer:
+    """Bounded write-behind queue in front of the DB sink."""
+
+    @pytest.fixture
+    async def pool(self):
+        from luthien_proxy.utils.db import DatabasePool
+        from luthien_proxy.utils.migration_check import check_migrations
+
+        p = DatabasePool("sqlite://:memory:")
+        await check_migrations(p)
+        return p
+
+    @staticmethod
+    def _write(call_id: str = "tx-1") -> PendingEventWrite:
+        return PendingEventWrite(call_id, "test.event", {"session_id": "sess"}, datetime.now(UTC))
+
+    @staticmethod
+    async def _event_count(pool) -> int:
+        async with pool.connection() as conn:
+            return int(await conn.fetchval("SELECT COUNT(*) FROM conversation_events"))
+
+    def test_rejects_invalid_config(self) -> None:
+        with pytest.raises(ValueError):
+            EventWriteBuffer(AsyncMock(), max_queue_size=0)
+        with pytest.raises(ValueError):
+            EventWriteBuffer(AsyncMock(), flush_size=0)
+        with pytest.raises(ValueError):
+            EventWriteBuffer(AsyncMock(), flush_interval_seconds=0)
+
+    def test_full_queue_drops_and_counts(self) -> None:
+        buffer = EventWriteBuffer(AsyncMock(), max_queue_size=2)
+        assert buffer.enqueue(self._write()) is True
+        assert buffer.enqueue(self._write()) is True
+        assert buffer.enqueue(self._write()) is False
+        assert buffer.queue_depth == 2
+        assert buffer.dropped_queue_full_count == 1
+        assert buffer.stats()["high_water_mark"] == 2
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_in_batches(self, pool) -> None:
+        buffer = EventWriteBuffer(pool, flush_size=2)
+        for i in range(5):
+            buffer.enqueue(self._write(f"tx-{i}"))
+        await buffer.flush()
+        assert await self._event_count(pool) == 5
+        assert buffer.queue_depth == 0
+        assert buffer.written_count == 5
+        assert buffer.stats()["flushes"] == 3
+
+    @pytest.mark.asyncio
+    async def test_drainer_flushes_on_interval(self, pool) -> None:
+        buffer = EventWriteBuffer(pool, flush_size=100, flush_interval_seconds=0.01)
+        buffer.start()
+        try:
+            buffer.enqueue(self._write())
+            for _ in range(100):
+                if buffer.written_count:
+                    break
+                await asyncio.sleep(0.01)
+            assert await self._event_count(pool) == 1
+        finally:
+            await buffer.stop()
+
+    @pytest.mark.asyncio
+    async def test_drainer_wakes_early_at_flush_size(self, pool) -> None:
+        buffer = EventWriteBuffer(pool, flush_size=2, flush_interval_seconds=60)
+        buffer.start()
+        try:
+            buffer.enqueue(self._write("tx-1"))
+            buffer.enqueue(self._write("tx-2"))
+            for _ in range(100):
+                if buffer.written_count == 2:
+                    break
+                await asyncio.sleep(0.01)
+            assert buffer.written_count == 2
+        finally:
+            await buffer.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_remaining_and_rejects_later_events(self, pool) -> None:
+        buffer = EventWriteBuffer(pool, flush_interval_seconds=60)
+        buffer.start()
+        buffer.enqueue(self._write())
+        await buffer.stop()
+        assert await self._event_count(pool) == 1
+        assert buffer.enqueue(self._write()) is False
+        assert buffer.dropped_queue_full_count == 0
+
+    @pytest.mark.asyncio
+    async def test_stop_during_in_flight_write_keeps_the_batch(self, pool) -> None:
+        from luthien_proxy.observability import emitter as emitter_module
+
+        writing = asyncio.Event()
+        release = asyncio.Event()
+        real_write = emitter_module.write_event_batch
+
+        async def slow_write(conn, batch, **kwargs):
+            writing.set()
+            await release.wait()
+            await real_write(conn, batch, **kwargs)
+
+        buffer = EventWriteBuffer(pool, flush_size=1, flush_interval_seconds=60)
+        buffer.start()
+        with patch("luthien_proxy.observability.emitter.write_event_batch", new=slow_write):
+            buffer.enqueue(self._write("tx-1"))
+            await writing.wait()
+            assert buffer.queue_depth == 0
+            stopping = asyncio.create_task(buffer.stop())
+            await asyncio.sleep(0)
+            release.set()
+            await stopping
+
+        assert await self._event_count(pool) == 1
+        assert buffer.written_count == 1
+        assert buffer.stats()["flushes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_drops_whole_batch(self, pool) -> None:
+        import sqlite3
+
+        buffer = EventWriteBuffer(pool)
+        buffer.enqueue(self._write("tx-1"))
+        buffer.enqueue(self._write("tx-2"))
+        before = EventEmitter.dropped_db_writes
+        with patch(
+            "luthien_proxy.observability.emitter.apply_session_summary_delta",
+            new_callable=AsyncMock,
+            side_effect=sqlite3.OperationalError("disk I/O error"),
+        ):
+            await buffer.flush()
+        assert EventEmitter.dropped_db_writes == before + 2
+        assert buffer.failed_flush_count == 1
+        assert buffer.written_count == 0
+        assert buffer.stats()["flushes"] == 0
+        assert await self._event_count(pool) == 0
+
+    @pytest.mark.asyncio
+    async def test_emitter_enqueues_instead_of_writing(self, pool) -> None:
+        buffer = EventWriteBuffer(pool)
+        emitter = EventEmitter(db_pool=pool, stdout_enabled=False, db_write_buffer=buffer)
+        with patch.object(emitter, "_write_db", new_callable=AsyncMock) as direct:
+            await emitter.emit("tx-1", "test.event", {"when": datetime(2026, 1, 1, tzinfo=UTC)})
+        direct.assert_not_called()
+        assert buffer.queue_depth == 1
+        await buffer.flush()
+        assert await self._event_count(pool) == 1
+        assert emitter.db_write_stats()["written"] == 1
@@ -50,6 +50,28 @@ class TestInProcessEventPublisher:
         assert len(received_a) == 1
         assert len(received_b) == 1
 
+    @pytest.mark.asyncio
+    async def test_event_type_filter_is_per_subscriber(self):
+        publisher = InProcessEventPublisher()
+        filtered: list[str] = []
+        unfiltered: list[str] = []
+
+        async def consume(target: list[str], event_types: tuple[str, ...] | None):
+            async for event in publisher.stream_events(heartbeat_seconds=999, event_types=event_types):
+                target.append(event)
+                break
+
+        task_filtered = asyncio.create_task(consume(filtered, ("policy.",)))
+        task_unfiltered = asyncio.create_task(consume(unfiltered, None))
+        await asyncio.sleep(0.01)
+
+        await publisher.publish_event("call-1", "transaction.request_recorded")
+        await publisher.publish_event("call-1", "policy.decision")
+        await asyncio.wait_for(asyncio.gather(task_filtered, task_unfiltered), timeout=1.0)
+
+        assert "policy.decision" in filtered[0]
+        assert "transaction.request_recorded" in unfiltered[0]
+
     @pytest.mark.asyncio
     async def test_no_subscribers_does_not_error(self):
         publisher = InProcessEventPublisher()
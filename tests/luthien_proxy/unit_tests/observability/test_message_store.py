@@ -0,0 +1,238 @@
+"""Tests for content-addressed conversation message storage."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from luthien_proxy.debug.service import fetch_call_diff, fetch_call_events
+from luthien_proxy.history.service import fetch_session_detail, fetch_session_list
+from luthien_proxy.observability.emitter import EventEmitter, PendingEventWrite, write_event_batch
+from luthien_proxy.observability.message_store import (
+    BLOB_REF_KEY,
+    externalize_messages,
+    message_digest,
+    rehydrate_payloads,
+    store_message_blobs,
+)
+from luthien_proxy.retention.purger import ConversationPurger
+from luthien_proxy.utils.db import DatabasePool
+from luthien_proxy.utils.migration_check import check_migrations
+
+_HISTORY = [
+    {"role": "user", "content": "Refactor the parser please"},
+    {"role": "assistant", "content": [{"type": "text", "text": "Sure, here is a plan."}]},
+]
+_TURN = [*_HISTORY, {"role": "user", "content": [{"type": "text", "text": "Now add tests"}]}]
+
+
+def _request_recorded(messages: list[dict], session_id: str = "sess-1") -> dict:
+    return {
+        "session_id": session_id,
+        "user_id": "u1",
+        "final_model": "claude-x",
+        "original_request": {"model": "claude-x", "max_tokens": 100, "messages": messages},
+        "final_request": {"model": "claude-x", "max_tokens": 100, "messages": messages},
+    }
+
+
+@pytest.fixture
+async def pool():
+    p = DatabasePool("sqlite://:memory:")
+    await check_migrations(p)
+    yield p
+    await p.close()
+
+
+async def _stored_payloads(pool: DatabasePool, call_id: str) -> list[dict]:
+    async with pool.connection() as conn:
+        rows = await conn.fetch(
+            "SELECT payload FROM conversation_events WHERE call_id = $1 ORDER BY created_at ASC", call_id
+        )
+    return [json.loads(row["payload"]) for row in rows]
+
+
+async def _blob_count(pool: DatabasePool) -> int:
+    async with pool.connection() as conn:
+        return int(await conn.fetchval("SELECT COUNT(*) FROM conversation_message_blobs"))  # type: ignore[arg-type]
+
+
+class TestExternalizeMessages:
+    def test_replaces_messages_with_refs_without_mutating_input(self) -> None:
+        data = _request_recorded(_TURN)
+        snapshot = json.loads(json.dumps(data))
+
+        stored, blobs = externalize_messages(data)
+
+        assert data == snapshot
+        refs = stored["final_request"]["messages"]
+        assert refs == [{BLOB_REF_KEY: message_digest(m)} for m in _TURN]
+        assert stored["original_request"]["messages"] == refs
+        assert stored["final_request"]["max_tokens"] == 100
+        # Identical messages across original/final collapse to one blob each.
+        assert len(blobs) == len(_TURN)
+        assert {json.loads(v)["role"] for v in blobs.values()} == {"user", "assistant"}
+
+    def test_client_request_payload_key_is_externalized(self) -> None:
+        stored, blobs = externalize_messages({"payload": {"messages": _HISTORY}, "session_id": "s"})
+        assert all(BLOB_REF_KEY in m for m in stored["payload"]["messages"])
+        assert len(blobs) == 2
+
+    def test_payload_without_messages_is_returned_as_is(self) -> None:
+        data = {"final_response": {"content": "hi"}, "summary": "done"}
+        stored, blobs = externalize_messages(data)
+        assert stored is data
+        assert blobs == {}
+
+    def test_digest_ignores_key_order(self) -> None:
+        assert message_digest({"role": "user", "content": "x"}) == message_digest({"content": "x", "role": "user"})
+
+
+class TestStoreAndRehydrate:
+    @pytest.mark.asyncio
+    async def test_round_trip(self, pool) -> None:
+        stored, blobs = externalize_messages(_request_recorded(_TURN))
+        async with pool.connection() as conn:
+            await store_message_blobs(conn, blobs, datetime.now(UTC))
+            await rehydrate_payloads(conn, [stored])
+
+        assert stored["final_request"]["messages"] == _TURN
+        assert stored["original_request"]["messages"] == _TURN
+
+    @pytest.mark.asyncio
+    async def test_existing_blob_bumps_last_seen(self, pool) -> None:
+        _, blobs = externalize_messages(_request_recorded(_HISTORY))
+        first = datetime(2026, 1, 1, tzinfo=UTC)
+        later = first + timedelta(days=3)
+        async with pool.connection() as conn:
+            await store_message_blobs(conn, blobs, first)
+            await store_message_blobs(conn, blobs, later)
+            rows = await conn.fetch("SELECT created_at, last_seen_at FROM conversation_message_blobs")
+
+        assert len(rows) == 2
+        for row in rows:
+            assert str(row["created_at"]) < str(row["last_seen_at"])
+
+    @pytest.mark.asyncio
+    async def test_missing_blob_leaves_ref_in_place(self, pool) -> None:
+        payload = {"final_request": {"messages": [{BLOB_REF_KEY: "0" * 64}, {"role": "user", "content": "inline"}]}}
+        async with pool.connection() as conn:
+            await rehydrate_payloads(conn, [payload])
+        assert payload["final_request"]["messages"] == [{BLOB_REF_KEY: "0" * 64}, {"role": "user", "content": "inline"}]
+
+
+class TestEmitterDedup:
+    @pytest.mark.asyncio
+    async def test_direct_write_stores_refs_and_shares_prefix_blobs(self, pool) -> None:
+        emitter = EventEmitter(db_pool=pool, stdout_enabled=False, dedup_messages=True)
+        now = datetime.now(UTC)
+        await emitter._write_db("tx-1", "transaction.request_recorded", _request_recorded(_HISTORY), now)
+        await emitter._write_db("tx-2", "transaction.request_recorded", _request_recorded(_TURN), now)
+
+        (payload,) = await _stored_payloads(pool, "tx-2")
+        assert all(set(m) == {BLOB_REF_KEY} for m in payload["final_request"]["messages"])
+        # The second turn only adds its one new message.
+        assert await _blob_count(pool) == len(_TURN)
+
+        async with pool.connection() as conn:
+            summary = await conn.fetchrow(
+                "SELECT preview_message FROM session_summaries WHERE session_id = $1", "sess-1"
+            )
+        assert summary is not None
+        assert summary["preview_message"] == "Refactor the parser please"
+
+    @pytest.mark.asyncio
+    async def test_batch_write_stores_refs(self, pool) -> None:
+        now = datetime.now(UTC)
+        batch = [
+            PendingEventWrite("tx-1", "pipeline.client_request", {"payload": {"messages": _TURN}}, now),
+            PendingEventWrite("tx-1", "transaction.request_recorded", _request_recorded(_TURN), now),
+        ]
+        async with pool.connection() as conn:
+            async with conn.transaction():
+                await write_event_batch(conn, batch, dedup_messages=True)
+
+        payloads = await _stored_payloads(pool, "tx-1")
+        assert all(BLOB_REF_KEY in m for m in payloads[0]["payload"]["messages"])
+        assert await _blob_count(pool) == len(_TURN)
+
+    @pytest.mark.asyncio
+    async def test_dedup_disabled_stores_inline(self, pool) -> None:
+        emitter = EventEmitter(db_pool=pool, stdout_enabled=False)
+        await emitter._write_db("tx-1", "transaction.request_recorded", _request_recorded(_TURN), datetime.now(UTC))
+
+        (payload,) = await _stored_payloads(pool, "tx-1")
+        assert payload["final_request"]["messages"] == _TURN
+        assert await _blob_count(pool) == 0
+
+    @pytest.mark.asyncio
+    async def test_search_index_sees_message_text(self, pool) -> None:
+        emitter = EventEmitter(db_pool=pool, stdout_enabled=False, dedup_messages=True)
+        await emitter._write_db("tx-1", "transaction.request_recorded", _request_recorded(_TURN), datetime.now(UTC))
+
+        async with pool.connection() as conn:
+            rows = await conn.fetch(
+                "SELECT si.session_id FROM session_search_index si "
+                "WHERE si.id IN (SELECT rowid FROM session_search_fts WHERE session_search_fts MATCH $1)",
+                "parser",
+            )
+        assert [row["session_id"] for row in rows] == ["sess-1"]
+
+
+class TestReadersRehydrate:
+    @pytest.fixture
+    async def deduped_pool(self, pool):
+        emitter = EventEmitter(db_pool=pool, stdout_enabled=False, dedup_messages=True)
+        now = datetime.now(UTC)
+        final = _request_recorded(_TURN)
+        final["final_request"] = {**final["final_request"], "messages": [*_TURN, {"role": "user", "content": "ctx"}]}
+        await emitter._write_db("tx-1", "pipeline.client_request", {"payload": {"messages": _TURN}}, now)
+        await emitter._write_db("tx-1", "transaction.request_recorded", final, now + timedelta(milliseconds=1))
+        return pool
+
+    @pytest.mark.asyncio
+    async def test_session_detail(self, deduped_pool) -> None:
+        detail = await fetch_session_detail("sess-1", deduped_pool)
+        texts = [m.content for m in detail.turns[0].request_messages]
+        assert "Refactor the parser please" in texts
+        assert "Now add tests" in texts
+
+    @pytest.mark.asyncio
+    async def test_session_list_preview(self, deduped_pool) -> None:
+        result = await fetch_session_list(10, deduped_pool)
+        assert result.sessions[0].preview_message == "Refactor the parser please"
+
+    @pytest.mark.asyncio
+    async def test_debug_events_and_diff(self, deduped_pool) -> None:
+        events = await fetch_call_events("tx-1", deduped_pool)
+        assert events.events[0].payload["payload"]["messages"] == _TURN
+
+        diff = await fetch_call_diff("tx-1", deduped_pool)
+        assert diff.request is not None
+        assert [m.original_content for m in diff.request.messages[:2]] == [
+            "Refactor the parser please",
+            "Sure, here is a plan.",
+        ]
+
+
+class TestPurgeMessageBlobs:
+    @pytest.mark.asyncio
+    async def test_blobs_only_referenced_by_purged_calls_are_deleted(self, pool) -> None:
+        emitter = EventEmitter(db_pool=pool, stdout_enabled=False, dedup_messages=True)
+        now = datetime.now(UTC)
+        await emitter._write_db(
+            "old", "transaction.request_recorded", _request_recorded(_HISTORY), now - timedelta(days=40)
+        )
+        await emitter._write_db("new", "transaction.request_recorded", _request_recorded(_TURN[2:]), now)
+        assert await _blob_count(pool) == 3
+
+        purger = ConversationPurger(db_pool=pool, retention_days=30, purge_message_blobs=True)
+        assert await purger.purge_once() == 1
+
+        assert await _blob_count(pool) == 1
+        (payload,) = await _stored_payloads(pool, "new")
+        async with pool.connection() as conn:
+            await rehydrate_payloads(conn, [payload])
+        assert payload["final_request"]["messages"] == _TURN[2:]
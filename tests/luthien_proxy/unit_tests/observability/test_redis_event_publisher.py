@@ -278,6 +278,28 @@ class TestStreamActivityEvents:
         assert chunks[0] == 'data: {"event": "test1"}\n\n'
         assert chunks[1] == 'data: {"event": "test2"}\n\n'
 
+    @pytest.mark.asyncio
+    async def test_event_type_filter_skips_other_events(self) -> None:
+        """Only events matching the subscriber's filter are forwarded."""
+        redis = FakeRedis()
+        redis.messages = [
+            {"type": "message", "data": b'{"call_id": "c", "event_type": "pipeline.client_request"}'},
+            {"type": "message", "data": b"not json"},
+            {"type": "message", "data": b'{"call_id": "c", "event_type": "policy.decision"}'},
+        ]
+
+        chunks = []
+        async for chunk in stream_activity_events(
+            redis,  # type: ignore
+            heartbeat_seconds=60.0,
+            timeout_seconds=0.1,
+            event_types=("policy.",),
+        ):
+            chunks.append(chunk)
+            break
+
+        assert chunks == ['data: {"call_id": "c", "event_type": "policy.decision"}\n\n']
+
     @pytest.mark.asyncio
     async def test_handles_bytes_data(self) -> None:
         """Test that bytes data is properly decoded."""
@@ -601,6 +623,19 @@ class TestRedisEventPublisher:
         assert parsed["data"]["mixed"]["bool"] is True
         assert parsed["data"]["mixed"]["none"] is None
 
+    @pytest.mark.asyncio
+    async def test_publish_event_uses_pre_encoded_data(self) -> None:
+        """data_json is published verbatim instead of re-encoding data."""
+        mock_redis = Mock()
+        mock_redis.publish = AsyncMock()
+
+        publisher = RedisEventPublisher(mock_redis)
+        await publisher.publish_event("call-123", "test.event", data={"key": "value"}, data_json='{"key":"value"}')
+
+        published_json = mock_redis.publish.call_args[0][1]
+        assert published_json.endswith(', "data": {"key":"value"}}')
+        assert json.loads(published_json)["data"] == {"key": "value"}
+
     @pytest.mark.asyncio
     async def test_publisher_initialization(self) -> None:
         """Test that publisher stores the Redis client and channel."""
@@ -0,0 +1,176 @@
+"""Unit tests for the incremental session search index.
+
+Text extraction is tested directly; the indexer runs against a real in-memory
+SQLite DatabasePool with all migrations applied, so the FTS5 sync triggers on
+``session_search_index`` are live.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from luthien_proxy.observability.emitter import EventEmitter, PendingEventWrite, write_event_batch
+from luthien_proxy.observability.search_index import (
+    SearchIndexEvent,
+    content_text,
+    index_session_search_text,
+    new_user_text,
+    request_messages,
+    response_text,
+)
+from luthien_proxy.utils.db import DatabasePool
+from luthien_proxy.utils.migration_check import check_migrations
+
+_T0 = datetime(2026, 4, 1, 10, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+async def pool():
+    p = DatabasePool("sqlite://:memory:")
+    await check_migrations(p)
+    yield p
+    await p.close()
+
+
+def _user(text: str) -> dict:
+    return {"role": "user", "content": text}
+
+
+def _assistant(text: str) -> dict:
+    return {"role": "assistant", "content": [{"type": "text", "text": text}]}
+
+
+def _request(messages: list[dict], *, session_id: str = "sess-1", max_tokens: int = 100) -> dict:
+    return {
+        "session_id": session_id,
+        "original_request": {"max_tokens": max_tokens, "messages": messages},
+        "final_request": {"max_tokens": max_tokens, "messages": [*messages, _user("<policy-context>")]},
+    }
+
+
+def _response(text: str, *, session_id: str = "sess-1") -> dict:
+    return {"session_id": session_id, "final_response": {"content": [{"type": "text", "text": text}]}}
+
+
+async def _indexed(pool: DatabasePool) -> list[tuple[str, str]]:
+    async with pool.connection() as conn:
+        rows = await conn.fetch("SELECT call_id, content FROM session_search_index ORDER BY id")
+    return [(row["call_id"], row["content"]) for row in rows]
+
+
+async def _matching_sessions(pool: DatabasePool, term: str) -> list[str]:
+    async with pool.connection() as conn:
+        rows = await conn.fetch(
+            "SELECT DISTINCT si.session_id FROM session_search_index si "
+            "WHERE si.id IN (SELECT rowid FROM session_search_fts WHERE session_search_fts MATCH $1)",
+            term,
+        )
+    return [row["session_id"] for row in rows]
+
+
+class TestExtraction:
+    def test_content_text_joins_text_blocks_only(self) -> None:
+        content = [
+            {"type": "text", "text": " first "},
+            {"type": "tool_result", "content": "skipped"},
+            {"type": "text", "text": ""},
+            {"type": "text", "text": "second"},
+        ]
+        assert content_text(content) == "first second"
+        assert content_text("  plain  ") == "plain"
+        assert content_text(None) == ""
+
+    def test_request_messages_prefers_original_request(self) -> None:
+        assert request_messages(_request([_user("hi")])) == [_user("hi")]
+        assert request_messages({"final_request": {"messages": [_user("hi")]}}) == [_user("hi")]
+
+    def test_probe_request_has_no_messages(self) -> None:
+        assert request_messages(_request([_user("hi")], max_tokens=1)) is None
+
+    def test_new_user_text_skips_seen_prefix_and_assistant_turns(self) -> None:
+        messages = [_user("old"), _assistant("reply"), _user("new")]
+        assert new_user_text(messages, 1) == "new"
+        assert new_user_text(messages, 0) == "old new"
+
+    def test_shorter_history_counts_as_new(self) -> None:
+        assert new_user_text([_user("compacted")], 5) == "compacted"
+
+    def test_response_text(self) -> None:
+        assert response_text(_response("the answer")) == "the answer"
+        assert response_text({}) == ""
+
+
+class TestIndexSessionSearchText:
+    @pytest.mark.asyncio
+    async def test_each_turn_indexes_only_its_new_text(self, pool) -> None:
+        emitter = EventEmitter(db_pool=pool, stdout_enabled=False)
+        first = [_user("alpha question")]
+        second = [*first, _assistant("beta answer"), _user("gamma followup")]
+        await emitter._write_db("tx-1", "transaction.request_recorded", _request(first), _T0)
+        await emitter._write_db(
+            "tx-1", "transaction.non_streaming_response_recorded", _response("beta answer"), _T0 + timedelta(seconds=1)
+        )
+        await emitter._write_db("tx-2", "transaction.request_recorded", _request(second), _T0 + timedelta(seconds=2))
+
+        assert await _indexed(pool) == [("tx-1", "alpha question"), ("tx-1", "beta answer"), ("tx-2", "gamma followup")]
+        async with pool.connection() as conn:
+            count = await conn.fetchval(
+                "SELECT message_count FROM session_search_state WHERE session_id = $1", "sess-1"
+            )
+        assert count == 3
+
+    @pytest.mark.asyncio
+    async def test_policy_context_is_not_indexed(self, pool) -> None:
+        emitter = EventEmitter(db_pool=pool, stdout_enabled=False)
+        await emitter._write_db("tx-1", "transaction.request_recorded", _request([_user("hello")]), _T0)
+
+        assert await _matching_sessions(pool, "hello") == ["sess-1"]
+        assert await _matching_sessions(pool, '"policy"') == []
+
+    @pytest.mark.asyncio
+    async def test_probe_leaves_message_count_alone(self, pool) -> None:
+        emitter = EventEmitter(db_pool=pool, stdout_enabled=False)
+        history = [_user("one"), _assistant("two"), _user("three")]
+        await emitter._write_db("tx-1", "transaction.request_recorded", _request(history), _T0)
+        await emitter._write_db(
+            "tx-2", "transaction.request_recorded", _request([_user("probe")], max_tokens=1), _T0 + timedelta(seconds=1)
+        )
+        await emitter._write_db(
+            "tx-3",
+            "transaction.request_recorded",
+            _request([*history, _assistant("four"), _user("five")]),
+            _T0 + timedelta(seconds=2),
+        )
+
+        assert await _indexed(pool) == [("tx-1", "one three"), ("tx-3", "five")]
+
+    @pytest.mark.asyncio
+    async def test_events_without_text_issue_no_statements(self) -> None:
+        class _NoQueryConn:
+            async def fetch(self, *args, **kwargs):
+                raise AssertionError("unexpected query")
+
+            async def execute(self, *args, **kwargs):
+                raise AssertionError("unexpected query")
+
+        event = SearchIndexEvent(call_id="tx-1", session_id="sess-1", event_type="policy.block", data={}, timestamp=_T0)
+        await index_session_search_text(_NoQueryConn(), [event])  # type: ignore[arg-type]
+
+    @pytest.mark.asyncio
+    async def test_batch_diffs_requests_in_write_order(self, pool) -> None:
+        first = [_user("alpha")]
+        second = [*first, _assistant("beta"), _user("gamma")]
+        batch = [
+            PendingEventWrite("tx-1", "transaction.request_recorded", _request(first), _T0),
+            PendingEventWrite("tx-1", "transaction.streaming_response_recorded", _response("beta"), _T0),
+            PendingEventWrite("tx-2", "transaction.request_recorded", _request(second), _T0),
+            PendingEventWrite("tx-3", "transaction.request_recorded", _request([_user("other")], session_id="s2"), _T0),
+        ]
+        async with pool.connection() as conn:
+            async with conn.transaction():
+                await write_event_batch(conn, batch)
+
+        assert await _indexed(pool) == [("tx-1", "alpha"), ("tx-1", "beta"), ("tx-2", "gamma"), ("tx-3", "other")]
+        assert await _matching_sessions(pool, "other") == ["s2"]
@@ -44,6 +44,10 @@ class TestIsPolicyEvent:
         assert _is_policy_event("policy.judge.evaluation") is False
         assert _is_policy_event("policy.judge.evaluation.completed") is False
 
+    def test_prefixed_judge_evaluation_excluded(self) -> None:
+        assert _is_policy_event("policy.anthropic_judge.evaluation_started") is False
+        assert _is_policy_event("policy.anthropic_judge.tool_call_blocked") is True
+
     def test_non_policy_excluded(self) -> None:
         assert _is_policy_event("transaction.request_recorded") is False
         assert _is_policy_event("pipeline.client_request") is False
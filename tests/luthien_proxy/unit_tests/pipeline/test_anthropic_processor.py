@@ -45,6 +45,45 @@ from luthien_proxy.policy_core.anthropic_execution_interface import (
 from luthien_proxy.policy_core.policy_context import PolicyContext
 
 
+class _EventPathNoOpPolicy(NoOpPolicy):
+    """NoOp that opts out of SSE passthrough, to exercise the per-event streaming path."""
+
+    observes_stream_events_only = False
+
+
+def _text_stream_events(message_id: str, texts: list[str]) -> list[MessageStreamEvent]:
+    """A complete single-text-block stream whose deltas carry ``texts``."""
+    return [
+        RawMessageStartEvent(
+            type="message_start",
+            message={
+                "id": message_id,
+                "type": "message",
+                "role": "assistant",
+                "content": [],
+                "model": DEFAULT_TEST_MODEL,
+                "stop_reason": None,
+                "stop_sequence": None,
+                "usage": {"input_tokens": 7, "output_tokens": 0},
+            },
+        ),
+        RawContentBlockStartEvent(type="content_block_start", index=0, content_block={"type": "text", "text": ""}),
+        *[
+            RawContentBlockDeltaEvent(
+                type="content_block_delta", index=0, delta=TextDelta(type="text_delta", text=text)
+            )
+            for text in texts
+        ],
+        RawContentBlockStopEvent(type="content_block_stop", index=0),
+        RawMessageDeltaEvent(
+            type="message_delta",
+            delta={"stop_reason": "end_turn", "stop_sequence": None},
+            usage={"output_tokens": 3},
+        ),
+        RawMessageStopEvent(type="message_stop"),
+    ]
+
+
 class TestFormatSSEEvent:
     """Tests for _format_sse_event helper function."""
 
@@ -860,7 +899,7 @@ class TestMidStreamErrorHandling:
     @pytest.fixture
     def mock_policy(self):
         """Create a mock Anthropic policy."""
-        return NoOpPolicy()
+        return _EventPathNoOpPolicy()
 
     @pytest.mark.asyncio
     async def test_mid_stream_api_error_emits_error_event(self, mock_policy):
@@ -1269,7 +1308,7 @@ class TestExecutionPolicyRuntime:
             yield RawMessageStopEvent(type="message_stop")
 
         mock_anthropic_client.stream = MagicMock(return_value=backend_stream())
-        policy = NoOpPolicy()
+        policy = _EventPathNoOpPolicy()
 
         response = await process_anthropic_request(
             request=mock_request,
@@ -1806,7 +1845,7 @@ class TestStreamingResponseRecording:
 
         response = await process_anthropic_request(
             request=mock_request,
-            policy=NoOpPolicy(),
+            policy=_EventPathNoOpPolicy(),
             anthropic_client=mock_client,
             emitter=mock_emitter,
         )
@@ -2086,40 +2125,30 @@ class TestAnthropicPolicyIOBuffering:
             is_streaming=is_streaming,
         )
 
-    def test_buffer_raw_events_false_when_streaming(self):
-        """Streaming requests should NOT buffer raw events (memory optimisation)."""
+    def test_streaming_does_not_fold_raw_events(self):
+        """Streaming requests reconstruct from emitted events; no second accumulator."""
         io = self._make_io(is_streaming=True)
-        assert io._buffer_raw_events is False
+        assert io._raw_backend_accumulator is None
+        assert io.first_backend_response is None
 
-    def test_buffer_raw_events_true_when_not_streaming(self):
-        """Non-streaming requests should buffer raw events for response reconstruction."""
+    @pytest.mark.asyncio
+    async def test_non_streaming_backend_stream_sets_first_backend_response(self):
+        """A policy that streams from the backend in non-streaming mode still gets
+        an original response, reconstructed from the raw backend events."""
         io = self._make_io(is_streaming=False)
-        assert io._buffer_raw_events is True
-
-    def test_raw_backend_events_starts_empty(self):
-        """Raw backend events list starts empty regardless of streaming mode."""
-        for streaming in (True, False):
-            io = self._make_io(is_streaming=streaming)
-            assert io._raw_backend_events == []
 
-    def test_streaming_fallback_uses_accumulated_events(self):
-        """When buffering is disabled (streaming), raw_events should come from
-        accumulated_events, not from the empty _raw_backend_events list."""
-        io = self._make_io(is_streaming=True)
-        accumulated_events = [MagicMock(spec=MessageStreamEvent)]
-
-        # This mirrors the logic in the streaming response path
-        raw_events = accumulated_events if not io._buffer_raw_events else io._raw_backend_events
-        assert raw_events is accumulated_events
+        async def _backend():
+            for event in _text_stream_events("msg_raw", ["Hel", "lo"]):
+                yield event
 
-    def test_non_streaming_uses_raw_backend_events(self):
-        """When buffering is enabled (non-streaming), raw_events should come
-        from _raw_backend_events, even when it is empty."""
-        io = self._make_io(is_streaming=False)
-        accumulated_events = [MagicMock(spec=MessageStreamEvent)]
+        io._anthropic_client.stream = MagicMock(return_value=_backend())
+        async for _ in io.stream():
+            pass
 
-        raw_events = accumulated_events if not io._buffer_raw_events else io._raw_backend_events
-        assert raw_events is io._raw_backend_events
+        response = io.first_backend_response
+        assert response is not None
+        assert response["id"] == "msg_raw"
+        assert response["content"] == [{"type": "text", "text": "Hello"}]
 
 
 class TestStreamingWebhookGate:
@@ -2154,8 +2183,7 @@ class TestStreamingWebhookGate:
         io = MagicMock()
         io.request = {"model": "claude-test"}
         io.ensure_request_recorded = MagicMock()
-        io._buffer_raw_events = False
-        io._raw_backend_events = []
+        io._raw_backend_accumulator = None
 
         span = MagicMock()
         ctx = MagicMock()
@@ -2647,8 +2675,7 @@ class TestWebhookFireIsolation:
         io = MagicMock()
         io.request = {"model": "claude-test"}
         io.ensure_request_recorded = MagicMock()
-        io._buffer_raw_events = False
-        io._raw_backend_events = []
+        io._raw_backend_accumulator = None
 
         span = MagicMock()
         ctx = MagicMock()
@@ -2704,8 +2731,7 @@ class TestWebhookFireIsolation:
         io = MagicMock()
         io.request = {"model": "claude-test"}
         io.ensure_request_recorded = MagicMock()
-        io._buffer_raw_events = False
-        io._raw_backend_events = []
+        io._raw_backend_accumulator = None
         span = MagicMock()
         ctx = MagicMock()
         ctx.session_id = "sess-1"
@@ -2736,3 +2762,297 @@ class TestWebhookFireIsolation:
 
         webhook.fire_and_forget.assert_called_once()
         recorder.flush.assert_called()  # cleanup completed despite webhook failure
+
+
+class TestUsageReservationSettle:
+    """Token/concurrency reservations are settled with the response usage."""
+
+    @pytest.mark.asyncio
+    async def test_non_streaming_settles_with_response_usage(self):
+        from luthien_proxy.pipeline.anthropic_processor import _handle_execution_non_streaming
+
+        response_obj: AnthropicResponse = {
+            "id": "msg_1",
+            "type": "message",
+            "role": "assistant",
+            "content": [],
+            "model": "claude-test",
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": build_usage(input_tokens=10, output_tokens=5),
+        }
+
+        async def emissions():
+            yield response_obj
+
+        io, ctx, recorder, emitter = TestNonStreamingWebhookErrorPath._make_deps()
+        reservation = MagicMock()
+
+        await _handle_execution_non_streaming(
+            emissions=emissions(),
+            io=io,
+            emitter=emitter,
+            policy_ctx=ctx,
+            call_id="call-1",
+            request_log_recorder=recorder,
+            request_start_time=0.0,
+            usage_reservation=reservation,
+        )
+
+        reservation.settle.assert_called_once()
+        (usage,) = reservation.settle.call_args.args
+        assert usage["input_tokens"] == 10
+        assert usage["output_tokens"] == 5
+
+    @pytest.mark.asyncio
+    async def test_non_streaming_error_settles_without_usage(self):
+        from luthien_proxy.pipeline.anthropic_processor import _handle_execution_non_streaming
+
+        async def emissions():
+            raise RuntimeError("policy boom")
+            yield  # unreachable but makes this an async generator
+
+        io, ctx, recorder, emitter = TestNonStreamingWebhookErrorPath._make_deps()
+        reservation = MagicMock()
+
+        with pytest.raises(BackendAPIError):
+            await _handle_execution_non_streaming(
+                emissions=emissions(),
+                io=io,
+                emitter=emitter,
+                policy_ctx=ctx,
+                call_id="call-2",
+                request_log_recorder=recorder,
+                request_start_time=0.0,
+                usage_reservation=reservation,
+            )
+
+        reservation.settle.assert_called_once_with(None)
+
+    @pytest.mark.asyncio
+    async def test_streaming_settles_when_stream_ends(self):
+        from luthien_proxy.pipeline.anthropic_processor import _handle_execution_streaming
+
+        async def emissions():
+            for event in _text_stream_events("msg_settle", ["hi"]):
+                yield event
+
+        io, span, ctx, recorder, emitter = TestStreamingWebhookGate._make_deps()
+        reservation = MagicMock()
+
+        response = await _handle_execution_streaming(
+            emissions=emissions(),
+            io=io,
+            call_id="call-3",
+            root_span=span,
+            policy_ctx=ctx,
+            request_log_recorder=recorder,
+            emitter=emitter,
+            request_start_time=0.0,
+            usage_reservation=reservation,
+        )
+        reservation.settle.assert_not_called()
+        await TestStreamingWebhookGate._drain(response)
+
+        reservation.settle.assert_called_once_with(build_usage(input_tokens=7, output_tokens=3))
+
+
+def _sse(name: str, data: dict) -> bytes:
+    return f"event: {name}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+_UPSTREAM_SSE = [
+    _sse(
+        "message_start",
+        {
+            "type": "message_start",
+            "message": {
+                "id": "msg_raw",
+                "type": "message",
+                "role": "assistant",
+                "content": [],
+                "model": DEFAULT_TEST_MODEL,
+                "stop_reason": None,
+                "stop_sequence": None,
+                "usage": {"input_tokens": 8, "output_tokens": 0},
+            },
+        },
+    ),
+    _sse("ping", {"type": "ping"}),
+    _sse(
+        "content_block_start",
+        {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}},
+    ),
+    # A frame split across network chunks.
+    _sse(
+        "content_block_delta",
+        {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "hi"}},
+    )[:20],
+    _sse(
+        "content_block_delta",
+        {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "hi"}},
+    )[20:],
+    _sse("content_block_stop", {"type": "content_block_stop", "index": 0}),
+    _sse(
+        "message_delta",
+        {
+            "type": "message_delta",
+            "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+            "usage": {"output_tokens": 2},
+        },
+    ),
+    _sse("message_stop", {"type": "message_stop"}),
+]
+
+
+class TestStreamPassthrough:
+    """Observe-only policies get upstream SSE bytes forwarded unchanged."""
+
+    @pytest.fixture
+    def mock_request(self):
+        request = MagicMock()
+        request.headers = {}
+        request.method = "POST"
+        request.url = MagicMock()
+        request.url.path = "/v1/messages"
+        request.json = AsyncMock(
+            return_value={
+                "model": DEFAULT_TEST_MODEL,
+                "messages": [{"role": "user", "content": "hello"}],
+                "max_tokens": 64,
+                "stream": True,
+            }
+        )
+        return request
+
+    @staticmethod
+    def _client(chunks: list[bytes]) -> MagicMock:
+        async def _raw():
+            for chunk in chunks:
+                yield chunk
+
+        client = MagicMock()
+        client.stream_raw = MagicMock(return_value=_raw())
+        client.stream = MagicMock()
+        return client
+
+    @staticmethod
+    async def _body(response: FastAPIStreamingResponse) -> bytes:
+        body = b""
+        async for chunk in response.body_iterator:
+            body += chunk if isinstance(chunk, bytes) else chunk.encode()
+        return body
+
+    @pytest.mark.asyncio
+    async def test_noop_forwards_upstream_bytes_and_records_response(self, mock_request):
+        client = self._client(_UPSTREAM_SSE)
+        emitter = MagicMock()
+        reservation = MagicMock()
+
+        response = await process_anthropic_request(
+            request=mock_request,
+            policy=NoOpPolicy(),
+            anthropic_client=client,
+            emitter=emitter,
+            usage_reservation=reservation,
+        )
+        body = await self._body(response)
+
+        assert body == b"".join(_UPSTREAM_SSE)
+        client.stream.assert_not_called()
+        recorded = next(
+            call.args[2]
+            for call in emitter.record.call_args_list
+            if call.args[1] == "transaction.streaming_response_recorded"
+        )
+        assert recorded["final_response"]["id"] == "msg_raw"
+        assert recorded["final_response"]["content"][0]["text"] == "hi"
+        (usage,) = reservation.settle.call_args.args
+        assert usage["input_tokens"] == 8
+        assert usage["output_tokens"] == 2
+
+    @pytest.mark.asyncio
+    async def test_buffered_bytes_are_parsed_mid_stream(self, mock_request):
+        client = self._client(_UPSTREAM_SSE)
+        emitter = MagicMock()
+
+        with patch("luthien_proxy.pipeline.anthropic_processor._PASSTHROUGH_PARSE_BYTES", 1):
+            response = await process_anthropic_request(
+                request=mock_request, policy=NoOpPolicy(), anthropic_client=client, emitter=emitter
+            )
+            body = await self._body(response)
+
+        assert body == b"".join(_UPSTREAM_SSE)
+        recorded = next(
+            call.args[2]
+            for call in emitter.record.call_args_list
+            if call.args[1] == "transaction.streaming_response_recorded"
+        )
+        assert recorded["final_response"]["content"] == [{"type": "text", "text": "hi"}]
+
+    @pytest.mark.asyncio
+    async def test_observing_policy_sees_every_event(self, mock_request):
+        seen: list[str] = []
+
+        class _Observer(NoOpPolicy):
+            observes_stream_events_only = True
+
+            async def on_anthropic_stream_event(self, event, context):
+                seen.append(event.type)
+                return [event]
+
+        client = self._client(_UPSTREAM_SSE)
+        response = await process_anthropic_request(
+            request=mock_request, policy=_Observer(), anthropic_client=client, emitter=MagicMock()
+        )
+        body = await self._body(response)
+
+        assert body == b"".join(_UPSTREAM_SSE)
+        assert seen == [
+            "message_start",
+            "content_block_start",
+            "content_block_delta",
+            "content_block_stop",
+            "message_delta",
+            "message_stop",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_setting_off_uses_event_path(self, mock_request):
+        client = self._client(_UPSTREAM_SSE)
+        settings = MagicMock(stream_passthrough=False, inject_policy_context=False, trust_user_id_header=False)
+
+        async def _events():
+            yield TestStreamingWebhookGate._make_event()
+
+        client.stream = MagicMock(return_value=_events())
+
+        with patch("luthien_proxy.pipeline.anthropic_processor.get_settings", return_value=settings):
+            response = await process_anthropic_request(
+                request=mock_request, policy=NoOpPolicy(), anthropic_client=client, emitter=MagicMock()
+            )
+            await self._body(response)
+
+        client.stream_raw.assert_not_called()
+        client.stream.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_upstream_error_frame_sets_webhook_status(self, mock_request):
+        error = _sse("error", {"type": "error", "error": {"type": "overloaded_error", "message": "Overloaded"}})
+        client = self._client([*_UPSTREAM_SSE[:3], error])
+        webhook = MagicMock()
+        webhook.enabled = True
+
+        response = await process_anthropic_request(
+            request=mock_request,
+            policy=NoOpPolicy(),
+            anthropic_client=client,
+            emitter=MagicMock(),
+            webhook_sender=webhook,
+        )
+        body = await self._body(response)
+
+        assert body.endswith(error)
+        kwargs = webhook.fire_and_forget.call_args.kwargs
+        assert kwargs["success"] is False
+        assert kwargs["http_status"] == 529
@@ -0,0 +1,79 @@
+"""Tests for side-channel parsing of passthrough SSE bytes."""
+
+import json
+
+from anthropic.types import RawContentBlockDeltaEvent, RawMessageStartEvent, RawMessageStopEvent
+
+from luthien_proxy.pipeline.sse_passthrough import SSEEventCollector
+
+
+def _frame(name: str, data: dict, newline: str = "\n") -> bytes:
+    return f"event: {name}{newline}data: {json.dumps(data)}{newline}{newline}".encode()
+
+
+_MESSAGE_START = {
+    "type": "message_start",
+    "message": {
+        "id": "msg_1",
+        "type": "message",
+        "role": "assistant",
+        "content": [],
+        "model": "claude-test",
+        "stop_reason": None,
+        "stop_sequence": None,
+        "usage": {"input_tokens": 5, "output_tokens": 1},
+    },
+}
+_DELTA = {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "hé"}}
+
+
+class TestSSEEventCollector:
+    def test_frames_split_across_chunks(self):
+        body = _frame("message_start", _MESSAGE_START) + _frame("content_block_delta", _DELTA)
+        collector = SSEEventCollector()
+        for i in range(0, len(body), 7):
+            collector.feed(body[i : i + 7])
+
+        events = collector.finish()
+
+        assert [type(e) for e in events] == [RawMessageStartEvent, RawContentBlockDeltaEvent]
+        assert events[1].delta.text == "hé"  # type: ignore[union-attr]
+
+    def test_drain_returns_only_complete_new_frames(self):
+        collector = SSEEventCollector()
+        frame = _frame("message_start", _MESSAGE_START, newline="\r\n")
+        collector.feed(frame[:-3])
+        assert collector.drain() == []
+        collector.feed(frame[-3:])
+        assert [e.type for e in collector.drain()] == ["message_start"]
+        assert collector.drain() == []
+
+    def test_ping_skipped_and_error_captured(self):
+        collector = SSEEventCollector()
+        collector.feed(_frame("ping", {"type": "ping"}))
+        collector.feed(_frame("error", {"type": "error", "error": {"type": "overloaded_error", "message": "busy"}}))
+        assert collector.finish() == []
+        assert collector.upstream_error == {"type": "error", "error": {"type": "overloaded_error", "message": "busy"}}
+
+    def test_unterminated_final_frame_and_missing_type(self):
+        collector = SSEEventCollector()
+        collector.feed(b"event: message_stop\ndata: {}")
+        assert [type(e) for e in collector.finish()] == [RawMessageStopEvent]
+
+    def test_malformed_frames_are_skipped(self):
+        collector = SSEEventCollector()
+        collector.feed(b"event: content_block_delta\ndata: {not json\n\n")
+        collector.feed(_frame("content_block_delta", {"type": "content_block_delta", "index": "x"}))
+        collector.feed(_frame("message_stop", {"type": "message_stop"}))
+        assert [e.type for e in collector.finish()] == ["message_stop"]
+
+    def test_finish_returns_only_undrained_events(self):
+        collector = SSEEventCollector()
+        collector.feed(_frame("message_start", _MESSAGE_START))
+        assert len(collector.drain()) == 1
+        assert collector.buffered_bytes == 0
+
+        collector.feed(_frame("content_block_delta", _DELTA))
+        assert collector.buffered_bytes > 0
+        assert [e.type for e in collector.finish()] == ["content_block_delta"]
+        assert collector.finish() == []
@@ -0,0 +1,115 @@
+"""Tests for incremental stream response accumulation."""
+
+from anthropic.types import (
+    InputJSONDelta,
+    RawContentBlockDeltaEvent,
+    RawContentBlockStartEvent,
+    RawContentBlockStopEvent,
+    RawMessageDeltaEvent,
+    RawMessageStartEvent,
+    RawMessageStopEvent,
+    TextDelta,
+)
+
+from luthien_proxy.pipeline.stream_accumulator import StreamResponseAccumulator
+from luthien_proxy.pipeline.stream_protocol_validator import validate_anthropic_event_ordering
+
+_START = RawMessageStartEvent(
+    type="message_start",
+    message={
+        "id": "msg_acc",
+        "type": "message",
+        "role": "assistant",
+        "content": [],
+        "model": "claude-test",
+        "stop_reason": None,
+        "stop_sequence": None,
+        "usage": {"input_tokens": 11, "output_tokens": 0, "cache_read_input_tokens": 4},
+    },
+)
+
+
+def _text_delta(index: int, text: str) -> RawContentBlockDeltaEvent:
+    return RawContentBlockDeltaEvent(
+        type="content_block_delta", index=index, delta=TextDelta(type="text_delta", text=text)
+    )
+
+
+def _tool_events(index: int, parts: list[str]) -> list:
+    return [
+        RawContentBlockStartEvent(
+            type="content_block_start",
+            index=index,
+            content_block={"type": "tool_use", "id": "toolu_1", "name": "Bash", "input": {}},
+        ),
+        *[
+            RawContentBlockDeltaEvent(
+                type="content_block_delta",
+                index=index,
+                delta=InputJSONDelta(type="input_json_delta", partial_json=part),
+            )
+            for part in parts
+        ],
+        RawContentBlockStopEvent(type="content_block_stop", index=index),
+    ]
+
+
+def _stream(deltas: list[str]) -> list:
+    return [
+        _START,
+        RawContentBlockStartEvent(type="content_block_start", index=0, content_block={"type": "text", "text": ""}),
+        *[_text_delta(0, text) for text in deltas],
+        RawContentBlockStopEvent(type="content_block_stop", index=0),
+        *_tool_events(1, ['{"comm', 'and": "ls"}']),
+        RawMessageDeltaEvent(
+            type="message_delta",
+            delta={"stop_reason": "tool_use", "stop_sequence": None},
+            usage={"output_tokens": 9},
+        ),
+        RawMessageStopEvent(type="message_stop"),
+    ]
+
+
+def _fold(events: list) -> StreamResponseAccumulator:
+    accumulator = StreamResponseAccumulator()
+    for event in events:
+        accumulator.add(event)
+    return accumulator
+
+
+class TestStreamResponseAccumulator:
+    def test_rebuilds_text_tool_and_usage(self):
+        accumulator = _fold(_stream(["a"] * 5000))
+
+        response = accumulator.response()
+
+        assert response is not None
+        assert response["content"] == [
+            {"type": "text", "text": "a" * 5000},
+            {"type": "tool_use", "id": "toolu_1", "name": "Bash", "input": {"command": "ls"}},
+        ]
+        assert response["stop_reason"] == "tool_use"
+        assert response["usage"]["input_tokens"] == 11
+        assert response["usage"]["output_tokens"] == 9
+        assert response["usage"]["cache_read_input_tokens"] == 4
+        assert accumulator.event_count == 5009
+
+    def test_response_can_be_read_mid_stream(self):
+        accumulator = _fold(_stream(["Hel", "lo"])[:3])
+        assert accumulator.response()["content"] == [{"type": "text", "text": "Hel"}]  # type: ignore[index]
+
+        accumulator.add(_text_delta(0, "lo"))
+        assert accumulator.response()["content"] == [{"type": "text", "text": "Hello"}]  # type: ignore[index]
+
+    def test_no_response_before_message_start(self):
+        assert _fold([_text_delta(0, "orphan")]).response() is None
+
+    def test_malformed_tool_json_keeps_empty_input(self):
+        accumulator = _fold([_START, *_tool_events(0, ['{"broken'])])
+        assert accumulator.response()["content"][0]["input"] == {}  # type: ignore[index]
+
+    def test_validation_matches_list_validator(self):
+        broken = [_text_delta(0, "x"), *_stream(["a"])[1:-1]]
+
+        assert _fold(broken).validation() == validate_anthropic_event_ordering(broken)
+        assert _fold(_stream(["a", "b"])).validation().valid
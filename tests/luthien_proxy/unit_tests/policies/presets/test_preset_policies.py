@@ -67,3 +67,41 @@ def test_preset_class_refs_are_importable():
         module = importlib.import_module(module_path)
         cls = getattr(module, class_name)
         assert cls is not None
+
+
+@pytest.mark.parametrize(
+    ("policy_class", "tool_name", "tool_input", "decision"),
+    [
+        (BlockDangerousCommandsPolicy, "Bash", {"command": "git diff HEAD~1"}, "allow"),
+        (BlockDangerousCommandsPolicy, "Bash", {"command": "git status && git diff"}, "escalate"),
+        (BlockDangerousCommandsPolicy, "Bash", {"command": "git diff --output=/etc/cron.d/x"}, "escalate"),
+        (BlockDangerousCommandsPolicy, "Bash", {"command": "git log --output=/tmp/log.txt"}, "escalate"),
+        (BlockDangerousCommandsPolicy, "Bash", {"command": "git diff --ext-diff"}, "escalate"),
+        (BlockDangerousCommandsPolicy, "Bash", {"command": "rg --pre ./x.sh secret"}, "escalate"),
+        (BlockDangerousCommandsPolicy, "Bash", {"command": 'grep -rn "rm -rf" scripts/'}, "escalate"),
+        (BlockDangerousCommandsPolicy, "Bash", {"command": 'git commit -m "drop shred usage"'}, "escalate"),
+        (BlockDangerousCommandsPolicy, "Bash", {"command": "cd build && sudo rm -rf /"}, "block"),
+        (BlockDangerousCommandsPolicy, "Bash", {"command": "echo x > /dev/sda"}, "block"),
+        (BlockDangerousCommandsPolicy, "Bash", {"command": "rm -rf /"}, "block"),
+        (BlockDangerousCommandsPolicy, "Bash", {"command": "chmod -R 777 ."}, "block"),
+        (BlockDangerousCommandsPolicy, "Bash", {"command": ":(){ :|:& };:"}, "block"),
+        (BlockDangerousCommandsPolicy, "Bash", {"command": "rm -r src"}, "escalate"),
+        (BlockSensitiveFileWritesPolicy, "Write", {"file_path": "/home/u/project/app.py"}, "allow"),
+        (BlockSensitiveFileWritesPolicy, "Edit", {"file_path": "/home/u/.ssh/config"}, "block"),
+        (BlockSensitiveFileWritesPolicy, "Write", {"file_path": "/home/u/keys/id_ed25519.pub"}, "block"),
+        (BlockSensitiveFileWritesPolicy, "Write", {"file_path": "/etc/sudoers"}, "block"),
+        (BlockSensitiveFileWritesPolicy, "Write", {"file_path": "/home/u/project/src/styles/shadow.css"}, "escalate"),
+        (BlockSensitiveFileWritesPolicy, "Write", {"file_path": "/home/u/project/passwd_reset.py"}, "escalate"),
+        (BlockSensitiveFileWritesPolicy, "Write", {"file_path": "docs/known_hosts_parsing.md"}, "escalate"),
+        (BlockSensitiveFileWritesPolicy, "Write", {"file_path": "/home/u/project/src/api.key"}, "escalate"),
+        (BlockSensitiveFileWritesPolicy, "Bash", {"command": "git diff --output=/etc/cron.d/x"}, "escalate"),
+        (BlockSensitiveFileWritesPolicy, "Bash", {"command": "echo key >> ~/.ssh/authorized_keys"}, "block"),
+        (BlockSensitiveFileWritesPolicy, "Bash", {"command": "cat /etc/passwd"}, "allow"),
+        (BlockSensitiveFileWritesPolicy, "Bash", {"command": "cp cfg /etc/app.conf"}, "escalate"),
+    ],
+)
+def test_preset_prefilter_settles_obvious_calls(policy_class, tool_name, tool_input, decision):
+    """The tool-call presets decide obvious calls with rules and escalate the rest to the judge."""
+    prefilter = policy_class()._prefilter
+    assert prefilter is not None
+    assert prefilter.evaluate(tool_name, tool_input).decision == decision
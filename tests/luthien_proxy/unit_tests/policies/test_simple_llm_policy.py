@@ -44,6 +44,7 @@ from luthien_proxy.policies.simple_llm_utils import (
     ReplacementBlock,
     SimpleLLMJudgeConfig,
 )
+from luthien_proxy.policies.tool_prefilter import ToolPrefilterConfig
 from luthien_proxy.policy_core.policy_context import PolicyContext
 
 # ============================================================================
@@ -1332,3 +1333,139 @@ class TestToolUseTrailingNonStreaming:
         types = [b.get("type") for b in result["content"]]
         assert types == ["text", "tool_use", "tool_use"], f"Got: {types}"
         assert mock_judge.call_count == 3
+
+
+class TestVerdictCache:
+    """Identical tool_use blocks reuse the cached decision when the cache is enabled."""
+
+    @staticmethod
+    def _policy(ttl: int) -> SimpleLLMPolicy:
+        return SimpleLLMPolicy(
+            SimpleLLMJudgeConfig(
+                instructions="test instructions", auth_provider="user_credentials", verdict_cache_ttl_seconds=ttl
+            )
+        )
+
+    @staticmethod
+    async def _stream_tool(policy: SimpleLLMPolicy, partial_json: str) -> list[MessageStreamEvent]:
+        ctx = _make_context()
+        events: list[MessageStreamEvent] = []
+        for event in (tool_start(0), tool_delta(partial_json, 0), block_stop(0), message_delta("tool_use")):
+            events.extend(await policy.on_anthropic_stream_event(event, ctx))
+        return events
+
+    @pytest.mark.asyncio
+    async def test_repeat_tool_call_across_requests_skips_judge(self):
+        policy = self._policy(ttl=3600)
+        replacement = JudgeAction(action="replace", blocks=(ReplacementBlock(type="text", text="[BLOCKED] rm"),))
+
+        with patch.object(policy, "_judge_block", new_callable=AsyncMock) as mock_judge:
+            mock_judge.return_value = replacement
+            first = await self._stream_tool(policy, '{"command": "rm -rf /"}')
+            second = await self._stream_tool(policy, '{ "command":"rm -rf /" }')
+
+        assert mock_judge.call_count == 1
+        assert event_types(first) == event_types(second)
+        assert "[BLOCKED] rm" in str(second)
+
+    @pytest.mark.asyncio
+    async def test_non_streaming_shares_cache_with_streaming(self):
+        policy = self._policy(ttl=3600)
+        response: dict[str, Any] = {
+            "content": [{"type": "tool_use", "id": "toolu_a", "name": "Bash", "input": {"command": "ls"}}],
+            "stop_reason": "tool_use",
+        }
+
+        with patch.object(policy, "_judge_block", new_callable=AsyncMock) as mock_judge:
+            mock_judge.return_value = JudgeAction(action="pass")
+            await self._stream_tool(policy, '{"command": "ls"}')
+            result = await policy.on_anthropic_response(response, _make_context())
+
+        assert mock_judge.call_count == 1
+        assert [b["type"] for b in result["content"]] == ["tool_use"]
+
+    @pytest.mark.asyncio
+    async def test_judge_failures_are_not_cached(self):
+        policy = self._policy(ttl=3600)
+
+        with patch.object(policy, "_judge_block", new_callable=AsyncMock) as mock_judge:
+            mock_judge.side_effect = [JudgeAction(action="pass", judge_failed=True), JudgeAction(action="pass")]
+            await self._stream_tool(policy, '{"command": "ls"}')
+            await self._stream_tool(policy, '{"command": "ls"}')
+
+        assert mock_judge.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        policy = _make_policy()
+
+        with patch.object(policy, "_judge_block", new_callable=AsyncMock) as mock_judge:
+            mock_judge.return_value = JudgeAction(action="pass")
+            await self._stream_tool(policy, '{"command": "ls"}')
+            await self._stream_tool(policy, '{"command": "ls"}')
+
+        assert mock_judge.call_count == 2
+
+
+class TestPrefilter:
+    """Tool calls the prefilter rules settle never reach the judge."""
+
+    @staticmethod
+    def _policy() -> SimpleLLMPolicy:
+        return SimpleLLMPolicy(
+            SimpleLLMJudgeConfig(
+                instructions="test instructions",
+                auth_provider="user_credentials",
+                prefilter=ToolPrefilterConfig(
+                    safe_commands=("ls",),
+                    command_block_patterns=(r"\brm\s+-rf\b",),
+                    block_message="[BLOCKED] {match}",
+                ),
+            )
+        )
+
+    @staticmethod
+    async def _stream_tool(policy: SimpleLLMPolicy, partial_json: str) -> list[MessageStreamEvent]:
+        ctx = _make_context()
+        events: list[MessageStreamEvent] = []
+        for event in (tool_start(0), tool_delta(partial_json, 0), block_stop(0), message_delta("tool_use")):
+            events.extend(await policy.on_anthropic_stream_event(event, ctx))
+        return events
+
+    @pytest.mark.asyncio
+    async def test_allowed_call_passes_without_judge(self):
+        policy = self._policy()
+
+        with patch.object(policy, "_judge_block", new_callable=AsyncMock) as mock_judge:
+            events = await self._stream_tool(policy, '{"command": "ls -la"}')
+
+        mock_judge.assert_not_called()
+        assert "tool_use" in str(events)
+        assert "ls -la" in str(events)
+
+    @pytest.mark.asyncio
+    async def test_blocked_call_is_replaced_without_judge(self):
+        policy = self._policy()
+        response: dict[str, Any] = {
+            "content": [{"type": "tool_use", "id": "toolu_a", "name": "Bash", "input": {"command": "rm -rf /"}}],
+            "stop_reason": "tool_use",
+        }
+
+        with patch.object(policy, "_judge_block", new_callable=AsyncMock) as mock_judge:
+            result = await policy.on_anthropic_response(response, _make_context())
+
+        mock_judge.assert_not_called()
+        assert result["content"] == [{"type": "text", "text": "[BLOCKED] rm -rf"}]
+
+    @pytest.mark.asyncio
+    async def test_ambiguous_call_escalates_to_judge(self):
+        policy = self._policy()
+
+        with patch.object(policy, "_judge_block", new_callable=AsyncMock) as mock_judge:
+            mock_judge.return_value = JudgeAction(action="pass")
+            await self._stream_tool(policy, '{"command": "make install"}')
+            await self._stream_tool(policy, '{"command": "ls"}')
+
+        assert mock_judge.call_count == 1
+        assert policy._prefilter is not None
+        assert policy._prefilter.escalation_ratio == 0.5
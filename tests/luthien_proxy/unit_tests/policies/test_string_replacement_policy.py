@@ -4,6 +4,7 @@ Tests native Anthropic API support.
 """
 
 import copy
+import random
 from dataclasses import dataclass, field
 from typing import Any, cast
 
@@ -34,6 +35,7 @@ from luthien_proxy.policies.string_replacement_policy import (
     StringReplacementPolicy,
     _apply_capitalization_pattern,
     _detect_capitalization_pattern,
+    _ReplacementEngine,
     apply_replacements,
     apply_replacements_with_count,
 )
@@ -145,6 +147,58 @@ class TestApplyReplacementsWithCount:
         assert result_count == 4
 
 
+class TestReplacementEngine:
+    """The single-pass engine must match sequential application exactly."""
+
+    @pytest.mark.parametrize("match_cap", [False, True])
+    def test_matches_sequential_on_random_inputs(self, match_cap):
+        rng = random.Random(1234)
+        alphabet = "abcAB "
+        for _ in range(500):
+            pairs = [
+                (
+                    "".join(rng.choices(alphabet, k=rng.randint(1, 3))),
+                    "".join(rng.choices(alphabet, k=rng.randint(0, 3))),
+                )
+                for _ in range(rng.randint(1, 5))
+            ]
+            text = "".join(rng.choices(alphabet, k=rng.randint(0, 20)))
+            engine = _ReplacementEngine(pairs, match_cap)
+            assert engine.apply(text) == apply_replacements_with_count(text, pairs, match_cap), (pairs, text)
+
+    @pytest.mark.parametrize("match_cap", [False, True])
+    def test_redaction_list_needs_one_scan(self, match_cap):
+        pairs = [(f"secret{i}", "[REDACTED]") for i in range(50)] + [("alice@corp.example", "[REDACTED]")]
+        engine = _ReplacementEngine(pairs, match_cap)
+
+        assert engine.stage_count == 1
+        text = "mail alice@corp.example about secret7 and secret42"
+        assert engine.apply(text) == apply_replacements_with_count(text, pairs, match_cap)
+
+    def test_chained_pairs_split_into_stages(self):
+        engine = _ReplacementEngine([("foo", "barbar"), ("bar", "y")], False)
+
+        assert engine.stage_count == 2
+        assert engine.apply("foobar") == ("yyy", 4)
+
+    @pytest.mark.parametrize("match_cap", [False, True])
+    def test_overlapping_sources_keep_list_order(self, match_cap):
+        """A later source that would win the scan still loses to an earlier overlapping one."""
+        pairs = [("bc", "y"), ("ab", "x")]
+        engine = _ReplacementEngine(pairs, match_cap)
+
+        assert engine.apply("abc") == ("ay", 1)
+        assert engine.apply("abc") == apply_replacements_with_count("abc", pairs, match_cap)
+
+    def test_non_ascii_case_folding_matches_sequential(self):
+        # U+212A KELVIN SIGN folds to "k" under IGNORECASE.
+        pairs = [("k", "x"), ("straße", "street")]
+        engine = _ReplacementEngine(pairs, True)
+        text = "\u212a Kilo STRASSE Straße"
+
+        assert engine.apply(text) == apply_replacements_with_count(text, pairs, True)
+
+
 class TestConfigValidation:
     """Misconfigured replacement pairs should fail loudly at config-load time."""
 
@@ -1724,6 +1778,24 @@ class TestRequestModifiedEvent:
         # 1 (foo->barbar) + 3 (bar->y on "barbarbar") = 4
         assert payloads[0]["total_replacements"] == 4
 
+    @pytest.mark.asyncio
+    async def test_resent_history_reports_same_counts_from_memo(self):
+        policy = StringReplacementPolicy(
+            config=StringReplacementConfig(replacements=[["foo", "bar"]], apply_to="request")
+        )
+        request = _request_with_messages([{"role": "user", "content": "foo foo"}])
+
+        payloads = []
+        for _ in range(2):
+            ctx, recorder = _ctx_with_recorder()
+            result = await policy.on_anthropic_request(request, ctx)
+            assert result["messages"][0]["content"] == "bar bar"
+            payloads.extend(recorder.by_type(REQUEST_MODIFIED_EVENT))
+
+        assert payloads[0] == payloads[1]
+        assert payloads[0]["total_replacements"] == 2
+        assert policy._request_memo.hits == 1
+
     @pytest.mark.asyncio
     async def test_event_not_emitted_for_response_only_config(self):
         policy = StringReplacementPolicy(config=StringReplacementConfig(replacements=[["foo", "bar"]]))
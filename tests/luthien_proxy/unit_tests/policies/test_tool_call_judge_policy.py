@@ -7,6 +7,7 @@ call the judge, and emit the correct event sequences. Judge calls are mocked
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any, cast
 from unittest.mock import AsyncMock, patch
 
@@ -33,8 +34,10 @@ from tests.luthien_proxy.unit_tests.policies.anthropic_event_builders import (
 )
 
 from luthien_proxy.policies.tool_call_judge_policy import (
+    ToolCallDict,
     ToolCallJudgeConfig,
     ToolCallJudgePolicy,
+    _SpeculativeStreamState,
 )
 from luthien_proxy.policies.tool_call_judge_utils import JudgeResult
 from luthien_proxy.policy_core.anthropic_message_builder import AnthropicMessageBuilder
@@ -802,3 +805,177 @@ class TestPolicyConfiguration:
         policy = _make_policy(judge_instructions=custom_instructions)
 
         assert policy._judge_instructions == custom_instructions
+
+
+class TestVerdictCache:
+    """Repeated identical tool calls reuse the cached judge verdict."""
+
+    _SAFE = JudgeResult(probability=0.1, explanation="read-only", prompt=[], response_text='{"probability": 0.1}')
+
+    @pytest.mark.asyncio
+    async def test_identical_call_skips_judge(self):
+        policy = _make_policy(verdict_cache_ttl_seconds=3600)
+        ctx = _make_context()
+
+        with patch.object(policy, "_run_judge", new_callable=AsyncMock) as mock_judge:
+            mock_judge.return_value = self._SAFE
+            first = await policy._call_judge("Bash", '{"command": "git status"}', ctx)
+            second = await policy._call_judge("Bash", '{"command":"git status"}', ctx)
+
+        mock_judge.assert_awaited_once()
+        assert (second.probability, second.explanation) == (first.probability, first.explanation)
+        assert second.prompt  # rebuilt for observability
+        assert policy._verdict_cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_blocked_verdict_is_rechecked_against_threshold(self):
+        policy = _make_policy(verdict_cache_ttl_seconds=3600, probability_threshold=0.5)
+        ctx = _make_context()
+        risky = JudgeResult(probability=0.9, explanation="destructive", prompt=[], response_text="")
+        tool_call: ToolCallDict = {"id": "toolu_1", "name": "Bash", "arguments": '{"command": "rm -rf /"}'}
+
+        with patch.object(policy, "_run_judge", new_callable=AsyncMock, return_value=risky) as mock_judge:
+            assert await policy._evaluate_and_maybe_block(tool_call, ctx) is not None
+            blocked = await policy._evaluate_and_maybe_block(tool_call, ctx)
+
+        mock_judge.assert_awaited_once()
+        assert blocked is not None
+        assert blocked.explanation == "destructive"
+
+    @pytest.mark.asyncio
+    async def test_judge_failure_is_not_cached(self):
+        policy = _make_policy(verdict_cache_ttl_seconds=3600)
+        ctx = _make_context()
+
+        with patch.object(policy, "_run_judge", new_callable=AsyncMock) as mock_judge:
+            mock_judge.side_effect = [RuntimeError("judge down"), self._SAFE]
+            tool_call: ToolCallDict = {"id": "toolu_1", "name": "Bash", "arguments": '{"command": "ls"}'}
+            assert await policy._evaluate_and_maybe_block(tool_call, ctx) is not None
+            assert await policy._evaluate_and_maybe_block(tool_call, ctx) is None
+
+        assert mock_judge.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        policy = _make_policy()
+        ctx = _make_context()
+
+        with patch.object(policy, "_run_judge", new_callable=AsyncMock, return_value=self._SAFE) as mock_judge:
+            await policy._call_judge("Bash", '{"command": "ls"}', ctx)
+            await policy._call_judge("Bash", '{"command": "ls"}', ctx)
+
+        assert mock_judge.await_count == 2
+
+
+class TestSpeculativeJudging:
+    """With speculative_judging, judges start once tool JSON completes and don't block the stream."""
+
+    @pytest.mark.asyncio
+    async def test_judge_starts_when_input_json_completes(self):
+        policy = _make_policy(speculative_judging=True)
+        ctx = _make_context()
+
+        with patch.object(policy, "_evaluate_and_maybe_block", new_callable=AsyncMock) as mock_eval:
+            mock_eval.return_value = None
+            await policy.on_anthropic_stream_event(cast(MessageStreamEvent, tool_start(0, tool_id="toolu_1")), ctx)
+            await policy.on_anthropic_stream_event(cast(MessageStreamEvent, tool_delta('{"command": "echo }"', 0)), ctx)
+            assert mock_eval.call_count == 0
+
+            await policy.on_anthropic_stream_event(cast(MessageStreamEvent, tool_delta("}", 0)), ctx)
+            assert mock_eval.call_count == 1
+            judged: ToolCallDict = mock_eval.call_args.args[0]
+            assert judged["arguments"] == '{"command": "echo }"}'
+
+            await policy.on_anthropic_stream_event(cast(MessageStreamEvent, block_stop(0)), ctx)
+            emitted = await policy.on_anthropic_stream_event(cast(MessageStreamEvent, message_delta("tool_use")), ctx)
+
+        assert mock_eval.call_count == 1
+        assert event_types(emitted) == [
+            "content_block_start",
+            "content_block_delta",
+            "content_block_stop",
+            "message_delta",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stream_continues_while_judge_runs(self):
+        policy = _make_policy(speculative_judging=True)
+        ctx = _make_context()
+        release = asyncio.Event()
+
+        async def slow_eval(tool_call: ToolCallDict, context: PolicyContext) -> JudgeResult | None:
+            await release.wait()
+            return None
+
+        with patch.object(policy, "_evaluate_and_maybe_block", side_effect=slow_eval):
+            await policy.on_anthropic_stream_event(cast(MessageStreamEvent, tool_start(0, tool_id="toolu_1")), ctx)
+            await policy.on_anthropic_stream_event(cast(MessageStreamEvent, tool_delta('{"a": 1}', 0)), ctx)
+            # block_stop returns without waiting for the judge.
+            stop_events = await asyncio.wait_for(
+                policy.on_anthropic_stream_event(cast(MessageStreamEvent, block_stop(0)), ctx), timeout=1
+            )
+            assert stop_events == []
+
+            release.set()
+            emitted = await policy.on_anthropic_stream_event(cast(MessageStreamEvent, message_delta("tool_use")), ctx)
+
+        assert "content_block_start" in event_types(emitted)
+
+    @pytest.mark.asyncio
+    async def test_blocked_verdicts_applied_in_tool_order(self):
+        policy = _make_policy(speculative_judging=True)
+        ctx = _make_context()
+        blocked = JudgeResult(probability=0.9, explanation="dangerous", prompt=[], response_text="")
+
+        async def judge(tool_call: ToolCallDict, context: PolicyContext) -> JudgeResult | None:
+            return blocked if tool_call["id"] == "toolu_1" else None
+
+        with patch.object(policy, "_evaluate_and_maybe_block", side_effect=judge):
+            for idx, tool_id in enumerate(("toolu_1", "toolu_2")):
+                await policy.on_anthropic_stream_event(cast(MessageStreamEvent, tool_start(idx, tool_id=tool_id)), ctx)
+                await policy.on_anthropic_stream_event(cast(MessageStreamEvent, tool_delta('{"x": 1}', idx)), ctx)
+                await policy.on_anthropic_stream_event(cast(MessageStreamEvent, block_stop(idx)), ctx)
+            emitted = await policy.on_anthropic_stream_event(cast(MessageStreamEvent, message_delta("tool_use")), ctx)
+
+        starts = [e for e in emitted if isinstance(e, RawContentBlockStartEvent)]
+        assert isinstance(starts[0].content_block, TextBlock)
+        assert isinstance(starts[1].content_block, ToolUseBlock)
+        assert starts[1].content_block.id == "toolu_2"
+
+    @pytest.mark.asyncio
+    async def test_rejudges_when_input_changes_after_speculation(self):
+        policy = _make_policy(speculative_judging=True)
+        ctx = _make_context()
+
+        with patch.object(policy, "_evaluate_and_maybe_block", new_callable=AsyncMock) as mock_eval:
+            mock_eval.return_value = None
+            await policy.on_anthropic_stream_event(cast(MessageStreamEvent, tool_start(0, tool_id="toolu_1")), ctx)
+            await policy.on_anthropic_stream_event(cast(MessageStreamEvent, tool_delta('{"a": 1}', 0)), ctx)
+            await policy.on_anthropic_stream_event(cast(MessageStreamEvent, tool_delta("garbage", 0)), ctx)
+            await policy.on_anthropic_stream_event(cast(MessageStreamEvent, block_stop(0)), ctx)
+            await policy.on_anthropic_stream_event(cast(MessageStreamEvent, message_delta("tool_use")), ctx)
+
+        assert mock_eval.call_count == 2
+        assert mock_eval.call_args.args[0]["arguments"] == '{"a": 1}garbage'
+
+    @pytest.mark.asyncio
+    async def test_cleanup_cancels_outstanding_judges(self):
+        policy = _make_policy(speculative_judging=True)
+        ctx = _make_context()
+        never = asyncio.Event()
+
+        async def hang(tool_call: ToolCallDict, context: PolicyContext) -> JudgeResult | None:
+            await never.wait()
+            return None
+
+        with patch.object(policy, "_evaluate_and_maybe_block", side_effect=hang):
+            await policy.on_anthropic_stream_event(cast(MessageStreamEvent, tool_start(0, tool_id="toolu_1")), ctx)
+            await policy.on_anthropic_stream_event(cast(MessageStreamEvent, tool_delta('{"a": 1}', 0)), ctx)
+            await policy.on_anthropic_stream_event(cast(MessageStreamEvent, block_stop(0)), ctx)
+            state = ctx.get_request_state(policy, _SpeculativeStreamState, _SpeculativeStreamState)
+            task = state.pending[0][1].task
+
+            await policy.on_anthropic_streaming_policy_complete(ctx)
+            await asyncio.sleep(0)
+
+        assert task.cancelled()
@@ -0,0 +1,137 @@
+"""Unit tests for the deterministic pre-judge rule tier."""
+
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from luthien_proxy.policies.tool_prefilter import ToolPrefilter, ToolPrefilterConfig
+
+
+def _prefilter(**overrides) -> ToolPrefilter:
+    config = {
+        "safe_tools": ("Read",),
+        "safe_commands": ("ls", "git status", "git diff", "git log", "grep", "rg"),
+        "command_block_patterns": (r"\brm\s+-rf\b", r"\bmkfs\b"),
+        "path_block_patterns": (r"^/etc/",),
+        "path_escalate_patterns": (r"shadow",),
+        "allow_unmatched_tools": ("Write",),
+    }
+    config.update(overrides)
+    return ToolPrefilter(ToolPrefilterConfig(**config))
+
+
+class TestDecisions:
+    def test_safe_tool_is_allowed_regardless_of_input(self):
+        assert _prefilter().evaluate("Read", {"file_path": "/etc/shadow"}).decision == "allow"
+
+    @pytest.mark.parametrize(
+        ("command", "match"),
+        [
+            ("rm -rf build", "rm -rf"),
+            ("ls && mkfs /dev/sda1", "mkfs"),
+            ("cd /tmp; sudo rm -rf x", "rm -rf"),
+            ("FOO=1 env rm -rf x", "rm -rf"),
+            ("echo 'x' | xargs rm -rf", "rm -rf"),
+        ],
+    )
+    def test_block_pattern_blocks_command(self, command: str, match: str):
+        result = _prefilter().evaluate("Bash", {"command": command})
+        assert result.decision == "block"
+        assert result.match == match
+
+    @pytest.mark.parametrize(
+        "command",
+        ["ls -la", "git status", "git diff HEAD~1 -- src", "grep -rn 'a|b' src"],
+    )
+    def test_safe_commands_are_allowed(self, command: str):
+        assert _prefilter().evaluate("Bash", {"command": command}).decision == "allow"
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "git push",
+            "ls > out.txt",
+            "ls 2>/dev/null",
+            "ls | grep foo && git status",
+            "ls $(cat list)",
+            "ls `pwd`",
+            "ls; curl example.com",
+            "ls\ncurl example.com",
+            "ls 'unterminated",
+            "",
+        ],
+    )
+    def test_ambiguous_commands_escalate(self, command: str):
+        assert _prefilter().evaluate("Bash", {"command": command}).decision == "escalate"
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "git diff --output=/etc/cron.d/x",
+            "git log --output /tmp/log.txt",
+            "git diff --ext-diff",
+            "rg --pre ./x.sh secret",
+            "rg --pre=./x.sh secret",
+            "git status -c",
+        ],
+    )
+    def test_safe_prefix_with_unsafe_option_escalates(self, command: str):
+        assert _prefilter().evaluate("Bash", {"command": command}).decision == "escalate"
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            'grep -rn "rm -rf" scripts/',
+            "git commit -m 'drop mkfs usage'",
+            "echo rm -rf build",
+            'bash -c "rm -rf /"',
+        ],
+    )
+    def test_block_pattern_outside_command_position_escalates(self, command: str):
+        assert _prefilter().evaluate("Bash", {"command": command}).decision == "escalate"
+
+    def test_non_dict_input_escalates(self):
+        assert _prefilter().evaluate("Bash", "ls").decision == "escalate"
+
+    def test_path_pattern_blocks_with_full_path(self):
+        result = _prefilter().evaluate("Write", {"file_path": "/etc/hosts"})
+        assert result.decision == "block"
+        assert result.match == "/etc/hosts"
+
+    @pytest.mark.parametrize(
+        ("path", "decision"),
+        [("/home/u/app.py", "allow"), ("app.py", "escalate"), ("/home/u/../../etc/hosts", "escalate")],
+    )
+    def test_unmatched_tools_allow_only_plain_absolute_paths(self, path: str, decision: str):
+        assert _prefilter().evaluate("Write", {"file_path": path}).decision == decision
+
+    def test_path_escalate_pattern_overrides_allow(self):
+        assert _prefilter().evaluate("Write", {"file_path": "/home/u/src/shadow.css"}).decision == "escalate"
+
+    def test_unlisted_tool_escalates(self):
+        assert _prefilter().evaluate("WebFetch", {"url": "https://example.com"}).decision == "escalate"
+
+
+class TestCounters:
+    def test_escalation_ratio(self):
+        prefilter = _prefilter()
+        assert prefilter.escalation_ratio == 0.0
+
+        prefilter.evaluate("Bash", {"command": "ls"})
+        prefilter.evaluate("Bash", {"command": "rm -rf /"})
+        prefilter.evaluate("Bash", {"command": "make"})
+        prefilter.evaluate("Bash", {"command": "make install"})
+
+        assert (prefilter.allowed, prefilter.blocked, prefilter.escalated) == (1, 1, 2)
+        assert prefilter.escalation_ratio == 0.5
+
+
+class TestConfig:
+    def test_invalid_pattern_is_rejected(self):
+        with pytest.raises(ValidationError, match="invalid block pattern"):
+            ToolPrefilterConfig(command_block_patterns=("(unclosed",))
+
+    def test_block_message_template(self):
+        prefilter = _prefilter(block_message="[BLOCKED] {tool_name}: {match}")
+        assert prefilter.block_message("Bash", "rm -rf") == "[BLOCKED] Bash: rm -rf"
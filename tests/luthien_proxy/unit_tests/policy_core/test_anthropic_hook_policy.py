@@ -5,7 +5,15 @@ from __future__ import annotations
 import pytest
 from tests.luthien_proxy.fixtures.policy_context import make_policy_context
 
-from luthien_proxy.policy_core.anthropic_hook_policy import AnthropicHookPolicy
+from luthien_proxy.policies.all_caps_policy import AllCapsPolicy
+from luthien_proxy.policies.debug_logging_policy import DebugLoggingPolicy
+from luthien_proxy.policies.multi_serial_policy import MultiSerialPolicy
+from luthien_proxy.policies.noop_policy import NoOpPolicy
+from luthien_proxy.policy_core.anthropic_hook_policy import (
+    AnthropicHookPolicy,
+    observes_stream_events,
+    stream_passthrough_supported,
+)
 
 
 class TestAnthropicHookPolicyDefaults:
@@ -67,3 +75,44 @@ class TestAnthropicHookPolicyDefaults:
         result = await policy.on_anthropic_stream_complete(ctx)
 
         assert result == []
+
+
+class TestStreamPassthroughDeclaration:
+    """observes_stream_events_only only counts where the stream hook is defined."""
+
+    def test_default_policy_does_not_opt_in(self):
+        assert stream_passthrough_supported(AnthropicHookPolicy()) is False
+
+    def test_noop_and_debug_logging_opt_in(self):
+        assert stream_passthrough_supported(NoOpPolicy()) is True
+        assert stream_passthrough_supported(DebugLoggingPolicy()) is True
+        assert observes_stream_events(NoOpPolicy()) is False
+        assert observes_stream_events(DebugLoggingPolicy()) is True
+
+    def test_subclass_overriding_hook_opts_out_until_it_redeclares(self):
+        class Rewriting(NoOpPolicy):
+            async def on_anthropic_stream_event(self, event, context):
+                return []
+
+        class Observing(Rewriting):
+            observes_stream_events_only = True
+
+        assert stream_passthrough_supported(Rewriting()) is False
+        assert stream_passthrough_supported(Observing()) is True
+
+    def test_subclass_overriding_stream_complete_opts_out_until_it_redeclares(self):
+        class Appending(NoOpPolicy):
+            async def on_anthropic_stream_complete(self, context):
+                return []
+
+        class Observing(Appending):
+            observes_stream_events_only = True
+
+        assert stream_passthrough_supported(Appending()) is False
+        assert stream_passthrough_supported(Observing()) is True
+
+    def test_multi_serial_requires_every_sub_policy(self):
+        observe_only = MultiSerialPolicy.from_instances([NoOpPolicy(), DebugLoggingPolicy()])
+        mixed = MultiSerialPolicy.from_instances([NoOpPolicy(), AllCapsPolicy()])
+        assert stream_passthrough_supported(observe_only) is True
+        assert stream_passthrough_supported(mixed) is False
@@ -0,0 +1,103 @@
+"""Tests for the judge verdict cache."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from tests.luthien_proxy.fixtures.policy_context import make_policy_context
+
+from luthien_proxy.policy_core.judge_verdict_cache import JudgeVerdictCache, judge_cache_key
+from luthien_proxy.utils.db import DatabasePool
+from luthien_proxy.utils.migration_check import check_migrations
+from luthien_proxy.utils.policy_cache import PolicyCache
+
+
+def _key(tool_input: object = '{"command": "ls"}', **overrides: str) -> str:
+    fields = {"instructions": "Judge it.", "model": "claude-haiku-4-5", "tool_name": "Bash", **overrides}
+    return judge_cache_key(tool_input=tool_input, **fields)
+
+
+@pytest.fixture
+async def db_pool():
+    pool = DatabasePool("sqlite://:memory:")
+    await check_migrations(pool)
+    yield pool
+    await pool.close()
+
+
+class TestJudgeCacheKey:
+    def test_equivalent_inputs_share_a_key(self):
+        assert _key('{"a": 1, "b": [1, 2]}') == _key({"b": [1, 2], "a": 1})
+        assert _key(instructions="Judge   it.\n") == _key()
+
+    def test_every_component_changes_the_key(self):
+        base = _key()
+        assert _key('{"command": "ls -la"}') != base
+        assert _key(tool_name="Read") != base
+        assert _key(model="claude-sonnet-4-5") != base
+        assert _key(instructions="Judge it harshly.") != base
+
+    def test_non_json_input_is_used_verbatim(self):
+        assert _key("not json") != _key("not  json")
+
+
+class TestJudgeVerdictCache:
+    @pytest.mark.asyncio
+    async def test_disabled_cache_never_hits(self):
+        cache = JudgeVerdictCache("ns", ttl_seconds=0)
+        ctx = make_policy_context()
+        await cache.put("k", {"probability": 0.1}, ctx)
+        assert await cache.get("k", ctx) is None
+        assert cache.misses == 0
+
+    @pytest.mark.asyncio
+    async def test_in_process_hit_and_expiry(self):
+        cache = JudgeVerdictCache("ns", ttl_seconds=60)
+        ctx = make_policy_context()
+        with patch("luthien_proxy.policy_core.judge_verdict_cache.time.monotonic", return_value=1000.0):
+            assert await cache.get("k", ctx) is None
+            await cache.put("k", {"probability": 0.1}, ctx)
+            assert await cache.get("k", ctx) == {"probability": 0.1}
+        with patch("luthien_proxy.policy_core.judge_verdict_cache.time.monotonic", return_value=1061.0):
+            assert await cache.get("k", ctx) is None
+        assert (cache.hits, cache.shared_hits, cache.misses) == (1, 0, 2)
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        cache = JudgeVerdictCache("ns", ttl_seconds=60, max_entries=2)
+        ctx = make_policy_context()
+        await cache.put("a", {"v": 1}, ctx)
+        await cache.put("b", {"v": 2}, ctx)
+        await cache.get("a", ctx)
+        await cache.put("c", {"v": 3}, ctx)
+
+        assert await cache.get("b", ctx) is None
+        assert await cache.get("a", ctx) == {"v": 1}
+        assert await cache.get("c", ctx) == {"v": 3}
+
+    @pytest.mark.asyncio
+    async def test_shared_tier_survives_a_new_process(self, db_pool):
+        ctx = make_policy_context(policy_cache_factory=lambda name: PolicyCache(db_pool, name))
+        await JudgeVerdictCache("judge_verdict:X", ttl_seconds=60).put("k", {"probability": 0.9}, ctx)
+
+        fresh = JudgeVerdictCache("judge_verdict:X", ttl_seconds=60)
+        assert await fresh.get("k", ctx) == {"probability": 0.9}
+        assert await fresh.get("k", ctx) == {"probability": 0.9}
+        assert (fresh.hits, fresh.shared_hits) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_shared_tier_errors_degrade_to_miss(self):
+        class _Broken:
+            async def get(self, key):
+                raise RuntimeError("db down")
+
+            async def put(self, key, value, ttl_seconds):
+                raise RuntimeError("db down")
+
+        ctx = make_policy_context(policy_cache_factory=lambda name: _Broken())  # type: ignore[arg-type,return-value]
+        cache = JudgeVerdictCache("ns", ttl_seconds=60)
+
+        assert await cache.get("k", ctx) is None
+        await cache.put("k", {"probability": 0.2}, ctx)
+        assert await cache.get("k", ctx) == {"probability": 0.2}
@@ -0,0 +1,163 @@
+"""Tests for memoized, copy-on-write request scrubbing."""
+
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+import pytest
+from tests.luthien_proxy.fixtures.policy_context import make_policy_context
+
+from luthien_proxy.policy_core import TextModifierPolicy
+from luthien_proxy.policy_core.text_scrub_memo import TextScrubMemo, scrub_request_messages
+from luthien_proxy.utils.db import DatabasePool
+from luthien_proxy.utils.migration_check import check_migrations
+from luthien_proxy.utils.policy_cache import PolicyCache
+
+
+class _CountingTransform:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def __call__(self, text: str) -> tuple[str, int]:
+        self.calls.append(text)
+        count = text.count("secret")
+        return text.replace("secret", "[X]"), count
+
+
+def _history() -> list[dict[str, Any]]:
+    return [
+        {"role": "user", "content": "my secret is here"},
+        {"role": "assistant", "content": [{"type": "text", "text": "nothing to scrub"}]},
+        {
+            "role": "user",
+            "content": [
+                {"type": "tool_result", "tool_use_id": "t1", "content": "a secret file"},
+                {
+                    "type": "tool_result",
+                    "tool_use_id": "t2",
+                    "content": [{"type": "text", "text": "secret"}, {"type": "text", "text": "plain"}],
+                },
+                {"type": "image", "source": {"type": "base64", "media_type": "image/png", "data": "secret"}},
+            ],
+        },
+    ]
+
+
+@pytest.fixture
+async def db_pool():
+    pool = DatabasePool("sqlite://:memory:")
+    await check_migrations(pool)
+    yield pool
+    await pool.close()
+
+
+class TestScrubRequestMessages:
+    @pytest.mark.asyncio
+    async def test_copies_only_changed_parts(self):
+        messages = _history()
+        snapshot = copy.deepcopy(messages)
+
+        result = await scrub_request_messages(
+            messages, TextScrubMemo("ns", "fp"), _CountingTransform(), make_policy_context()
+        )
+
+        assert messages == snapshot
+        assert result.messages is not None
+        assert result.messages[0]["content"] == "my [X] is here"
+        assert result.messages[1] is messages[1]
+        blocks = result.messages[2]["content"]
+        assert blocks[0]["content"] == "a [X] file"
+        assert blocks[1]["content"][0]["text"] == "[X]"
+        assert blocks[1]["content"][1] is messages[2]["content"][1]["content"][1]
+        assert blocks[2] is messages[2]["content"][2]
+        assert (result.blocks_modified, result.total_replacements) == (3, 3)
+
+    @pytest.mark.asyncio
+    async def test_unchanged_history_returns_none(self):
+        messages = [{"role": "user", "content": "hello"}]
+        result = await scrub_request_messages(
+            messages, TextScrubMemo("ns", "fp"), _CountingTransform(), make_policy_context()
+        )
+        assert result.messages is None
+        assert result.blocks_modified == 0
+
+    @pytest.mark.asyncio
+    async def test_resent_history_is_not_rescrubbed(self):
+        memo = TextScrubMemo("ns", "fp")
+        transform = _CountingTransform()
+        ctx = make_policy_context()
+        turn_one = _history()
+        first = await scrub_request_messages(turn_one, memo, transform, ctx)
+
+        calls_after_first = len(transform.calls)
+        turn_two = _history() + [{"role": "user", "content": "another secret"}]
+        second = await scrub_request_messages(turn_two, memo, transform, ctx)
+
+        assert transform.calls[calls_after_first:] == ["another secret"]
+        assert second.messages is not None and first.messages is not None
+        assert second.messages[:3] == first.messages
+        assert second.total_replacements == first.total_replacements + 1
+
+
+class TestTextScrubMemo:
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        memo = TextScrubMemo("ns", "fp", max_entries=2)
+        transform = _CountingTransform()
+        ctx = make_policy_context()
+        for text in ("a", "b", "a", "c", "b"):
+            await memo.apply(text, transform, ctx)
+        assert transform.calls == ["a", "b", "c", "b"]
+
+    @pytest.mark.asyncio
+    async def test_shared_tier_survives_a_new_process(self, db_pool):
+        ctx = make_policy_context(policy_cache_factory=lambda name: PolicyCache(db_pool, name))
+        await TextScrubMemo("scrub", "fp", shared_ttl_seconds=60).apply("a secret", _CountingTransform(), ctx)
+
+        fresh = TextScrubMemo("scrub", "fp", shared_ttl_seconds=60)
+        transform = _CountingTransform()
+        assert await fresh.apply("a secret", transform, ctx) == ("a [X]", 1)
+        assert transform.calls == []
+        assert fresh.shared_hits == 1
+
+        other_config = TextScrubMemo("scrub", "other", shared_ttl_seconds=60)
+        await other_config.apply("a secret", transform, ctx)
+        assert transform.calls == ["a secret"]
+
+    def test_rejects_bad_bounds(self):
+        with pytest.raises(ValueError):
+            TextScrubMemo("ns", "fp", max_entries=0)
+        with pytest.raises(ValueError):
+            TextScrubMemo("ns", "fp", shared_ttl_seconds=-1)
+
+
+class _UpperRequests(TextModifierPolicy):
+    modify_requests = True
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def modify_text(self, text: str) -> str:
+        self.calls += 1
+        return text.upper()
+
+
+class TestTextModifierRequests:
+    @pytest.mark.asyncio
+    async def test_requests_pass_through_by_default(self):
+        request: dict[str, Any] = {"model": "m", "messages": [{"role": "user", "content": "hi"}], "max_tokens": 10}
+        assert await TextModifierPolicy().on_anthropic_request(request, make_policy_context()) is request  # type: ignore[arg-type]
+
+    @pytest.mark.asyncio
+    async def test_modify_requests_is_memoized(self):
+        policy = _UpperRequests()
+        policy.freeze_configured_state()
+        request: dict[str, Any] = {"model": "m", "messages": [{"role": "user", "content": "hi"}], "max_tokens": 10}
+
+        for _ in range(3):
+            result = await policy.on_anthropic_request(request, make_policy_context())  # type: ignore[arg-type]
+            assert result["messages"][0]["content"] == "HI"
+
+        assert request["messages"][0]["content"] == "hi"
+        assert policy.calls == 1
@@ -1,19 +1,21 @@
 """Unit tests for S3ConversationArchiver.
 
-The archiver exposes ``fetch_batch`` (DB-only) and ``upload_batch`` (S3-only)
-as separate methods so the purger can release the DB connection across the
-S3 PUT. These tests cover:
+The archiver exposes ``fetch_batch`` (DB-only) and ``open_segment`` (S3-only)
+separately so the purger can release the DB connection across the S3
+upload. These tests cover:
 
 - Constructor-time validation of encryption settings, batch_size cap, prefix
   normalization, and boto3 import probe
 - Per-batch JSONL serialization (call + events + policy_events + judge_decisions)
 - Encryption modes: AES256, aws:kms (with/without key id), bucket-default
-- S3 error propagation from upload_batch (the purger handles "stop the run")
+- S3 error propagation from the segment writer (the purger handles "stop the run")
+- Gzip compression and multipart segment uploads against an in-memory S3 stand-in
 - DB-only / S3-only separation (regression guard for the connection-release fix)
 """
 
 from __future__ import annotations
 
+import gzip
 import json
 from datetime import UTC, datetime
 from typing import Any
@@ -21,7 +23,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from luthien_proxy.retention import archiver as archiver_module
 from luthien_proxy.retention.archiver import VALID_ENCRYPTION_MODES, S3ConversationArchiver
+from luthien_proxy.retention.partitions import Partition
 
 
 def _make_call(call_id: str, **overrides: Any) -> dict[str, Any]:
@@ -33,6 +37,7 @@ def _make_call(call_id: str, **overrides: Any) -> dict[str, Any]:
         "created_at": datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC),
         "completed_at": datetime(2024, 1, 1, 12, 0, 5, tzinfo=UTC),
         "session_id": None,
+        "user_id": None,
     }
     base.update(overrides)
     return base
@@ -116,17 +121,22 @@ def test_valid_encryption_modes_constant():
     assert VALID_ENCRYPTION_MODES == frozenset({"AES256", "aws:kms", "bucket-default"})
 
 
-async def _fetch_and_upload(archiver, *, conn, cutoff, last_call_id=None, run_id="run0001", batch_index=0):
-    """Drive fetch_batch then upload_batch. Helper for tests that previously
-    used the combined archive_one_batch API."""
+async def _fetch_and_upload(archiver, *, conn, cutoff, last_call_id=None, run_id="run0001", segment_index=0):
+    """Drive fetch_batch, then write the batch as a one-batch segment."""
     body, archived_ids, has_more = await archiver.fetch_batch(db_conn=conn, cutoff=cutoff, last_call_id=last_call_id)
     if archived_ids:
-        await archiver.upload_batch(
-            body=body, cutoff=cutoff, run_id=run_id, batch_index=batch_index, record_count=len(archived_ids)
-        )
+        writer = archiver.open_segment(cutoff=cutoff, run_id=run_id, segment_index=segment_index)
+        await writer.write(body)
+        await writer.complete()
     return archived_ids, has_more
 
 
+def _put_body(client: MagicMock, call_index: int = -1) -> bytes:
+    """Return the decompressed Body of a put_object call (gzip is the default)."""
+    body = client.put_object.call_args_list[call_index].kwargs["Body"]
+    return gzip.decompress(body)
+
+
 # ── fetch_batch + upload_batch happy paths ────────────────────────────────
 
 
@@ -145,7 +155,7 @@ async def test_fetch_and_upload_emits_jsonl_with_full_records(mock_s3_client, cu
     assert archived_ids == ["call-001", "call-002"]
     assert has_more is False  # 2 < batch_size 10
     mock_s3_client.put_object.assert_called_once()
-    body = mock_s3_client.put_object.call_args.kwargs["Body"]
+    body = _put_body(mock_s3_client)
     # Body must end with a trailing newline (NDJSON convention).
     assert body.endswith(b"\n")
     lines = [json.loads(line) for line in body.decode().splitlines() if line]
@@ -200,12 +210,14 @@ async def test_fetch_batch_uses_cursor_when_last_call_id_set(mock_s3_client, cut
 
 
 @pytest.mark.asyncio
-async def test_upload_batch_propagates_s3_error(mock_s3_client, cutoff):
-    """upload_batch surfaces S3 errors; the purger handles 'stop the run'."""
+async def test_segment_complete_propagates_s3_error(mock_s3_client, cutoff):
+    """The segment writer surfaces S3 errors; the purger handles 'stop the run'."""
     mock_s3_client.put_object = MagicMock(side_effect=RuntimeError("S3 down"))
     archiver = S3ConversationArchiver(bucket="b", s3_client=mock_s3_client)
+    writer = archiver.open_segment(cutoff=cutoff, run_id="r", segment_index=0)
+    await writer.write(b'{"call":{}}\n')
     with pytest.raises(RuntimeError, match="S3 down"):
-        await archiver.upload_batch(body=b'{"call":{}}\n', cutoff=cutoff, run_id="r", batch_index=0, record_count=1)
+        await writer.complete()
 
 
 @pytest.mark.asyncio
@@ -279,12 +291,14 @@ def test_build_s3_key_partitions_by_run_date_not_cutoff():
     prefix."""
     archiver = S3ConversationArchiver(bucket="b", prefix="p/")
     cutoff = datetime(2024, 3, 15, 10, 30, tzinfo=UTC)
-    key = archiver._build_s3_key(cutoff, run_id="abc12345", batch_index=2)
+    key = archiver._build_s3_key(cutoff, run_id="abc12345", segment_index=2)
     today = datetime.now(UTC).strftime("%Y-%m-%d")
     assert key.startswith(f"p/{today}/")
     assert "cutoff-2024-03-15" in key
     assert "abc12345" in key
-    assert key.endswith("-0002.jsonl")
+    assert key.endswith("-0002.jsonl.gz")
+    uncompressed = S3ConversationArchiver(bucket="b", prefix="p/", compression="none")
+    assert uncompressed._build_s3_key(cutoff, run_id="abc12345", segment_index=2).endswith("-0002.jsonl")
 
 
 def test_prefix_without_trailing_slash_normalized():
@@ -318,15 +332,41 @@ def test_prefix_multiple_leading_slashes_stripped():
 
 
 def test_batch_size_at_max_accepted():
-    """Boundary: 900 is the documented max."""
-    archiver = S3ConversationArchiver(bucket="b", batch_size=900)
-    assert archiver.batch_size == 900
+    """Boundary: 10,000 is the documented max — no longer pinned by SQLite's variable limit."""
+    archiver = S3ConversationArchiver(bucket="b", batch_size=10_000)
+    assert archiver.batch_size == 10_000
 
 
 def test_batch_size_above_max_rejected():
-    """Boundary: 901 just above the cap is rejected — locks the contract."""
-    with pytest.raises(ValueError, match="SQLITE_MAX_VARIABLE_NUMBER"):
-        S3ConversationArchiver(bucket="b", batch_size=901)
+    """Boundary: just above the cap is rejected — locks the contract."""
+    with pytest.raises(ValueError, match="out of range"):
+        S3ConversationArchiver(bucket="b", batch_size=10_001)
+
+
+def test_invalid_archive_format_rejected():
+    with pytest.raises(ValueError, match="archive_format"):
+        S3ConversationArchiver(bucket="b", archive_format="avro")
+
+
+def test_invalid_compression_rejected():
+    with pytest.raises(ValueError, match="compression"):
+        S3ConversationArchiver(bucket="b", compression="brotli")
+
+
+@pytest.mark.asyncio
+async def test_children_fetched_in_parameter_bounded_chunks(mock_s3_client, cutoff):
+    """Batches above SQLite's variable limit split the child IN clauses."""
+    calls = [_make_call(f"call-{i:04d}") for i in range(1_000)]
+    conn = AsyncMock()
+    conn.fetch = AsyncMock(side_effect=[calls] + [[]] * 6)
+
+    archiver = S3ConversationArchiver(bucket="b", batch_size=2_000, s3_client=mock_s3_client)
+    _, archived_ids, _ = await archiver.fetch_batch(db_conn=conn, cutoff=cutoff, last_call_id=None)
+
+    assert len(archived_ids) == 1_000
+    # 1 call fetch + 3 child tables x 2 chunks (900 + 100).
+    assert conn.fetch.call_count == 7
+    assert max(len(c.args) - 1 for c in conn.fetch.call_args_list[1:]) == 900
 
 
 def test_batch_size_zero_rejected():
@@ -355,6 +395,142 @@ async def test_jsonb_string_reparsed_into_structure(mock_s3_client, cutoff):
 
     archiver = S3ConversationArchiver(bucket="b", s3_client=mock_s3_client)
     await _fetch_and_upload(archiver, conn=conn, cutoff=cutoff, run_id="r")
-    body = mock_s3_client.put_object.call_args.kwargs["Body"]
-    record = json.loads(body.decode().splitlines()[0])
+    record = json.loads(_put_body(mock_s3_client).decode().splitlines()[0])
     assert record["events"][0]["payload"] == {"role": "user", "content": "hi"}
+
+
+# ── whole-partition archive ───────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_archive_partition_pages_rows_into_separate_objects(mock_s3_client):
+    rows = [_make_event("call-001", i, {"prompt": f"p{i}"}) for i in range(3)]
+    conn = AsyncMock()
+    conn.fetch = AsyncMock(side_effect=[rows[:2], rows[2:]])
+    pool = MagicMock()
+    cm = MagicMock()
+    cm.__aenter__ = AsyncMock(return_value=conn)
+    cm.__aexit__ = AsyncMock(return_value=False)
+    pool.connection = MagicMock(return_value=cm)
+    partition = Partition("conversation_events", "conversation_events_p20240101", datetime(2024, 1, 2, tzinfo=UTC))
+
+    archiver = S3ConversationArchiver(bucket="b", s3_client=mock_s3_client, segment_max_bytes=1)
+    with patch.object(archiver_module, "_PARTITION_PAGE_ROWS", 2):
+        total = await archiver.archive_partition(db_pool=pool, partition=partition, run_id="run1")
+
+    assert total == 3
+    assert mock_s3_client.put_object.call_count == 2
+    keys = [c.kwargs["Key"] for c in mock_s3_client.put_object.call_args_list]
+    assert all("/partition-conversation_events_p20240101-" in key for key in keys)
+    assert keys[0].endswith("-run1-0000.jsonl.gz") and keys[1].endswith("-run1-0001.jsonl.gz")
+    second_query, *cursor = conn.fetch.call_args_list[1].args
+    assert 'FROM "conversation_events_p20240101" WHERE (created_at, id) > ($1, $2)' in second_query
+    assert cursor == [rows[1]["created_at"], rows[1]["id"]]
+    lines = _put_body(mock_s3_client, 1).decode().splitlines()
+    assert json.loads(lines[0])["payload"] == {"prompt": "p2"}
+
+
+# ── multipart segments against an in-memory S3 stand-in ───────────────────
+
+
+class _FakeS3:
+    """Just enough of the boto3 S3 client for put + multipart uploads."""
+
+    def __init__(self, fail_part: int | None = None) -> None:
+        self.objects: dict[str, bytes] = {}
+        self.object_kwargs: dict[str, dict[str, Any]] = {}
+        self.uploads: dict[str, dict[str, Any]] = {}
+        self.aborted: list[str] = []
+        self._fail_part = fail_part
+
+    def put_object(self, *, Bucket: str, Key: str, Body: bytes, **kwargs: Any) -> dict[str, Any]:
+        self.objects[Key] = Body
+        self.object_kwargs[Key] = kwargs
+        return {}
+
+    def create_multipart_upload(self, *, Bucket: str, Key: str, **kwargs: Any) -> dict[str, Any]:
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {"key": Key, "parts": {}, "kwargs": kwargs}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, *, Bucket: str, Key: str, UploadId: str, PartNumber: int, Body: bytes) -> dict[str, Any]:
+        if PartNumber == self._fail_part:
+            raise RuntimeError("part upload failed")
+        self.uploads[UploadId]["parts"][PartNumber] = Body
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(
+        self, *, Bucket: str, Key: str, UploadId: str, MultipartUpload: dict[str, Any]
+    ) -> dict[str, Any]:
+        upload = self.uploads.pop(UploadId)
+        numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        assert numbers == sorted(upload["parts"])
+        self.objects[Key] = b"".join(upload["parts"][n] for n in numbers)
+        self.object_kwargs[Key] = upload["kwargs"]
+        return {}
+
+    def abort_multipart_upload(self, *, Bucket: str, Key: str, UploadId: str) -> dict[str, Any]:
+        self.uploads.pop(UploadId)
+        self.aborted.append(UploadId)
+        return {}
+
+
+def _jsonl(count: int, start: int = 0) -> bytes:
+    return "".join(json.dumps({"n": i, "pad": "x" * 200}) + "\n" for i in range(start, start + count)).encode()
+
+
+@pytest.mark.asyncio
+async def test_large_segment_streams_as_multipart_upload(cutoff):
+    s3 = _FakeS3()
+    archiver = S3ConversationArchiver(
+        bucket="b", s3_client=s3, compression="none", encryption_mode="aws:kms", kms_key_id="k"
+    )
+    archiver._PART_SIZE = 4_096  # type: ignore[misc]
+
+    writer = archiver.open_segment(cutoff=cutoff, run_id="r", segment_index=0)
+    for batch in range(5):
+        await writer.write(_jsonl(20, start=batch * 20))
+        # Never more than one part buffered in memory.
+        assert len(writer._buffer) < archiver._PART_SIZE
+    await writer.complete()
+
+    (key,) = s3.objects
+    assert [json.loads(line)["n"] for line in s3.objects[key].splitlines()] == list(range(100))
+    assert s3.object_kwargs[key]["ServerSideEncryption"] == "aws:kms"
+    assert s3.object_kwargs[key]["SSEKMSKeyId"] == "k"
+    assert not s3.uploads
+
+
+@pytest.mark.asyncio
+async def test_gzip_multipart_object_decompresses_to_all_batches(cutoff):
+    s3 = _FakeS3()
+    archiver = S3ConversationArchiver(bucket="b", s3_client=s3)
+    archiver._PART_SIZE = 256  # type: ignore[misc]
+
+    writer = archiver.open_segment(cutoff=cutoff, run_id="r", segment_index=3)
+    for batch in range(4):
+        await writer.write(_jsonl(50, start=batch * 50).replace(b"x" * 200, str(batch).encode() * 7))
+    await writer.complete()
+
+    (key,) = s3.objects
+    assert key.endswith("-0003.jsonl.gz")
+    assert s3.object_kwargs[key]["ContentEncoding"] == "gzip"
+    lines = gzip.decompress(s3.objects[key]).splitlines()
+    assert [json.loads(line)["n"] for line in lines] == list(range(200))
+    assert writer.size == len(s3.objects[key])
+
+
+@pytest.mark.asyncio
+async def test_failed_part_is_aborted_and_nothing_is_visible(cutoff):
+    s3 = _FakeS3(fail_part=2)
+    archiver = S3ConversationArchiver(bucket="b", s3_client=s3, compression="none")
+    archiver._PART_SIZE = 1_024  # type: ignore[misc]
+
+    writer = archiver.open_segment(cutoff=cutoff, run_id="r", segment_index=0)
+    with pytest.raises(RuntimeError, match="part upload failed"):
+        await writer.write(_jsonl(20))
+    await writer.abort()
+
+    assert s3.objects == {}
+    assert s3.aborted == ["upload-0"]
+    assert not s3.uploads
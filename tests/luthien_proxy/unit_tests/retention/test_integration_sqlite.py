@@ -9,6 +9,7 @@ because they hold no external dependencies (no Docker, no S3, no Postgres).
 
 from __future__ import annotations
 
+import gzip
 import json
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -172,11 +173,11 @@ async def test_purge_with_archiver_against_real_sqlite(sqlite_pool):
 
     # Verify the S3 payload
     s3_client.put_object.assert_called_once()
-    # Key shape: {prefix}{run-date}/cutoff-{cutoff-date}-{ts}-{run_id}-{batch:04d}.jsonl
+    # Key shape: {prefix}{run-date}/cutoff-{cutoff-date}-{ts}-{run_id}-{segment:04d}.jsonl.gz
     key = s3_client.put_object.call_args.kwargs["Key"]
     assert key.startswith(f"luthien-archive/{today}/cutoff-")
-    assert key.endswith("-0000.jsonl")
-    body = s3_client.put_object.call_args.kwargs["Body"].decode()
+    assert key.endswith("-0000.jsonl.gz")
+    body = gzip.decompress(s3_client.put_object.call_args.kwargs["Body"]).decode()
     lines = [json.loads(line) for line in body.splitlines() if line]
     assert len(lines) == 2
     archived_call_ids = {line["call"]["call_id"] for line in lines}
@@ -236,7 +237,8 @@ async def test_purge_partial_run_archives_and_deletes_first_batch_only(sqlite_po
 
     s3_client = MagicMock()
     s3_client.put_object = MagicMock(side_effect=[None, RuntimeError("S3 flapped")])
-    archiver = S3ConversationArchiver(bucket="b", s3_client=s3_client, batch_size=2)
+    # One object per batch, so batch 0 is durable before batch 1 is written.
+    archiver = S3ConversationArchiver(bucket="b", s3_client=s3_client, batch_size=2, segment_max_bytes=1)
     purger = ConversationPurger(db_pool=sqlite_pool, retention_days=30, archiver=archiver)
 
     deleted = await purger.purge_once()
@@ -286,7 +288,7 @@ async def test_archive_includes_policy_events_and_judge_decisions(sqlite_pool):
     assert await _count(sqlite_pool, "conversation_judge_decisions") == 0
 
     # Archive content: every child record's payload survives, structured.
-    body = s3_client.put_object.call_args.kwargs["Body"].decode()
+    body = gzip.decompress(s3_client.put_object.call_args.kwargs["Body"]).decode()
     record = json.loads(body.splitlines()[0])
     assert record["call"]["call_id"] == "old-1"
     assert len(record["events"]) == 1
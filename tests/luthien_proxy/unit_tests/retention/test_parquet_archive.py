@@ -0,0 +1,162 @@
+"""Unit tests for the Parquet archive format.
+
+Covers flattening per-call archive records into typed rows (model and token
+extraction), the Hive ``dt=/model=`` key layout, and ``ParquetSegmentWriter``
+grouping, upload and abort against an in-memory S3 stand-in.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from luthien_proxy.retention.archiver import S3ConversationArchiver  # noqa: E402
+from luthien_proxy.retention.parquet_archive import (  # noqa: E402
+    UNKNOWN_MODEL,
+    ParquetSegmentWriter,
+    partition_of,
+    record_to_row,
+)
+
+_CUTOFF = datetime(2024, 1, 3, tzinfo=UTC)
+
+
+def _record(
+    call_id: str,
+    *,
+    model: str | None = "claude-sonnet-4",
+    created_at: str = "2024-01-01T12:00:00+00:00",
+    usage: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    events: list[dict[str, Any]] = []
+    if model is not None:
+        events.append({"event_type": "transaction.request_recorded", "payload": {"final_model": model}})
+    if usage is not None:
+        events.append(
+            {
+                "event_type": "transaction.non_streaming_response_recorded",
+                "payload": {"final_response": {"usage": usage}},
+            }
+        )
+    return {
+        "call": {
+            "call_id": call_id,
+            "model_name": None,
+            "provider": "anthropic",
+            "status": "completed",
+            "created_at": created_at,
+            "completed_at": None,
+            "session_id": "s1",
+            "user_id": "u1",
+        },
+        "events": events,
+        "policy_events": [],
+        "judge_decisions": [{"id": 1, "probability": 0.1}],
+    }
+
+
+def _jsonl(*records: dict[str, Any]) -> bytes:
+    return "".join(json.dumps(record) + "\n" for record in records).encode()
+
+
+class _FakeS3:
+    def __init__(self, fail_on_put: int | None = None) -> None:
+        self.objects: dict[str, bytes] = {}
+        self.object_kwargs: dict[str, dict[str, Any]] = {}
+        self.deleted: list[str] = []
+        self._puts = 0
+        self._fail_on_put = fail_on_put
+
+    def put_object(self, *, Bucket: str, Key: str, Body: bytes, **kwargs: Any) -> dict[str, Any]:
+        self._puts += 1
+        if self._puts == self._fail_on_put:
+            raise RuntimeError("put failed")
+        self.objects[Key] = Body
+        self.object_kwargs[Key] = kwargs
+        return {}
+
+    def delete_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+        self.objects.pop(Key, None)
+        self.deleted.append(Key)
+        return {}
+
+
+def _archiver(client: _FakeS3) -> S3ConversationArchiver:
+    return S3ConversationArchiver(bucket="b", prefix="p/", s3_client=client, archive_format="parquet")
+
+
+class TestRecordToRow:
+    def test_typed_columns_and_token_totals(self):
+        row = record_to_row(_record("c1", usage={"input_tokens": 10, "output_tokens": 3, "cache_read_input_tokens": 0}))
+
+        assert row["model"] == "claude-sonnet-4"
+        assert row["user_id"] == "u1"
+        assert row["created_at"] == datetime(2024, 1, 1, 12, tzinfo=UTC)
+        assert row["event_types"] == ["transaction.request_recorded", "transaction.non_streaming_response_recorded"]
+        assert (row["input_tokens"], row["output_tokens"], row["cache_read_input_tokens"]) == (10, 3, 0)
+        assert row["cache_creation_input_tokens"] is None
+        assert json.loads(row["judge_decisions"]) == [{"id": 1, "probability": 0.1}]
+
+    def test_model_falls_back_to_call_row_then_unknown(self):
+        record = _record("c1", model=None)
+        assert record_to_row(record)["model"] == UNKNOWN_MODEL
+        record["call"]["model_name"] = "claude-3"
+        assert record_to_row(record)["model"] == "claude-3"
+
+    def test_naive_sqlite_timestamp_is_utc(self):
+        row = record_to_row(_record("c1", created_at="2024-01-01 23:30:00"))
+        assert partition_of(row) == ("2024-01-01", "claude-sonnet-4")
+
+
+def test_parquet_key_is_hive_partitioned():
+    archiver = _archiver(_FakeS3())
+    key = archiver._build_s3_key(_CUTOFF, "run1", 3, dt="2024-01-01", model="openrouter/claude")
+    assert key.startswith("p/calls/dt=2024-01-01/model=openrouter%2Fclaude/cutoff-2024-01-03-")
+    assert key.endswith("-run1-0003.parquet")
+    with pytest.raises(ValueError, match="dt and model"):
+        archiver._build_s3_key(_CUTOFF, "run1", 3)
+
+
+class TestParquetSegmentWriter:
+    @pytest.mark.asyncio
+    async def test_one_object_per_day_and_model(self):
+        client = _FakeS3()
+        writer = _archiver(client).open_segment(cutoff=_CUTOFF, run_id="run1", segment_index=0)
+        assert isinstance(writer, ParquetSegmentWriter)
+
+        await writer.write(_jsonl(_record("c1", usage={"input_tokens": 5}), _record("c2", model="claude-haiku")))
+        await writer.write(_jsonl(_record("c3", created_at="2024-01-02T01:00:00+00:00")))
+        await writer.complete()
+
+        assert sorted(key.split("/cutoff-")[0] for key in client.objects) == [
+            "p/calls/dt=2024-01-01/model=claude-haiku",
+            "p/calls/dt=2024-01-01/model=claude-sonnet-4",
+            "p/calls/dt=2024-01-02/model=claude-sonnet-4",
+        ]
+        key = next(k for k in client.objects if "dt=2024-01-01/model=claude-sonnet-4" in k)
+        assert client.object_kwargs[key]["ContentType"] == "application/vnd.apache.parquet"
+        assert "ContentEncoding" not in client.object_kwargs[key]
+        table = pq.read_table(io.BytesIO(client.objects[key]))
+        assert table.schema.field("input_tokens").type == pa.int64()
+        assert table.column("call_id").to_pylist() == ["c1"]
+        assert table.column("input_tokens").to_pylist() == [5]
+
+    @pytest.mark.asyncio
+    async def test_abort_removes_objects_already_written(self):
+        client = _FakeS3(fail_on_put=2)
+        writer = _archiver(client).open_segment(cutoff=_CUTOFF, run_id="run1", segment_index=0)
+        await writer.write(_jsonl(_record("c1"), _record("c2", model="claude-haiku")))
+
+        with pytest.raises(RuntimeError, match="put failed"):
+            await writer.complete()
+        await writer.abort()
+
+        assert client.objects == {}
+        assert len(client.deleted) == 1
@@ -0,0 +1,162 @@
+"""Unit tests for PartitionManager and its bound/name helpers.
+
+Postgres isn't available to unit tests, so the catalog queries are answered
+by a fake connection and the tests assert on the DDL the manager issues.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from luthien_proxy.retention.partitions import (
+    Partition,
+    PartitionManager,
+    parse_upper_bound,
+    partition_name,
+    quote_identifier,
+)
+
+
+def _make_pool(
+    *, partitioned: list[str], bounds: dict[str, list[tuple[str, str]]], is_sqlite: bool = False
+) -> tuple[MagicMock, AsyncMock]:
+    """Fake pool whose catalog reports ``partitioned`` tables with the given (name, bound) partitions."""
+
+    async def fetch(query: str, *args: Any) -> list[dict[str, Any]]:
+        if "relkind = 'p'" in query:
+            return [{"relname": table} for table in partitioned]
+        return [{"name": name, "bound": bound} for name, bound in bounds.get(args[0], [])]
+
+    conn = AsyncMock()
+    conn.fetch = AsyncMock(side_effect=fetch)
+    conn.execute = AsyncMock(return_value=None)
+    tx = MagicMock()
+    tx.__aenter__ = AsyncMock(return_value=None)
+    tx.__aexit__ = AsyncMock(return_value=False)
+    conn.transaction = MagicMock(return_value=tx)
+
+    pool = MagicMock()
+    pool.is_sqlite = is_sqlite
+    cm = MagicMock()
+    cm.__aenter__ = AsyncMock(return_value=conn)
+    cm.__aexit__ = AsyncMock(return_value=False)
+    pool.connection = MagicMock(return_value=cm)
+    return pool, conn
+
+
+def _day_bound(start: str, end: str) -> str:
+    return f"FOR VALUES FROM ('{start} 00:00:00+00') TO ('{end} 00:00:00+00')"
+
+
+_LEGACY = ("conversation_events_legacy", "FOR VALUES FROM (MINVALUE) TO ('2026-10-16 00:00:00+00')")
+
+
+def _executed(conn: AsyncMock) -> list[str]:
+    return [c.args[0] for c in conn.execute.call_args_list]
+
+
+class TestHelpers:
+    def test_parse_upper_bound(self):
+        assert parse_upper_bound(_day_bound("2026-10-15", "2026-10-16")) == datetime(2026, 10, 16, tzinfo=UTC)
+        assert parse_upper_bound(_LEGACY[1]) == datetime(2026, 10, 16, tzinfo=UTC)
+        assert parse_upper_bound("DEFAULT") is None
+        assert parse_upper_bound("FOR VALUES FROM ('2026-10-15 00:00:00+00') TO (MAXVALUE)") is None
+
+    def test_partition_name(self):
+        assert partition_name("request_logs", date(2026, 1, 5)) == "request_logs_p20260105"
+
+    def test_quote_identifier_rejects_unsafe_names(self):
+        assert quote_identifier("conversation_events_p20260105") == '"conversation_events_p20260105"'
+        with pytest.raises(ValueError):
+            quote_identifier('events"; DROP TABLE conversation_calls; --')
+
+
+class TestEnsureFuturePartitions:
+    @pytest.mark.asyncio
+    async def test_creates_days_after_latest_bound_through_horizon(self):
+        pool, conn = _make_pool(
+            partitioned=["conversation_events"],
+            bounds={
+                "conversation_events": [
+                    _LEGACY,
+                    ("conversation_events_p20261016", _day_bound("2026-10-16", "2026-10-17")),
+                ]
+            },
+        )
+        manager = PartitionManager(db_pool=pool, premake_days=3)
+
+        created = await manager.ensure_future_partitions(now=datetime(2026, 10, 16, 9, tzinfo=UTC))
+
+        assert created == 2
+        ddl = _executed(conn)
+        assert 'CREATE TABLE IF NOT EXISTS "conversation_events_p20261017" PARTITION OF "conversation_events"' in ddl[0]
+        assert "FROM ('2026-10-17T00:00:00+00:00') TO ('2026-10-18T00:00:00+00:00')" in ddl[0]
+        assert '"conversation_events_p20261018"' in ddl[1]
+
+    @pytest.mark.asyncio
+    async def test_fills_gap_after_outage(self):
+        pool, conn = _make_pool(
+            partitioned=["request_logs"],
+            bounds={"request_logs": [("request_logs_p20261010", _day_bound("2026-10-10", "2026-10-11"))]},
+        )
+        manager = PartitionManager(db_pool=pool, premake_days=1)
+
+        created = await manager.ensure_future_partitions(now=datetime(2026, 10, 13, tzinfo=UTC))
+
+        assert created == 3
+        assert '"request_logs_p20261011"' in _executed(conn)[0]
+        assert '"request_logs_p20261013"' in _executed(conn)[2]
+
+    @pytest.mark.asyncio
+    async def test_unpartitioned_tables_are_left_alone(self):
+        pool, conn = _make_pool(partitioned=[], bounds={})
+        assert await PartitionManager(db_pool=pool).ensure_future_partitions() == 0
+        conn.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_sqlite_never_queries_the_catalog(self):
+        pool, conn = _make_pool(partitioned=["conversation_events"], bounds={}, is_sqlite=True)
+        assert await PartitionManager(db_pool=pool).partitioned_tables() == []
+        conn.fetch.assert_not_called()
+
+    def test_rejects_non_positive_premake(self):
+        with pytest.raises(ValueError):
+            PartitionManager(db_pool=MagicMock(), premake_days=0)
+
+
+class TestExpiry:
+    @pytest.mark.asyncio
+    async def test_expired_partitions_are_wholly_before_cutoff(self):
+        pool, _ = _make_pool(
+            partitioned=["conversation_events", "request_logs"],
+            bounds={
+                "conversation_events": [
+                    ("conversation_events_p20261002", _day_bound("2026-10-02", "2026-10-03")),
+                    _LEGACY,
+                    ("conversation_events_default", "DEFAULT"),
+                ],
+                "request_logs": [("request_logs_p20261001", _day_bound("2026-10-01", "2026-10-02"))],
+            },
+        )
+        manager = PartitionManager(db_pool=pool)
+
+        expired = await manager.expired_partitions(datetime(2026, 10, 3, 12, tzinfo=UTC))
+
+        assert [p.name for p in expired] == ["request_logs_p20261001", "conversation_events_p20261002"]
+
+    @pytest.mark.asyncio
+    async def test_drop_partition_detaches_then_drops_in_one_transaction(self):
+        pool, conn = _make_pool(partitioned=[], bounds={})
+        partition = Partition("conversation_events", "conversation_events_p20261002", datetime(2026, 10, 3, tzinfo=UTC))
+
+        await PartitionManager(db_pool=pool).drop_partition(partition)
+
+        conn.transaction.assert_called_once()
+        assert _executed(conn) == [
+            'ALTER TABLE "conversation_events" DETACH PARTITION "conversation_events_p20261002"',
+            'DROP TABLE "conversation_events_p20261002"',
+        ]
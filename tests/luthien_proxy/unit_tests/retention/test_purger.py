@@ -20,6 +20,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from luthien_proxy.retention.partitions import Partition
 from luthien_proxy.retention.purger import ConversationPurger
 
 
@@ -51,26 +52,45 @@ def _make_archiver(
     *,
     batches: list[tuple[list[str], bool]],
     upload_side_effect: object | None = None,
+    segment_max_bytes: int = 0,
 ) -> MagicMock:
-    """Build a mock archiver whose split fetch_batch + upload_batch produce the given batches.
+    """Build a mock archiver whose fetch_batch + segment writer produce the given batches.
 
     Each batch is a tuple ``(call_ids, has_more)``. fetch_batch returns
-    ``(body, call_ids, has_more)`` derived from the tuple; upload_batch is a
-    plain AsyncMock the caller can attach a side_effect to via
-    ``upload_side_effect`` (a single exception, or a list of values to
-    return / raise per call).
+    ``(body, call_ids, has_more)`` derived from the tuple. Every segment is
+    the same fake writer, exposed as ``archiver.segment``; its ``write``
+    gets ``upload_side_effect`` (a single exception, or a list of values to
+    return / raise per call). Each write adds one byte to ``size``, so the
+    default ``segment_max_bytes=0`` closes a segment after every batch.
 
     new_run_id returns a deterministic value for assertions.
     """
     archiver = MagicMock()
     archiver.new_run_id = MagicMock(return_value="testrun1")
     archiver.fetch_batch = AsyncMock(side_effect=[(b"<jsonl>", call_ids, has_more) for call_ids, has_more in batches])
-    if upload_side_effect is None:
-        archiver.upload_batch = AsyncMock(return_value=None)
-    elif isinstance(upload_side_effect, list):
-        archiver.upload_batch = AsyncMock(side_effect=upload_side_effect)
-    else:
-        archiver.upload_batch = AsyncMock(side_effect=upload_side_effect)
+    archiver.segment_max_bytes = segment_max_bytes
+    writer = MagicMock()
+    writer.size = 0
+    side_effects = list(upload_side_effect) if isinstance(upload_side_effect, list) else None
+
+    async def write(_body: bytes) -> None:
+        writer.size += 1
+        if side_effects is not None:
+            effect = side_effects.pop(0)
+            if isinstance(effect, BaseException):
+                raise effect
+        elif isinstance(upload_side_effect, BaseException):
+            raise upload_side_effect
+
+    def open_segment(**_kwargs: object) -> MagicMock:
+        writer.size = 0
+        return writer
+
+    writer.write = AsyncMock(side_effect=write)
+    writer.complete = AsyncMock(return_value=None)
+    writer.abort = AsyncMock(return_value=None)
+    archiver.open_segment = MagicMock(side_effect=open_segment)
+    archiver.segment = writer
     return archiver
 
 
@@ -92,12 +112,11 @@ async def test_archive_then_delete_per_batch_loops_until_no_more():
 
     assert count == 3
     assert archiver.fetch_batch.call_count == 2
-    assert archiver.upload_batch.call_count == 2
+    assert archiver.segment.write.call_count == 2
     # Cursor advances to last archived id of previous batch.
     second_fetch_kwargs = archiver.fetch_batch.call_args_list[1].kwargs
     assert second_fetch_kwargs["last_call_id"] == "c2"
-    second_upload_kwargs = archiver.upload_batch.call_args_list[1].kwargs
-    assert second_upload_kwargs["batch_index"] == 1
+    assert archiver.open_segment.call_args_list[1].kwargs["segment_index"] == 1
 
 
 @pytest.mark.asyncio
@@ -110,7 +129,7 @@ async def test_archive_then_delete_stops_when_first_batch_empty():
 
     assert count == 0
     archiver.fetch_batch.assert_called_once()
-    archiver.upload_batch.assert_not_called()
+    archiver.open_segment.assert_not_called()
     # No DELETE issued because there were no archived ids.
     conn.execute.assert_not_called()
 
@@ -131,17 +150,16 @@ async def test_upload_failure_mid_run_preserves_earlier_batches():
     assert count == 2
     assert conn.execute.call_count == 1
     assert archiver.fetch_batch.call_count == 2
-    assert archiver.upload_batch.call_count == 2
+    assert archiver.segment.write.call_count == 2
+    archiver.segment.abort.assert_called_once()
 
 
 @pytest.mark.asyncio
 async def test_fetch_failure_mid_run_preserves_earlier_batches():
     """First batch archives+deletes successfully; second batch fails to fetch from DB."""
     pool, conn = _make_pool()
-    archiver = MagicMock()
-    archiver.new_run_id = MagicMock(return_value="testrun1")
-    archiver.fetch_batch = AsyncMock(side_effect=[(b"<jsonl>", ["c1", "c2"], True), RuntimeError("DB error")])
-    archiver.upload_batch = AsyncMock(return_value=None)
+    archiver = _make_archiver(batches=[])
+    archiver.fetch_batch.side_effect = [(b"<jsonl>", ["c1", "c2"], True), RuntimeError("DB error")]
 
     purger = ConversationPurger(db_pool=pool, retention_days=30, archiver=archiver)
     count = await purger.purge_once()
@@ -171,8 +189,9 @@ async def test_delete_failure_mid_run_stops_loop_archive_kept():
     count = await purger.purge_once()
 
     assert count == 0
-    # Loop stopped after first DELETE failure — second batch never fetched.
-    assert archiver.fetch_batch.call_count == 1
+    # Loop stopped after the first DELETE failure — the prefetched second
+    # batch was never written.
+    assert archiver.segment.write.call_count == 1
 
 
 @pytest.mark.asyncio
@@ -214,7 +233,7 @@ async def test_db_connection_released_before_s3_upload():
         return None
 
     archiver = _make_archiver(batches=[(["c1"], False)])
-    archiver.upload_batch = AsyncMock(side_effect=upload_records_state)
+    archiver.segment.write = AsyncMock(side_effect=upload_records_state)
 
     purger = ConversationPurger(db_pool=pool, retention_days=30, archiver=archiver)
     count = await purger.purge_once()
@@ -429,3 +448,129 @@ async def test_loop_exception_logged(caplog):
 
     purger._task = None  # Drain so stop() short-circuits.
     assert any("Purger background task raised an unexpected exception" in r.message for r in caplog.records)
+
+
+# ── partition drop ────────────────────────────────────────────────────────
+
+
+def _make_partitions(names: list[str], drop_side_effect: object | None = None) -> MagicMock:
+    manager = MagicMock()
+    manager.expired_partitions = AsyncMock(
+        return_value=[Partition("conversation_events", name, datetime(2024, 1, 1, tzinfo=UTC)) for name in names]
+    )
+    manager.drop_partition = AsyncMock(side_effect=drop_side_effect)
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_expired_partitions_archived_then_dropped_before_call_loop():
+    pool, _ = _make_pool()
+    archiver = _make_archiver(batches=[([], False)])
+    order: list[str] = []
+    archiver.archive_partition = AsyncMock(side_effect=lambda **kw: order.append(f"archive:{kw['partition'].name}"))
+    partitions = _make_partitions(["p1", "p2"])
+    partitions.drop_partition.side_effect = lambda partition: order.append(f"drop:{partition.name}")
+    archiver.fetch_batch.side_effect = lambda **kw: order.append("calls") or (b"", [], False)
+
+    purger = ConversationPurger(db_pool=pool, retention_days=30, archiver=archiver, partitions=partitions)
+    await purger.purge_once()
+
+    assert order == ["archive:p1", "drop:p1", "archive:p2", "drop:p2", "calls"]
+    assert archiver.archive_partition.call_args.kwargs["run_id"] == "testrun1"
+
+
+@pytest.mark.asyncio
+async def test_partition_archive_failure_keeps_partition_and_stops():
+    pool, _ = _make_pool()
+    archiver = _make_archiver(batches=[([], False)])
+    archiver.archive_partition = AsyncMock(side_effect=RuntimeError("S3 down"))
+    partitions = _make_partitions(["p1", "p2"])
+
+    purger = ConversationPurger(db_pool=pool, retention_days=30, archiver=archiver, partitions=partitions)
+    await purger.purge_once()
+
+    archiver.archive_partition.assert_called_once()
+    partitions.drop_partition.assert_not_called()
+    # The per-call loop still runs.
+    archiver.fetch_batch.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_partitions_dropped_without_archiver():
+    pool, conn = _make_pool()
+    conn.fetch = AsyncMock(return_value=[])
+    partitions = _make_partitions(["p1"])
+
+    purger = ConversationPurger(db_pool=pool, retention_days=30, partitions=partitions)
+    assert await purger.purge_once() == 0
+
+    partitions.drop_partition.assert_called_once()
+
+
+# ── multi-batch segments and prefetch ─────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_segment_rows_deleted_only_after_object_completes():
+    pool, conn = _make_pool()
+    archiver = _make_archiver(
+        batches=[(["c1", "c2"], True), (["c3"], True), ([], False)],
+        segment_max_bytes=1_000,
+    )
+    completed_before_delete: list[bool] = []
+
+    async def execute(*_args: object) -> None:
+        completed_before_delete.append(archiver.segment.complete.await_count == 1)
+
+    conn.execute = AsyncMock(side_effect=execute)
+
+    purger = ConversationPurger(db_pool=pool, retention_days=30, archiver=archiver)
+    count = await purger.purge_once()
+
+    assert count == 3
+    archiver.open_segment.assert_called_once()
+    assert archiver.segment.write.call_count == 2
+    assert completed_before_delete == [True]
+    assert conn.execute.call_args.args[1:] == ("c1", "c2", "c3")
+
+
+@pytest.mark.asyncio
+async def test_segment_upload_failure_deletes_nothing_from_that_segment():
+    pool, conn = _make_pool()
+    archiver = _make_archiver(
+        batches=[(["c1"], True), (["c2"], False)],
+        upload_side_effect=[None, RuntimeError("S3 down")],
+        segment_max_bytes=1_000,
+    )
+
+    purger = ConversationPurger(db_pool=pool, retention_days=30, archiver=archiver)
+    count = await purger.purge_once()
+
+    assert count == 0
+    conn.execute.assert_not_called()
+    archiver.segment.complete.assert_not_called()
+    archiver.segment.abort.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_next_batch_fetch_overlaps_current_upload():
+    pool, _ = _make_pool()
+    archiver = _make_archiver(batches=[(["c1"], True), (["c2"], False)])
+    second_fetch_started = asyncio.Event()
+    batches = iter([(b"<jsonl>", ["c1"], True), (b"<jsonl>", ["c2"], False)])
+
+    async def fetch_batch(**_kwargs: object) -> tuple[bytes, list[str], bool]:
+        batch = next(batches)
+        if batch[1] == ["c2"]:
+            second_fetch_started.set()
+        return batch
+
+    async def slow_write(_body: bytes) -> None:
+        # Batch 1's upload only finishes once batch 2's fetch is under way.
+        await asyncio.wait_for(second_fetch_started.wait(), timeout=1.0)
+
+    archiver.fetch_batch = AsyncMock(side_effect=fetch_batch)
+    archiver.segment.write = AsyncMock(side_effect=slow_write)
+
+    purger = ConversationPurger(db_pool=pool, retention_days=30, archiver=archiver)
+    assert await purger.purge_once() == 2
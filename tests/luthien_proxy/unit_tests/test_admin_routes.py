@@ -1910,3 +1910,102 @@ class TestWebhookStatsRoute:
         assert result.max_pending_tasks == 1000
         assert result.started_at == started.isoformat()
         assert result.worker_pid > 0
+
+
+class TestEventWriteStatsRoute:
+    """Test /api/admin/events/stats route handler."""
+
+    @pytest.mark.asyncio
+    async def test_null_emitter_reports_direct_mode(self):
+        from luthien_proxy.admin.routes import event_write_stats
+        from luthien_proxy.observability.emitter import NullEventEmitter
+
+        result = await event_write_stats(_=AUTH_TOKEN, emitter=NullEventEmitter())
+        assert result.write_behind is False
+        assert result.dropped_db_writes == 0
+        assert result.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_reports_write_behind_counters(self):
+        from datetime import UTC, datetime
+
+        from luthien_proxy.admin.routes import event_write_stats
+        from luthien_proxy.observability.emitter import EventEmitter, EventWriteBuffer, PendingEventWrite
+
+        buffer = EventWriteBuffer(MagicMock(), max_queue_size=1)
+        emitter = EventEmitter(stdout_enabled=False, db_write_buffer=buffer)
+        write = PendingEventWrite("tx", "test.event", {}, datetime.now(UTC))
+        assert buffer.enqueue(write) is True
+        assert buffer.enqueue(write) is False
+
+        result = await event_write_stats(_=AUTH_TOKEN, emitter=emitter)
+        assert result.write_behind is True
+        assert result.queue_depth == 1
+        assert result.max_queue_size == 1
+        assert result.dropped_queue_full == 1
+        assert result.worker_pid > 0
+
+
+class TestPolicyCacheStatsRoute:
+    """Test /api/admin/policy-cache/stats route handler."""
+
+    @pytest.mark.asyncio
+    async def test_reports_disabled_without_front(self):
+        from luthien_proxy.admin.routes import policy_cache_stats
+
+        result = await policy_cache_stats(_=AUTH_TOKEN)
+        assert result.write_behind is False
+        assert result.hits == 0
+
+    @pytest.mark.asyncio
+    async def test_reports_front_counters(self):
+        from luthien_proxy.admin.routes import policy_cache_stats
+        from luthien_proxy.utils.policy_cache import install_front
+        from luthien_proxy.utils.policy_cache_front import PolicyCacheFront
+
+        front = PolicyCacheFront(MagicMock())
+        front.put("ns", "k", {"v": 1}, 60, None)
+        front.put("ns", "k", {"v": 2}, 60, None)
+        assert await front.get("ns", "k") == {"v": 2}
+        install_front(front)
+        try:
+            result = await policy_cache_stats(_=AUTH_TOKEN)
+        finally:
+            install_front(None)
+
+        assert result.write_behind is True
+        assert (result.hits, result.misses, result.hit_rate) == (1, 0, 1.0)
+        assert (result.pending_writes, result.coalesced_writes) == (1, 1)
+        assert result.worker_pid > 0
+
+
+class TestUpstreamHttpStatsRoute:
+    """Test /api/admin/upstream-http/stats route handler."""
+
+    @pytest.mark.asyncio
+    async def test_reports_pool_stats(self):
+        from luthien_proxy.admin.routes import upstream_http_stats
+        from luthien_proxy.llm import upstream_http
+
+        with patch.object(
+            upstream_http,
+            "stats",
+            return_value={
+                "http2": True,
+                "max_connections": 100,
+                "max_keepalive_connections": 20,
+                "open_connections": 3,
+                "active_connections": 2,
+                "idle_connections": 1,
+                "connects": 5,
+                "failed_connects": 0,
+                "avg_connect_ms": 41.5,
+                "last_connect_ms": 40.0,
+                "max_connect_ms": 60.0,
+            },
+        ):
+            result = await upstream_http_stats(_=AUTH_TOKEN)
+
+        assert (result.open_connections, result.active_connections, result.idle_connections) == (3, 2, 1)
+        assert result.avg_connect_ms == 41.5
+        assert result.worker_pid > 0
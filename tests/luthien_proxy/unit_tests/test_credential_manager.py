@@ -1,5 +1,6 @@
 """Unit tests for credential manager."""
 
+import asyncio
 import json
 import time
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -12,6 +13,7 @@ from luthien_proxy.credential_manager import (
     CredentialManager,
     hash_credential,
 )
+from luthien_proxy.utils.credential_cache import INVALIDATE_ALL, InProcessCredentialCache
 
 
 class TestHashCredential:
@@ -478,3 +480,252 @@ class TestUpdateConfig:
         manager = CredentialManager(db_pool=None, cache=None)
         with pytest.raises(ValueError):
             await manager.update_config(auth_mode="proxy_key")
+
+
+class _RecordingBus:
+    """In-memory invalidation bus: records publishes, lets tests deliver messages."""
+
+    def __init__(self):
+        self.published: list[str] = []
+        self.subscriber = None
+
+    async def publish(self, key_hash: str) -> None:
+        self.published.append(key_hash)
+
+    async def listen(self, on_invalidate) -> None:
+        self.subscriber = on_invalidate
+        await asyncio.Event().wait()
+
+
+class TestL1Cache:
+    @pytest.mark.asyncio
+    async def test_l1_hit_skips_shared_cache(self):
+        cache = InProcessCredentialCache()
+        cache.get = AsyncMock(wraps=cache.get)
+        manager = CredentialManager(db_pool=None, cache=cache, l1_ttl_seconds=30, touch_flush_interval_seconds=30)
+
+        with patch.object(manager, "_call_count_tokens", new_callable=AsyncMock, return_value=True) as upstream:
+            assert await manager.validate_credential("k", is_bearer=False) is True
+            cache.get.reset_mock()
+            for _ in range(5):
+                assert await manager.validate_credential("k", is_bearer=False) is True
+
+        upstream.assert_awaited_once()
+        cache.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_shared_cache_hit_populates_l1(self):
+        mock_redis = AsyncMock()
+        mock_redis.get.return_value = json.dumps({"valid": True, "validated_at": time.time()})
+        manager = CredentialManager(db_pool=None, cache=mock_redis, l1_ttl_seconds=30, touch_flush_interval_seconds=30)
+
+        await manager.validate_credential("k", is_bearer=False)
+        await manager.validate_credential("k", is_bearer=False)
+
+        mock_redis.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_l1_entries_expire(self):
+        manager = CredentialManager(db_pool=None, cache=None, l1_ttl_seconds=30)
+        with patch.object(manager, "_call_count_tokens", new_callable=AsyncMock, return_value=True) as upstream:
+            await manager.validate_credential("k", is_bearer=False)
+            with patch("luthien_proxy.credential_manager.time.monotonic", return_value=time.monotonic() + 31):
+                await manager.validate_credential("k", is_bearer=False)
+        assert upstream.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_l1_evicts_least_recently_used(self):
+        manager = CredentialManager(db_pool=None, cache=None, l1_ttl_seconds=30, l1_max_entries=2)
+        with patch.object(manager, "_call_count_tokens", new_callable=AsyncMock, return_value=True) as upstream:
+            for key in ("a", "b", "a", "c", "a", "b"):
+                await manager.validate_credential(key, is_bearer=False)
+        # a, b, c miss; "b" was evicted when "c" arrived (a was more recent) and misses again.
+        assert upstream.await_count == 4
+
+    def test_rejects_non_positive_max_entries(self):
+        with pytest.raises(ValueError):
+            CredentialManager(db_pool=None, cache=None, l1_max_entries=0)
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_upstream_call(self):
+        release = asyncio.Event()
+
+        async def slow_validate(credential, *, is_bearer):
+            await release.wait()
+            return True
+
+        manager = CredentialManager(db_pool=None, cache=InProcessCredentialCache())
+        with patch.object(manager, "_call_count_tokens", side_effect=slow_validate) as upstream:
+            waiters = [asyncio.create_task(manager.validate_credential("k", is_bearer=False)) for _ in range(10)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*waiters)
+
+        assert results == [True] * 10
+        assert upstream.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_fail_followers(self):
+        release = asyncio.Event()
+
+        async def slow_validate(credential, *, is_bearer):
+            await release.wait()
+            return True
+
+        manager = CredentialManager(db_pool=None, cache=None)
+        with patch.object(manager, "_call_count_tokens", side_effect=slow_validate):
+            leader = asyncio.create_task(manager.validate_credential("k", is_bearer=False))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(manager.validate_credential("k", is_bearer=False))
+            await asyncio.sleep(0)
+            leader.cancel()
+            release.set()
+            assert await follower is True
+
+    @pytest.mark.asyncio
+    async def test_inconclusive_result_is_not_reused_after_flight(self):
+        manager = CredentialManager(db_pool=None, cache=InProcessCredentialCache())
+        with patch.object(manager, "_call_count_tokens", new_callable=AsyncMock, return_value=None) as upstream:
+            assert await manager.validate_credential("k", is_bearer=False) is False
+            assert await manager.validate_credential("k", is_bearer=False) is False
+        assert upstream.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_flight_skips_cache_fill(self):
+        release = asyncio.Event()
+
+        async def slow_validate(credential, *, is_bearer):
+            await release.wait()
+            return True
+
+        cache = InProcessCredentialCache()
+        manager = CredentialManager(db_pool=None, cache=cache, l1_ttl_seconds=30)
+        with patch.object(manager, "_call_count_tokens", side_effect=slow_validate) as upstream:
+            pending = asyncio.create_task(manager.validate_credential("k", is_bearer=False))
+            await asyncio.sleep(0)
+            await manager.invalidate_credential(hash_credential("k"))
+            release.set()
+            assert await pending is True
+
+            assert await cache.get(f"luthien:auth:cred:{hash_credential('k')}") is None
+            await manager.validate_credential("k", is_bearer=False)
+        assert upstream.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_remote_invalidation_during_flight_skips_l1_fill(self):
+        release = asyncio.Event()
+
+        async def slow_validate(credential, *, is_bearer):
+            await release.wait()
+            return True
+
+        bus = _RecordingBus()
+        manager = CredentialManager(db_pool=None, cache=None, l1_ttl_seconds=30, invalidation_bus=bus)
+        manager.start()
+        await asyncio.sleep(0)
+        try:
+            with patch.object(manager, "_call_count_tokens", side_effect=slow_validate) as upstream:
+                pending = asyncio.create_task(manager.validate_credential("k", is_bearer=False))
+                await asyncio.sleep(0)
+                bus.subscriber(INVALIDATE_ALL)
+                release.set()
+                await pending
+                await manager.validate_credential("k", is_bearer=False)
+            assert upstream.call_count == 2
+        finally:
+            await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_shared_cache_read_skips_l1_fill(self):
+        mock_redis = AsyncMock()
+        mock_redis.get.return_value = json.dumps({"valid": True, "validated_at": time.time()})
+        manager = CredentialManager(db_pool=None, cache=mock_redis, l1_ttl_seconds=30, touch_flush_interval_seconds=30)
+
+        async def get_then_invalidate(key):
+            manager._on_invalidation(hash_credential("k"))
+            return json.dumps({"valid": True, "validated_at": time.time()})
+
+        mock_redis.get.side_effect = get_then_invalidate
+        await manager.validate_credential("k", is_bearer=False)
+        mock_redis.get.side_effect = None
+        await manager.validate_credential("k", is_bearer=False)
+
+        assert mock_redis.get.await_count == 2
+
+
+class TestTouchBatching:
+    @pytest.mark.asyncio
+    async def test_touches_are_buffered_until_flush(self):
+        cache = InProcessCredentialCache()
+        manager = CredentialManager(db_pool=None, cache=cache, l1_ttl_seconds=30, touch_flush_interval_seconds=30)
+        with patch.object(manager, "_call_count_tokens", new_callable=AsyncMock, return_value=True):
+            await manager.validate_credential("k", is_bearer=False)
+        key = f"luthien:auth:cred:{hash_credential('k')}"
+        before = json.loads(await cache.get(key))["last_used_at"]
+
+        cache.setex = AsyncMock(wraps=cache.setex)
+        with patch("luthien_proxy.credential_manager.time.time", return_value=before + 100):
+            await manager.validate_credential("k", is_bearer=False)
+        cache.setex.assert_not_called()
+
+        await manager.flush_touches()
+        assert json.loads(await cache.get(key))["last_used_at"] == before + 100
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending_touches(self):
+        cache = InProcessCredentialCache()
+        manager = CredentialManager(db_pool=None, cache=cache, l1_ttl_seconds=30, touch_flush_interval_seconds=30)
+        manager.start()
+        with patch.object(manager, "_call_count_tokens", new_callable=AsyncMock, return_value=True):
+            await manager.validate_credential("k", is_bearer=False)
+        await manager.validate_credential("k", is_bearer=False)
+
+        with patch.object(manager, "_touch_last_used", new_callable=AsyncMock) as touch:
+            await manager.close()
+        touch.assert_awaited_once()
+
+
+class TestInvalidationFanOut:
+    @pytest.mark.asyncio
+    async def test_backend_401_drops_l1_and_publishes(self):
+        bus = _RecordingBus()
+        manager = CredentialManager(
+            db_pool=None, cache=InProcessCredentialCache(), l1_ttl_seconds=30, invalidation_bus=bus
+        )
+        with patch.object(manager, "_call_count_tokens", new_callable=AsyncMock, return_value=True) as upstream:
+            await manager.validate_credential("k", is_bearer=False)
+            await manager.on_backend_401("k")
+            await manager.validate_credential("k", is_bearer=False)
+
+        assert bus.published == [hash_credential("k")]
+        assert upstream.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_all_publishes_wildcard(self):
+        bus = _RecordingBus()
+        manager = CredentialManager(db_pool=None, cache=None, l1_ttl_seconds=30, invalidation_bus=bus)
+        await manager.invalidate_all()
+        assert bus.published == [INVALIDATE_ALL]
+
+    @pytest.mark.asyncio
+    async def test_remote_invalidation_drops_l1_entry(self):
+        bus = _RecordingBus()
+        manager = CredentialManager(db_pool=None, cache=None, l1_ttl_seconds=30, invalidation_bus=bus)
+        manager.start()
+        await asyncio.sleep(0)
+        try:
+            with patch.object(manager, "_call_count_tokens", new_callable=AsyncMock, return_value=True) as upstream:
+                await manager.validate_credential("a", is_bearer=False)
+                await manager.validate_credential("b", is_bearer=False)
+                bus.subscriber(hash_credential("a"))
+                await manager.validate_credential("a", is_bearer=False)
+                await manager.validate_credential("b", is_bearer=False)
+                assert upstream.await_count == 3
+
+                bus.subscriber(INVALIDATE_ALL)
+                await manager.validate_credential("b", is_bearer=False)
+                assert upstream.await_count == 4
+        finally:
+            await manager.close()
@@ -90,6 +90,7 @@ class TestGatewayAuthAndClientResolution:
         deps.db_pool = None
         deps.enable_request_logging = False
         deps.rate_limiter = None
+        deps.usage_rate_limiter = None
         deps.get_anthropic_policy.return_value = mock_anthropic_policy
 
         app.state.dependencies = deps
@@ -550,6 +551,7 @@ class TestProxyPassthrough:
         deps.db_pool = None
         deps.enable_request_logging = False
         deps.rate_limiter = None
+        deps.usage_rate_limiter = None
         app.state.dependencies = deps
         return app
 
@@ -560,9 +562,9 @@ class TestProxyPassthrough:
         mock_response.content = b'{"data": []}'
         mock_response.headers = {"content-type": "application/json"}
 
-        with patch("luthien_proxy.gateway_routes._passthrough_client") as mock_client:
-            mock_client.request = AsyncMock(return_value=mock_response)
-
+        mock_client = MagicMock()
+        mock_client.request = AsyncMock(return_value=mock_response)
+        with patch("luthien_proxy.gateway_routes.upstream_http.shared_http_client", return_value=mock_client):
             client = TestClient(mock_app, raise_server_exceptions=False)
             response = client.get(
                 "/v1/models",
@@ -573,6 +575,8 @@ class TestProxyPassthrough:
             mock_client.request.assert_called_once()
             call_kwargs = mock_client.request.call_args.kwargs
             assert call_kwargs["url"] == "https://api.anthropic.com/v1/models"
+            assert call_kwargs["timeout"] == 30.0
+            assert call_kwargs["follow_redirects"] is False
 
     def test_passthrough_requires_auth(self, mock_app):
         """Test that passthrough route requires authentication."""
@@ -621,6 +625,7 @@ class TestRateLimitingRouteIntegration:
         deps.db_pool = None
         deps.enable_request_logging = False
         deps.rate_limiter = TokenBucketRateLimiter(rpm=60, burst=1)
+        deps.usage_rate_limiter = None
         deps.get_anthropic_policy.return_value = mock_anthropic_policy
 
         app.state.dependencies = deps
@@ -674,16 +679,16 @@ class TestRateLimitingRouteIntegration:
             mock_process.assert_not_called()
 
     def test_proxy_passthrough_rate_limited(self, rate_limited_app):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b"{}"
+        mock_response.headers = {}
+        mock_client = MagicMock()
+        mock_client.request = AsyncMock(return_value=mock_response)
         with (
-            patch("luthien_proxy.gateway_routes._passthrough_client") as mock_client,
+            patch("luthien_proxy.gateway_routes.upstream_http.shared_http_client", return_value=mock_client),
             patch("luthien_proxy.rate_limit.time.monotonic", return_value=1000.0),
         ):
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.content = b"{}"
-            mock_response.headers = {}
-            mock_client.request = AsyncMock(return_value=mock_response)
-
             client = TestClient(rate_limited_app, raise_server_exceptions=False)
             headers = {"Authorization": "Bearer test-proxy-key"}
             response1 = client.get("/v1/models", headers=headers)
@@ -691,3 +696,121 @@ class TestRateLimitingRouteIntegration:
 
             response2 = client.get("/v1/models", headers=headers)
             assert response2.status_code == 429
+
+
+class TestUsageLimitRouteIntegration:
+    """Token/concurrency limits are enforced on /v1/messages and settled afterwards."""
+
+    @pytest.fixture
+    def usage_limited_app(self):
+        from luthien_proxy.dependencies import Dependencies
+        from luthien_proxy.gateway_routes import router
+        from luthien_proxy.policy_core import AnthropicExecutionInterface
+        from luthien_proxy.rate_limit import UsageRateLimiter
+
+        app = FastAPI()
+        app.include_router(router)
+
+        mock_credential_manager = MagicMock(spec=CredentialManager)
+        mock_credential_manager.config = AuthConfig(
+            auth_mode=AuthMode.CLIENT_KEY,
+            validate_credentials=True,
+            valid_cache_ttl_seconds=3600,
+            invalid_cache_ttl_seconds=300,
+        )
+        mock_anthropic_client = MagicMock(spec=AnthropicClient)
+        mock_anthropic_client._base_url = None
+
+        deps = MagicMock(spec=Dependencies)
+        deps.api_key = "test-proxy-key"
+        deps.anthropic_client = mock_anthropic_client
+        deps.credential_manager = mock_credential_manager
+        deps.emitter = MagicMock()
+        deps.db_pool = None
+        deps.enable_request_logging = False
+        deps.rate_limiter = None
+        deps.usage_rate_limiter = UsageRateLimiter(input_tpm=100, max_concurrent=1)
+        deps.get_anthropic_policy.return_value = MagicMock(spec=AnthropicExecutionInterface)
+
+        app.state.dependencies = deps
+        return app, deps.usage_rate_limiter
+
+    def _post(self, app, content: str):
+        from tests.constants import DEFAULT_TEST_MODEL
+
+        client = TestClient(app, raise_server_exceptions=False)
+        return client.post(
+            "/v1/messages",
+            json={"model": DEFAULT_TEST_MODEL, "messages": [{"role": "user", "content": content}], "max_tokens": 10},
+            headers={"Authorization": "Bearer test-proxy-key"},
+        )
+
+    def test_oversized_context_is_throttled_with_headers(self, usage_limited_app):
+        app, _ = usage_limited_app
+        with patch("luthien_proxy.gateway_routes.process_anthropic_request", new_callable=AsyncMock) as mock_process:
+            mock_process.return_value = MagicMock()
+
+            # The first request is admitted even though it exceeds the budget
+            # (the bucket was full); it then leaves the bucket empty.
+            assert self._post(app, "x" * 2000).status_code == 200
+            reservation = mock_process.call_args.kwargs["usage_reservation"]
+            reservation.settle({"input_tokens": 500, "output_tokens": 1})
+
+            response = self._post(app, "x" * 400)
+
+        assert response.status_code == 429
+        assert response.headers["x-ratelimit-limit"] == "100"
+        assert response.headers["x-ratelimit-remaining"] == "0"
+        assert int(response.headers["retry-after"]) > 0
+
+    def test_admitted_request_stashes_decision_for_headers(self, usage_limited_app):
+        app, _ = usage_limited_app
+        with patch("luthien_proxy.gateway_routes.process_anthropic_request", new_callable=AsyncMock) as mock_process:
+            mock_process.return_value = MagicMock()
+            assert self._post(app, "hi").status_code == 200
+            decision = mock_process.call_args.kwargs["request"].state.usage_limit_decision
+
+        # The single concurrency slot is now held, so it is the tightest dimension.
+        assert decision.allowed is True
+        assert (decision.limit, decision.remaining) == (1, 0)
+
+    def test_unsettled_request_holds_concurrency_slot(self, usage_limited_app):
+        app, _ = usage_limited_app
+        with patch("luthien_proxy.gateway_routes.process_anthropic_request", new_callable=AsyncMock) as mock_process:
+            mock_process.return_value = MagicMock()
+            assert self._post(app, "hi").status_code == 200
+            assert self._post(app, "hi").status_code == 429
+
+            mock_process.call_args.kwargs["usage_reservation"].settle({"input_tokens": 1, "output_tokens": 1})
+            assert self._post(app, "hi").status_code == 200
+
+    def test_failed_client_resolution_does_not_hold_a_slot(self, usage_limited_app):
+        from tests.constants import DEFAULT_TEST_MODEL
+
+        app, limiter = usage_limited_app
+        client = TestClient(app, raise_server_exceptions=False)
+        payload = {"model": DEFAULT_TEST_MODEL, "messages": [{"role": "user", "content": "hi"}], "max_tokens": 10}
+        with patch("luthien_proxy.gateway_routes.process_anthropic_request", new_callable=AsyncMock) as mock_process:
+            mock_process.return_value = MagicMock()
+            for _ in range(3):
+                response = client.post(
+                    "/v1/messages",
+                    json=payload,
+                    # An empty override key is rejected by resolve_anthropic_client.
+                    headers={"Authorization": "Bearer test-proxy-key", "x-anthropic-api-key": " "},
+                )
+                assert response.status_code == 401
+            mock_process.assert_not_called()
+            assert limiter._states == {}
+
+            # max_concurrent=1: a leaked reservation would turn this into a 429.
+            assert self._post(app, "hi").status_code == 200
+
+    def test_pipeline_failure_releases_reservation(self, usage_limited_app):
+        app, _ = usage_limited_app
+        with patch("luthien_proxy.gateway_routes.process_anthropic_request", new_callable=AsyncMock) as mock_process:
+            mock_process.side_effect = RuntimeError("boom")
+            assert self._post(app, "hi").status_code == 500
+            reservation = mock_process.call_args.kwargs["usage_reservation"]
+
+        assert reservation.settled is True
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
-from unittest.mock import patch
+import math
+from unittest.mock import MagicMock, patch
 
 import pytest
+import redis.asyncio as redis
 
-from luthien_proxy.rate_limit import TokenBucketRateLimiter
+from luthien_proxy.rate_limit import (
+    RateLimitDecision,
+    RedisTokenBucketRateLimiter,
+    TokenBucketRateLimiter,
+    UsageRateLimiter,
+    estimate_input_tokens,
+    tightest_decision,
+    usage_input_tokens,
+)
 
 
 @pytest.mark.asyncio
@@ -249,3 +259,265 @@ async def test_concurrent_different_keys():
             limiter.check("key_c"),
         )
     assert len(limiter._buckets) == 3
+
+
+class _FakeTokenBucketScript:
+    """Python port of the Lua token bucket, with a settable server clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.buckets: dict[str, tuple[float, float]] = {}
+        self.calls = 0
+        self.error: Exception | None = None
+
+    async def __call__(self, keys, args):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        rate, burst, lease = float(args[0]), float(args[1]), int(args[2])
+        tokens, ts = self.buckets.get(keys[0], (burst, self.now))
+        tokens = min(burst, tokens + max(0.0, self.now - ts) * rate)
+        granted, retry_ms = 0, 0
+        if tokens >= 1:
+            granted = lease if lease > 1 and tokens >= 2 * lease else 1
+            tokens -= granted
+        else:
+            retry_ms = math.ceil((1 - tokens) / rate * 1000)
+        self.buckets[keys[0]] = (tokens, self.now)
+        return [granted, str(tokens), retry_ms]
+
+
+def _redis_limiter(script: _FakeTokenBucketScript, **kwargs) -> RedisTokenBucketRateLimiter:
+    client = MagicMock()
+    client.register_script.return_value = script
+    return RedisTokenBucketRateLimiter(client, **kwargs)
+
+
+class TestRedisTokenBucketRateLimiter:
+    @pytest.mark.asyncio
+    async def test_replicas_share_one_bucket(self):
+        script = _FakeTokenBucketScript()
+        replica_a = _redis_limiter(script, rpm=60, burst=3)
+        replica_b = _redis_limiter(script, rpm=60, burst=3)
+
+        results = [await limiter.check("key") for limiter in (replica_a, replica_b, replica_a, replica_b)]
+
+        assert [d.allowed for d in results] == [True, True, True, False]
+        assert results[-1].retry_after == 1
+        assert results[-1].limit == 60
+
+    @pytest.mark.asyncio
+    async def test_bucket_keys_are_hashed(self):
+        script = _FakeTokenBucketScript()
+        limiter = _redis_limiter(script, rpm=60, burst=3)
+        await limiter.check("sk-secret")
+        (key,) = script.buckets
+        assert key.startswith("luthien:ratelimit:")
+        assert "sk-secret" not in key
+
+    @pytest.mark.asyncio
+    async def test_refill_uses_server_clock(self):
+        script = _FakeTokenBucketScript()
+        limiter = _redis_limiter(script, rpm=60, burst=1)
+        assert (await limiter.check("key")).allowed is True
+        assert (await limiter.check("key")).allowed is False
+        script.now += 1.0
+        assert (await limiter.check("key")).allowed is True
+
+    @pytest.mark.asyncio
+    async def test_local_lease_skips_round_trips_far_below_limit(self):
+        script = _FakeTokenBucketScript()
+        limiter = _redis_limiter(script, rpm=600, burst=100, lease_size=5)
+
+        decisions = [await limiter.check("key") for _ in range(10)]
+
+        assert all(d.allowed for d in decisions)
+        assert script.calls == 2
+        assert limiter.local_admissions == 8
+        assert [d.remaining for d in decisions[:5]] == [99, 98, 97, 96, 95]
+
+    @pytest.mark.asyncio
+    async def test_near_limit_goes_to_redis_per_request(self):
+        script = _FakeTokenBucketScript()
+        limiter = _redis_limiter(script, rpm=60, burst=6, lease_size=5)
+
+        decisions = [await limiter.check("key") for _ in range(7)]
+
+        assert [d.allowed for d in decisions] == [True] * 6 + [False]
+        assert script.calls == 7
+        assert limiter.local_admissions == 0
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_dropped(self):
+        script = _FakeTokenBucketScript()
+        limiter = _redis_limiter(script, rpm=600, burst=100, lease_size=5, lease_ttl_seconds=1.0)
+        with patch("luthien_proxy.rate_limit.time.monotonic", return_value=50.0):
+            await limiter.check("key")
+        with patch("luthien_proxy.rate_limit.time.monotonic", return_value=51.0):
+            await limiter.check("key")
+        assert script.calls == 2
+        assert limiter.local_admissions == 0
+
+    @pytest.mark.asyncio
+    async def test_redis_error_falls_back_to_in_process_bucket(self):
+        script = _FakeTokenBucketScript()
+        script.error = redis.ConnectionError("down")
+        limiter = _redis_limiter(script, rpm=60, burst=2)
+
+        decisions = [await limiter.check("key") for _ in range(3)]
+
+        assert [d.allowed for d in decisions] == [True, True, False]
+        assert limiter.fallback_checks == 3
+
+    @pytest.mark.asyncio
+    async def test_disabled_never_calls_redis(self):
+        script = _FakeTokenBucketScript()
+        limiter = _redis_limiter(script, rpm=0, burst=0)
+        assert (await limiter.check("key")).allowed is True
+        assert script.calls == 0
+
+    def test_invalid_lease_size_raises(self):
+        with pytest.raises(ValueError, match="lease_size"):
+            _redis_limiter(_FakeTokenBucketScript(), rpm=60, burst=10, lease_size=0)
+
+
+class TestEstimateInputTokens:
+    def test_counts_system_messages_and_tools(self):
+        body = {
+            "model": "ignored-model-name",
+            "system": "a" * 40,
+            "messages": [{"role": "user", "content": [{"type": "text", "text": "b" * 36}]}],
+            "tools": [{"name": "c" * 4, "description": "", "input_schema": {}}],
+        }
+        # system 40 + "user" 4 + "text" 4 + text 36 + tool name 4 = 88 chars; model is not input
+        assert estimate_input_tokens(body) == 22
+
+    def test_base64_attachments_use_flat_estimate(self):
+        image = {"type": "image", "source": {"type": "base64", "media_type": "image/png", "data": "A" * 400_000}}
+        body = {"messages": [{"role": "user", "content": [image, image]}]}
+        assert estimate_input_tokens(body) == 1 + 2 * 1_600
+
+    def test_usage_input_tokens_includes_cache(self):
+        usage = {"input_tokens": 10, "cache_creation_input_tokens": 20, "cache_read_input_tokens": None}
+        assert usage_input_tokens(usage) == 30
+
+
+class TestUsageRateLimiter:
+    @pytest.mark.asyncio
+    async def test_input_budget_debits_estimate_and_reconciles(self):
+        limiter = UsageRateLimiter(input_tpm=1000)
+        with patch("luthien_proxy.rate_limit.time.monotonic", return_value=1000.0):
+            decision, reservation = await limiter.acquire("key", 800)
+            assert decision.allowed is True
+            assert decision.remaining == 200
+            assert reservation is not None
+
+            denied, none = await limiter.acquire("key", 300)
+            assert denied.allowed is False
+            assert none is None
+            assert denied.limit == 1000
+            # 100 token shortfall at 1000/60 tokens per second
+            assert denied.retry_after == 6
+
+            # Actual usage was far below the estimate: the difference is refunded.
+            reservation.settle({"input_tokens": 50, "output_tokens": 10})
+            decision, _ = await limiter.acquire("key", 300)
+        assert decision.allowed is True
+        assert decision.remaining == 650
+
+    @pytest.mark.asyncio
+    async def test_request_larger_than_budget_admitted_only_when_full(self):
+        limiter = UsageRateLimiter(input_tpm=100)
+        with patch("luthien_proxy.rate_limit.time.monotonic", return_value=1000.0):
+            decision, reservation = await limiter.acquire("key", 150_000)
+            assert decision.allowed is True
+            assert reservation is not None
+            reservation.settle({"input_tokens": 150_000, "output_tokens": 1})
+            decision, _ = await limiter.acquire("key", 1)
+        assert decision.allowed is False
+
+    @pytest.mark.asyncio
+    async def test_output_budget_charged_on_settle(self):
+        limiter = UsageRateLimiter(output_tpm=60)
+        with patch("luthien_proxy.rate_limit.time.monotonic", return_value=1000.0):
+            _, reservation = await limiter.acquire("key", 0)
+            assert reservation is not None
+            reservation.settle({"input_tokens": 1, "output_tokens": 120})
+            denied, _ = await limiter.acquire("key", 0)
+        assert denied.allowed is False
+        assert denied.retry_after == 61
+
+        with patch("luthien_proxy.rate_limit.time.monotonic", return_value=1061.0):
+            decision, _ = await limiter.acquire("key", 0)
+        assert decision.allowed is True
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_and_release(self):
+        limiter = UsageRateLimiter(max_concurrent=2)
+        _, first = await limiter.acquire("key", 0)
+        _, second = await limiter.acquire("key", 0)
+        denied, _ = await limiter.acquire("key", 0)
+        assert denied.allowed is False
+        assert denied.limit == 2
+
+        assert first is not None and second is not None
+        first.release()
+        first.release()  # idempotent
+        decision, _ = await limiter.acquire("key", 0)
+        assert decision.allowed is True
+        other, _ = await limiter.acquire("other-key", 0)
+        assert other.allowed is True
+
+    @pytest.mark.asyncio
+    async def test_stale_reservation_stops_counting(self):
+        limiter = UsageRateLimiter(max_concurrent=1, stale_after_seconds=60)
+        with patch("luthien_proxy.rate_limit.time.monotonic", return_value=1000.0):
+            await limiter.acquire("key", 0)
+        with patch("luthien_proxy.rate_limit.time.monotonic", return_value=1061.0):
+            decision, _ = await limiter.acquire("key", 0)
+        assert decision.allowed is True
+
+    @pytest.mark.asyncio
+    async def test_release_without_usage_keeps_estimate(self):
+        limiter = UsageRateLimiter(input_tpm=1000)
+        with patch("luthien_proxy.rate_limit.time.monotonic", return_value=1000.0):
+            _, reservation = await limiter.acquire("key", 600)
+            assert reservation is not None
+            reservation.release()
+            denied, _ = await limiter.acquire("key", 600)
+        assert denied.allowed is False
+
+    def test_negative_limit_raises(self):
+        with pytest.raises(ValueError, match="output_tpm"):
+            UsageRateLimiter(output_tpm=-1)
+
+    @pytest.mark.asyncio
+    async def test_admission_reports_dimension_with_least_headroom(self):
+        limiter = UsageRateLimiter(input_tpm=1000, max_concurrent=2)
+        with patch("luthien_proxy.rate_limit.time.monotonic", return_value=1000.0):
+            decision, reservation = await limiter.acquire("key", 100)
+            # 900/1000 input tokens left vs 1/2 slots: concurrency is tighter.
+            assert (decision.limit, decision.remaining) == (2, 1)
+
+            assert reservation is not None
+            reservation.release()
+            # 50/1000 input tokens left vs 1/2 slots: input is tighter.
+            decision, _ = await limiter.acquire("key", 850)
+        assert (decision.limit, decision.remaining) == (1000, 50)
+
+
+class TestTightestDecision:
+    @staticmethod
+    def _allowed(remaining: int, limit: int) -> RateLimitDecision:
+        return RateLimitDecision(allowed=True, remaining=remaining, limit=limit, retry_after=0, reset_unix=0)
+
+    def test_picks_smallest_fraction_remaining(self):
+        requests = self._allowed(50, 60)
+        tokens = self._allowed(10_000, 100_000)
+        assert tightest_decision(requests, tokens) is tokens
+        assert tightest_decision(tokens, requests) is tokens
+
+    def test_ignores_missing_and_unlimited_decisions(self):
+        requests = self._allowed(5, 60)
+        assert tightest_decision(None, requests, self._allowed(0, 0)) is requests
+        assert tightest_decision(None, None) is None
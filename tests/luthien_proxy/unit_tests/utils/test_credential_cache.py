@@ -1,10 +1,15 @@
-"""Unit tests for in-process credential cache."""
+"""Unit tests for the credential cache implementations and invalidation bus."""
 
 import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from luthien_proxy.utils.credential_cache import InProcessCredentialCache
+from luthien_proxy.utils.credential_cache import (
+    CREDENTIAL_INVALIDATION_CHANNEL,
+    InProcessCredentialCache,
+    RedisCredentialInvalidationBus,
+)
 
 
 class TestInProcessCredentialCache:
@@ -83,3 +88,62 @@ class TestInProcessCredentialCache:
         assert count == 2
         assert await cache.get("a") is None
         assert await cache.get("c") == "vc"
+
+
+class _FakePubSub:
+    def __init__(self, messages):
+        self._messages = messages
+        self.subscribed: list[str] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def subscribe(self, channel):
+        self.subscribed.append(channel)
+
+    async def listen(self):
+        for message in self._messages:
+            yield message
+        await asyncio.Event().wait()
+
+
+class TestRedisCredentialInvalidationBus:
+    @pytest.mark.asyncio
+    async def test_publish_uses_channel(self):
+        client = MagicMock()
+        client.publish = AsyncMock(return_value=1)
+        bus = RedisCredentialInvalidationBus(client)
+        await bus.publish("abc")
+        client.publish.assert_awaited_once_with(CREDENTIAL_INVALIDATION_CHANNEL, "abc")
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_is_swallowed(self):
+        client = MagicMock()
+        client.publish = AsyncMock(side_effect=ConnectionError("redis down"))
+        await RedisCredentialInvalidationBus(client).publish("abc")
+
+    @pytest.mark.asyncio
+    async def test_listen_dispatches_decoded_messages(self):
+        pubsub = _FakePubSub(
+            [
+                {"type": "subscribe", "data": 1},
+                {"type": "message", "data": b"abc"},
+                {"type": "message", "data": "*"},
+            ]
+        )
+        client = MagicMock()
+        client.pubsub = MagicMock(return_value=pubsub)
+        received: list[str] = []
+
+        task = asyncio.create_task(RedisCredentialInvalidationBus(client).listen(received.append))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert pubsub.subscribed == [CREDENTIAL_INVALIDATION_CHANNEL]
+        assert received == ["abc", "*"]
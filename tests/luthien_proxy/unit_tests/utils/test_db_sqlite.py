@@ -1,8 +1,13 @@
+import asyncio
+import sqlite3
+
 import pytest
 
 from luthien_proxy.utils.db_sqlite import (
+    SqlitePool,
     _convert_arg,
     _translate_params,
+    _translate_query,
     create_sqlite_pool,
     is_sqlite_url,
     parse_sqlite_url,
@@ -163,6 +168,25 @@ class TestTranslateParams:
         assert args == ("a", "b")
 
 
+class TestTranslatedQueryCache:
+    def test_repeat_query_reuses_translation_with_new_args(self):
+        query = "INSERT INTO cache_test (a, b, c) VALUES ($2, $1, $2::jsonb)"
+        _translate_params(query, ("x", "y"))
+        hits = _translate_query.cache_info().hits
+
+        translated, args = _translate_params(query, ("p", "q"))
+
+        assert _translate_query.cache_info().hits == hits + 1
+        assert translated == "INSERT INTO cache_test (a, b, c) VALUES (?, ?, ?)"
+        assert args == ("q", "p", "q")
+
+    def test_arg_count_is_checked_on_cache_hits(self):
+        query = "SELECT * FROM cache_test WHERE a = $1 AND b = $2"
+        _translate_params(query, ("x", "y"))
+        with pytest.raises(ValueError, match=r"Parameter \$2 exceeds number of provided arguments \(1\)"):
+            _translate_params(query, ("x",))
+
+
 class TestConvertArg:
     def test_bool_to_int(self):
         assert _convert_arg(True) == 1
@@ -320,3 +344,82 @@ class TestSqlitePool:
                 assert val_none is None
         finally:
             await pool.close()
+
+
+class TestSqlitePoolReaders:
+    """File-backed pools: one writer plus read-only WAL connections."""
+
+    @pytest.fixture
+    async def pool(self, tmp_path):
+        pool = await create_sqlite_pool(f"sqlite:///{tmp_path / 'db.sqlite'}", readers=2)
+        await pool.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, val TEXT)")
+        yield pool
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_reads_do_not_wait_for_an_open_transaction(self, pool):
+        await pool.execute("INSERT INTO t (id, val) VALUES ($1, $2)", 1, "committed")
+        in_tx = asyncio.Event()
+        release = asyncio.Event()
+
+        async def hold_write_transaction() -> None:
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.execute("INSERT INTO t (id, val) VALUES ($1, $2)", 2, "pending")
+                    # Reads inside the transaction stay on the writer.
+                    assert await conn.fetchval("SELECT COUNT(*) FROM t") == 2
+                    in_tx.set()
+                    await release.wait()
+
+        writer = asyncio.create_task(hold_write_transaction())
+        await in_tx.wait()
+        rows = await asyncio.wait_for(pool.fetch("SELECT val FROM t ORDER BY id"), timeout=2)
+        assert [row["val"] for row in rows] == ["committed"]
+
+        release.set()
+        await writer
+        assert await pool.fetchrow("SELECT val FROM t WHERE id = $1", 2) is not None
+
+    @pytest.mark.asyncio
+    async def test_handle_is_not_exclusive_outside_a_transaction(self, pool):
+        async with pool.acquire() as conn:
+            assert await conn.fetchval("SELECT COUNT(*) FROM t") == 0
+            # Another handle's write does not wait for this handle to be released.
+            await asyncio.wait_for(pool.execute("INSERT INTO t (id, val) VALUES ($1, $2)", 1, "other"), timeout=2)
+            assert await conn.fetchval("SELECT COUNT(*) FROM t") == 1
+
+    @pytest.mark.asyncio
+    async def test_read_modify_write_in_transaction_is_serialized(self, pool):
+        await pool.execute("INSERT INTO t (id, val) VALUES ($1, $2)", 1, "0")
+
+        async def increment() -> None:
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    current = int(await conn.fetchval("SELECT val FROM t WHERE id = $1", 1))
+                    await asyncio.sleep(0.01)
+                    await conn.execute("UPDATE t SET val = $1 WHERE id = $2", str(current + 1), 1)
+
+        await asyncio.gather(*(increment() for _ in range(5)))
+        assert await pool.fetchrow("SELECT val FROM t WHERE id = $1", 1) == {"val": "5"}
+
+    @pytest.mark.asyncio
+    async def test_readers_are_read_only_and_tuned(self, pool):
+        assert pool.reader_count == 2
+        async with pool.acquire() as conn:
+            with pytest.raises(sqlite3.OperationalError, match="readonly"):
+                await conn.fetch("INSERT INTO t (id, val) VALUES (1, 'x') RETURNING id")
+            # 1 = NORMAL
+            assert await conn.fetchval("PRAGMA synchronous") == 1
+            assert await conn.fetchval("PRAGMA journal_mode") == "wal"
+
+    @pytest.mark.asyncio
+    async def test_memory_database_has_no_readers(self):
+        pool = await create_sqlite_pool("sqlite://:memory:", readers=4)
+        try:
+            assert pool.reader_count == 0
+        finally:
+            await pool.close()
+
+    def test_rejects_negative_readers(self):
+        with pytest.raises(ValueError):
+            SqlitePool("db.sqlite", readers=-1)
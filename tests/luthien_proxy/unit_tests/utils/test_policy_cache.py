@@ -712,7 +712,7 @@ class TestPolicyCacheSizeCap:
         """Updating an existing key at cap does not trigger eviction of that key.
 
         Row count is unchanged by an upsert (ON CONFLICT update, not insert),
-        so _enforce_cap sees count == cap and does nothing. Crucially the
+        so enforce_cap sees count == cap and does nothing. Crucially the
         cap check runs *after* the upsert inside the same transaction, so
         even if the count were briefly wrong, the value must not be lost.
         """
@@ -751,7 +751,7 @@ class TestPolicyCacheSizeCap:
     async def test_cap_does_not_evict_other_namespaces(self, db_pool: SqlitePool):
         """Filling one namespace over its cap must never delete rows from another.
 
-        Regression guard: a buggy _enforce_cap that forgot the ``WHERE
+        Regression guard: a buggy enforce_cap that forgot the ``WHERE
         policy_name = $1`` filter in the SELECT would happily pick up rows
         from the oldest-inserted namespace, not the one being filled.
         """
@@ -0,0 +1,250 @@
+"""Tests for the in-process PolicyCache front (L1 reads + write-behind)."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+
+import pytest
+
+from luthien_proxy.utils import policy_cache_front
+from luthien_proxy.utils.db import DatabasePool
+from luthien_proxy.utils.migration_check import check_migrations
+from luthien_proxy.utils.policy_cache import PolicyCache, build_factory, install_front
+from luthien_proxy.utils.policy_cache_front import PolicyCacheFront
+
+
+@pytest.fixture
+async def db_pool():
+    pool = DatabasePool("sqlite://:memory:")
+    await check_migrations(pool)
+    yield pool
+    await pool.close()
+
+
+async def _row_count(db_pool: DatabasePool, policy_name: str) -> int:
+    pool = await db_pool.get_pool()
+    row = await pool.fetchrow("SELECT COUNT(*) AS n FROM policy_cache WHERE policy_name = $1", policy_name)
+    assert row is not None
+    return row["n"]
+
+
+class _LocalBus:
+    """In-memory stand-in for Redis pub/sub connecting several fronts."""
+
+    def __init__(self) -> None:
+        self.listeners: list[Callable[[str], None]] = []
+
+    async def publish(self, message: str) -> None:
+        for listener in self.listeners:
+            listener(message)
+
+    async def listen(self, on_message: Callable[[str], None]) -> None:
+        self.listeners.append(on_message)
+
+
+class TestReadsAndWrites:
+    @pytest.mark.asyncio
+    async def test_put_is_readable_before_and_after_flush(self, db_pool):
+        front = PolicyCacheFront(db_pool)
+        cache = PolicyCache(db_pool, "p", front=front)
+
+        await cache.put("k", {"v": 1}, ttl_seconds=60)
+        assert await _row_count(db_pool, "p") == 0
+        assert await cache.get("k") == {"v": 1}
+
+        await front.flush()
+        assert await PolicyCache(db_pool, "p").get("k") == {"v": 1}
+        assert front.stats()["written"] == 1
+
+    @pytest.mark.asyncio
+    async def test_hits_return_fresh_objects(self, db_pool):
+        cache = PolicyCache(db_pool, "p", front=PolicyCacheFront(db_pool))
+        await cache.put("k", {"v": [1]}, ttl_seconds=60)
+
+        first = await cache.get("k")
+        first["v"].append(2)
+        assert await cache.get("k") == {"v": [1]}
+
+    @pytest.mark.asyncio
+    async def test_miss_loads_from_db_once(self, db_pool):
+        await PolicyCache(db_pool, "p").put("k", {"v": 1}, ttl_seconds=60)
+        front = PolicyCacheFront(db_pool)
+        cache = PolicyCache(db_pool, "p", front=front)
+
+        assert await cache.get("k") == {"v": 1}
+        assert await cache.get("k") == {"v": 1}
+        assert await cache.get("absent") is None
+        stats = front.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 2)
+
+    @pytest.mark.asyncio
+    async def test_repeated_puts_coalesce_into_one_row(self, db_pool):
+        front = PolicyCacheFront(db_pool)
+        cache = PolicyCache(db_pool, "p", front=front)
+        for i in range(3):
+            await cache.put("k", {"v": i}, ttl_seconds=60)
+
+        assert front.stats()["coalesced_writes"] == 2
+        await front.flush()
+        assert await PolicyCache(db_pool, "p").get("k") == {"v": 2}
+
+    @pytest.mark.asyncio
+    async def test_delete_is_visible_immediately_and_flushed(self, db_pool):
+        await PolicyCache(db_pool, "p").put("k", {"v": 1}, ttl_seconds=60)
+        front = PolicyCacheFront(db_pool)
+        cache = PolicyCache(db_pool, "p", front=front)
+        assert await cache.get("k") == {"v": 1}
+
+        await cache.delete("k")
+        assert await cache.get("k") is None
+        await front.flush()
+        assert await _row_count(db_pool, "p") == 0
+
+    @pytest.mark.asyncio
+    async def test_cap_is_enforced_once_per_flush(self, db_pool):
+        front = PolicyCacheFront(db_pool)
+        cache = PolicyCache(db_pool, "p", max_entries=2, front=front)
+        for key in ("a", "b", "c"):
+            await cache.put(key, {"k": key}, ttl_seconds=60)
+
+        await front.flush()
+        assert await _row_count(db_pool, "p") == 2
+
+    @pytest.mark.asyncio
+    async def test_full_buffer_drops_new_keys(self, db_pool):
+        front = PolicyCacheFront(db_pool, max_pending=1)
+        front.put("p", "a", 1, 60, None)
+        front.put("p", "b", 2, 60, None)
+        front.put("p", "a", 3, 60, None)
+
+        stats = front.stats()
+        assert (stats["pending_writes"], stats["dropped_writes"], stats["coalesced_writes"]) == (1, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_counted(self, db_pool, monkeypatch):
+        front = PolicyCacheFront(db_pool)
+        front.put("p", "k", 1, 60, None)
+
+        async def _fail(conn, batch):
+            raise OSError("db down")
+
+        monkeypatch.setattr(front, "_write_batch", _fail)
+        await front.flush()
+
+        stats = front.stats()
+        assert (stats["failed_flushes"], stats["pending_writes"], stats["written"]) == (1, 0, 0)
+        assert await _row_count(db_pool, "p") == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_keeps_its_batch_pending(self, db_pool, monkeypatch):
+        front = PolicyCacheFront(db_pool)
+        front.put("p", "k", 1, 60, None)
+        writing = asyncio.Event()
+
+        async def _hang(conn, batch):
+            writing.set()
+            await asyncio.Event().wait()
+
+        monkeypatch.setattr(front, "_write_batch", _hang)
+        task = asyncio.create_task(front.flush())
+        await writing.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        stats = front.stats()
+        assert (stats["pending_writes"], stats["flushes"]) == (1, 0)
+        monkeypatch.undo()
+        await front.flush()
+        assert await PolicyCache(db_pool, "p").get("k") == 1
+
+    @pytest.mark.asyncio
+    async def test_write_during_miss_does_not_cache_stale_row(self, db_pool, monkeypatch):
+        await PolicyCache(db_pool, "p").put("k", "old", ttl_seconds=60)
+        front = PolicyCacheFront(db_pool)
+        fetching = asyncio.Event()
+        release = asyncio.Event()
+        real_fetch = policy_cache_front.fetch_entry
+
+        async def _slow_fetch(*args):
+            loaded = await real_fetch(*args)
+            fetching.set()
+            await release.wait()
+            return loaded
+
+        monkeypatch.setattr(policy_cache_front, "fetch_entry", _slow_fetch)
+        reader = asyncio.create_task(front.get("p", "k"))
+        await fetching.wait()
+        front.put("p", "k", "new", 60, None)
+        await front.flush()
+        release.set()
+
+        assert await reader == "old"
+        assert await front.get("p", "k") == "new"
+
+
+class TestInvalidation:
+    @pytest.mark.asyncio
+    async def test_flush_invalidates_other_replicas(self, db_pool):
+        bus = _LocalBus()
+        writer = PolicyCacheFront(db_pool, invalidation_bus=bus)
+        reader = PolicyCacheFront(db_pool, invalidation_bus=bus)
+        for front in (writer, reader):
+            await bus.listen(front._on_invalidation)
+
+        await PolicyCache(db_pool, "p").put("k", {"v": 1}, ttl_seconds=60)
+        assert await PolicyCache(db_pool, "p", front=reader).get("k") == {"v": 1}
+
+        await PolicyCache(db_pool, "p", front=writer).put("k", {"v": 2}, ttl_seconds=60)
+        await writer.flush()
+
+        assert await PolicyCache(db_pool, "p", front=reader).get("k") == {"v": 2}
+        assert reader.stats()["invalidations_received"] == 1
+        assert writer.stats()["invalidations_received"] == 0
+
+
+class TestBuildFactory:
+    @pytest.mark.asyncio
+    async def test_installed_front_applies_to_its_pool_only(self, db_pool):
+        front = PolicyCacheFront(db_pool)
+        install_front(front)
+        try:
+            await build_factory(db_pool)("p").put("k", 1, 60)  # type: ignore[misc]
+            other = DatabasePool("sqlite://:memory:")
+            assert build_factory(other)("p")._front is None  # type: ignore[misc]
+        finally:
+            install_front(None)
+        assert front.stats()["pending_writes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_pending_writes(self, db_pool):
+        front = PolicyCacheFront(db_pool, flush_interval_seconds=60)
+        front.start()
+        front.put("p", "k", {"v": 1}, 60, None)
+        await front.stop()
+        assert await PolicyCache(db_pool, "p").get("k") == {"v": 1}
+
+    @pytest.mark.asyncio
+    async def test_stop_waits_for_in_flight_flush(self, db_pool, monkeypatch):
+        front = PolicyCacheFront(db_pool, flush_size=1, flush_interval_seconds=60)
+        writing = asyncio.Event()
+        release = asyncio.Event()
+        real_write = front._write_batch
+
+        async def _slow_write(conn, batch):
+            writing.set()
+            await release.wait()
+            await real_write(conn, batch)
+
+        monkeypatch.setattr(front, "_write_batch", _slow_write)
+        front.start()
+        front.put("p", "k", {"v": 1}, 60, None)
+        await writing.wait()
+        stopping = asyncio.create_task(front.stop())
+        await asyncio.sleep(0)
+        release.set()
+        await stopping
+
+        assert await PolicyCache(db_pool, "p").get("k") == {"v": 1}
+        assert front.stats()["flushes"] == 1
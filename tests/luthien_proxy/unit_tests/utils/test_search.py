@@ -1,4 +1,4 @@
-"""Unit tests for conversation-event full-text search (SQLite FTS5 + helper)."""
+"""Unit tests for session full-text search (SQLite FTS5 migrations + helper)."""
 
 from __future__ import annotations
 
@@ -327,6 +327,36 @@ async def test_fts_cascade_delete_from_parent_call() -> None:
         await pool.close()
 
 
+async def _fresh_index_pool() -> DatabasePool:
+    """In-memory pool with every migration applied (session_search_index + its FTS5 table)."""
+    pool = DatabasePool("sqlite://:memory:")
+    for path in sorted(MIGRATIONS_DIR.glob("*.sql")):
+        await _apply_migration(pool, path.name)
+    return pool
+
+
+async def _index_text(pool: DatabasePool, *, session_id: str, content: str, call_id: str = "call-1") -> None:
+    async with pool.connection() as conn:
+        await conn.execute(
+            "INSERT OR IGNORE INTO conversation_calls (call_id, session_id) VALUES ($1, $2)",
+            call_id,
+            session_id,
+        )
+        await conn.execute(
+            "INSERT INTO session_search_index (session_id, call_id, content) VALUES ($1, $2, $3)",
+            session_id,
+            call_id,
+            content,
+        )
+
+
+async def _matching_sessions(pool: DatabasePool, fragment: str, bind_value: str) -> list[str]:
+    # Substitute the fragment into a realistic parent query.
+    async with pool.connection() as conn:
+        rows = await conn.fetch(f"SELECT si.session_id FROM session_search_index si WHERE {fragment}", bind_value)
+    return [r["session_id"] for r in rows]
+
+
 @pytest.mark.parametrize(
     "dangerous_query",
     ["%", "'", "foo-bar", "foo+bar", 'foo "bar', "content:nope", '"', "-baz"],
@@ -339,22 +369,13 @@ async def test_helper_sanitizes_fts5_special_characters(dangerous_query: str) ->
     column-filter prefixes like ``name:``, stray ``"``, etc. The helper takes
     ownership of these inputs and returns a safe quoted-phrase expression.
     """
-    pool = await _fresh_fts_pool()
+    pool = await _fresh_index_pool()
     try:
-        await _insert_event(
-            pool,
-            event_id="e-safe",
-            session_id="s-safe",
-            payload={"final_request": {"messages": [{"role": "user", "content": "ordinary words here"}]}},
-        )
+        await _index_text(pool, session_id="s-safe", content="ordinary words here")
         fragment, bind_value = session_fts_filter_sql(pool, dangerous_query, placeholder="$1")
-        assert "conversation_events_fts" in fragment
+        assert "session_search_fts" in fragment
         # Must not raise -- MATCH parses the sanitized phrase.
-        async with pool.connection() as conn:
-            await conn.fetch(
-                "SELECT event_id FROM conversation_events_fts WHERE conversation_events_fts MATCH $1",
-                bind_value,
-            )
+        await _matching_sessions(pool, fragment, bind_value)
     finally:
         await pool.close()
 
@@ -362,22 +383,12 @@ async def test_helper_sanitizes_fts5_special_characters(dangerous_query: str) ->
 @pytest.mark.asyncio
 async def test_helper_returns_bind_value_matching_content() -> None:
     """End-to-end: helper output, bound via asyncpg-style params, hits indexed rows."""
-    pool = await _fresh_fts_pool()
+    pool = await _fresh_index_pool()
     try:
-        await _insert_event(
-            pool,
-            event_id="e-bind",
-            session_id="s-bind",
-            payload={"final_request": {"messages": [{"role": "user", "content": "salmon risotto"}]}},
-        )
+        await _index_text(pool, session_id="s-bind", content="salmon risotto", call_id="c-bind")
+        await _index_text(pool, session_id="s-other", content="mushroom soup", call_id="c-other")
         fragment, bind_value = session_fts_filter_sql(pool, "salmon", placeholder="$1")
-        # Substitute the fragment into a realistic parent query.
-        async with pool.connection() as conn:
-            rows = await conn.fetch(
-                f"SELECT ce.id AS event_id FROM conversation_events ce WHERE {fragment}",
-                bind_value,
-            )
-        assert [r["event_id"] for r in rows] == ["e-bind"]
+        assert await _matching_sessions(pool, fragment, bind_value) == ["s-bind"]
     finally:
         await pool.close()
 
@@ -385,21 +396,101 @@ async def test_helper_returns_bind_value_matching_content() -> None:
 @pytest.mark.asyncio
 async def test_helper_empty_query_matches_nothing() -> None:
     """Empty/whitespace input yields zero matches, mirroring plainto_tsquery('')."""
-    pool = await _fresh_fts_pool()
+    pool = await _fresh_index_pool()
     try:
-        await _insert_event(
-            pool,
-            event_id="e-empty",
-            session_id="s-empty",
-            payload={"final_request": {"messages": [{"role": "user", "content": "anything"}]}},
-        )
+        await _index_text(pool, session_id="s-empty", content="anything")
         fragment, bind_value = session_fts_filter_sql(pool, "   ", placeholder="$1")
+        assert await _matching_sessions(pool, fragment, bind_value) == []
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_session_search_fts_follows_cascade_delete() -> None:
+    """Purging a call removes its index rows from the external-content FTS5 table too."""
+    pool = await _fresh_index_pool()
+    try:
+        await _index_text(pool, session_id="s-cascade", content="cascadetoken", call_id="call-cascade")
+        fragment, bind_value = session_fts_filter_sql(pool, "cascadetoken", placeholder="$1")
+        assert await _matching_sessions(pool, fragment, bind_value) == ["s-cascade"]
+
         async with pool.connection() as conn:
-            rows = await conn.fetch(
-                f"SELECT ce.id AS event_id FROM conversation_events ce WHERE {fragment}",
-                bind_value,
+            await conn.execute("DELETE FROM conversation_calls WHERE call_id = $1", "call-cascade")
+            fts_rows = await conn.fetch(
+                "SELECT rowid FROM session_search_fts WHERE session_search_fts MATCH $1", "cascadetoken"
             )
-        assert rows == []
+        assert fts_rows == []
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_024_backfill_indexes_only_new_messages() -> None:
+    """Migration 024 backfills each call's new user text and each response's text.
+
+    Mirrors the Python indexer: the assistant turn echoed back in the second
+    request is not re-indexed, probes are skipped, and a shorter history is
+    indexed whole.
+    """
+    pool = DatabasePool("sqlite://:memory:")
+    try:
+        for path in sorted(MIGRATIONS_DIR.glob("*.sql")):
+            if path.name < "024":
+                await _apply_migration(pool, path.name)
+
+        first = [{"role": "user", "content": "alpha question"}]
+        second = [
+            *first,
+            {"role": "assistant", "content": [{"type": "text", "text": "beta answer"}]},
+            {"role": "user", "content": [{"type": "text", "text": "gamma"}, {"type": "text", "text": "delta"}]},
+        ]
+        events = [
+            ("c1", "transaction.request_recorded", {"original_request": {"messages": first}}),
+            (
+                "c1",
+                "transaction.non_streaming_response_recorded",
+                {"final_response": {"content": second[1]["content"]}},
+            ),
+            ("c2", "transaction.request_recorded", {"original_request": {"max_tokens": 1, "messages": first}}),
+            ("c3", "transaction.request_recorded", {"original_request": {"messages": second}}),
+            (
+                "c4",
+                "transaction.request_recorded",
+                {"final_request": {"messages": [{"role": "user", "content": "eps"}]}},
+            ),
+        ]
+        async with pool.connection() as conn:
+            for i, (call_id, event_type, payload) in enumerate(events):
+                created_at = f"2026-04-01T10:00:0{i}"
+                await conn.execute(
+                    "INSERT OR IGNORE INTO conversation_calls (call_id, session_id, created_at) VALUES ($1, $2, $3)",
+                    call_id,
+                    "s1",
+                    created_at,
+                )
+                await conn.execute(
+                    "INSERT INTO conversation_events (id, call_id, event_type, payload, session_id, created_at) "
+                    "VALUES ($1, $2, $3, $4, $5, $6)",
+                    f"e{i}",
+                    call_id,
+                    event_type,
+                    json.dumps(payload),
+                    "s1",
+                    created_at,
+                )
+
+        await _apply_migration(pool, "024_add_session_search_index.sql")
+
+        async with pool.connection() as conn:
+            rows = await conn.fetch("SELECT call_id, content FROM session_search_index ORDER BY call_id, id")
+            state = await conn.fetch("SELECT session_id, message_count FROM session_search_state")
+        assert [(r["call_id"], r["content"]) for r in rows] == [
+            ("c1", "alpha question"),
+            ("c1", "beta answer"),
+            ("c3", "gamma delta"),
+            ("c4", "eps"),
+        ]
+        assert [(r["session_id"], r["message_count"]) for r in state] == [("s1", 1)]
     finally:
         await pool.close()
 
@@ -408,7 +499,7 @@ def test_session_fts_filter_sql_sqlite_shape() -> None:
     """SQLite dialect returns the FTS subquery predicate and sanitized bind value."""
     pool = DatabasePool("sqlite://:memory:")
     fragment, bind_value = session_fts_filter_sql(pool, "chocolate croissants", placeholder="$3")
-    assert "conversation_events_fts" in fragment
+    assert "session_search_fts" in fragment
     assert "MATCH $3" in fragment
     assert "search_vector" not in fragment
     assert bind_value == '"chocolate" "croissants"'
@@ -418,10 +509,10 @@ def test_session_fts_filter_sql_postgres_shape() -> None:
     """Postgres dialect returns the tsvector predicate and passes the query through."""
     pool = DatabasePool("postgresql://example/db")
     fragment, bind_value = session_fts_filter_sql(pool, "chocolate croissants", placeholder="$3")
-    assert "search_vector" in fragment
+    assert "si.search_vector" in fragment
     assert "plainto_tsquery" in fragment
     assert "$3" in fragment
-    assert "conversation_events_fts" not in fragment
+    assert "session_search_fts" not in fragment
     # Postgres side hands the query to plainto_tsquery unchanged.
     assert bind_value == "chocolate croissants"
 